@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Bit-parallel approximate quote locator for OCR-damaged sources.
+
+When a quote is not found verbatim, the usual causes are OCR noise in the
+Legge djvu text or small punctuation drift. ApproxLocator finds the closest
+substring of a QuoteIndex's normalized documents within an edit-distance
+budget, so verify_quotes.py can say where the quote most likely came from.
+
+Two stages:
+
+1. Prefilter (pigeonhole): split the quote into k+1 disjoint pieces, where
+   k is the error budget. A substring within k edits of the quote must
+   contain at least one piece unchanged, so exact ``str.find`` hits of the
+   pieces give every candidate window (the piece's offset in the quote,
+   widened by k on each side). Overlapping windows are merged.
+2. Verify: Myers' bit-parallel edit distance (Hyyrö's formulation) scans each
+   window once, one character per step with the whole quote packed in an
+   int bit-vector, giving the best end position and its distance. A second
+   run over the reversed window, anchored at that end, finds the start.
+
+Distances are Levenshtein distances between normalized texts; similarity is
+1 - distance / len(normalized quote).
+
+Usage:
+    locator = ApproxLocator(gate_quote_index('legge', legge_data))
+    match = locator.find(quote, max_error_rate=0.15)
+    if match:
+        print(match.key, match.distance, match.similarity, match.text)
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from quote_index import Key, QuoteIndex
+
+# Fraction of the normalized quote length allowed as edits by default
+DEFAULT_MAX_ERROR_RATE = 0.15
+
+
+class ApproxMatch(NamedTuple):
+    key: Key            # (gate, line) of the document
+    start: int          # character span in the normalized document
+    end: int
+    distance: int       # edit distance between quote and span
+    similarity: float   # 1 - distance / len(normalized quote)
+    text: str           # the matched normalized text
+
+
+def _peq(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in the pattern."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def myers_scan(pattern: str, text: str, anchored: bool = False,
+               peq: Optional[Dict[str, int]] = None) -> Tuple[int, int]:
+    """
+    Best (distance, end) of the pattern against text, scanning text once.
+
+    Unanchored (search): distance to the best substring ending at ``end``.
+    Anchored: distance to the prefix text[:end]. Ties keep the smallest end.
+    An empty text gives (len(pattern), 0).
+    """
+    m = len(pattern)
+    if m == 0:
+        return (0, 0)
+    peq = peq if peq is not None else _peq(pattern)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    carry = 1 if anchored else 0
+    pv, mv, score = mask, 0, m
+    best, best_end = m, 0
+    for j, char in enumerate(text, 1):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | carry) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        if score < best:
+            best, best_end = score, j
+    return (best, best_end)
+
+
+def align(pattern: str, text: str, peq: Optional[Dict[str, int]] = None) -> Tuple[int, int, int]:
+    """
+    Best approximate occurrence of pattern in text as (distance, start, end).
+
+    The forward scan gives the end; the reversed scan anchored at that end
+    gives the shortest start reaching the same distance.
+    """
+    distance, end = myers_scan(pattern, text, peq=peq)
+    if distance >= len(pattern):
+        return (distance, end, end)
+    _, length = myers_scan(pattern[::-1], text[end - 1::-1] if end else "", anchored=True)
+    return (distance, end - length, end)
+
+
+def split_pieces(pattern: str, count: int) -> List[Tuple[int, str]]:
+    """Split pattern into count disjoint (offset, piece) parts of near-equal length."""
+    count = max(1, min(count, len(pattern)))
+    bounds = [len(pattern) * i // count for i in range(count + 1)]
+    return [(bounds[i], pattern[bounds[i]:bounds[i + 1]]) for i in range(count)]
+
+
+class ApproxLocator:
+    """Approximate lookups over the normalized documents of a QuoteIndex."""
+
+    def __init__(self, index: QuoteIndex):
+        self.index = index
+        self.windows = 0
+        self.scanned_chars = 0
+
+    def candidate_windows(self, pattern: str, max_errors: int, doc_id: int) -> List[Tuple[int, int, int]]:
+        """
+        Merged (start, end, pieces) character windows of one document that
+        may hold a match; pieces counts the distinct quote pieces found in it.
+        """
+        text = self.index.texts[doc_id]
+        m = len(pattern)
+        hits = []
+        for piece_no, (offset, piece) in enumerate(split_pieces(pattern, max_errors + 1)):
+            pos = text.find(piece)
+            while pos != -1:
+                start = max(0, pos - offset - max_errors)
+                hits.append((start, min(len(text), pos - offset + m + max_errors), piece_no))
+                pos = text.find(piece, pos + 1)
+        hits.sort()
+        merged: List[Tuple[int, int, set]] = []
+        for start, end, piece_no in hits:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end), merged[-1][2] | {piece_no})
+            else:
+                merged.append((start, end, {piece_no}))
+        return [(start, end, len(pieces)) for start, end, pieces in merged]
+
+    def find(self, quote: str, gate: Optional[int] = None,
+             max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+             max_errors: Optional[int] = None) -> Optional[ApproxMatch]:
+        """
+        Closest span to the quote within the error budget, or None.
+
+        The budget is max_errors if given, else max_error_rate times the
+        normalized quote length. Documents are searched in insertion order
+        (optionally only those of one gate); the lowest distance wins and
+        ties keep the first document.
+
+        Windows are verified most-pieces-first. d edits destroy at most d of
+        the k+1 pieces, so a window holding p pieces has distance at least
+        (k+1) - p; once a match at distance d is known, windows with fewer
+        than (k+1) - d pieces cannot reach it and are skipped.
+        """
+        pattern = self.index.normalize(quote)
+        if not pattern:
+            return None
+        budget = max_errors if max_errors is not None else int(max_error_rate * len(pattern))
+        budget = min(budget, len(pattern) - 1)
+        if budget < 0:
+            return None
+        peq = _peq(pattern)
+        doc_ids = self.index._gate_docs.get(gate, []) if gate is not None else range(len(self.index.keys))
+
+        windows = [
+            (-pieces, doc_id, start, end)
+            for doc_id in doc_ids
+            for start, end, pieces in self.candidate_windows(pattern, budget, doc_id)
+        ]
+        windows.sort()
+
+        best: Optional[ApproxMatch] = None
+        best_rank = None
+        for neg_pieces, doc_id, win_start, win_end in windows:
+            if best is not None and -neg_pieces < budget + 1 - best.distance:
+                break
+            self.windows += 1
+            self.scanned_chars += win_end - win_start
+            text = self.index.texts[doc_id]
+            distance, start, end = align(pattern, text[win_start:win_end], peq)
+            if distance > budget:
+                continue
+            rank = (distance, doc_id, win_start + start)
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                start, end = win_start + start, win_start + end
+                best = ApproxMatch(
+                    key=self.index.keys[doc_id],
+                    start=start,
+                    end=end,
+                    distance=distance,
+                    similarity=round(1 - distance / len(pattern), 3),
+                    text=text[start:end],
+                )
+        return best
+
+    def format_stats(self) -> str:
+        return f"{self.windows} windows verified, {self.scanned_chars} characters scanned"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: approximate quote lookups (approx_match.ApproxLocator).
+
+Draws one quote of 6-25 words from every indexed Legge and Line Companion
+document of all 64 gates, damages it with 1-4 OCR-style substitutions, adds
+one unrelated quote per gate and source (a true miss), and times the
+closest-match lookup against the quote's own gate, as verify_quotes.py
+--approx does for every failed quote.
+
+Usage:
+    python GPT-5/scripts/bench_approx_match.py [--seed 3] [--max-error-rate 0.15]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from approx_match import DEFAULT_MAX_ERROR_RATE, ApproxLocator
+from verify_quotes import gate_quote_index, get_corpus
+
+MISS = "the quick brown fox jumps over the lazy dog near the river bank today"
+
+
+def damaged_quotes(rng: random.Random):
+    """(source, data, quote) triples over every gate's indexed documents."""
+    corpus = get_corpus()
+    quotes = []
+    for gate in range(1, 65):
+        for source, data in (('legge', corpus.legge(gate)), ('line_companion', corpus.line_companion(gate))):
+            if data is None:
+                continue
+            for text in gate_quote_index(source, data).texts:
+                words = text.split()
+                if len(words) < 12:
+                    continue
+                start = rng.randrange(len(words) - 10)
+                chars = list(" ".join(words[start:start + rng.randint(6, 25)]))
+                for _ in range(rng.randint(1, 4)):
+                    chars[rng.randrange(len(chars))] = rng.choice("l1|.,'")
+                quotes.append((source, data, "".join(chars)))
+            quotes.append((source, data, MISS))
+    return quotes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark approximate quote lookups")
+    parser.add_argument("--seed", type=int, default=3, help="Random seed for quote selection")
+    parser.add_argument("--max-error-rate", type=float, default=DEFAULT_MAX_ERROR_RATE,
+                        help=f"Edit budget as a fraction of quote length (default: {DEFAULT_MAX_ERROR_RATE})")
+    args = parser.parse_args()
+
+    quotes = damaged_quotes(random.Random(args.seed))
+    if not quotes:
+        print("No Legge or Line Companion sources found")
+        return 1
+
+    found = windows = 0
+    start = time.perf_counter()
+    for source, data, quote in quotes:
+        locator = ApproxLocator(gate_quote_index(source, data))
+        found += locator.find(quote, max_error_rate=args.max_error_rate) is not None
+        windows += locator.windows
+    seconds = time.perf_counter() - start
+
+    print(f"{len(quotes)} quotes, {found} matched, {windows} windows verified")
+    print(f"{seconds:.2f}s total, {seconds / len(quotes) * 1000:.2f} ms per quote")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,31 +5,43 @@ Fuzz test pairwise exclusion rules across sample gate data.
 This script tests all pairwise exclusion invariants against existing gate outputs
 to verify rule compliance and generate a comprehensive invariants report.
 
+All requested star maps are loaded into one weight tensor (weight_tensor.py)
+and each rule -- the pairwise exclusions, the Orion faction rule, top-2 and
+sum_unorm -- is evaluated as one pass over the whole corpus; violations are
+mapped back to "Gate NN, NN.L: ..." messages.
+
+With --generate, it instead produces random lines biased towards the rule
+pairs, threshold/cap boundaries (0.35/0.36, 0.59/0.60/0.61), ties,
+misassigned roles and malformed entries (mis-cased or unknown names,
+duplicated systems, missing roles, zero weights), checks the corpus tensor
+and the validate_gate_outputs rules against a reference oracle in batches,
+and shrinks every disagreement to a minimal line.
+
 Usage:
     python fuzz_invariants.py [--gates GATE_LIST]
     python fuzz_invariants.py --gates 01,03,07,10
     python fuzz_invariants.py  # Tests all available gates
+    python fuzz_invariants.py --generate 1000000 --seed 7 --target tensor
 """
 
 import argparse
 import json
+import random
+import re
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 from collections import defaultdict
 
+from validate_gate_outputs import (
+    CANONICAL_SYSTEMS, ORION_FACTION_RULE, PAIRWISE_EXCLUSIONS, RULES_BY_NAME, GateFile, run_rules,
+)
+from weight_tensor import LINES, WeightTensor, check_tensor
 
-# Pairwise exclusion rules (system_a, system_b, threshold_a, max_b)
-PAIRWISE_EXCLUSIONS = [
-    ("Pleiades", "Draco", 0.0, None),  # If Pleiades > 0 → Draco = 0
-    ("Sirius", "Orion Light", 0.60, 0.35),  # If Sirius ≥ 0.60 → Orion Light ≤ 0.35
-    ("Andromeda", "Orion Dark", 0.60, 0.0),  # If Andromeda ≥ 0.60 → Orion Dark = 0
-    ("Arcturus", "Pleiades", 0.0, 0.0),  # If Arcturus > 0 → Pleiades = 0
-    ("Lyra", "Draco", 0.0, None),  # If Lyra > 0 → Draco = 0
-]
-
-# Orion faction conflict rule
-ORION_FACTION_RULE = ("Orion Light", "Orion Dark", 0.35)
+# PAIRWISE_EXCLUSIONS (system_a, system_b, threshold_a, max_b) and
+# ORION_FACTION_RULE (light, dark, threshold) are loaded by validate_gate_outputs
+# from s3-data/pipeline_rules/scoring_invariants.v1.json
 
 
 class InvariantTester:
@@ -39,6 +51,8 @@ class InvariantTester:
         self.violations = []
         self.passes = []
         self.stats = defaultdict(lambda: {"tested": 0, "violations": 0, "passes": 0})
+        self.check_seconds = 0.0
+        self.lines_checked = 0
         
     def load_gate_weights(self, gate_num: str) -> Dict:
         """Load weight file for a gate."""
@@ -117,103 +131,74 @@ class InvariantTester:
         sys_weights: Dict[str, float]
     ) -> Tuple[bool, str]:
         """Test Orion faction conflict rule."""
-        orion_light_weight = sys_weights.get("Orion Light", 0.0)
-        orion_dark_weight = sys_weights.get("Orion Dark", 0.0)
+        light, dark, threshold = ORION_FACTION_RULE
+        orion_light_weight = sys_weights.get(light, 0.0)
+        orion_dark_weight = sys_weights.get(dark, 0.0)
         
         if orion_light_weight > 0 and orion_dark_weight > 0:
-            # Both present - one should be ≤ 0.35 or 0
-            if orion_light_weight > 0.35 and orion_dark_weight > 0.35:
+            # Both present - one should be ≤ threshold or 0
+            if orion_light_weight > threshold and orion_dark_weight > threshold:
                 msg = (
                     f"Gate {gate_num}, {line_key}: Orion faction conflict - "
-                    f"both Light ({orion_light_weight}) and Dark ({orion_dark_weight}) > 0.35; "
+                    f"both Light ({orion_light_weight}) and Dark ({orion_dark_weight}) > {threshold}; "
                     f"one should be down-ranked"
                 )
                 return False, msg
         
         return True, None
     
-    def test_gate(self, gate_num: str) -> Dict:
-        """Test all invariants for a single gate."""
-        weights = self.load_gate_weights(gate_num)
+    def test_gates(self, gate_nums: List[str]) -> Dict[str, Dict]:
+        """
+        Test all invariants for several gates in one pass over a weight tensor.
         
-        if weights is None:
-            return {"status": "skipped", "reason": "file not found"}
+        Returns:
+            Per-gate result dicts keyed by gate number, in input order
+        """
+        loaded = {}
+        results = {}
+        for gate_num in gate_nums:
+            weights = self.load_gate_weights(gate_num)
+            if weights is None:
+                results[gate_num] = {"status": "skipped", "reason": "file not found"}
+            else:
+                loaded[gate_num] = weights
+                results[gate_num] = None
         
-        gate_violations = []
-        gate_passes = []
+        start = time.perf_counter()
+        tensor = WeightTensor.from_weights(loaded)
+        violations, stats = check_tensor(tensor, PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+        self.check_seconds += time.perf_counter() - start
+        self.lines_checked += sum(tensor.present)
         
-        # Test each line
-        for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-            systems = weights[line_key]
-            
-            if not isinstance(systems, list):
-                continue
-            
-            # Build system weight map
-            sys_weights = {s["star_system"]: s["weight"] for s in systems}
-            
-            # Test each pairwise exclusion rule
-            for sys_a, sys_b, threshold_a, max_b in PAIRWISE_EXCLUSIONS:
-                rule_name = f"{sys_a}/{sys_b}"
-                self.stats[rule_name]["tested"] += 1
-                
-                passed, msg = self.test_pairwise_exclusion(
-                    gate_num, line_key, sys_weights, sys_a, sys_b, threshold_a, max_b
-                )
-                
-                if passed:
-                    self.stats[rule_name]["passes"] += 1
-                    if msg is None:
-                        # Rule didn't apply
-                        gate_passes.append({
-                            "line": line_key,
-                            "rule": rule_name,
-                            "status": "not_applicable"
-                        })
-                    else:
-                        gate_passes.append({
-                            "line": line_key,
-                            "rule": rule_name,
-                            "status": "passed"
-                        })
-                else:
-                    self.stats[rule_name]["violations"] += 1
-                    gate_violations.append({
-                        "line": line_key,
-                        "rule": rule_name,
-                        "message": msg
-                    })
-                    self.violations.append(msg)
-            
-            # Test Orion faction conflict
-            rule_name = "Orion Light/Orion Dark"
-            self.stats[rule_name]["tested"] += 1
-            
-            passed, msg = self.test_orion_faction_conflict(gate_num, line_key, sys_weights)
-            
-            if passed:
-                self.stats[rule_name]["passes"] += 1
-                gate_passes.append({
-                    "line": line_key,
-                    "rule": rule_name,
-                    "status": "passed" if msg is None else "not_applicable"
-                })
-            else:
-                self.stats[rule_name]["violations"] += 1
-                gate_violations.append({
-                    "line": line_key,
-                    "rule": rule_name,
-                    "message": msg
-                })
-                self.violations.append(msg)
+        for rule_name, rule_stats in stats.items():
+            for key in ("tested", "violations", "passes"):
+                self.stats[rule_name][key] += rule_stats[key]
+        
+        gate_violations = defaultdict(list)
+        for violation in violations:
+            gate_violations[violation.gate].append({
+                "line": violation.line_key,
+                "rule": violation.rule,
+                "message": violation.message
+            })
+            self.violations.append(violation.message)
+        
+        for g, gate_num in enumerate(tensor.gates):
+            lines = sum(tensor.present[g * LINES:(g + 1) * LINES])
+            checks = lines * (len(PAIRWISE_EXCLUSIONS) + 2) + 1
+            failed = {(v["line"], v["rule"]) for v in gate_violations[gate_num]}
+            results[gate_num] = {
+                "status": "tested",
+                "violations": gate_violations[gate_num],
+                "violation_count": len(gate_violations[gate_num]),
+                "pass_count": checks - len(failed)
+            }
         
-        return {
-            "status": "tested",
-            "violations": gate_violations,
-            "passes": gate_passes,
-            "violation_count": len(gate_violations),
-            "pass_count": len(gate_passes)
-        }
+        return results
+    
+    def test_gate(self, gate_num: str) -> Dict:
+        """Test all invariants for a single gate."""
+        return self.test_gates([gate_num])[gate_num]
     
     def generate_report(self, tested_gates: List[str]) -> str:
         """Generate comprehensive invariants report."""
@@ -279,7 +264,10 @@ class InvariantTester:
             
             report.append(f"• {sys_a} {op} {threshold_a} → {constraint}")
         
-        report.append(f"• Orion Light > 0 AND Orion Dark > 0 → one must be ≤ 0.35")
+        light, dark, threshold = ORION_FACTION_RULE
+        report.append(f"• {light} > 0 AND {dark} > 0 → one must be ≤ {threshold}")
+        report.append("• Top-2: ≤2 systems per line, exactly 1 primary, primary weight > secondary weight")
+        report.append("• sum_unorm: declared _meta.sum_unorm = sum of all weights (±0.01)")
         report.append("")
         
         # Tested gates
@@ -312,6 +300,300 @@ def find_available_gates() -> List[str]:
     return gates
 
 
+# ----------------------------------------------------------------------
+# Generative fuzzing
+# ----------------------------------------------------------------------
+# One case is one gate.line: a list of {star_system, weight, role} entries
+# with distinct systems. Cases are generated in batches, checked by every
+# target at once, and compared line by line with oracle_violations();
+# disagreements are shrunk to a minimal line.
+
+ORION_RULE_NAME = f"{ORION_FACTION_RULE[0]}/{ORION_FACTION_RULE[1]}"
+TOP2_RULE_NAME = "Top-2"
+
+
+def boundary_weights() -> List[float]:
+    """Rule thresholds and caps, their 0.01 neighbours, and the ends of the range."""
+    edges = {0.0, 0.01, 0.5, 0.99, 1.0}
+    for _, _, threshold_a, max_b in PAIRWISE_EXCLUSIONS:
+        edges.update(v for v in (threshold_a, max_b) if v is not None)
+    edges.add(ORION_FACTION_RULE[2])
+    near = {round(v + step, 2) for v in edges for step in (-0.01, 0.0, 0.01)}
+    return sorted(v for v in near if 0.0 <= v <= 1.0)
+
+
+BOUNDARY_WEIGHTS = boundary_weights()
+
+
+def oracle_violations(systems: List[Dict], exclusions=PAIRWISE_EXCLUSIONS,
+                      orion_rule=ORION_FACTION_RULE) -> Set[str]:
+    """Reference oracle: rule names one line violates, written straight from the rule table."""
+    weight = {s["star_system"]: s["weight"] for s in systems}
+    violated = set()
+    
+    for sys_a, sys_b, threshold_a, max_b in exclusions:
+        weight_a, weight_b = weight.get(sys_a, 0.0), weight.get(sys_b, 0.0)
+        applies = weight_a >= threshold_a if threshold_a else weight_a > 0
+        if applies and weight_b > (max_b or 0.0):
+            violated.add(f"{sys_a}/{sys_b}")
+    
+    light, dark, cap = orion_rule
+    if weight.get(light, 0.0) > cap and weight.get(dark, 0.0) > cap:
+        violated.add(f"{light}/{dark}")
+    
+    primaries = [s["weight"] for s in systems if s.get("role") == "primary"]
+    secondaries = [s["weight"] for s in systems if s.get("role") == "secondary"]
+    if (len(systems) > 2 or len(primaries) != 1 or len(secondaries) > 1
+            or (len(systems) == 2 and primaries and secondaries and primaries[0] <= secondaries[0])):
+        violated.add(TOP2_RULE_NAME)
+    
+    return violated
+
+
+def random_line(rng: random.Random, boundary_rate: float = 0.6, malformed_rate: float = 0.2) -> List[Dict]:
+    """
+    A random line biased towards rule pairs, boundary weights, ties and
+    misassigned roles; a malformed_rate share of lines also gets a
+    mis-cased or unknown system name, a duplicated system, a missing role
+    or a zero weight.
+    """
+    count = rng.choices((0, 1, 2, 3), weights=(1, 4, 10, 2))[0]
+    if count >= 2 and rng.random() < 0.6:
+        sys_a, sys_b = rng.choice(PAIRWISE_EXCLUSIONS + [ORION_FACTION_RULE])[:2]
+        others = [s for s in CANONICAL_SYSTEMS if s not in (sys_a, sys_b)]
+        systems = [sys_a, sys_b] + rng.sample(others, count - 2)
+        rng.shuffle(systems)
+    else:
+        systems = rng.sample(CANONICAL_SYSTEMS, count)
+    
+    weights = [
+        rng.choice(BOUNDARY_WEIGHTS) if rng.random() < boundary_rate else rng.randint(1, 100) / 100
+        for _ in systems
+    ]
+    if count >= 2 and rng.random() < 0.15:
+        weights[1] = weights[0]  # tie
+    
+    if rng.random() < 0.8:
+        # Well-formed roles: heaviest first is primary
+        order = sorted(range(count), key=lambda i: -weights[i])
+        roles = {i: "primary" if rank == 0 else "secondary" for rank, i in enumerate(order)}
+    else:
+        roles = {i: rng.choice(("primary", "secondary")) for i in range(count)}
+    
+    line = [{"star_system": s, "weight": w, "role": roles[i]} for i, (s, w) in enumerate(zip(systems, weights))]
+    if line and rng.random() < malformed_rate:
+        _malform(rng, line)
+    return line
+
+
+def _malform(rng: random.Random, line: List[Dict]) -> None:
+    """Apply one malformation in place to a non-empty line."""
+    i = rng.randrange(len(line))
+    kind = rng.randrange(4)
+    if kind == 0:
+        name = line[i]["star_system"]
+        line[i]["star_system"] = rng.choice((name.lower(), name.upper(), "Vega", ""))
+    elif kind == 1:
+        duplicate = dict(line[i], weight=rng.choice(BOUNDARY_WEIGHTS), role=rng.choice(("primary", "secondary")))
+        line.insert(rng.randrange(len(line) + 1), duplicate)
+    elif kind == 2:
+        del line[i]["role"]
+    else:
+        line[i]["weight"] = 0.0
+
+
+def _lines_to_gates(lines: List[List[Dict]]) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+    """Pack lines six to a synthetic gate; returns (star maps by gate label, line key -> case index)."""
+    gates = {}
+    rows = {}
+    for i, systems in enumerate(lines):
+        gate = f"{i // LINES:02d}"
+        line_key = f"{gate}.{i % LINES + 1}"
+        weights = gates.setdefault(gate, {"_meta": {"gate": gate, "sum_unorm": 0.0}})
+        weights[line_key] = systems
+        weights["_meta"]["sum_unorm"] += sum(s["weight"] for s in systems)
+        rows[line_key] = i
+    return gates, rows
+
+
+def tensor_violations(lines: List[List[Dict]]) -> List[Set[str]]:
+    """Target: weight_tensor.check_tensor over the whole batch at once."""
+    gates, rows = _lines_to_gates(lines)
+    violations, _ = check_tensor(WeightTensor.from_weights(gates), PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+    found = [set() for _ in lines]
+    for violation in violations:
+        if violation.line_key is not None:
+            found[rows[violation.line_key]].add(violation.rule)
+    return found
+
+
+_PAIRWISE_MESSAGE_RE = re.compile(r"violated - (?P<a>.+?) [>≥] [\d.]+ requires (?P<b>.+?) [=≤] ")
+_LINE_RULES = [RULES_BY_NAME["top2"], RULES_BY_NAME["pairwise_exclusions"]]
+
+
+def rule_engine_violations(lines: List[List[Dict]]) -> List[Set[str]]:
+    """Target: validate_gate_outputs top-2 and pairwise rules, one gate file per six lines."""
+    gates, rows = _lines_to_gates(lines)
+    found = [set() for _ in lines]
+    for weights in gates.values():
+        errors, _ = run_rules(GateFile(weights), _LINE_RULES)
+        for rule_name, messages in errors.items():
+            for message in messages:
+                line_key, _, text = message.partition(": ")
+                if rule_name == "top2":
+                    rule = TOP2_RULE_NAME
+                elif text.startswith("Orion faction conflict"):
+                    rule = ORION_RULE_NAME
+                else:
+                    match = _PAIRWISE_MESSAGE_RE.search(text)
+                    rule = f"{match.group('a')}/{match.group('b')}"
+                found[rows[line_key]].add(rule)
+    return found
+
+
+FUZZ_TARGETS = {
+    "tensor": tensor_violations,
+    "rules": rule_engine_violations,
+}
+
+
+def _line_cost(systems: List[Dict]) -> Tuple:
+    """Shrink order: fewer entries, smaller then shorter weights, well-formed roles, sorted."""
+    weights = [s["weight"] for s in systems]
+    misassigned = sum(
+        1 for i, s in enumerate(systems) if s.get("role") != ("primary" if i == 0 else "secondary")
+    )
+    return (
+        len(systems),
+        round(sum(weights), 2),
+        sum(len(f"{w:g}") for w in weights),
+        misassigned,
+        weights != sorted(weights, reverse=True),
+    )
+
+
+def _shrink_candidates(systems: List[Dict]):
+    for i in range(len(systems)):
+        yield systems[:i] + systems[i + 1:]
+    for i, entry in enumerate(systems):
+        for weight in BOUNDARY_WEIGHTS + [round(0.1 * k, 1) for k in range(11)]:
+            if weight != entry["weight"]:
+                yield systems[:i] + [dict(entry, weight=weight)] + systems[i + 1:]
+    reordered = sorted(systems, key=lambda s: -s["weight"])
+    yield [dict(s, role="primary" if i == 0 else "secondary") for i, s in enumerate(reordered)]
+    yield [dict(s, role="primary" if i == 0 else "secondary") for i, s in enumerate(systems)]
+    yield reordered
+
+
+def shrink_line(systems: List[Dict], fails) -> List[Dict]:
+    """
+    Greedily shrink a failing line: take the first strictly cheaper
+    candidate (by _line_cost) that still fails, until none does.
+    """
+    current = systems
+    improved = True
+    while improved:
+        improved = False
+        cost = _line_cost(current)
+        for candidate in _shrink_candidates(current):
+            if _line_cost(candidate) < cost and fails(candidate):
+                current = candidate
+                improved = True
+                break
+    return current
+
+
+def fuzz(cases: int, seed: int = 0, batch_size: int = 6144, targets: Dict = None,
+         max_failures: int = 5) -> Dict:
+    """
+    Check targets against oracle_violations on generated lines.
+    
+    Args:
+        cases: Number of lines to generate
+        seed: Random seed (runs are reproducible)
+        batch_size: Lines per batch handed to each target
+        targets: name -> function(list of lines) -> list of violated rule sets
+            (default: FUZZ_TARGETS)
+        max_failures: Stop after this many distinct shrunk failures
+    
+    Returns:
+        Dict with cases, seconds, rule_hits (oracle violations per rule)
+        and failures (target, original, shrunk, expected, got)
+    """
+    targets = targets or FUZZ_TARGETS
+    rng = random.Random(seed)
+    rule_hits = defaultdict(int)
+    failures = []
+    seen = set()
+    done = 0
+    start = time.perf_counter()
+    
+    while done < cases and len(failures) < max_failures:
+        lines = [random_line(rng) for _ in range(min(batch_size, cases - done))]
+        expected = [oracle_violations(systems) for systems in lines]
+        for violated in expected:
+            for rule in violated:
+                rule_hits[rule] += 1
+        
+        for name, target in targets.items():
+            for systems, want, got in zip(lines, expected, target(lines)):
+                if got == want:
+                    continue
+                fails = lambda candidate, target=target: target([candidate])[0] != oracle_violations(candidate)
+                shrunk = shrink_line(systems, fails)
+                key = (name, json.dumps(shrunk, sort_keys=True))
+                if key in seen:
+                    continue
+                seen.add(key)
+                failures.append({
+                    "target": name,
+                    "original": systems,
+                    "shrunk": shrunk,
+                    "expected": sorted(oracle_violations(shrunk)),
+                    "got": sorted(target([shrunk])[0]),
+                })
+                if len(failures) >= max_failures:
+                    break
+        done += len(lines)
+    
+    return {
+        "cases": done,
+        "seconds": time.perf_counter() - start,
+        "rule_hits": dict(sorted(rule_hits.items())),
+        "failures": failures,
+    }
+
+
+def run_generative(cases: int, seed: int, batch_size: int, target_names: List[str]) -> int:
+    """Run fuzz() and print throughput, rule coverage and shrunk failures."""
+    targets = {name: FUZZ_TARGETS[name] for name in target_names}
+    print(f"Generating {cases} line(s) (seed {seed}, batches of {batch_size}) against: {', '.join(targets)}")
+    print()
+    
+    result = fuzz(cases, seed, batch_size, targets)
+    
+    rate = result["cases"] / result["seconds"] * 60 if result["seconds"] else 0.0
+    print(f"Checked {result['cases']} line(s) in {result['seconds']:.2f}s ({rate:,.0f} lines/minute)")
+    print()
+    print("Oracle violations by rule:")
+    for rule, hits in result["rule_hits"].items():
+        print(f"  {rule}: {hits}")
+    print()
+    
+    if not result["failures"]:
+        print("✓ All targets agree with the oracle")
+        return 0
+    
+    print(f"✗ {len(result['failures'])} disagreement(s) with the oracle (shrunk):")
+    for failure in result["failures"]:
+        print()
+        print(f"  target: {failure['target']}")
+        print(f"  line: {json.dumps(failure['shrunk'], ensure_ascii=False)}")
+        print(f"  expected: {failure['expected']}")
+        print(f"  got: {failure['got']}")
+    return 1
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -327,9 +609,37 @@ def main():
         type=str,
         help="Output file for report (default: print to stdout)"
     )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        metavar="CASES",
+        help="Instead of replaying star maps, check CASES generated lines against the reference oracle"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for --generate (default: 0)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=6144,
+        help="Generated lines per batch (default: 6144)"
+    )
+    parser.add_argument(
+        "--target",
+        choices=sorted(FUZZ_TARGETS) + ["all"],
+        default="all",
+        help="Validator to check with --generate: tensor (weight_tensor), rules (validate_gate_outputs) or all"
+    )
     
     args = parser.parse_args()
     
+    if args.generate is not None:
+        target_names = sorted(FUZZ_TARGETS) if args.target == "all" else [args.target]
+        return run_generative(args.generate, args.seed, args.batch_size, target_names)
+    
     # Determine which gates to test
     if args.gates:
         gates_to_test = [g.strip().zfill(2) for g in args.gates.split(",")]
@@ -348,9 +658,9 @@ def main():
     tested_gates = []
     skipped_gates = []
     
-    for gate_num in gates_to_test:
-        result = tester.test_gate(gate_num)
-        
+    results = tester.test_gates(gates_to_test)
+    
+    for gate_num, result in results.items():
         if result["status"] == "skipped":
             skipped_gates.append(gate_num)
             print(f"Gate {gate_num}: SKIPPED ({result['reason']})")
@@ -366,6 +676,8 @@ def main():
     if skipped_gates:
         print(f"Skipped {len(skipped_gates)} gate(s): {', '.join(skipped_gates)}")
         print()
+    print(f"Checked {tester.lines_checked} line(s) in {tester.check_seconds * 1000:.2f} ms")
+    print()
     
     # Generate report
     report = tester.generate_report(tested_gates)
@@ -19,6 +19,10 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+# Shared gate/hexagram loaders live with the lore-research pipeline scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "lore-research" / "scripts"))
+from gate_corpus import get_corpus
+
 
 def load_json_file(file_path: Path) -> Optional[dict]:
     """
@@ -34,8 +38,8 @@ def load_json_file(file_path: Path) -> Optional[dict]:
         return None
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Memoized: the baseline file is shared by every gate
+        return get_corpus().load_json(file_path)
     except json.JSONDecodeError as e:
         print(f"ERROR: Invalid JSON in {file_path}: {e}", file=sys.stderr)
         return None
@@ -139,7 +143,7 @@ def pack_gate_prompt(gate_num: int, project_root: Path) -> tuple[bool, Optional[
     if baseline_data is None:
         return False, None, f"Failed to load baseline file: {baseline_path}"
     
-    # Load gate file (Line Companion)
+    # Load gate file (Line Companion); memoized through load_json_file
     gate_path = project_root / "claude" / "Full Pass" / f"gate-{gate_num}-full.json"
     gate_data = load_json_file(gate_path)
     if gate_data is None:
@@ -234,6 +238,7 @@ def main():
     print(f"Total gates processed: {len(gate_nums)}")
     print(f"Successfully packed: {success_count}")
     print(f"Failed: {error_count}")
+    print(get_corpus().format_stats())
     print()
     
     if errors:
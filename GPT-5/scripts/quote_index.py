@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Token-shingle inverted index for verbatim quote lookups.
+
+verify_quotes.py used to normalize every line of a source for every quote
+and test ``quote in line`` one line at a time. QuoteIndex normalizes each
+source document once, indexes its whitespace tokens (unigrams and k-token
+shingles), and answers a lookup with a few hash probes plus a substring
+check on the surviving candidates only.
+
+Why the probes never miss a match: after normalization, tokens are
+separated by single spaces. If a quote "t0 t1 ... tn" occurs in a document,
+every interior token t1..t(n-1) is bounded by spaces on both sides, so it is
+a whole document token, and consecutive interior tokens are consecutive
+document tokens. Only t0 and tn may be partial (a suffix or a prefix of a
+document token). Every document containing the quote therefore contains all
+interior shingles, and the substring check on the candidates gives exactly
+the old ``normalized_quote in normalized_doc`` result. Quotes with no
+interior token (one or two tokens) fall back to a substring scan of the
+documents in scope.
+
+Documents are keyed by (gate, line); line may be None (e.g. the Legge
+full_text). Lookups return the first matching key in insertion order, either
+within one gate or across the whole corpus.
+
+Usage:
+    index = QuoteIndex(normalize_text)
+    index.add((1, 3), line_text)
+    index.find(quote, gate=1)          # -> (1, 3) or None
+    index.find(quote)                  # any gate
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+Key = Tuple[int, Optional[int]]
+
+
+class QuoteIndex:
+    """Inverted index of normalized token shingles over (gate, line) documents."""
+
+    def __init__(self, normalize: Optional[Callable[[str], str]] = None, shingle: int = 2):
+        """
+        Initialize index.
+
+        Args:
+            normalize: Text normalizer applied to documents and quotes
+                (must collapse whitespace to single spaces)
+            shingle: Tokens per shingle for multi-token probes (>= 2)
+        """
+        if shingle < 2:
+            raise ValueError("shingle must be at least 2")
+        self.normalize = normalize or (lambda text: " ".join(text.split()))
+        self.shingle = shingle
+        self.keys: List[Key] = []
+        self.texts: List[str] = []
+        self._postings: Dict[Hashable, List[int]] = {}
+        self._gate_docs: Dict[int, List[int]] = {}
+        self.probes = 0
+        self.verifications = 0
+        self.scans = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: Key, text: str, normalized: bool = False) -> int:
+        """
+        Normalize and index one document; returns its id.
+
+        Pass normalized=True for text already run through the normalizer
+        (e.g. copied from another index's ``texts``) to skip normalizing again.
+        """
+        doc_id = len(self.keys)
+        normalized = (text or "") if normalized else self.normalize(text or "")
+        self.keys.append(key)
+        self.texts.append(normalized)
+        self._gate_docs.setdefault(key[0], []).append(doc_id)
+
+        tokens = normalized.split(" ") if normalized else []
+        seen = set()
+        for i, token in enumerate(tokens):
+            grams = [token]
+            if i + self.shingle <= len(tokens):
+                grams.append(tuple(tokens[i:i + self.shingle]))
+            for gram in grams:
+                if gram not in seen:
+                    seen.add(gram)
+                    self._postings.setdefault(gram, []).append(doc_id)
+        return doc_id
+
+    def _probe_grams(self, tokens: List[str]) -> List[Hashable]:
+        """Interior unigrams/shingles every matching document must contain."""
+        interior = tokens[1:-1]
+        if len(interior) >= self.shingle:
+            return [tuple(interior[i:i + self.shingle]) for i in range(len(interior) - self.shingle + 1)]
+        return interior
+
+    def candidates(self, normalized_quote: str, gate: Optional[int] = None) -> List[int]:
+        """Document ids (in insertion order) that may contain the quote."""
+        tokens = normalized_quote.split(" ") if normalized_quote else []
+        grams = self._probe_grams(tokens)
+        if not grams:
+            self.scans += 1
+            return list(self._gate_docs.get(gate, [])) if gate is not None else list(range(len(self.keys)))
+
+        postings = []
+        for gram in grams:
+            self.probes += 1
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        shortest = postings[0]
+        if gate is not None:
+            shortest = [d for d in shortest if self.keys[d][0] == gate]
+        if len(postings) == 1:
+            return shortest
+        others = [set(p) for p in postings[1:3]]
+        return [d for d in shortest if all(d in s for s in others)]
+
+    def find_all(self, quote: str, gate: Optional[int] = None) -> List[Key]:
+        """Keys of every document (in insertion order) containing the quote verbatim."""
+        normalized_quote = self.normalize(quote)
+        found = []
+        for doc_id in self.candidates(normalized_quote, gate):
+            self.verifications += 1
+            if normalized_quote in self.texts[doc_id]:
+                found.append(self.keys[doc_id])
+        return found
+
+    def find(self, quote: str, gate: Optional[int] = None) -> Optional[Key]:
+        """Key of the first document containing the quote verbatim, or None."""
+        normalized_quote = self.normalize(quote)
+        for doc_id in self.candidates(normalized_quote, gate):
+            self.verifications += 1
+            if normalized_quote in self.texts[doc_id]:
+                return self.keys[doc_id]
+        return None
+
+    def format_stats(self) -> str:
+        return (
+            f"{len(self.keys)} documents, {len(self._postings)} index terms; "
+            f"{self.probes} probes, {self.verifications} verifications, {self.scans} scans"
+        )
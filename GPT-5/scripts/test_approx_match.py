@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test the bit-parallel approximate quote locator and its verify_quotes hints.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from approx_match import ApproxLocator, align, myers_scan
+from quote_index import QuoteIndex
+from verify_quotes import error_record, normalize_text, validate_legge_quote
+
+
+def edit_table(pattern: str, text: str, free_start: bool):
+    """
+    Bottom DP row: distance of pattern to text[:j], or with free_start
+    (first row all zeros) to the best substring ending at j.
+    """
+    row = list(range(len(pattern) + 1))
+    last = [row[-1]]
+    for j, char in enumerate(text, 1):
+        cur = [0 if free_start else j]
+        for i, p in enumerate(pattern, 1):
+            cur.append(min(row[i] + 1, cur[i - 1] + 1, row[i - 1] + (p != char)))
+        row = cur
+        last.append(row[-1])
+    return last
+
+
+def levenshtein(a: str, b: str) -> int:
+    return edit_table(a, b, free_start=False)[-1]
+
+
+def test_myers_matches_dynamic_programming():
+    """Myers scans agree with plain edit-distance DP on random strings."""
+    rng = random.Random(17)
+    for _ in range(150):
+        pattern = "".join(rng.choice("ab c") for _ in range(rng.randint(1, 70)))
+        text = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 90)))
+        search = edit_table(pattern, text, free_start=True)
+        anchored = edit_table(pattern, text, free_start=False)
+        assert myers_scan(pattern, text) == min((d, j) for j, d in enumerate(search)), (pattern, text)
+        assert myers_scan(pattern, text, anchored=True) == min((d, j) for j, d in enumerate(anchored))
+        distance, start, end = align(pattern, text)
+        if distance < len(pattern):
+            assert levenshtein(pattern, text[start:end]) == distance
+    print("✓ Myers scans match dynamic programming")
+
+
+def test_locator_finds_ocr_damaged_quotes():
+    """OCR-damaged quotes resolve to the right line within the error budget."""
+    index = QuoteIndex(normalize_text)
+    index.add((1, 1), "In the first line, undivided, we see its subject as the dragon lying hid in the deep.")
+    index.add((1, 2), "In the second line, undivided, we see its subject as the dragon appearing in the field.")
+    index.add((1, None), "Khien represents what is great and originating, penetrating, advantageous, correct and firm.")
+    locator = ApproxLocator(index)
+
+    match = locator.find("the dragon appear1ng in the fie1d")
+    assert match.key == (1, 2) and match.distance == 2
+    assert match.text == "the dragon appearing in the field" and match.similarity == 0.939
+
+    match = locator.find("Khien represents what is great , and originating")
+    assert match.key == (1, None) and match.distance == 2
+
+    assert locator.find("the tiger crouching in the mountain pass") is None
+    assert locator.find("the dragon appear1ng in the fie1d", max_errors=1) is None
+    assert locator.find("dragon lying hid", gate=2) is None
+    assert locator.windows > 0
+    print("✓ locator finds OCR-damaged quotes")
+
+
+def test_not_found_errors_carry_closest_match():
+    """Not-found errors name the closest line, and the report record parses it."""
+    legge_data = {"gate": 1, "lines": [{"line": 4, "legge_line_text": "as if he were leaping up, but still in the deep"}]}
+    errors = validate_legge_quote(
+        "as if he were 1eaping up, but still in the deep", "Hex 1, Line 4", "01.4", "Lyra", 0.3, legge_data,
+        max_error_rate=0.15
+    )
+    assert errors == [
+        "01.4 (Lyra, Legge): Quote not found verbatim in source: Legge Hex 1, Line 4; "
+        "closest match in Line 4 (1 edit(s), similarity 0.979): \"as if he were leaping up, but still in the deep\""
+    ]
+    record = error_record(1, errors[0])
+    assert record["kind"] == "quote_not_found"
+    assert record["closest"] == {
+        "line": 4, "distance": 1, "similarity": 0.979, "text": "as if he were leaping up, but still in the deep"
+    }
+
+    errors = validate_legge_quote("as if he were 1eaping up", "Hex 1, Line 4", "01.4", "Lyra", 0.3, legge_data)
+    assert errors == ["01.4 (Lyra, Legge): Quote not found verbatim in source: Legge Hex 1, Line 4"]
+    assert error_record(1, errors[0])["closest"] is None
+    print("✓ not-found errors carry the closest match")
+
+
+if __name__ == "__main__":
+    test_myers_matches_dynamic_programming()
+    test_locator_finds_ocr_damaged_quotes()
+    test_not_found_errors_carry_closest_match()
+
+    print()
+    print("✓ All tests passed!")
@@ -8,7 +8,16 @@ Tests the invariant testing logic with synthetic data.
 import json
 import sys
 from pathlib import Path
-from fuzz_invariants import InvariantTester
+from fuzz_invariants import (
+    BOUNDARY_WEIGHTS,
+    CANONICAL_SYSTEMS,
+    PAIRWISE_EXCLUSIONS,
+    InvariantTester,
+    fuzz,
+    oracle_violations,
+    random_line,
+    shrink_line,
+)
 
 
 def test_pleiades_draco_exclusion():
@@ -158,6 +167,67 @@ def test_lyra_draco_exclusion():
     print("✓ Lyra/Draco exclusion tests passed")
 
 
+def test_generator_hits_boundaries():
+    """Test the generator favours thresholds, caps and their neighbours."""
+    import random
+    
+    for weight in (0.35, 0.36, 0.59, 0.6, 0.61):
+        assert weight in BOUNDARY_WEIGHTS, f"{weight} missing from boundary weights"
+    
+    rng = random.Random(3)
+    lines = [random_line(rng) for _ in range(5000)]
+    weights = [s["weight"] for line in lines for s in line]
+    assert weights.count(0.6) > 100 and weights.count(0.36) > 100
+    clean = [random_line(rng, malformed_rate=0.0) for _ in range(1000)]
+    assert all(len({s["star_system"] for s in line}) == len(line) for line in clean)
+    
+    # Malformed inputs: unknown or mis-cased names, duplicates, missing roles, zero weights
+    entries = [s for line in lines for s in line]
+    assert any(s["star_system"] not in CANONICAL_SYSTEMS for s in entries)
+    assert any(len({s["star_system"] for s in line}) < len(line) for line in lines)
+    assert any("role" not in s for s in entries)
+    assert weights.count(0.0) > 100
+    
+    hits = {rule for line in lines for rule in oracle_violations(line)}
+    assert hits == {f"{a}/{b}" for a, b, _, _ in PAIRWISE_EXCLUSIONS} | {"Orion Light/Orion Dark", "Top-2"}
+    
+    print("✓ Generator boundary tests passed")
+
+
+def test_targets_agree_with_oracle():
+    """Test the tensor and rule-engine validators against the oracle."""
+    result = fuzz(30000, seed=11)
+    assert result["cases"] == 30000
+    assert result["failures"] == [], result["failures"][:1]
+    
+    print("✓ Targets agree with the oracle")
+
+
+def test_failures_are_shrunk():
+    """Test a validator with an off-by-one Sirius threshold is caught and shrunk."""
+    buggy_rules = [
+        ("Sirius", "Orion Light", 0.61, 0.35) if rule[0] == "Sirius" else rule
+        for rule in PAIRWISE_EXCLUSIONS
+    ]
+    buggy = lambda lines: [oracle_violations(line, exclusions=buggy_rules) for line in lines]
+    
+    result = fuzz(20000, seed=5, targets={"buggy": buggy}, max_failures=1)
+    assert len(result["failures"]) == 1
+    failure = result["failures"][0]
+    assert failure["shrunk"] == [
+        {"star_system": "Sirius", "weight": 0.6, "role": "primary"},
+        {"star_system": "Orion Light", "weight": 0.36, "role": "secondary"},
+    ], failure["shrunk"]
+    assert failure["expected"] == ["Sirius/Orion Light"] and failure["got"] == []
+    
+    # Shrinking keeps the failure and never grows the line
+    fails = lambda line: buggy([line])[0] != oracle_violations(line)
+    assert fails(failure["original"]) and len(failure["shrunk"]) <= len(failure["original"])
+    assert shrink_line(failure["shrunk"], fails) == failure["shrunk"]
+    
+    print("✓ Failure shrinking tests passed")
+
+
 def main():
     """Run all tests."""
     print("Running invariant fuzz tester unit tests...")
@@ -170,6 +240,9 @@ def main():
         test_andromeda_orion_dark_exclusion()
         test_arcturus_pleiades_exclusion()
         test_lyra_draco_exclusion()
+        test_generator_hits_boundaries()
+        test_targets_agree_with_oracle()
+        test_failures_are_shrunk()
         
         print()
         print("=" * 80)
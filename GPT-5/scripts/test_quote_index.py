@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the quote shingle index and the cross-gate locator checks built on it.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import verify_quotes
+from quote_index import QuoteIndex
+from verify_quotes import normalize_text, validate_legge_quote, validate_line_companion_quote
+
+
+def test_index_matches_substring_scan():
+    """Index lookups agree with normalize-and-scan on random quotes, including partial tokens."""
+    rng = random.Random(15)
+    words = ["the", "dragon", "lying", "hid", "in", "deep", "‘great’", "man", "field", "self-control"]
+    docs = []
+    for gate in range(1, 5):
+        for line in range(1, 7):
+            docs.append(((gate, line), "  ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))))
+
+    index = QuoteIndex(normalize_text)
+    for key, text in docs:
+        index.add(key, text)
+
+    for _ in range(2000):
+        _, text = rng.choice(docs)
+        start = rng.randrange(len(text) + 1)
+        quote = text[start:start + rng.randint(1, 60)]
+        if rng.random() < 0.2:
+            quote += " " + rng.choice(words)
+        gate = rng.choice([None, 1, 2, 3, 4])
+        expected = [
+            key for key, text in docs
+            if (gate is None or key[0] == gate) and normalize_text(quote) in normalize_text(text)
+        ]
+        assert index.find_all(quote, gate) == expected, (quote, gate)
+        assert index.find(quote, gate) == (expected[0] if expected else None)
+
+    assert index.probes > 0 and index.scans > 0
+    print("✓ index matches substring scan")
+
+
+def test_probes_skip_unrelated_documents():
+    """A long quote is only verified against documents holding its interior shingles."""
+    index = QuoteIndex(normalize_text)
+    for line in range(1, 7):
+        index.add((1, line), f"filler text number {line} about nothing in particular")
+    index.add((2, 3), "It will be advantageous to meet with the great man.")
+
+    assert index.find("be advantageous to meet with the great") == (2, 3)
+    assert index.verifications == 1
+    assert index.find("advantageous to meet with the great", gate=1) is None
+    assert index.find("to meet the great man") is None
+    print("✓ probes skip unrelated documents")
+
+
+def test_cross_gate_locator_checks():
+    """Quotes found under another gate report a gate mismatch instead of 'not found'."""
+    legge_corpus = QuoteIndex(normalize_text)
+    legge_corpus.add((1, 2), "the dragon appearing in the field")
+    legge_corpus.add((2, 5), "the yellow lower garment")
+    lc_corpus = QuoteIndex(normalize_text)
+    lc_corpus.add((1, 1), "Time is everything")
+    lc_corpus.add((7, 4), "Love is light")
+    verify_quotes._CORPUS_INDEXES.update({"legge": legge_corpus, "line_companion": lc_corpus})
+    try:
+        legge_data = {"gate": 1, "lines": [{"line": 2, "legge_line_text": "the dragon appearing in the field"}]}
+        errors = validate_legge_quote("the yellow lower garment", "Hex 1, Line 2", "01.2", "Sirius", 0.3, legge_data, True)
+        assert errors == ["01.2 (Sirius, Legge): Locator gate mismatch: expected Hex 01 Line 2, but quote found in Hex 02 Line 5"]
+        errors = validate_legge_quote("the yellow lower garment", "Hex 1, Line 2", "01.2", "Sirius", 0.3, legge_data)
+        assert errors[0].endswith("Quote not found verbatim in source: Legge Hex 1, Line 2")
+
+        lc_data = {"gate": 1, "lines": [{"line": 1, "full_text": "Time is everything"}]}
+        errors = validate_line_companion_quote("Love is light", "Gate 1, Line 1", "01.1", "Lyra", lc_data, True)
+        assert errors == ["01.1 (Lyra, Line Companion): Locator gate mismatch: expected Gate 1, but quote found in Gate 7"]
+        assert validate_line_companion_quote("Time is everything", "Gate 1, Line 1", "01.1", "Lyra", lc_data, True) == []
+    finally:
+        verify_quotes._CORPUS_INDEXES.clear()
+    print("✓ cross-gate locator checks")
+
+
+if __name__ == "__main__":
+    test_index_matches_substring_scan()
+    test_probes_skip_unrelated_documents()
+    test_cross_gate_locator_checks()
+
+    print()
+    print("✓ All tests passed!")
@@ -23,6 +23,14 @@ from validate_gate_outputs import (
     validate_sorting,
     validate_sparse_format,
     validate_sum_unorm,
+    validate_gate,
+    build_report,
+    build_junit,
+    run_rules,
+    GateFile,
+    RULES,
+    RULES_BY_NAME,
+    SCHEMA_RULES,
     CANONICAL_SYSTEMS
 )
 
@@ -402,6 +410,98 @@ def test_sorting():
     print("  ✓ Sorting and tie-breaking tests passed")
 
 
+def test_rule_engine():
+    """Test the single-walk rule engine against the per-rule validators."""
+    print("Testing rule engine...")
+    
+    weights = {
+        "_meta": {"gate": "01", "sum_unorm": 1.0, "baseline_beacon": "59bfc617"},
+        "01.2": [
+            {"star_system": "Pleiades", "weight": 0.75, "role": "primary", "polarity": "core"},
+            {"star_system": "Draco", "weight": 0.0, "role": "secondary"}
+        ],
+        "01.1": [
+            {"star_system": "lyra", "weight": 0.555, "role": "primary"}
+        ],
+        "01.7": "not an array"
+    }
+    evidence = {"_meta": {"baseline_beacon": "59bfc617"}}
+    rules = [rule for rule in RULES if rule.name not in SCHEMA_RULES]
+    errors, seconds = run_rules(GateFile(weights, evidence, "59bfc617"), rules)
+    
+    assert list(errors) == [rule.name for rule in rules]
+    assert list(seconds) == list(errors) and all(t >= 0 for t in seconds.values())
+    assert errors["top2"] == validate_top2_constraint(weights)
+    assert "Expected array" in errors["top2"][0]
+    assert errors["pairwise_exclusions"] == []  # Draco weight is 0
+    assert errors["legge_gating"] == validate_legge_gating(weights, evidence)
+    assert len(errors["legge_gating"]) == 2
+    assert errors["canonical_names"] == validate_canonical_names(weights)
+    assert "should be 'Lyra'" in errors["canonical_names"][0]
+    assert errors["key_format"] == ["Invalid line number in '01.7' (must be 1-6, got '7')"]
+    assert errors["sorting"][0].startswith("Line keys not sorted")
+    assert errors["sparse_format"] == validate_sparse_format(weights)
+    assert errors["sum_unorm"] == validate_sum_unorm(weights)
+    assert errors["beacon_match"] == []
+    
+    print("  ✓ Rule engine tests passed")
+
+
+def test_file_order_rules():
+    """Key format and sorting errors follow file order; an empty sum prints as 0.0."""
+    print("Testing file-order rules...")
+    
+    unsorted = [
+        {"star_system": "Lyra", "weight": 0.2, "role": "secondary"},
+        {"star_system": "Sirius", "weight": 0.6, "role": "primary"}
+    ]
+    weights = {"_meta": {"gate": "01", "sum_unorm": 1.0}, "01.9": unsorted, "01.0": unsorted}
+    errors, _ = run_rules(GateFile(weights, {}, "59bfc617"), [RULES_BY_NAME["key_format"], RULES_BY_NAME["sorting"]])
+    assert [e.split("'")[1] for e in errors["key_format"]] == ["01.9", "01.0"]
+    assert [e[:4] for e in errors["sorting"][1:]] == ["01.9", "01.0"]
+    
+    assert validate_sum_unorm({"_meta": {"sum_unorm": 1.0}}) == [
+        "sum_unorm mismatch: declared 1.0, but sum of all weights = 0.0"
+    ]
+    
+    print("  ✓ File-order rule tests passed")
+
+
+def test_batch_report():
+    """Test batch results and the JSON/JUnit reports."""
+    print("Testing batch reports...")
+    
+    results = [validate_gate(1, schemas=False), validate_gate(2, schemas=False)]
+    assert results[0]["status"] == "passed", results[0]["errors"]
+    assert set(results[0]["rules"]).isdisjoint(SCHEMA_RULES)
+    assert results[1]["status"] == "error"  # no Gate 02 star map
+    
+    results.append({
+        "gate": 3, "status": "failed", "errors": ["03.1: Top-2 violation - found 3 systems (max 2)"],
+        "load_error": None, "seconds": 0.002,
+        "rules": {"top2": {"errors": ["03.1: Top-2 violation - found 3 systems (max 2)"], "seconds": 0.001}},
+    })
+    report = build_report(results, 0.01, 1, "59bfc617")
+    assert report["summary"]["passed"] == 1
+    assert report["summary"]["failed"] == 1
+    assert report["summary"]["load_errors"] == 1
+    assert report["errors"] == [{
+        "gate": 3, "rule": "top2", "line_key": "03.1",
+        "message": "03.1: Top-2 violation - found 3 systems (max 2)"
+    }]
+    top2 = next(total for total in report["rules"] if total["rule"] == "top2")
+    assert top2["failed_gates"] == 1 and top2["errors"] == 1
+    
+    junit = build_junit(results, 0.01)
+    suites = junit.findall("testsuite")
+    assert [suite.get("name") for suite in suites] == ["Gate01", "Gate02", "Gate03"]
+    assert suites[1].find("testcase/error") is not None
+    assert suites[2].find("testcase/failure").text.startswith("03.1:")
+    assert junit.get("failures") == "1" and junit.get("errors") == "1"
+    
+    print("  ✓ Batch report tests passed")
+
+
 def main():
     """Run all tests."""
     print("Running validation tests...\n")
@@ -415,6 +515,9 @@ def main():
         test_sum_unorm()
         test_weight_precision()
         test_sorting()
+        test_rule_engine()
+        test_file_order_rules()
+        test_batch_report()
         
         print("\n✓ All validation tests PASSED")
         return 0
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the compiled-schema batch validation in validate_schemas.py.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validate_schemas import (
+    discover_files, format_result, jsonschema, load_validator, summary_table,
+    validate_batch, validate_file,
+)
+from validate_gate_outputs import SCHEMA_PATHS
+
+
+class ErrorsAt:
+    """Validator double: one error per missing required key, reported in reverse order."""
+
+    class Error:
+        def __init__(self, message, path):
+            self.message = message
+            self.path = path
+
+    def __init__(self, required):
+        self.required = required
+
+    def iter_errors(self, data):
+        for key in reversed(self.required):
+            if key not in data:
+                yield self.Error(f"'{key}' is a required property", [key] if key != "_meta" else [])
+
+
+def test_all_errors_reported():
+    validator = ErrorsAt(["_meta", "01.1", "01.2"])
+    valid, errors = validate_file({}, validator, "Weights")
+    assert not valid
+    assert errors == [
+        "Weights validation error: '_meta' is a required property",
+        "Weights validation error: '01.1' is a required property",
+        "  Path: 01.1",
+        "Weights validation error: '01.2' is a required property",
+        "  Path: 01.2",
+    ]
+    assert validate_file({"_meta": {}, "01.1": [], "01.2": []}, validator, "Weights") == (True, [])
+    print("✓ all errors reported, in path order")
+
+
+def test_array_indices_sort_numerically():
+    class Indexed:
+        def iter_errors(self, data):
+            for path in (["01.1", 10, "weight"], ["01.1", 2, "weight"], ["01.1", "x"], ["01.1", 2, "role"]):
+                yield ErrorsAt.Error("bad", path)
+
+    _, errors = validate_file({}, Indexed(), "Weights")
+    assert [e for e in errors if e.startswith("  Path")] == [
+        "  Path: 01.1 -> 2 -> role",
+        "  Path: 01.1 -> 2 -> weight",
+        "  Path: 01.1 -> 10 -> weight",
+        "  Path: 01.1 -> x",
+    ]
+    print("✓ array indices sort numerically")
+
+
+def test_batch_over_directories():
+    with tempfile.TemporaryDirectory() as tmp:
+        star_maps, evidence = Path(tmp) / "star-maps", Path(tmp) / "evidence"
+        star_maps.mkdir()
+        evidence.mkdir()
+        (star_maps / "gateLine_star_map_Gate03.json").write_text('{"01.1": []}')
+        (star_maps / "gateLine_star_map_Gate01.json").write_text('{"_meta": {}, "01.1": []}')
+        (evidence / "gateLine_evidence_Gate01.json").write_text("")
+
+        files = discover_files([("Weights", star_maps, "*.json"), ("Evidence", evidence, "*.json")])
+        assert [(t, p.name) for t, p in files] == [
+            ("Weights", "gateLine_star_map_Gate01.json"),
+            ("Weights", "gateLine_star_map_Gate03.json"),
+            ("Evidence", "gateLine_evidence_Gate01.json"),
+        ]
+
+        seen = []
+        validators = {"Weights": ErrorsAt(["_meta", "01.1"]), "Evidence": ErrorsAt(["_meta"])}
+        results = validate_batch(files, validators, on_result=seen.append)
+        assert seen == results
+        assert [(r.valid, r.error_count) for r in results] == [(True, 0), (False, 1), (False, 1)]
+        assert results[2].errors[0].startswith("Error loading evidence file:")
+        assert results[2].validate_seconds == 0.0
+
+        lines = format_result(results[1])
+        assert lines[0].startswith("✗ gateLine_star_map_Gate03.json") and lines[0].endswith("(1 errors)")
+        assert lines[1] == "    Weights validation error: '_meta' is a required property"
+
+        table = summary_table(results, compile_seconds=0.002).splitlines()
+        assert [row.split()[:5] for row in table[2:5]] == [
+            ["Weights", "2", "1", "1", "1"],
+            ["Evidence", "1", "0", "1", "1"],
+            ["Total", "3", "1", "2", "2"],
+        ]
+        assert table[-1] == "Schema compilation: 2.00 ms (once per process)"
+    print("✓ batch over directories with summary table")
+
+
+def test_validators_compiled_once():
+    if jsonschema is None:
+        print("⚠ jsonschema not installed; skipping compiled schema check")
+        return
+    validator = load_validator(SCHEMA_PATHS["Weights"])
+    assert load_validator(SCHEMA_PATHS["Weights"]) is validator
+    assert type(validator).__name__.startswith("Draft")
+    print("✓ schemas compiled once into Draft validators")
+
+
+if __name__ == "__main__":
+    test_all_errors_reported()
+    test_array_indices_sort_numerically()
+    test_batch_over_directories()
+    test_validators_compiled_once()
+
+    print()
+    print("✓ All tests passed!")
@@ -9,7 +9,11 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import verify_quotes
 from verify_quotes import (
+    build_report,
+    error_record,
+    verify_gate,
     normalize_text,
     count_words,
     parse_legge_locator,
@@ -144,12 +148,55 @@ def test_find_quote_in_line_companion():
     print("✓ find_quote_in_line_companion tests passed")
 
 
+def test_batch_report():
+    """Test batch verification results and the JSON report records."""
+    legge_data = {"gate": 1, "lines": [{"line": 2, "legge_line_text": "The dragon appears in the field."}]}
+    lc_data = {"gate": 1, "lines": [{"line": 2, "full_text": "Time is everything"}]}
+    weights = {"01.2": [{"star_system": "Sirius", "weight": 0.8}, {"star_system": "Lyra", "weight": 0.9}]}
+    evidence = {"01.2": [
+        {"star_system": "Sirius", "sources": {
+            "legge1899": {"quote": "dragon appears in the field", "locator": "Hex 1, Line 2"},
+            "line_companion": {"quote": "Time is nothing", "locator": "Gate 1, Line 2"},
+        }},
+        {"star_system": "Lyra", "sources": {}},
+    ]}
+    
+    def fake_inputs(gate_num):
+        if gate_num == 2:
+            raise FileNotFoundError("no evidence for gate 2")
+        return weights, evidence, legge_data, lc_data
+    
+    original = verify_quotes.load_gate_inputs
+    verify_quotes.load_gate_inputs = fake_inputs
+    try:
+        results = [verify_gate(1, cross_gate=False), verify_gate(2, cross_gate=False)]
+    finally:
+        verify_quotes.load_gate_inputs = original
+    
+    assert results[0]["status"] == "failed" and len(results[0]["errors"]) == 2
+    assert results[1]["status"] == "error" and results[1]["load_error"] == "no evidence for gate 2"
+    
+    report = build_report(results, 0.5, cross_gate=False, jobs=1)
+    assert report["summary"]["gates"] == 2 and report["summary"]["failed"] == 1
+    assert report["summary"]["load_errors"] == 1 and report["summary"]["errors"] == 2
+    assert [g["status"] for g in report["gates"]] == ["failed", "error"]
+    assert [(e["line_key"], e["star_system"], e["source"], e["kind"]) for e in report["errors"]] == [
+        ("01.2", "Sirius", "Line Companion", "quote_not_found"),
+        ("01.2", "Lyra", None, "missing_legge_quote"),
+    ]
+    
+    assert error_record(3, "unparseable")["kind"] == "other"
+    
+    print("✓ batch report tests passed")
+
+
 if __name__ == "__main__":
     test_normalize_text()
     test_count_words()
     test_parse_locators()
     test_find_quote_in_legge()
     test_find_quote_in_line_companion()
+    test_batch_report()
     
     print()
     print("✓ All tests passed!")
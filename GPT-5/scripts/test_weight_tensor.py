@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the corpus weight tensor checks against the per-line invariant checks.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fuzz_invariants import ORION_FACTION_RULE, PAIRWISE_EXCLUSIONS, InvariantTester
+from validate_gate_outputs import CANONICAL_SYSTEMS, validate_sum_unorm, validate_top2_constraint
+from weight_tensor import LINES, WeightTensor, check_tensor
+
+WEIGHTS = [0.0, 0.05, 0.35, 0.36, 0.4, 0.59, 0.6, 0.61, 0.75, 0.9]
+
+
+def random_star_map(rng: random.Random, gate: str, messy: bool = False) -> dict:
+    """Random star map; messy adds mis-cased/unknown names and duplicated systems."""
+    names = CANONICAL_SYSTEMS + (["pleiades", "Vega"] if messy else [])
+    weights = {"_meta": {"gate": gate, "sum_unorm": 0.0}}
+    total = 0.0
+    for line in range(1, LINES + 1):
+        if rng.random() < 0.1:
+            continue
+        count = rng.choice([1, 2, 2, 2, 3])
+        systems = [rng.choice(names) for _ in range(count)] if messy else rng.sample(names, count)
+        entries = [
+            {"star_system": name, "weight": rng.choice(WEIGHTS), "role": rng.choice(["primary", "secondary"])}
+            for name in systems
+        ]
+        total += sum(entry["weight"] for entry in entries)
+        weights[f"{gate}.{line}"] = entries
+    weights["_meta"]["sum_unorm"] = round(total + rng.choice([0.0, 0.0, 0.5]), 2)
+    return weights
+
+
+def reference_messages(gate: str, weights: dict) -> list:
+    """Per-line checks, in gate/line/rule order, formatted like the tensor messages."""
+    tester = InvariantTester()
+    messages = []
+    top2 = validate_top2_constraint(weights)
+    for line_key in sorted(k for k in weights if k != "_meta"):
+        sys_weights = {s["star_system"]: s["weight"] for s in weights[line_key]}
+        for sys_a, sys_b, threshold_a, max_b in PAIRWISE_EXCLUSIONS:
+            passed, msg = tester.test_pairwise_exclusion(gate, line_key, sys_weights, sys_a, sys_b, threshold_a, max_b)
+            if not passed:
+                messages.append(msg)
+        passed, msg = tester.test_orion_faction_conflict(gate, line_key, sys_weights)
+        if not passed:
+            messages.append(msg)
+        messages.extend(f"Gate {gate}, {err}" for err in top2 if err.startswith(f"{line_key}:"))
+    messages.extend(f"Gate {gate}: {err}" for err in validate_sum_unorm(weights))
+    return messages
+
+
+def test_tensor_matches_per_line_checks():
+    rng = random.Random(22)
+    for _ in range(50):
+        corpus = {f"{g:02d}": random_star_map(rng, f"{g:02d}") for g in rng.sample(range(1, 65), 8)}
+        tensor = WeightTensor.from_weights(corpus)
+        violations, stats = check_tensor(tensor, PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+        expected = [msg for gate, weights in corpus.items() for msg in reference_messages(gate, weights)]
+        assert [v.message for v in violations] == expected
+        assert stats["Top-2"]["tested"] == sum(tensor.present)
+        assert stats["sum_unorm"]["tested"] == len(corpus)
+    print("✓ tensor checks match the per-line checks")
+
+
+def test_entries_as_written():
+    rng = random.Random(23)
+    for _ in range(50):
+        corpus = {f"{g:02d}": random_star_map(rng, f"{g:02d}", messy=True) for g in rng.sample(range(1, 65), 8)}
+        violations, _ = check_tensor(WeightTensor.from_weights(corpus), PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+        expected = [msg for gate, weights in corpus.items() for msg in reference_messages(gate, weights)]
+        assert [v.message for v in violations] == expected
+
+    weights = {
+        "_meta": {"gate": "07", "sum_unorm": 1.5},
+        "07.1": [{"star_system": "pleiades", "weight": 0.6, "role": "primary"}],
+        "07.2": [
+            {"star_system": "Pleiades", "weight": 0.6, "role": "primary"},
+            {"star_system": "Pleiades", "weight": 0.3, "role": "secondary"},
+        ],
+    }
+    violations, _ = check_tensor(WeightTensor.from_weights({"07": weights}), PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+    assert violations == []
+    print("✓ roles and sum_unorm count entries as written")
+
+
+def test_layout_and_unplaced_entries():
+    weights = {
+        "_meta": {"gate": "05"},
+        "05.2": [
+            {"star_system": "Sirius", "weight": 0.6, "role": "primary", "polarity": "core"},
+            {"star_system": "Orion-Light", "weight": 0.3, "role": "secondary"},
+        ],
+        "05.9": [],
+    }
+    tensor = WeightTensor.from_weights({"05": weights})
+    cell = (0 * LINES + 1) * len(CANONICAL_SYSTEMS) + CANONICAL_SYSTEMS.index("Sirius")
+    assert tensor.weights[cell] == 0.6 and tensor.roles[cell] == 1 and tensor.polarity[cell] == 1
+    assert list(tensor.present) == [0, 1, 0, 0, 0, 0] and tensor.listed[1] == 2
+    assert [(gate, key) for gate, key, _ in tensor.unplaced] == [("05", "05.2"), ("05", "05.9")]
+    assert list(tensor.column("Sirius")) == [0.0, 0.6, 0.0, 0.0, 0.0, 0.0]
+
+    violations, _ = check_tensor(tensor, PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+    assert [v.message for v in violations] == ["Gate 05: Missing sum_unorm in _meta block"]
+    assert violations[0].line_key is None
+    print("✓ tensor layout and unplaced entries")
+
+
+def test_full_corpus_in_milliseconds():
+    rng = random.Random(64)
+    corpus = {f"{g:02d}": random_star_map(rng, f"{g:02d}") for g in range(1, 65)}
+    tensor = WeightTensor.from_weights(corpus)
+    start = time.perf_counter()
+    check_tensor(tensor, PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.5, f"64-gate check took {elapsed:.3f}s"
+    print(f"✓ 64-gate corpus checked in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    test_tensor_matches_per_line_checks()
+    test_entries_as_written()
+    test_layout_and_unplaced_entries()
+    test_full_corpus_in_milliseconds()
+
+    print()
+    print("✓ All tests passed!")
@@ -9,38 +9,65 @@ This script enforces all structural and business rules for v4.2 scoring:
 - Role/polarity separation
 - Canonical ordering and formatting
 
+Every check is a Rule in the RULES registry. run_rules() builds each
+gate.line entry (system weight map, evidence by system) once, runs the
+file-level checks, then walks the lines once in key order and dispatches
+every line check, timing each rule. The weights/evidence JSON schemas are
+compiled into validators once per process.
+
+Batch mode (--all / --gates) validates many star-map/evidence pairs in one
+process, optionally across a worker pool, and can write a JSON report
+(--report) and a JUnit XML report (--junit) with per-rule timings.
+
 Usage:
     python validate_gate_outputs.py GATE_NUMBER
     python validate_gate_outputs.py 01
+    python validate_gate_outputs.py --all --jobs 4 --report gate-report.json --junit gate-report.xml
+    python validate_gate_outputs.py --gates 01-10
 """
 
 import argparse
 import json
+import multiprocessing
+import re
 import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from xml.etree import ElementTree
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
 except ImportError:
-    print("ERROR: jsonschema package not installed", file=sys.stderr)
-    print("Install with: pip install jsonschema", file=sys.stderr)
-    sys.exit(1)
+    jsonschema = None
+
+# Shared gate helpers live with the lore-research pipeline scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "lore-research" / "scripts"))
+from scoring_rules import load_scoring_rules
+from utils import map_gates, parse_gate_spec, parse_jobs
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
 
+SCHEMA_PATHS = {
+    "Weights": PROJECT_ROOT / "schemas" / "weights.schema.json",
+    "Evidence": PROJECT_ROOT / "schemas" / "evidence.schema.json",
+}
 
-CANONICAL_SYSTEMS = [
-    "Pleiades", "Sirius", "Lyra", "Andromeda",
-    "Orion Light", "Orion Dark", "Arcturus", "Draco"
-]
+DEFAULT_BEACON = "59bfc617"
 
-PAIRWISE_EXCLUSIONS = [
-    ("Pleiades", "Draco", 0.0, None),  # If Pleiades > 0 → Draco = 0
-    ("Sirius", "Orion Light", 0.60, 0.35),  # If Sirius ≥ 0.60 → Orion Light ≤ 0.35
-    ("Andromeda", "Orion Dark", 0.60, 0.0),  # If Andromeda ≥ 0.60 → Orion Dark = 0
-    ("Arcturus", "Pleiades", 0.0, 0.0),  # If Arcturus > 0 → Pleiades = 0
-    ("Lyra", "Draco", 0.0, None),  # If Lyra > 0 → Draco = 0
-]
+# Canonical names, pairwise exclusions (system_a, system_b, threshold_a, max_b)
+# and the Orion faction rule (light, dark, threshold) come from
+# s3-data/pipeline_rules/scoring_invariants.v1.json
+SCORING_RULES = load_scoring_rules()
+CANONICAL_SYSTEMS = SCORING_RULES.canonical_systems
+PAIRWISE_EXCLUSIONS = SCORING_RULES.pairwise_exclusions
+ORION_FACTION_RULE = SCORING_RULES.orion_faction_rule
+
+# Line-key prefix of a line-level error message ("01.3: ...")
+LINE_KEY_RE = re.compile(r"^(\d{2}\.\d): ")
 
 
 class ValidationError(Exception):
@@ -56,408 +83,752 @@ def load_json(path: Path) -> Dict:
         return json.load(f)
 
 
-def validate_schema(data: Dict, schema: Dict, file_type: str) -> List[str]:
-    """Validate against JSON schema."""
+# ----------------------------------------------------------------------
+# Schema validators
+# ----------------------------------------------------------------------
+
+# Compiled validators keyed by file type ("Weights", "Evidence"), built once per process
+_SCHEMA_VALIDATORS: Dict[str, Any] = {}
+
+
+def compile_schema(schema: Dict) -> Any:
+    """
+    Build a validator for a JSON schema (the draft named by its $schema).
+    
+    Raises:
+        RuntimeError: If jsonschema is not installed
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    if jsonschema is None:
+        raise RuntimeError("jsonschema package not installed (pip install jsonschema)")
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def schema_validators() -> Dict[str, Any]:
+    """Compiled weights/evidence validators for SCHEMA_PATHS, compiled on first use."""
+    if not _SCHEMA_VALIDATORS:
+        for file_type, path in SCHEMA_PATHS.items():
+            _SCHEMA_VALIDATORS[file_type] = compile_schema(load_json(path))
+    return _SCHEMA_VALIDATORS
+
+
+def validate_schema(data: Dict, schema: Any, file_type: str) -> List[str]:
+    """Validate against a JSON schema (a schema dict or a compile_schema validator)."""
     errors = []
-    try:
-        jsonschema.validate(instance=data, schema=schema)
-    except jsonschema.ValidationError as e:
-        errors.append(f"{file_type} schema validation failed: {e.message}")
-        if e.path:
-            errors.append(f"  Path: {' -> '.join(str(p) for p in e.path)}")
+    validator = compile_schema(schema) if isinstance(schema, dict) else schema
+    # Report the same single error jsonschema.validate would raise
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        errors.append(f"{file_type} schema validation failed: {error.message}")
+        if error.path:
+            errors.append(f"  Path: {' -> '.join(str(p) for p in error.path)}")
     return errors
 
 
-def validate_top2_constraint(weights: Dict) -> List[str]:
-    """Enforce top-2 constraint: exactly 1 primary, optional 1 secondary per line."""
-    errors = []
+# ----------------------------------------------------------------------
+# Gate files and lines
+# ----------------------------------------------------------------------
+
+class GateLine:
+    """One gate.line entry of a weights file, with the lookups every rule shares."""
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
-        
-        if not isinstance(systems, list):
-            errors.append(f"{line_key}: Expected array, got {type(systems).__name__}")
-            continue
-        
-        if len(systems) > 2:
-            errors.append(f"{line_key}: Top-2 violation - found {len(systems)} systems (max 2)")
-            continue
-        
-        # Count roles
-        primary_count = sum(1 for s in systems if s.get("role") == "primary")
-        secondary_count = sum(1 for s in systems if s.get("role") == "secondary")
-        
-        if primary_count != 1:
-            errors.append(f"{line_key}: Must have exactly 1 primary, found {primary_count}")
-        
-        if secondary_count > 1:
-            errors.append(f"{line_key}: Must have ≤1 secondary, found {secondary_count}")
-        
-        # Verify primary has highest weight
-        if len(systems) == 2:
-            primary_sys = next((s for s in systems if s.get("role") == "primary"), None)
-            secondary_sys = next((s for s in systems if s.get("role") == "secondary"), None)
-            
-            if primary_sys and secondary_sys:
-                if primary_sys["weight"] <= secondary_sys["weight"]:
-                    errors.append(
-                        f"{line_key}: Primary weight ({primary_sys['weight']}) must be > "
-                        f"secondary weight ({secondary_sys['weight']})"
-                    )
+    __slots__ = ("key", "systems", "is_list", "weights", "evidence")
     
-    return errors
+    def __init__(self, key: str, systems: Any, evidence_entries: Any):
+        self.key = key
+        self.systems = systems
+        self.is_list = isinstance(systems, list)
+        systems = systems if self.is_list else []
+        self.weights = {s.get("star_system"): s.get("weight", 0.0) for s in systems}
+        # First evidence entry per star system (same-line only)
+        self.evidence: Dict[str, Dict] = {}
+        if isinstance(evidence_entries, list):
+            for entry in evidence_entries:
+                self.evidence.setdefault(entry.get("star_system"), entry)
 
 
-def validate_pairwise_exclusions(weights: Dict) -> List[str]:
-    """Enforce pairwise exclusion rules."""
-    errors = []
+class GateFile:
+    """A weights file and its evidence file, prepared once for all rules."""
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
+    def __init__(self, weights: Dict, evidence: Optional[Dict] = None,
+                 beacon: Optional[str] = None, validators: Optional[Dict[str, Any]] = None):
+        """
+        Initialize gate file.
         
-        if not isinstance(systems, list):
-            continue
-        
-        # Build system weight map
-        sys_weights = {s["star_system"]: s["weight"] for s in systems}
-        
-        # Check each exclusion rule
-        for sys_a, sys_b, threshold_a, max_b in PAIRWISE_EXCLUSIONS:
-            weight_a = sys_weights.get(sys_a, 0.0)
-            weight_b = sys_weights.get(sys_b, 0.0)
-            
-            if threshold_a is None:
-                threshold_a = 0.0
-            
-            # Use > for zero thresholds, >= for non-zero thresholds
-            threshold_met = weight_a >= threshold_a if threshold_a > 0 else weight_a > threshold_a
-            
-            if threshold_met:
-                if max_b is None:
-                    # Must be 0
-                    if weight_b > 0.0:
-                        op = "≥" if threshold_a > 0 else ">"
-                        errors.append(
-                            f"{line_key}: Pairwise exclusion violated - "
-                            f"{sys_a} {op} {threshold_a} requires {sys_b} = 0, "
-                            f"but {sys_b} = {weight_b}"
-                        )
-                else:
-                    # Must be ≤ max_b
-                    if weight_b > max_b:
-                        op = "≥" if threshold_a > 0 else ">"
-                        errors.append(
-                            f"{line_key}: Pairwise exclusion violated - "
-                            f"{sys_a} {op} {threshold_a} requires {sys_b} ≤ {max_b}, "
-                            f"but {sys_b} = {weight_b}"
-                        )
-        
-        # Check Orion faction conflict
-        orion_light_weight = sys_weights.get("Orion Light", 0.0)
-        orion_dark_weight = sys_weights.get("Orion Dark", 0.0)
+        Args:
+            weights: Parsed star-map weights file
+            evidence: Parsed evidence file
+            beacon: Expected baseline beacon
+            validators: Compiled schema validators keyed by "Weights"/"Evidence"
+        """
+        self.weights = weights
+        self.evidence = evidence or {}
+        self.beacon = beacon
+        self.validators = validators or {}
+        self.meta = weights.get("_meta", {})
+        self.gate = self.meta.get("gate", "")
+        # In file order; rules walk them sorted by key
+        self.lines = [
+            GateLine(key, systems, self.evidence.get(key, []))
+            for key, systems in weights.items() if key != "_meta"
+        ]
+
+
+# ----------------------------------------------------------------------
+# Line rules
+# ----------------------------------------------------------------------
+
+def check_top2(line: GateLine, gate: GateFile) -> List[str]:
+    """Exactly 1 primary, optional 1 secondary with a lower weight."""
+    systems = line.systems
+    if not line.is_list:
+        return [f"{line.key}: Expected array, got {type(systems).__name__}"]
+    
+    if len(systems) > 2:
+        return [f"{line.key}: Top-2 violation - found {len(systems)} systems (max 2)"]
+    
+    errors = []
+    # Count roles
+    primary_count = sum(1 for s in systems if s.get("role") == "primary")
+    secondary_count = sum(1 for s in systems if s.get("role") == "secondary")
+    
+    if primary_count != 1:
+        errors.append(f"{line.key}: Must have exactly 1 primary, found {primary_count}")
+    
+    if secondary_count > 1:
+        errors.append(f"{line.key}: Must have ≤1 secondary, found {secondary_count}")
+    
+    # Verify primary has highest weight
+    if len(systems) == 2:
+        primary_sys = next((s for s in systems if s.get("role") == "primary"), None)
+        secondary_sys = next((s for s in systems if s.get("role") == "secondary"), None)
         
-        if orion_light_weight > 0 and orion_dark_weight > 0:
-            # Both present - one should be ≤ 0.35 or 0
-            if orion_light_weight > 0.35 and orion_dark_weight > 0.35:
+        if primary_sys and secondary_sys:
+            if primary_sys["weight"] <= secondary_sys["weight"]:
                 errors.append(
-                    f"{line_key}: Orion faction conflict - both Light ({orion_light_weight}) "
-                    f"and Dark ({orion_dark_weight}) > 0.35; one should be down-ranked"
+                    f"{line.key}: Primary weight ({primary_sys['weight']}) must be > "
+                    f"secondary weight ({secondary_sys['weight']})"
                 )
     
     return errors
 
 
-def validate_legge_gating(weights: Dict, evidence: Dict) -> List[str]:
-    """Enforce Legge-gating: weight >0.50 requires same-line Legge quote."""
+def check_pairwise_exclusions(line: GateLine, gate: GateFile) -> List[str]:
+    """PAIRWISE_EXCLUSIONS and the Orion faction conflict."""
     errors = []
+    sys_weights = line.weights
+    
+    for (sys_a, sys_b, threshold_a, max_b), violated in zip(PAIRWISE_EXCLUSIONS,
+                                                          SCORING_RULES.exclusion_predicates):
+        weight_b = sys_weights.get(sys_b, 0.0)
+        if violated(sys_weights.get(sys_a, 0.0), weight_b):
+            # > for zero thresholds, >= for non-zero thresholds
+            op = "≥" if threshold_a > 0 else ">"
+            constraint = f"{sys_b} = 0" if max_b is None else f"{sys_b} ≤ {max_b}"
+            errors.append(
+                f"{line.key}: Pairwise exclusion violated - "
+                f"{sys_a} {op} {threshold_a} requires {constraint}, "
+                f"but {sys_b} = {weight_b}"
+            )
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
-        
-        if not isinstance(systems, list):
-            continue
-        
-        for sys in systems:
-            weight = sys.get("weight", 0.0)
-            star_system = sys.get("star_system")
-            
-            if weight > 0.50:
-                # Must have Legge quote in evidence for this line
-                evidence_entries = evidence.get(line_key, [])
-                
-                # Find evidence for this system
-                sys_evidence = next(
-                    (e for e in evidence_entries if e.get("star_system") == star_system),
-                    None
-                )
-                
-                if not sys_evidence:
-                    errors.append(
-                        f"{line_key}: Legge-gating violated - {star_system} weight {weight} > 0.50 "
-                        f"but no evidence entry found"
-                    )
-                    continue
-                
-                legge_quote = sys_evidence.get("sources", {}).get("legge1899", {}).get("quote", "")
-                
-                if not legge_quote or len(legge_quote.strip()) == 0:
-                    errors.append(
-                        f"{line_key}: Legge-gating violated - {star_system} weight {weight} > 0.50 "
-                        f"but Legge quote is empty"
-                    )
+    # Check Orion faction conflict
+    light, dark, threshold = ORION_FACTION_RULE
+    orion_light_weight = sys_weights.get(light, 0.0)
+    orion_dark_weight = sys_weights.get(dark, 0.0)
+    
+    if orion_light_weight > 0 and orion_dark_weight > 0:
+        # Both present - one should be ≤ threshold or 0
+        if orion_light_weight > threshold and orion_dark_weight > threshold:
+            errors.append(
+                f"{line.key}: Orion faction conflict - both Light ({orion_light_weight}) "
+                f"and Dark ({orion_dark_weight}) > {threshold}; one should be down-ranked"
+            )
     
     return errors
 
 
-def validate_weight_precision(weights: Dict) -> List[str]:
-    """Ensure all weights are multiples of 0.01."""
+def check_legge_gating(line: GateLine, gate: GateFile) -> List[str]:
+    """Weight >0.50 requires a same-line Legge quote."""
     errors = []
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
+    for sys in line.systems:
+        weight = sys.get("weight", 0.0)
+        star_system = sys.get("star_system")
         
-        if not isinstance(systems, list):
-            continue
-        
-        for sys in systems:
-            weight = sys.get("weight", 0.0)
+        if weight > 0.50:
+            sys_evidence = line.evidence.get(star_system)
             
-            # Check if weight is multiple of 0.01 (allowing for float precision)
-            rounded = round(weight * 100) / 100
-            if abs(weight - rounded) > 0.001:
+            if not sys_evidence:
                 errors.append(
-                    f"{line_key}: Weight precision error - {sys.get('star_system')} "
-                    f"weight {weight} is not a multiple of 0.01"
+                    f"{line.key}: Legge-gating violated - {star_system} weight {weight} > 0.50 "
+                    f"but no evidence entry found"
+                )
+                continue
+            
+            legge_quote = sys_evidence.get("sources", {}).get("legge1899", {}).get("quote", "")
+            
+            if not legge_quote or len(legge_quote.strip()) == 0:
+                errors.append(
+                    f"{line.key}: Legge-gating violated - {star_system} weight {weight} > 0.50 "
+                    f"but Legge quote is empty"
                 )
     
     return errors
 
 
-def validate_polarity_presence(weights: Dict) -> List[str]:
-    """Require polarity when weight ≥ 0.40."""
+def check_weight_precision(line: GateLine, gate: GateFile) -> List[str]:
+    """Weights are multiples of 0.01."""
     errors = []
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
-        
-        if not isinstance(systems, list):
-            continue
+    for sys in line.systems:
+        weight = sys.get("weight", 0.0)
         
-        for sys in systems:
-            weight = sys.get("weight", 0.0)
-            polarity = sys.get("polarity")
-            
-            if weight >= 0.40 and not polarity:
-                errors.append(
-                    f"{line_key}: {sys.get('star_system')} weight {weight} ≥ 0.40 "
-                    f"requires polarity field"
-                )
+        # Check if weight is multiple of 0.01 (allowing for float precision)
+        rounded = round(weight * 100) / 100
+        if abs(weight - rounded) > 0.001:
+            errors.append(
+                f"{line.key}: Weight precision error - {sys.get('star_system')} "
+                f"weight {weight} is not a multiple of 0.01"
+            )
     
     return errors
 
 
-def validate_canonical_names(weights: Dict) -> List[str]:
-    """Validate all star system names use exact canonical format."""
+def check_polarity_presence(line: GateLine, gate: GateFile) -> List[str]:
+    """Polarity is required when weight ≥ 0.40."""
     errors = []
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
+    for sys in line.systems:
+        weight = sys.get("weight", 0.0)
         
-        if not isinstance(systems, list):
-            continue
-        
-        for sys in systems:
-            star_system = sys.get("star_system", "")
-            
-            if star_system not in CANONICAL_SYSTEMS:
-                # Find closest match for helpful error message
-                closest = None
-                star_lower = star_system.lower()
-                for canonical in CANONICAL_SYSTEMS:
-                    if canonical.lower() == star_lower:
-                        closest = canonical
-                        break
-                
-                if closest:
-                    errors.append(
-                        f"{line_key}: Non-canonical system name '{star_system}' "
-                        f"(should be '{closest}' with exact case and spacing)"
-                    )
-                else:
-                    errors.append(
-                        f"{line_key}: Invalid system name '{star_system}' "
-                        f"(must be one of: {', '.join(CANONICAL_SYSTEMS)})"
-                    )
+        if weight >= 0.40 and not sys.get("polarity"):
+            errors.append(
+                f"{line.key}: {sys.get('star_system')} weight {weight} ≥ 0.40 "
+                f"requires polarity field"
+            )
     
     return errors
 
 
-def validate_key_format(weights: Dict) -> List[str]:
-    """Validate line keys follow NN.L format (zero-padded gate, dot, line 1-6)."""
+def check_canonical_names(line: GateLine, gate: GateFile) -> List[str]:
+    """Star system names use the exact canonical format."""
     errors = []
     
-    gate_num = weights.get("_meta", {}).get("gate", "")
-    
-    for line_key in [k for k in weights.keys() if k != "_meta"]:
-        # Check format: NN.L where NN is zero-padded gate, L is 1-6
-        if not line_key or len(line_key) != 4:
-            errors.append(f"Invalid key format '{line_key}' (expected 'NN.L' format)")
-            continue
-        
-        parts = line_key.split(".")
-        if len(parts) != 2:
-            errors.append(f"Invalid key format '{line_key}' (expected 'NN.L' with dot separator)")
-            continue
-        
-        gate_part, line_part = parts
-        
-        # Validate gate part matches metadata
-        if gate_part != gate_num:
-            errors.append(
-                f"Key gate mismatch '{line_key}' (gate part '{gate_part}' "
-                f"doesn't match metadata gate '{gate_num}')"
-            )
+    for sys in line.systems:
+        star_system = sys.get("star_system", "")
         
-        # Validate line part is 1-6
-        if not line_part.isdigit() or int(line_part) < 1 or int(line_part) > 6:
-            errors.append(
-                f"Invalid line number in '{line_key}' (must be 1-6, got '{line_part}')"
-            )
+        if star_system not in CANONICAL_SYSTEMS:
+            # Find closest match for helpful error message
+            star_lower = star_system.lower()
+            closest = next((c for c in CANONICAL_SYSTEMS if c.lower() == star_lower), None)
+            
+            if closest:
+                errors.append(
+                    f"{line.key}: Non-canonical system name '{star_system}' "
+                    f"(should be '{closest}' with exact case and spacing)"
+                )
+            else:
+                errors.append(
+                    f"{line.key}: Invalid system name '{star_system}' "
+                    f"(must be one of: {', '.join(CANONICAL_SYSTEMS)})"
+                )
     
     return errors
 
 
-def validate_sorting(weights: Dict) -> List[str]:
-    """Validate line keys are sorted and systems within lines are sorted."""
-    errors = []
+def check_key_format(line: GateLine, gate: GateFile) -> List[str]:
+    """Line key follows NN.L format (zero-padded gate, dot, line 1-6)."""
+    line_key = line.key
     
-    # Check line keys are sorted
-    line_keys = [k for k in weights.keys() if k != "_meta"]
-    sorted_keys = sorted(line_keys)
+    # Check format: NN.L where NN is zero-padded gate, L is 1-6
+    if not line_key or len(line_key) != 4:
+        return [f"Invalid key format '{line_key}' (expected 'NN.L' format)"]
     
-    if line_keys != sorted_keys:
-        errors.append(f"Line keys not sorted: {line_keys} should be {sorted_keys}")
+    parts = line_key.split(".")
+    if len(parts) != 2:
+        return [f"Invalid key format '{line_key}' (expected 'NN.L' with dot separator)"]
     
-    # Check systems within each line are sorted by weight desc, then canonical order
-    for line_key in line_keys:
-        systems = weights[line_key]
-        
-        if not isinstance(systems, list) or len(systems) <= 1:
-            continue
-        
-        # Check weight descending
-        weights_list = [s.get("weight", 0.0) for s in systems]
-        if weights_list != sorted(weights_list, reverse=True):
-            errors.append(
-                f"{line_key}: Systems not sorted by weight descending: {weights_list}"
-            )
-        
-        # Check tie-breaking: if weights are equal, use canonical order
-        for i in range(len(systems) - 1):
-            curr_sys = systems[i]
-            next_sys = systems[i + 1]
-            curr_weight = curr_sys.get("weight", 0.0)
-            next_weight = next_sys.get("weight", 0.0)
-            
-            if abs(curr_weight - next_weight) < 0.001:  # Equal weights (within float precision)
-                curr_name = curr_sys.get("star_system", "")
-                next_name = next_sys.get("star_system", "")
-                
-                try:
-                    curr_idx = CANONICAL_SYSTEMS.index(curr_name)
-                    next_idx = CANONICAL_SYSTEMS.index(next_name)
-                    
-                    if curr_idx > next_idx:
-                        errors.append(
-                            f"{line_key}: Tie-breaking order violated - "
-                            f"{curr_name} (weight {curr_weight}) should come after "
-                            f"{next_name} (weight {next_weight}) in canonical order"
-                        )
-                except ValueError:
-                    # Invalid system name, will be caught by canonical name validation
-                    pass
+    errors = []
+    gate_part, line_part = parts
+    
+    # Validate gate part matches metadata
+    if gate_part != gate.gate:
+        errors.append(
+            f"Key gate mismatch '{line_key}' (gate part '{gate_part}' "
+            f"doesn't match metadata gate '{gate.gate}')"
+        )
+    
+    # Validate line part is 1-6
+    if not line_part.isdigit() or int(line_part) < 1 or int(line_part) > 6:
+        errors.append(
+            f"Invalid line number in '{line_key}' (must be 1-6, got '{line_part}')"
+        )
     
     return errors
 
 
-def validate_sparse_format(weights: Dict) -> List[str]:
-    """Verify sparse format: only non-zero weights present."""
+def check_line_sorting(line: GateLine, gate: GateFile) -> List[str]:
+    """Systems are sorted by weight descending, ties in canonical order."""
+    systems = line.systems
+    if len(systems) <= 1:
+        return []
+    
     errors = []
+    # Check weight descending
+    weights_list = [s.get("weight", 0.0) for s in systems]
+    if weights_list != sorted(weights_list, reverse=True):
+        errors.append(
+            f"{line.key}: Systems not sorted by weight descending: {weights_list}"
+        )
     
-    for line_key in sorted([k for k in weights.keys() if k != "_meta"]):
-        systems = weights[line_key]
+    # Check tie-breaking: if weights are equal, use canonical order
+    for curr_sys, next_sys in zip(systems, systems[1:]):
+        curr_weight = curr_sys.get("weight", 0.0)
+        next_weight = next_sys.get("weight", 0.0)
         
-        if not isinstance(systems, list):
-            continue
-        
-        for sys in systems:
-            weight = sys.get("weight", 0.0)
-            star_system = sys.get("star_system", "")
+        if abs(curr_weight - next_weight) < 0.001:  # Equal weights (within float precision)
+            curr_name = curr_sys.get("star_system", "")
+            next_name = next_sys.get("star_system", "")
             
-            if weight == 0.0:
+            try:
+                curr_idx = CANONICAL_SYSTEMS.index(curr_name)
+                next_idx = CANONICAL_SYSTEMS.index(next_name)
+            except ValueError:
+                # Invalid system name, will be caught by canonical name validation
+                continue
+            
+            if curr_idx > next_idx:
                 errors.append(
-                    f"{line_key}: Sparse format violation - {star_system} has weight 0.0 "
-                    f"(should be omitted from output)"
+                    f"{line.key}: Tie-breaking order violated - "
+                    f"{curr_name} (weight {curr_weight}) should come after "
+                    f"{next_name} (weight {next_weight}) in canonical order"
                 )
     
     return errors
 
 
-def validate_sum_unorm(weights: Dict) -> List[str]:
-    """Verify sum_unorm equals sum of all non-zero weights across all 6 lines."""
-    errors = []
-    
-    declared_sum = weights.get("_meta", {}).get("sum_unorm")
+def check_sparse_format(line: GateLine, gate: GateFile) -> List[str]:
+    """Only non-zero weights are present."""
+    return [
+        f"{line.key}: Sparse format violation - {sys.get('star_system', '')} has weight 0.0 "
+        f"(should be omitted from output)"
+        for sys in line.systems if sys.get("weight", 0.0) == 0.0
+    ]
+
+
+# ----------------------------------------------------------------------
+# File rules
+# ----------------------------------------------------------------------
+
+def check_weights_schema(gate: GateFile) -> List[str]:
+    return validate_schema(gate.weights, gate.validators["Weights"], "Weights")
+
+
+def check_evidence_schema(gate: GateFile) -> List[str]:
+    return validate_schema(gate.evidence, gate.validators["Evidence"], "Evidence")
+
+
+def check_key_order(gate: GateFile) -> List[str]:
+    """Line keys appear in sorted order."""
+    line_keys = [line.key for line in gate.lines]
+    sorted_keys = sorted(line_keys)
+    if line_keys != sorted_keys:
+        return [f"Line keys not sorted: {line_keys} should be {sorted_keys}"]
+    return []
+
+
+def check_sum_unorm(gate: GateFile) -> List[str]:
+    """sum_unorm equals the sum of all non-zero weights across all 6 lines."""
+    declared_sum = gate.meta.get("sum_unorm")
     
     if declared_sum is None:
-        errors.append("Missing sum_unorm in _meta block")
-        return errors
-    
-    # Compute actual sum
-    actual_sum = 0.0
-    for line_key in [k for k in weights.keys() if k != "_meta"]:
-        systems = weights[line_key]
-        
-        if not isinstance(systems, list):
-            continue
-        
-        for sys in systems:
-            weight = sys.get("weight", 0.0)
-            actual_sum += weight
+        return ["Missing sum_unorm in _meta block"]
     
     # Round to 2 decimal places for comparison (accounting for float precision)
-    actual_sum = round(actual_sum, 2)
+    # Weight by weight in file order; per-line subtotals can round differently
+    actual_sum = round(sum(
+        (sys.get("weight", 0.0) for line in gate.lines if line.is_list for sys in line.systems), 0.0
+    ), 2)
     declared_sum = round(declared_sum, 2)
     
     if abs(actual_sum - declared_sum) > 0.01:
-        errors.append(
+        return [
             f"sum_unorm mismatch: declared {declared_sum}, "
             f"but sum of all weights = {actual_sum}"
-        )
-    
-    return errors
+        ]
+    return []
 
 
-def validate_beacon_match(weights: Dict, evidence: Dict, expected_beacon: str) -> List[str]:
-    """Validate baseline_beacon matches expected value."""
+def check_beacon_match(gate: GateFile) -> List[str]:
+    """baseline_beacon of both files matches the expected value."""
     errors = []
     
-    weights_beacon = weights.get("_meta", {}).get("baseline_beacon")
-    evidence_beacon = evidence.get("_meta", {}).get("baseline_beacon")
+    weights_beacon = gate.meta.get("baseline_beacon")
+    evidence_beacon = gate.evidence.get("_meta", {}).get("baseline_beacon")
     
-    if weights_beacon != expected_beacon:
+    if weights_beacon != gate.beacon:
         errors.append(
-            f"Weights beacon mismatch: expected {expected_beacon}, got {weights_beacon}"
+            f"Weights beacon mismatch: expected {gate.beacon}, got {weights_beacon}"
         )
     
-    if evidence_beacon != expected_beacon:
+    if evidence_beacon != gate.beacon:
         errors.append(
-            f"Evidence beacon mismatch: expected {expected_beacon}, got {evidence_beacon}"
+            f"Evidence beacon mismatch: expected {gate.beacon}, got {evidence_beacon}"
         )
     
     return errors
 
 
+# ----------------------------------------------------------------------
+# Rule registry and engine
+# ----------------------------------------------------------------------
+
+class Rule(NamedTuple):
+    name: str       # id used in reports
+    section: str    # console heading; consecutive rules may share one
+    passed: str     # console message when the rule finds nothing
+    check_gate: Optional[Callable[[GateFile], List[str]]] = None
+    check_line: Optional[Callable[[GateLine, GateFile], List[str]]] = None
+    any_value: bool = False  # check_line also runs on lines whose value is not an array
+    file_order: bool = False  # report check_line errors in file order, not sorted-key order
+
+
+RULES = (
+    Rule("weights_schema", "Schema validation", "Weights schema valid", check_gate=check_weights_schema),
+    Rule("evidence_schema", "Schema validation", "Evidence schema valid", check_gate=check_evidence_schema),
+    Rule("top2", "Top-2 constraint", "Top-2 constraint satisfied", check_line=check_top2, any_value=True),
+    Rule("pairwise_exclusions", "Pairwise exclusions", "Pairwise exclusions satisfied",
+         check_line=check_pairwise_exclusions),
+    Rule("legge_gating", "Legge-gating", "Legge-gating satisfied", check_line=check_legge_gating),
+    Rule("weight_precision", "Weight precision", "Weight precision valid", check_line=check_weight_precision),
+    Rule("polarity_presence", "Polarity presence", "Polarity presence valid", check_line=check_polarity_presence),
+    Rule("canonical_names", "Canonical names", "Canonical names valid", check_line=check_canonical_names),
+    Rule("key_format", "Key format", "Key format valid", check_line=check_key_format, any_value=True,
+         file_order=True),
+    Rule("sorting", "Sorting and tie-breaking", "Sorting and tie-breaking valid",
+         check_gate=check_key_order, check_line=check_line_sorting, file_order=True),
+    Rule("sparse_format", "Sparse format", "Sparse format valid", check_line=check_sparse_format),
+    Rule("sum_unorm", "Sum unorm", "Sum unorm valid", check_gate=check_sum_unorm),
+    Rule("beacon_match", "Beacon match", "Beacon matches", check_gate=check_beacon_match),
+)
+
+RULES_BY_NAME = {rule.name: rule for rule in RULES}
+
+SCHEMA_RULES = ("weights_schema", "evidence_schema")
+
+
+def run_rules(gate: GateFile, rules=RULES) -> Tuple[Dict[str, List[str]], Dict[str, float]]:
+    """
+    Run rules over a gate file: file-level checks first, then one walk over
+    the lines (sorted by key) dispatching every line check. Errors of
+    file_order rules are regrouped into file order after the walk.
+    
+    Returns:
+        (errors, seconds): per-rule error lists and per-rule time, keyed by
+        rule name in rule order
+    """
+    errors: Dict[str, List[str]] = {rule.name: [] for rule in rules}
+    seconds: Dict[str, float] = {rule.name: 0.0 for rule in rules}
+    clock = time.perf_counter
+    
+    for rule in rules:
+        if rule.check_gate:
+            start = clock()
+            errors[rule.name].extend(rule.check_gate(gate))
+            seconds[rule.name] += clock() - start
+    
+    line_rules = [rule for rule in rules if rule.check_line]
+    # Per rule, errors by line position in the file
+    by_position = {rule.name: [[] for _ in gate.lines] for rule in line_rules if rule.file_order}
+    for position in sorted(range(len(gate.lines)), key=lambda i: gate.lines[i].key):
+        line = gate.lines[position]
+        for rule in line_rules:
+            if not (line.is_list or rule.any_value):
+                continue
+            start = clock()
+            found = rule.check_line(line, gate)
+            if rule.file_order:
+                by_position[rule.name][position] = found
+            else:
+                errors[rule.name].extend(found)
+            seconds[rule.name] += clock() - start
+    
+    for name, per_line in by_position.items():
+        for found in per_line:
+            errors[name].extend(found)
+    
+    return errors, seconds
+
+
+def _run_rule(name: str, weights: Dict, evidence: Optional[Dict] = None,
+              beacon: Optional[str] = None) -> List[str]:
+    """Errors of a single registered rule."""
+    errors, _ = run_rules(GateFile(weights, evidence, beacon), [RULES_BY_NAME[name]])
+    return errors[name]
+
+
+def validate_top2_constraint(weights: Dict) -> List[str]:
+    """Enforce top-2 constraint: exactly 1 primary, optional 1 secondary per line."""
+    return _run_rule("top2", weights)
+
+
+def validate_pairwise_exclusions(weights: Dict) -> List[str]:
+    """Enforce pairwise exclusion rules."""
+    return _run_rule("pairwise_exclusions", weights)
+
+
+def validate_legge_gating(weights: Dict, evidence: Dict) -> List[str]:
+    """Enforce Legge-gating: weight >0.50 requires same-line Legge quote."""
+    return _run_rule("legge_gating", weights, evidence)
+
+
+def validate_weight_precision(weights: Dict) -> List[str]:
+    """Ensure all weights are multiples of 0.01."""
+    return _run_rule("weight_precision", weights)
+
+
+def validate_polarity_presence(weights: Dict) -> List[str]:
+    """Require polarity when weight ≥ 0.40."""
+    return _run_rule("polarity_presence", weights)
+
+
+def validate_canonical_names(weights: Dict) -> List[str]:
+    """Validate all star system names use exact canonical format."""
+    return _run_rule("canonical_names", weights)
+
+
+def validate_key_format(weights: Dict) -> List[str]:
+    """Validate line keys follow NN.L format (zero-padded gate, dot, line 1-6)."""
+    return _run_rule("key_format", weights)
+
+
+def validate_sorting(weights: Dict) -> List[str]:
+    """Validate line keys are sorted and systems within lines are sorted."""
+    return _run_rule("sorting", weights)
+
+
+def validate_sparse_format(weights: Dict) -> List[str]:
+    """Verify sparse format: only non-zero weights present."""
+    return _run_rule("sparse_format", weights)
+
+
+def validate_sum_unorm(weights: Dict) -> List[str]:
+    """Verify sum_unorm equals sum of all non-zero weights across all 6 lines."""
+    return _run_rule("sum_unorm", weights)
+
+
+def validate_beacon_match(weights: Dict, evidence: Dict, expected_beacon: str) -> List[str]:
+    """Validate baseline_beacon matches expected value."""
+    return _run_rule("beacon_match", weights, evidence, expected_beacon)
+
+
+# ----------------------------------------------------------------------
+# Gates and batch reports
+# ----------------------------------------------------------------------
+
+def gate_file_paths(gate_num: int) -> Tuple[Path, Path]:
+    """(star-map weights path, evidence path) for a gate."""
+    return (
+        PROJECT_ROOT / "star-maps" / f"gateLine_star_map_Gate{gate_num:02d}.json",
+        PROJECT_ROOT / "evidence" / f"gateLine_evidence_Gate{gate_num:02d}.json",
+    )
+
+
+def validate_gate(gate_num: int, beacon: str = DEFAULT_BEACON, schemas: bool = True) -> Dict:
+    """
+    Validate one gate's star-map/evidence pair (batch worker; module-level so it pickles).
+    
+    Args:
+        gate_num: Gate number
+        beacon: Expected baseline beacon
+        schemas: Run the schema rules (needs jsonschema)
+    
+    Returns:
+        Dict with gate, status ("passed", "failed" or "error"), errors (all
+        messages), rules (per-rule errors and seconds), load_error and seconds
+    """
+    start = time.perf_counter()
+    result = {'gate': gate_num, 'status': 'passed', 'errors': [], 'rules': {}, 'load_error': None}
+    try:
+        weights_path, evidence_path = gate_file_paths(gate_num)
+        weights = load_json(weights_path)
+        evidence = load_json(evidence_path)
+    except Exception as e:
+        result.update(status='error', load_error=str(e))
+    else:
+        if schemas:
+            rules, validators = RULES, schema_validators()
+        else:
+            rules, validators = [r for r in RULES if r.name not in SCHEMA_RULES], None
+        errors, seconds = run_rules(GateFile(weights, evidence, beacon, validators), rules)
+        result['rules'] = {
+            name: {'errors': errors[name], 'seconds': round(seconds[name], 6)} for name in errors
+        }
+        result['errors'] = [err for rule_errors in errors.values() for err in rule_errors]
+        if result['errors']:
+            result['status'] = 'failed'
+    result['seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def rule_totals(results: List[Dict]) -> List[Dict]:
+    """Per-rule totals over all gates: failed gates, errors and seconds, in registry order."""
+    totals = []
+    for rule in RULES:
+        ran = [r['rules'][rule.name] for r in results if rule.name in r['rules']]
+        if not ran:
+            continue
+        totals.append({
+            'rule': rule.name,
+            'section': rule.section,
+            'failed_gates': sum(1 for entry in ran if entry['errors']),
+            'errors': sum(len(entry['errors']) for entry in ran),
+            'seconds': round(sum(entry['seconds'] for entry in ran), 6),
+        })
+    return totals
+
+
+def build_report(results: List[Dict], wall_seconds: float, jobs: int, beacon: str) -> Dict:
+    """Machine-readable batch report: summary, per-rule and per-gate timings, per-error records."""
+    statuses = [r['status'] for r in results]
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'beacon': beacon,
+        'jobs': jobs,
+        'summary': {
+            'gates': len(results),
+            'passed': statuses.count('passed'),
+            'failed': statuses.count('failed'),
+            'load_errors': statuses.count('error'),
+            'errors': sum(len(r['errors']) for r in results),
+            'wall_seconds': round(wall_seconds, 4),
+            'gate_seconds': round(sum(r['seconds'] for r in results), 4),
+        },
+        'rules': rule_totals(results),
+        'gates': [
+            {
+                'gate': r['gate'],
+                'status': r['status'],
+                'errors': len(r['errors']),
+                'load_error': r['load_error'],
+                'seconds': r['seconds'],
+                'rules': {
+                    name: {'errors': len(entry['errors']), 'seconds': entry['seconds']}
+                    for name, entry in r['rules'].items()
+                },
+            }
+            for r in results
+        ],
+        'errors': [
+            {
+                'gate': r['gate'],
+                'rule': name,
+                'line_key': match.group(1) if (match := LINE_KEY_RE.match(err)) else None,
+                'message': err,
+            }
+            for r in results for name, entry in r['rules'].items() for err in entry['errors']
+        ],
+    }
+
+
+def build_junit(results: List[Dict], wall_seconds: float) -> ElementTree.Element:
+    """JUnit XML: one testsuite per gate, one testcase per rule (time = rule seconds)."""
+    statuses = [r['status'] for r in results]
+    root = ElementTree.Element('testsuites', {
+        'name': 'validate_gate_outputs',
+        'tests': str(sum(max(len(r['rules']), 1) for r in results)),
+        'failures': str(sum(1 for r in results for entry in r['rules'].values() if entry['errors'])),
+        'errors': str(statuses.count('error')),
+        'time': f"{wall_seconds:.4f}",
+    })
+    for r in results:
+        name = f"Gate{r['gate']:02d}"
+        failures = sum(1 for entry in r['rules'].values() if entry['errors'])
+        suite = ElementTree.SubElement(root, 'testsuite', {
+            'name': name,
+            'tests': str(max(len(r['rules']), 1)),
+            'failures': str(failures),
+            'errors': '1' if r['status'] == 'error' else '0',
+            'time': f"{r['seconds']:.4f}",
+        })
+        if r['status'] == 'error':
+            case = ElementTree.SubElement(suite, 'testcase', {'classname': name, 'name': 'load', 'time': '0'})
+            ElementTree.SubElement(case, 'error', {'message': r['load_error']})
+            continue
+        for rule_name, entry in r['rules'].items():
+            case = ElementTree.SubElement(suite, 'testcase', {
+                'classname': name, 'name': rule_name, 'time': f"{entry['seconds']:.6f}",
+            })
+            if entry['errors']:
+                failure = ElementTree.SubElement(case, 'failure', {
+                    'message': f"{len(entry['errors'])} error(s)",
+                })
+                failure.text = "\n".join(entry['errors'])
+    return root
+
+
+def run_batch(gates: List[int], beacon: str, jobs: int, report_path: Optional[Path],
+              junit_path: Optional[Path]) -> int:
+    """Validate several gates in one process (or worker pool) and print a summary."""
+    start = time.perf_counter()
+    # Compile the schema validators once; forked workers inherit them, under
+    # spawn/forkserver each worker compiles its own on first use
+    try:
+        schema_validators()
+    except Exception as e:
+        print(f"ERROR loading schemas: {e}", file=sys.stderr)
+        return 1
+    mp_context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    results = map_gates(partial(validate_gate, beacon=beacon), gates, jobs, mp_context)
+    wall_seconds = time.perf_counter() - start
+    
+    print(f"Validating {len(gates)} gate(s)...")
+    print()
+    for r in results:
+        if r['status'] == 'passed':
+            print(f"  ✓ Gate {r['gate']:02d} ({r['seconds']:.3f}s)")
+        elif r['status'] == 'error':
+            print(f"  ✗ Gate {r['gate']:02d}: ERROR loading files: {r['load_error']}")
+        else:
+            print(f"  ✗ Gate {r['gate']:02d}: {len(r['errors'])} error(s) ({r['seconds']:.3f}s)")
+            for err in r['errors']:
+                print(f"      ✗ {err}")
+    
+    report = build_report(results, wall_seconds, jobs, beacon)
+    summary = report['summary']
+    print()
+    print("Rule timings:")
+    for total in report['rules']:
+        print(
+            f"  {total['rule']:<20} {total['seconds'] * 1000:8.2f} ms  "
+            f"{total['errors']} error(s) in {total['failed_gates']} gate(s)"
+        )
+    print()
+    print(
+        f"{summary['passed']} passed, {summary['failed']} failed, {summary['load_errors']} load error(s); "
+        f"{summary['errors']} validation error(s) in {summary['wall_seconds']:.2f}s"
+    )
+    
+    if report_path:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report written to {report_path}")
+    
+    if junit_path:
+        junit_path.parent.mkdir(parents=True, exist_ok=True)
+        tree = ElementTree.ElementTree(build_junit(results, wall_seconds))
+        ElementTree.indent(tree)
+        tree.write(junit_path, encoding='utf-8', xml_declaration=True)
+        print(f"JUnit report written to {junit_path}")
+    
+    return 1 if summary['failed'] or summary['load_errors'] else 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -466,17 +837,61 @@ def main():
     parser.add_argument(
         "gate",
         type=str,
+        nargs="?",
         help="Gate number (01-64, zero-padded)"
     )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate all 64 star-map/evidence pairs in one run"
+    )
+    selection.add_argument(
+        "--gates",
+        type=parse_gate_spec,
+        default=None,
+        help="Gates to validate in one run, e.g. 1,5,10-12 or 01-64"
+    )
     parser.add_argument(
         "--beacon",
         type=str,
-        default="59bfc617",
-        help="Expected baseline beacon (default: 59bfc617)"
+        default=DEFAULT_BEACON,
+        help=f"Expected baseline beacon (default: {DEFAULT_BEACON})"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=parse_jobs,
+        default=1,
+        help="Worker processes for --all/--gates (default: 1, 0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="Write a JSON report (summary, per-rule and per-gate timings, per-error records) for --all/--gates"
+    )
+    parser.add_argument(
+        "--junit",
+        type=Path,
+        default=None,
+        help="Write a JUnit XML report (one testcase per gate and rule) for --all/--gates"
     )
     
     args = parser.parse_args()
     
+    if jsonschema is None:
+        print("ERROR: jsonschema package not installed", file=sys.stderr)
+        print("Install with: pip install jsonschema", file=sys.stderr)
+        return 1
+    
+    if args.all or args.gates:
+        if args.gate:
+            parser.error("give either a gate number or --all/--gates, not both")
+        gates = list(range(1, 65)) if args.all else args.gates
+        return run_batch(gates, args.beacon, args.jobs, args.report, args.junit)
+    if not args.gate:
+        parser.error("a gate number, --all or --gates is required")
+    
     # Validate gate format
     if not args.gate.isdigit() or len(args.gate) != 2:
         print(f"ERROR: Gate must be zero-padded 2-digit number (01-64), got: {args.gate}", file=sys.stderr)
@@ -487,174 +902,41 @@ def main():
         print(f"ERROR: Gate must be 01-64, got: {args.gate}", file=sys.stderr)
         return 1
     
-    # Determine file paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    
-    weights_path = project_root / "star-maps" / f"gateLine_star_map_Gate{args.gate}.json"
-    evidence_path = project_root / "evidence" / f"gateLine_evidence_Gate{args.gate}.json"
-    weights_schema_path = project_root / "schemas" / "weights.schema.json"
-    evidence_schema_path = project_root / "schemas" / "evidence.schema.json"
-    
     # Load files
     try:
+        weights_path, evidence_path = gate_file_paths(gate_num)
         weights = load_json(weights_path)
         evidence = load_json(evidence_path)
-        weights_schema = load_json(weights_schema_path)
-        evidence_schema = load_json(evidence_schema_path)
+        validators = schema_validators()
     except Exception as e:
         print(f"ERROR loading files: {e}", file=sys.stderr)
         return 1
     
-    # Run all validations
-    all_errors = []
-    
     print(f"Validating Gate {args.gate}...")
     print()
     
-    # Schema validation
-    print("1. Schema validation...")
-    errors = validate_schema(weights, weights_schema, "Weights")
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Weights schema valid")
-    
-    errors = validate_schema(evidence, evidence_schema, "Evidence")
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Evidence schema valid")
-    print()
-    
-    # Top-2 constraint
-    print("2. Top-2 constraint...")
-    errors = validate_top2_constraint(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
+    errors, _ = run_rules(GateFile(weights, evidence, args.beacon, validators))
+    
+    # One numbered section per heading, in registry order
+    section = None
+    number = 0
+    for rule in RULES:
+        if rule.section != section:
+            if section is not None:
+                print()
+            section = rule.section
+            number += 1
+            print(f"{number}. {section}...")
+        for err in errors[rule.name]:
             print(f"  ✗ {err}")
-    else:
-        print("  ✓ Top-2 constraint satisfied")
-    print()
-    
-    # Pairwise exclusions
-    print("3. Pairwise exclusions...")
-    errors = validate_pairwise_exclusions(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Pairwise exclusions satisfied")
-    print()
-    
-    # Legge-gating
-    print("4. Legge-gating...")
-    errors = validate_legge_gating(weights, evidence)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Legge-gating satisfied")
-    print()
-    
-    # Weight precision
-    print("5. Weight precision...")
-    errors = validate_weight_precision(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Weight precision valid")
-    print()
-    
-    # Polarity presence
-    print("6. Polarity presence...")
-    errors = validate_polarity_presence(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Polarity presence valid")
-    print()
-    
-    # Canonical names
-    print("7. Canonical names...")
-    errors = validate_canonical_names(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Canonical names valid")
-    print()
-    
-    # Key format
-    print("8. Key format...")
-    errors = validate_key_format(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Key format valid")
-    print()
-    
-    # Sorting
-    print("9. Sorting and tie-breaking...")
-    errors = validate_sorting(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Sorting and tie-breaking valid")
-    print()
-    
-    # Sparse format
-    print("10. Sparse format...")
-    errors = validate_sparse_format(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Sparse format valid")
-    print()
-    
-    # Sum unorm
-    print("11. Sum unorm...")
-    errors = validate_sum_unorm(weights)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Sum unorm valid")
-    print()
-    
-    # Beacon match
-    print("12. Beacon match...")
-    errors = validate_beacon_match(weights, evidence, args.beacon)
-    if errors:
-        all_errors.extend(errors)
-        for err in errors:
-            print(f"  ✗ {err}")
-    else:
-        print("  ✓ Beacon matches")
+        if not errors[rule.name]:
+            print(f"  ✓ {rule.passed}")
     print()
     
     # Summary
-    if all_errors:
-        print(f"✗ Validation FAILED with {len(all_errors)} error(s)")
+    error_count = sum(len(rule_errors) for rule_errors in errors.values())
+    if error_count:
+        print(f"✗ Validation FAILED with {error_count} error(s)")
         return 1
     else:
         print("✓ All validations PASSED")
@@ -5,27 +5,47 @@ Validate weight and evidence files against JSON schemas.
 This script validates gate.line weight and evidence files against their respective
 JSON schemas to ensure structural correctness and compliance with requirements.
 
+Both schemas are compiled once per process into validators (the Draft*Validator
+named by each schema's $schema) and every file reports its complete error list
+(iter_errors), not just the first error.
+
 Usage:
     python validate_schemas.py [--weights WEIGHT_FILE] [--evidence EVIDENCE_FILE]
+    python validate_schemas.py --all
 
 If no files specified, validates example files from requirements:
     - GPT-5/star-maps/gateLine_star_map_Gate01.json
     - GPT-5/evidence/gateLine_evidence_Gate01.json
+
+--all validates every file in GPT-5/star-maps/ and GPT-5/evidence/ in one
+process, with per-file timing (load vs validate) and a summary table.
 """
 
 import argparse
 import json
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from validate_gate_outputs import PROJECT_ROOT, SCHEMA_PATHS, compile_schema, jsonschema
 
-try:
-    import jsonschema
-    from jsonschema import validate, ValidationError
-except ImportError:
-    print("ERROR: jsonschema package not installed", file=sys.stderr)
-    print("Install with: pip install jsonschema", file=sys.stderr)
-    sys.exit(1)
+# Batch mode: (file type, directory, glob) per data directory
+DATA_DIRS = [
+    ("Weights", PROJECT_ROOT / "star-maps", "*.json"),
+    ("Evidence", PROJECT_ROOT / "evidence", "*.json"),
+]
+
+
+class FileResult(NamedTuple):
+    path: Path
+    file_type: str
+    valid: bool
+    errors: List[str]        # message lines (an error may add a "  Path: ..." line)
+    error_count: int
+    load_seconds: float
+    validate_seconds: float
 
 
 def load_schema(schema_path: Path) -> Dict:
@@ -37,6 +57,12 @@ def load_schema(schema_path: Path) -> Dict:
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def load_validator(schema_path: Path) -> Any:
+    """Compiled validator for a schema file (loaded and checked once per path)."""
+    return compile_schema(load_schema(schema_path))
+
+
 def load_data_file(data_path: Path) -> Dict:
     """Load data file to validate."""
     if not data_path.exists():
@@ -46,43 +72,165 @@ def load_data_file(data_path: Path) -> Dict:
         return json.load(f)
 
 
-def validate_file(data: Dict, schema: Dict, file_type: str) -> Tuple[bool, List[str]]:
+def format_error(error: Any, file_type: str) -> List[str]:
+    """One jsonschema error as message lines (with the instance path when not at the root)."""
+    lines = [f"{file_type} validation error: {error.message}"]
+    if error.path:
+        lines.append(f"  Path: {' -> '.join(str(p) for p in error.path)}")
+    return lines
+
+
+def schema_errors(data: Dict, validator: Any) -> List[Any]:
+    """Every schema error of a document, in instance path order."""
+    # Array indices sort numerically and before object keys at the same depth
+    return sorted(
+        validator.iter_errors(data),
+        key=lambda e: [(not isinstance(p, int), p if isinstance(p, int) else str(p)) for p in e.path],
+    )
+
+
+def validate_file(data: Dict, schema: Any, file_type: str) -> Tuple[bool, List[str]]:
     """
-    Validate data against schema.
+    Validate data against schema (a schema dict or a compiled validator).
     
     Returns:
-        Tuple of (is_valid, error_messages)
+        Tuple of (is_valid, error_messages) with every error, in instance path order
     """
-    errors = []
+    validator = compile_schema(schema) if isinstance(schema, dict) else schema
+    found = schema_errors(data, validator)
     
+    errors = []
+    for error in found:
+        errors.extend(format_error(error, file_type))
+    return not found, errors
+
+
+def validate_path(data_path: Path, validator: Any, file_type: str) -> FileResult:
+    """Load one file and validate it with a compiled validator, timing the two steps separately."""
+    start = time.perf_counter()
     try:
-        validate(instance=data, schema=schema)
-        return True, []
-    except ValidationError as e:
-        errors.append(f"{file_type} validation error: {e.message}")
-        if e.path:
-            errors.append(f"  Path: {' -> '.join(str(p) for p in e.path)}")
-        return False, errors
+        data = load_data_file(data_path)
+    except Exception as e:
+        return FileResult(data_path, file_type, False,
+                          [f"Error loading {file_type.lower()} file: {e}"], 1,
+                          time.perf_counter() - start, 0.0)
+    loaded = time.perf_counter()
+    
+    found = schema_errors(data, validator)
+    errors = [line for error in found for line in format_error(error, file_type)]
+    return FileResult(data_path, file_type, not found, errors, len(found),
+                      loaded - start, time.perf_counter() - loaded)
 
 
-def validate_weights_file(weights_path: Path, schema_path: Path) -> Tuple[bool, List[str]]:
+def validate_weights_file(weights_path: Path, schema_path: Path = SCHEMA_PATHS["Weights"]) -> Tuple[bool, List[str]]:
     """Validate a weights file against the weights schema."""
     try:
-        schema = load_schema(schema_path)
-        data = load_data_file(weights_path)
-        return validate_file(data, schema, "Weights")
+        validator = load_validator(schema_path)
     except Exception as e:
-        return False, [f"Error loading weights file: {e}"]
+        return False, [f"Error loading weights schema: {e}"]
+    result = validate_path(weights_path, validator, "Weights")
+    return result.valid, result.errors
 
 
-def validate_evidence_file(evidence_path: Path, schema_path: Path) -> Tuple[bool, List[str]]:
+def validate_evidence_file(evidence_path: Path, schema_path: Path = SCHEMA_PATHS["Evidence"]) -> Tuple[bool, List[str]]:
     """Validate an evidence file against the evidence schema."""
     try:
-        schema = load_schema(schema_path)
-        data = load_data_file(evidence_path)
-        return validate_file(data, schema, "Evidence")
+        validator = load_validator(schema_path)
     except Exception as e:
-        return False, [f"Error loading evidence file: {e}"]
+        return False, [f"Error loading evidence schema: {e}"]
+    result = validate_path(evidence_path, validator, "Evidence")
+    return result.valid, result.errors
+
+
+def discover_files(data_dirs=DATA_DIRS) -> List[Tuple[str, Path]]:
+    """(file type, path) for every data file, directory by directory in sorted order."""
+    return [
+        (file_type, path)
+        for file_type, directory, pattern in data_dirs
+        for path in sorted(directory.glob(pattern))
+    ]
+
+
+def validate_batch(files: List[Tuple[str, Path]], validators: Optional[Dict[str, Any]] = None,
+                   on_result=None) -> List[FileResult]:
+    """
+    Validate many files in one process against validators compiled once.
+    
+    Args:
+        files: (file type, path) pairs, as from discover_files()
+        validators: Compiled validator per file type (default: SCHEMA_PATHS via load_validator)
+        on_result: Optional callback for each FileResult as it completes
+    """
+    if validators is None:
+        validators = {file_type: load_validator(path) for file_type, path in SCHEMA_PATHS.items()}
+    results = []
+    for file_type, path in files:
+        result = validate_path(path, validators[file_type], file_type)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def format_result(result: FileResult) -> List[str]:
+    """Per-file line (status, timing) followed by its errors."""
+    status = "✓" if result.valid else "✗"
+    summary = (
+        f"{status} {result.path.name:<40} "
+        f"load {result.load_seconds * 1000:7.2f} ms  validate {result.validate_seconds * 1000:7.2f} ms"
+    )
+    if not result.valid:
+        summary += f"  ({result.error_count} errors)"
+    return [summary] + [f"    {error}" for error in result.errors]
+
+
+def summary_table(results: List[FileResult], compile_seconds: Optional[float] = None) -> str:
+    """Files, failures, errors and time per file type, plus the slowest file of each."""
+    header = f"{'Type':<10} {'Files':>6} {'Valid':>6} {'Failed':>7} {'Errors':>7} {'Load ms':>9} {'Valid. ms':>10}  Slowest"
+    lines = [header, "-" * len(header)]
+    
+    rows = {}
+    for result in results:
+        rows.setdefault(result.file_type, []).append(result)
+    rows["Total"] = results
+    
+    for file_type, group in rows.items():
+        if not group:
+            continue
+        slowest = max(group, key=lambda r: r.load_seconds + r.validate_seconds)
+        errors = sum(r.error_count for r in group)
+        lines.append(
+            f"{file_type:<10} {len(group):>6} {sum(r.valid for r in group):>6} "
+            f"{sum(not r.valid for r in group):>7} {errors:>7} "
+            f"{sum(r.load_seconds for r in group) * 1000:>9.2f} "
+            f"{sum(r.validate_seconds for r in group) * 1000:>10.2f}  {slowest.path.name}"
+        )
+    
+    if compile_seconds is not None:
+        lines.append(f"Schema compilation: {compile_seconds * 1000:.2f} ms (once per process)")
+    return "\n".join(lines)
+
+
+def run_batch() -> int:
+    """Validate every star-map and evidence file; print per-file results and the summary table."""
+    start = time.perf_counter()
+    validators = {file_type: load_validator(path) for file_type, path in SCHEMA_PATHS.items()}
+    compile_seconds = time.perf_counter() - start
+    
+    files = discover_files()
+    print(f"Validating {len(files)} files against {len(validators)} compiled schemas")
+    print()
+    results = validate_batch(files, validators, on_result=lambda result: print("\n".join(format_result(result))))
+    
+    print()
+    print(summary_table(results, compile_seconds))
+    print(f"Total: {(time.perf_counter() - start) * 1000:.2f} ms")
+    
+    if all(result.valid for result in results):
+        print("\n✓ All validations passed")
+        return 0
+    print("\n✗ Validation failures detected")
+    return 1
 
 
 def main():
@@ -100,30 +248,36 @@ def main():
         type=Path,
         help="Path to evidence file to validate"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every file in GPT-5/star-maps/ and GPT-5/evidence/"
+    )
     
     args = parser.parse_args()
     
-    # Determine file paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    if jsonschema is None:
+        print("ERROR: jsonschema package not installed", file=sys.stderr)
+        print("Install with: pip install jsonschema", file=sys.stderr)
+        return 1
     
-    weights_schema_path = project_root / "schemas" / "weights.schema.json"
-    evidence_schema_path = project_root / "schemas" / "evidence.schema.json"
+    if args.all:
+        return run_batch()
     
     # Use example files if not specified
     if args.weights:
         weights_path = args.weights
     else:
-        weights_path = project_root / "star-maps" / "gateLine_star_map_Gate01.json"
+        weights_path = PROJECT_ROOT / "star-maps" / "gateLine_star_map_Gate01.json"
     
     if args.evidence:
         evidence_path = args.evidence
     else:
-        evidence_path = project_root / "evidence" / "gateLine_evidence_Gate01.json"
+        evidence_path = PROJECT_ROOT / "evidence" / "gateLine_evidence_Gate01.json"
     
     # Validate weights file
     print(f"Validating weights file: {weights_path}")
-    weights_valid, weights_errors = validate_weights_file(weights_path, weights_schema_path)
+    weights_valid, weights_errors = validate_weights_file(weights_path)
     
     if weights_valid:
         print("✓ Weights file is valid")
@@ -136,7 +290,7 @@ def main():
     
     # Validate evidence file
     print(f"Validating evidence file: {evidence_path}")
-    evidence_valid, evidence_errors = validate_evidence_file(evidence_path, evidence_schema_path)
+    evidence_valid, evidence_errors = validate_evidence_file(evidence_path)
     
     if evidence_valid:
         print("✓ Evidence file is valid")
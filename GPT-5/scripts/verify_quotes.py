@@ -8,20 +8,51 @@ This script validates:
 - Locator format and accuracy
 - Legge same-line requirement for weights >0.50
 - Line Companion line-agnostic matching within gate
+- Cross-gate locator checks (a quote found under another gate/hexagram)
+- With --approx, the closest approximate match for quotes not found
+  verbatim (OCR noise, punctuation drift), within an edit-distance budget
+
+Sources are indexed once (quote_index.QuoteIndex: normalized token
+shingles), so each quote is a few hash probes plus a substring check on the
+candidate lines instead of a normalize-and-scan of every line.
+
+Batch mode (--all / --gates) verifies many gates in one process, optionally
+across a worker pool, reusing the loaded sources and their normalized
+indexes, and can write a JSON report (--report) with a summary, per-gate
+timings and one record per error.
 
 Usage:
     python verify_quotes.py GATE_NUMBER
     python verify_quotes.py 01
+    python verify_quotes.py --all --jobs 4 --report quote-report.json
+    python verify_quotes.py --gates 01-10
+    python verify_quotes.py 01 --approx --max-error-rate 0.1
 """
 
 import argparse
 import json
+import multiprocessing
 import re
 import sys
+import time
 import unicodedata
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Shared gate/hexagram loaders live with the lore-research pipeline scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "lore-research" / "scripts"))
+from gate_corpus import get_corpus
+from utils import map_gates, parse_gate_spec, parse_jobs
+from approx_match import DEFAULT_MAX_ERROR_RATE, ApproxLocator
+from quote_index import QuoteIndex
+
+# Gate-level indexes keyed by id() of the (shared, read-only) source dict;
+# the dict itself is kept alongside so its id cannot be reused
+_GATE_INDEXES: Dict[Tuple[str, int], Tuple[Dict, QuoteIndex]] = {}
+_CORPUS_INDEXES: Dict[str, QuoteIndex] = {}
+
 
 def normalize_text(text: str) -> str:
     """
@@ -138,80 +169,105 @@ def parse_line_companion_locator(locator: str) -> Optional[Tuple[int, int]]:
 
 
 def load_legge_source(gate: int) -> Dict:
-    """Load Legge I Ching hexagram source file."""
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent.parent
-    
-    # Try multiple possible locations
-    possible_paths = [
-        project_root / "claude" / "I-Ching-Full-Pass" / f"hexagram-{gate:02d}.json",
-        project_root / "s3-data" / "hexagrams" / f"{gate:02d}.json",
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+    """
+    Load Legge I Ching hexagram source file.
     
-    raise FileNotFoundError(f"Legge source not found for hexagram {gate}")
+    Resolved through GateCorpus: claude/I-Ching-Full-Pass first, then
+    s3-data/hexagrams.
+    """
+    legge_data = get_corpus().legge(gate)
+    if legge_data is None:
+        raise FileNotFoundError(f"Legge source not found for hexagram {gate}")
+    return legge_data
 
 
 def load_line_companion_source(gate: int) -> Dict:
-    """Load Line Companion gate source file."""
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent.parent
-    
-    # Try multiple possible locations
-    possible_paths = [
-        project_root / "claude" / "Full Pass" / f"gate-{gate}-full.json",
-        project_root / "s3-data" / "gates" / f"{gate:02d}.json",
-        project_root / "lore-research" / "research-outputs" / "line-companion" / "gates" / f"gate-{gate:02d}.json",
-    ]
+    """
+    Load Line Companion gate source file.
     
-    for path in possible_paths:
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+    Resolved through GateCorpus: claude/Full Pass first, then s3-data/gates,
+    then the pipeline's line-companion/gates output.
+    """
+    lc_data = get_corpus().line_companion(gate)
+    if lc_data is None:
+        raise FileNotFoundError(f"Line Companion source not found for gate {gate}")
+    return lc_data
+
+
+def add_legge_documents(index: QuoteIndex, legge_data: Dict, gate: Optional[int] = None) -> None:
+    """Index a Legge hexagram: each line's text, then full_text (line None)."""
+    for line_obj in legge_data.get('lines', []):
+        index.add((gate, line_obj.get('line')), line_obj.get('legge_line_text', ''))
+    full_text = legge_data.get('full_text', '')
+    if full_text:
+        index.add((gate, None), full_text)
+
+
+def add_line_companion_documents(index: QuoteIndex, lc_data: Dict, gate: Optional[int] = None) -> None:
+    """Index a Line Companion gate: each line's full_text."""
+    for line_obj in lc_data.get('lines', []):
+        index.add((gate, line_obj.get('line')), line_obj.get('full_text', ''))
+
+
+_DOCUMENT_BUILDERS = {
+    'legge': add_legge_documents,
+    'line_companion': add_line_companion_documents,
+}
+
+
+def gate_quote_index(source: str, data: Dict) -> QuoteIndex:
+    """
+    Quote index over one gate's source dict ('legge' or 'line_companion'),
+    built once per dict and reused for every quote checked against it.
+    """
+    cached = _GATE_INDEXES.get((source, id(data)))
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    index = QuoteIndex(normalize_text)
+    _DOCUMENT_BUILDERS[source](index, data, data.get('gate'))
+    _GATE_INDEXES[(source, id(data))] = (data, index)
+    return index
+
+
+def corpus_quote_index(source: str) -> QuoteIndex:
+    """
+    Quote index over all 64 gates of a source ('legge' or 'line_companion'),
+    used for cross-gate locator checks. Built on first use; gates whose
+    source file is missing are skipped.
     
-    raise FileNotFoundError(f"Line Companion source not found for gate {gate}")
+    Documents are copied from the per-gate indexes (gate_quote_index), so
+    each gate's text is normalized once per process however many quotes,
+    gates or cross-gate checks use it.
+    """
+    if source not in _CORPUS_INDEXES:
+        corpus = get_corpus()
+        index = QuoteIndex(normalize_text)
+        for gate in range(1, 65):
+            data = corpus.legge(gate) if source == 'legge' else corpus.line_companion(gate)
+            if data is not None:
+                gate_index = gate_quote_index(source, data)
+                for (_, line), text in zip(gate_index.keys, gate_index.texts):
+                    index.add((gate, line), text, normalized=True)
+        _CORPUS_INDEXES[source] = index
+    return _CORPUS_INDEXES[source]
 
 
 def find_quote_in_legge(quote: str, legge_data: Dict, expected_line: int) -> Tuple[bool, Optional[int]]:
     """
     Find quote in Legge source and return (found, actual_line).
     
+    Lines are checked in order, then full_text; a quote only found in
+    full_text has no line.
+    
     Returns:
         (True, line_number) if found
+        (True, None) if found in full_text only
         (False, None) if not found
     """
-    normalized_quote = normalize_text(quote)
-    
-    # Check each line
-    for line_obj in legge_data.get('lines', []):
-        line_num = line_obj.get('line')
-        line_text = line_obj.get('legge_line_text', '')
-        
-        normalized_line = normalize_text(line_text)
-        
-        if normalized_quote in normalized_line:
-            return (True, line_num)
-    
-    # Also check full_text if available
-    full_text = legge_data.get('full_text', '')
-    if full_text:
-        normalized_full = normalize_text(full_text)
-        if normalized_quote in normalized_full:
-            # Try to determine which line it's from
-            for line_obj in legge_data.get('lines', []):
-                line_num = line_obj.get('line')
-                line_text = line_obj.get('legge_line_text', '')
-                normalized_line = normalize_text(line_text)
-                if normalized_quote in normalized_line:
-                    return (True, line_num)
-            # Found in full text but can't determine line
-            return (True, None)
-    
-    return (False, None)
+    key = gate_quote_index('legge', legge_data).find(quote)
+    if key is None:
+        return (False, None)
+    return (True, key[1])
 
 
 def find_quote_in_line_companion(quote: str, lc_data: Dict, expected_gate: int) -> Tuple[bool, Optional[int], Optional[int]]:
@@ -224,21 +280,44 @@ def find_quote_in_line_companion(quote: str, lc_data: Dict, expected_gate: int)
         (True, gate, line) if found
         (False, None, None) if not found
     """
-    normalized_quote = normalize_text(quote)
-    
-    gate_num = lc_data.get('gate')
+    key = gate_quote_index('line_companion', lc_data).find(quote)
+    if key is None:
+        return (False, None, None)
+    return (True, key[0], key[1])
+
+
+def find_quote_in_other_gates(quote: str, source: str, expected_gate: int) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Look a quote up across the whole corpus of a source.
     
-    # Check each line's full_text
-    for line_obj in lc_data.get('lines', []):
-        line_num = line_obj.get('line')
-        full_text = line_obj.get('full_text', '')
-        
-        normalized_text = normalize_text(full_text)
-        
-        if normalized_quote in normalized_text:
-            return (True, gate_num, line_num)
+    Returns:
+        (gate, line) of the first match outside expected_gate, or None
+    """
+    for gate, line in corpus_quote_index(source).find_all(quote):
+        if gate != expected_gate:
+            return (gate, line)
+    return None
+
+
+def closest_match_hint(quote: str, source: str, data: Dict, max_error_rate: Optional[float]) -> str:
+    """
+    Describe the closest approximate match of a quote within one gate's source.
     
-    return (False, None, None)
+    Returns:
+        '; closest match in Line L (N edit(s), similarity S): "..."' (or
+        'in full text'), or '' if max_error_rate is None or nothing is
+        within the budget
+    """
+    if max_error_rate is None:
+        return ""
+    match = ApproxLocator(gate_quote_index(source, data)).find(quote, max_error_rate=max_error_rate)
+    if match is None:
+        return ""
+    where = f"Line {match.key[1]}" if match.key[1] is not None else "full text"
+    return (
+        f"; closest match in {where} ({match.distance} edit(s), "
+        f"similarity {match.similarity:.3f}): \"{match.text}\""
+    )
 
 
 def validate_quote_length(quote: str, line_key: str, star_system: str, source_type: str) -> List[str]:
@@ -262,9 +341,18 @@ def validate_legge_quote(
     line_key: str,
     star_system: str,
     weight: float,
-    legge_data: Dict
+    legge_data: Dict,
+    cross_gate: bool = False,
+    max_error_rate: Optional[float] = None
 ) -> List[str]:
-    """Validate Legge quote against source."""
+    """
+    Validate Legge quote against source.
+    
+    With cross_gate, a quote missing from this hexagram is looked up in all
+    others so a wrong-hexagram locator is reported as such. With
+    max_error_rate, a quote not found anywhere gets its closest approximate
+    match in this hexagram appended to the error.
+    """
     errors = []
     
     # Skip if empty quote (allowed for weights ≤0.50)
@@ -300,11 +388,22 @@ def validate_legge_quote(
     
     # Find quote in source
     found, actual_line = find_quote_in_legge(quote, legge_data, expected_line)
+    elsewhere = None
+    if not found and cross_gate:
+        elsewhere = find_quote_in_other_gates(quote, 'legge', int(line_key.split('.')[0]))
     
-    if not found:
+    if elsewhere is not None:
+        other_gate, other_line = elsewhere
+        errors.append(
+            f"{line_key} ({star_system}, Legge): "
+            f"Locator gate mismatch: expected Hex {locator_gate:02d} Line {expected_line}, "
+            f"but quote found in Hex {other_gate:02d}" + (f" Line {other_line}" if other_line else "")
+        )
+    elif not found:
         errors.append(
             f"{line_key} ({star_system}, Legge): "
             f"Quote not found verbatim in source: Legge {locator}"
+            + closest_match_hint(quote, 'legge', legge_data, max_error_rate)
         )
     elif actual_line is not None and actual_line != expected_line:
         errors.append(
@@ -321,9 +420,18 @@ def validate_line_companion_quote(
     locator: str,
     line_key: str,
     star_system: str,
-    lc_data: Dict
+    lc_data: Dict,
+    cross_gate: bool = False,
+    max_error_rate: Optional[float] = None
 ) -> List[str]:
-    """Validate Line Companion quote against source."""
+    """
+    Validate Line Companion quote against source.
+    
+    With cross_gate, a quote missing from this gate is looked up in all
+    other gates so a wrong-gate locator is reported as such. With
+    max_error_rate, a quote not found anywhere gets its closest approximate
+    match in this gate appended to the error.
+    """
     errors = []
     
     # Skip if empty quote
@@ -354,11 +462,17 @@ def validate_line_companion_quote(
     
     # Find quote in source (line-agnostic within gate)
     found, actual_gate, actual_line = find_quote_in_line_companion(quote, lc_data, expected_gate)
+    if not found and cross_gate:
+        elsewhere = find_quote_in_other_gates(quote, 'line_companion', expected_gate)
+        if elsewhere is not None:
+            found = True
+            actual_gate, actual_line = elsewhere
     
     if not found:
         errors.append(
             f"{line_key} ({star_system}, Line Companion): "
             f"Quote not found verbatim in source: Line Companion {locator}"
+            + closest_match_hint(quote, 'line_companion', lc_data, max_error_rate)
         )
     elif actual_gate is not None and actual_gate != expected_gate:
         errors.append(
@@ -374,7 +488,9 @@ def validate_evidence_file(
     evidence: Dict,
     weights: Dict,
     legge_data: Dict,
-    lc_data: Dict
+    lc_data: Dict,
+    cross_gate: bool = False,
+    max_error_rate: Optional[float] = None
 ) -> List[str]:
     """Validate all quotes in evidence file."""
     all_errors = []
@@ -409,7 +525,7 @@ def validate_evidence_file(
                 
                 # Verbatim and locator validation
                 errors = validate_legge_quote(
-                    legge_quote, legge_locator, line_key, star_system, weight, legge_data
+                    legge_quote, legge_locator, line_key, star_system, weight, legge_data, cross_gate, max_error_rate
                 )
                 all_errors.extend(errors)
             elif weight > 0.50:
@@ -431,13 +547,186 @@ def validate_evidence_file(
                 
                 # Verbatim and locator validation
                 errors = validate_line_companion_quote(
-                    lc_quote, lc_locator, line_key, star_system, lc_data
+                    lc_quote, lc_locator, line_key, star_system, lc_data, cross_gate, max_error_rate
                 )
                 all_errors.extend(errors)
     
     return all_errors
 
 
+# Error message prefix -> machine-readable kind for batch reports
+ERROR_KINDS = (
+    ("Quote exceeds", "quote_too_long"),
+    ("Quote not found verbatim", "quote_not_found"),
+    ("Locator format invalid", "locator_format"),
+    ("Locator line mismatch", "locator_line_mismatch"),
+    ("Locator gate mismatch", "locator_gate_mismatch"),
+    ("Missing Legge quote", "missing_legge_quote"),
+)
+
+_ERROR_RE = re.compile(
+    r'^(?P<line_key>\S+) \((?P<star_system>[^,)]*)(?:, (?P<source>[^)]+))?\): (?P<message>.*)$',
+    re.DOTALL
+)
+_CLOSEST_RE = re.compile(
+    r'; closest match in (?:Line (?P<line>\d+)|full text) '
+    r'\((?P<distance>\d+) edit\(s\), similarity (?P<similarity>[\d.]+)\): "(?P<text>.*)"$',
+    re.DOTALL
+)
+
+
+def error_record(gate: int, error: str) -> Dict:
+    """
+    Split an error string from validate_evidence_file into a report record.
+    
+    Returns:
+        Dict with gate, line_key, star_system, source, kind, message and
+        closest (line, distance, similarity and text of the approximate
+        match, or None). Fields that cannot be recovered are None; kind
+        falls back to "other".
+    """
+    match = _ERROR_RE.match(error)
+    fields = match.groupdict() if match else {'line_key': None, 'star_system': None, 'source': None, 'message': error}
+    kind = next((k for prefix, k in ERROR_KINDS if fields['message'].startswith(prefix)), "other")
+    closest = _CLOSEST_RE.search(fields['message'])
+    if closest:
+        closest = {
+            'line': int(closest.group('line')) if closest.group('line') else None,
+            'distance': int(closest.group('distance')),
+            'similarity': float(closest.group('similarity')),
+            'text': closest.group('text'),
+        }
+    return {'gate': gate, **fields, 'kind': kind, 'closest': closest}
+
+
+def gate_file_paths(gate_num: int) -> Tuple[Path, Path]:
+    """(star-map weights path, evidence path) for a gate."""
+    project_root = Path(__file__).parent.parent
+    return (
+        project_root / "star-maps" / f"gateLine_star_map_Gate{gate_num:02d}.json",
+        project_root / "evidence" / f"gateLine_evidence_Gate{gate_num:02d}.json",
+    )
+
+
+def load_gate_inputs(gate_num: int) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    Load (weights, evidence, legge_data, lc_data) for a gate.
+    
+    Raises:
+        OSError, ValueError: If a file is missing or not valid JSON
+    """
+    weights_path, evidence_path = gate_file_paths(gate_num)
+    with open(weights_path, 'r', encoding='utf-8') as f:
+        weights = json.load(f)
+    with open(evidence_path, 'r', encoding='utf-8') as f:
+        evidence = json.load(f)
+    return weights, evidence, load_legge_source(gate_num), load_line_companion_source(gate_num)
+
+
+def verify_gate(gate_num: int, cross_gate: bool = True,
+                max_error_rate: Optional[float] = None) -> Dict:
+    """
+    Verify one gate's evidence file (batch worker; module-level so it pickles).
+    
+    Returns:
+        Dict with gate, status ("passed", "failed" or "error"), errors (the
+        validate_evidence_file strings), load_error and seconds
+    """
+    start = time.perf_counter()
+    result = {'gate': gate_num, 'status': 'passed', 'errors': [], 'load_error': None}
+    try:
+        weights, evidence, legge_data, lc_data = load_gate_inputs(gate_num)
+    except Exception as e:
+        result.update(status='error', load_error=str(e))
+    else:
+        result['errors'] = validate_evidence_file(
+            evidence, weights, legge_data, lc_data, cross_gate, max_error_rate
+        )
+        if result['errors']:
+            result['status'] = 'failed'
+    result['seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def build_report(results: List[Dict], wall_seconds: float, cross_gate: bool, jobs: int,
+                 max_error_rate: Optional[float] = None) -> Dict:
+    """Machine-readable batch report: summary, per-gate timings and per-error records."""
+    statuses = [r['status'] for r in results]
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'cross_gate': cross_gate,
+        'max_error_rate': max_error_rate,
+        'jobs': jobs,
+        'summary': {
+            'gates': len(results),
+            'passed': statuses.count('passed'),
+            'failed': statuses.count('failed'),
+            'load_errors': statuses.count('error'),
+            'errors': sum(len(r['errors']) for r in results),
+            'wall_seconds': round(wall_seconds, 4),
+            'gate_seconds': round(sum(r['seconds'] for r in results), 4),
+        },
+        'gates': [
+            {
+                'gate': r['gate'],
+                'status': r['status'],
+                'errors': len(r['errors']),
+                'load_error': r['load_error'],
+                'seconds': r['seconds'],
+            }
+            for r in results
+        ],
+        'errors': [error_record(r['gate'], err) for r in results for err in r['errors']],
+    }
+
+
+def run_batch(gates: List[int], cross_gate: bool, jobs: int, report_path: Optional[Path],
+              max_error_rate: Optional[float] = None) -> int:
+    """Verify several gates in one process (or worker pool) and print a summary."""
+    start = time.perf_counter()
+    # Where fork is available, build the corpus indexes up front and fork the
+    # workers so they inherit them; under spawn/forkserver each worker builds
+    # its own on first use
+    mp_context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+        if cross_gate and jobs > 1:
+            corpus_quote_index('legge')
+            corpus_quote_index('line_companion')
+    results = map_gates(
+        partial(verify_gate, cross_gate=cross_gate, max_error_rate=max_error_rate), gates, jobs, mp_context
+    )
+    wall_seconds = time.perf_counter() - start
+    
+    print(f"Verifying quotes for {len(gates)} gate(s)...")
+    print()
+    for r in results:
+        if r['status'] == 'passed':
+            print(f"  ✓ Gate {r['gate']:02d} ({r['seconds']:.3f}s)")
+        elif r['status'] == 'error':
+            print(f"  ✗ Gate {r['gate']:02d}: ERROR loading files: {r['load_error']}")
+        else:
+            print(f"  ✗ Gate {r['gate']:02d}: {len(r['errors'])} error(s) ({r['seconds']:.3f}s)")
+            for err in r['errors']:
+                print(f"      ✗ {err}")
+    
+    report = build_report(results, wall_seconds, cross_gate, jobs, max_error_rate)
+    summary = report['summary']
+    print()
+    print(
+        f"{summary['passed']} passed, {summary['failed']} failed, {summary['load_errors']} load error(s); "
+        f"{summary['errors']} quote error(s) in {summary['wall_seconds']:.2f}s"
+    )
+    
+    if report_path:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report written to {report_path}")
+    
+    return 1 if summary['failed'] or summary['load_errors'] else 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -446,10 +735,60 @@ def main():
     parser.add_argument(
         "gate",
         type=str,
+        nargs="?",
         help="Gate number (01-64, zero-padded)"
     )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--all",
+        action="store_true",
+        help="Verify all 64 gates in one run"
+    )
+    selection.add_argument(
+        "--gates",
+        type=parse_gate_spec,
+        default=None,
+        help="Gates to verify in one run, e.g. 1,5,10-12 or 01-64"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=parse_jobs,
+        default=1,
+        help="Worker processes for --all/--gates (default: 1, 0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="Write a JSON report (summary, per-gate timings, per-error records) for --all/--gates"
+    )
+    parser.add_argument(
+        "--no-cross-gate",
+        action="store_true",
+        help="Do not look up unmatched quotes in other gates/hexagrams"
+    )
+    parser.add_argument(
+        "--approx",
+        action="store_true",
+        help="Append the closest approximate match to quotes not found verbatim"
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=DEFAULT_MAX_ERROR_RATE,
+        help=f"Edit budget for --approx, as a fraction of quote length (default: {DEFAULT_MAX_ERROR_RATE})"
+    )
     
     args = parser.parse_args()
+    max_error_rate = args.max_error_rate if args.approx else None
+    
+    if args.all or args.gates:
+        if args.gate:
+            parser.error("give either a gate number or --all/--gates, not both")
+        gates = list(range(1, 65)) if args.all else args.gates
+        return run_batch(gates, not args.no_cross_gate, args.jobs, args.report, max_error_rate)
+    if not args.gate:
+        parser.error("a gate number, --all or --gates is required")
     
     # Validate gate format
     if not args.gate.isdigit() or len(args.gate) != 2:
@@ -461,22 +800,9 @@ def main():
         print(f"ERROR: Gate must be 01-64, got: {args.gate}", file=sys.stderr)
         return 1
     
-    # Determine file paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    
-    weights_path = project_root / "star-maps" / f"gateLine_star_map_Gate{args.gate}.json"
-    evidence_path = project_root / "evidence" / f"gateLine_evidence_Gate{args.gate}.json"
-    
     # Load files
     try:
-        with open(weights_path, 'r', encoding='utf-8') as f:
-            weights = json.load(f)
-        with open(evidence_path, 'r', encoding='utf-8') as f:
-            evidence = json.load(f)
-        
-        legge_data = load_legge_source(gate_num)
-        lc_data = load_line_companion_source(gate_num)
+        weights, evidence, legge_data, lc_data = load_gate_inputs(gate_num)
     except Exception as e:
         print(f"ERROR loading files: {e}", file=sys.stderr)
         return 1
@@ -485,7 +811,9 @@ def main():
     print(f"Verifying quotes for Gate {args.gate}...")
     print()
     
-    errors = validate_evidence_file(evidence, weights, legge_data, lc_data)
+    errors = validate_evidence_file(
+        evidence, weights, legge_data, lc_data, not args.no_cross_gate, max_error_rate
+    )
     
     if errors:
         print(f"✗ Quote verification FAILED with {len(errors)} error(s):")
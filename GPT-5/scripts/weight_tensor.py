@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Dense weight tensor over all star maps, for corpus-wide invariant checks.
+
+Every loaded star map becomes 6 lines x 8 systems (CANONICAL_SYSTEMS order)
+of one flat array, indexed ((gate * 6) + line) * 8 + system:
+
+    weights    array('d')  system weight (0.0 when not listed)
+    roles      array('b')  ROLES code (0 = not listed, -1 = unrecognised)
+    polarity   array('b')  POLARITIES code (same convention)
+    present    array('b')  per line: the key exists with an array value
+    listed     array('b')  per line: number of entries as written
+    primaries  array('b')  per line: entries with role "primary", as written
+    secondaries array('b') per line: entries with role "secondary", as written
+    primary_weight, secondary_weight  array('d')  per line: weight of the
+                           first primary / secondary entry as written
+    sum_unorm  array('d')  per gate: declared _meta.sum_unorm (nan if missing)
+
+The layout matches a C-ordered (gates, 6, 8) float64 array, so
+``numpy.frombuffer(tensor.weights).reshape(-1, 6, 8)`` views it without a
+copy where NumPy is available; the checks below use strided slices of the
+flat arrays (``weights[s::8]`` is one system's column over every line of
+the corpus) and list comprehensions over zipped columns, so each rule is
+one pass over two columns instead of a dict per line.
+
+Entries that cannot be placed (non-canonical system name, line key outside
+NN.1-NN.6) are kept in ``unplaced``; a duplicated system keeps its last
+entry, as the per-line weight maps do. The per-line role counts and the
+sum_unorm total still cover every entry as written: weights that have no
+cell (unplaced or overwritten) are kept per gate in ``off_grid``.
+
+Usage:
+    tensor = WeightTensor.from_weights({"01": weights_01, "03": weights_03})
+    violations, stats = check_tensor(tensor, PAIRWISE_EXCLUSIONS, ORION_FACTION_RULE)
+"""
+
+import math
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from validate_gate_outputs import CANONICAL_SYSTEMS
+
+LINES = 6
+SYSTEMS = len(CANONICAL_SYSTEMS)
+SYSTEM_INDEX = {name: i for i, name in enumerate(CANONICAL_SYSTEMS)}
+
+# Code = position + 1; 0 = not listed, -1 = unrecognised value
+ROLES = ("primary", "secondary")
+POLARITIES = ("core", "shadow")
+PRIMARY = 1
+SECONDARY = 2
+
+TOP2_RULE = "Top-2"
+SUM_UNORM_RULE = "sum_unorm"
+
+
+def _code(value: Optional[str], names: Sequence[str]) -> int:
+    if value is None:
+        return 0
+    return names.index(value) + 1 if value in names else -1
+
+
+class Violation(NamedTuple):
+    gate: str
+    line_key: Optional[str]   # None for gate-level rules (sum_unorm)
+    rule: str
+    message: str
+
+
+class WeightTensor:
+    """Star-map weights, roles and polarities of many gates as flat typed arrays."""
+
+    def __init__(self, gates: Sequence[str]):
+        """
+        Initialize an all-zero tensor.
+
+        Args:
+            gates: Gate labels ("01", "03", ...), one per gate slot
+        """
+        self.gates = list(gates)
+        cells = len(self.gates) * LINES * SYSTEMS
+        self.weights = array("d", bytes(8 * cells))
+        self.roles = array("b", bytes(cells))
+        self.polarity = array("b", bytes(cells))
+        self.present = array("b", bytes(len(self.gates) * LINES))
+        self.listed = array("b", bytes(len(self.gates) * LINES))
+        self.primaries = array("b", bytes(len(self.gates) * LINES))
+        self.secondaries = array("b", bytes(len(self.gates) * LINES))
+        self.primary_weight = array("d", bytes(8 * len(self.gates) * LINES))
+        self.secondary_weight = array("d", bytes(8 * len(self.gates) * LINES))
+        self.sum_unorm = array("d", [math.nan] * len(self.gates))
+        self.unplaced: List[Tuple[str, str, object]] = []  # (gate, line key, entry)
+        self.off_grid: List[List[float]] = [[] for _ in self.gates]  # per gate: weights without a cell
+
+    @classmethod
+    def from_weights(cls, gate_weights: Dict[str, Dict]) -> "WeightTensor":
+        """Build from parsed star-map files keyed by gate label, in the dict's order."""
+        tensor = cls(list(gate_weights))
+        for g, (gate, weights) in enumerate(gate_weights.items()):
+            tensor.add_gate(g, gate, weights)
+        return tensor
+
+    def add_gate(self, g: int, gate: str, weights: Dict) -> None:
+        """Fill gate slot ``g`` from one parsed star-map file."""
+        declared = weights.get("_meta", {}).get("sum_unorm")
+        if declared is not None:
+            self.sum_unorm[g] = declared
+
+        for line_key, systems in weights.items():
+            if line_key == "_meta":
+                continue
+            line_part = line_key.rpartition(".")[2]
+            if not isinstance(systems, list) or line_part not in ("1", "2", "3", "4", "5", "6"):
+                self.unplaced.append((gate, line_key, systems))
+                if isinstance(systems, list):
+                    self.off_grid[g].extend(entry.get("weight", 0.0) for entry in systems)
+                continue
+            row = g * LINES + int(line_part) - 1
+            self.present[row] = 1
+            self.listed[row] = min(len(systems), 127)
+            for entry in systems:
+                role = entry.get("role")
+                if role == "primary":
+                    if not self.primaries[row]:
+                        self.primary_weight[row] = entry.get("weight", 0.0)
+                    self.primaries[row] = min(self.primaries[row] + 1, 127)
+                elif role == "secondary":
+                    if not self.secondaries[row]:
+                        self.secondary_weight[row] = entry.get("weight", 0.0)
+                    self.secondaries[row] = min(self.secondaries[row] + 1, 127)
+
+                s = SYSTEM_INDEX.get(entry.get("star_system"))
+                if s is None:
+                    self.unplaced.append((gate, line_key, entry))
+                    self.off_grid[g].append(entry.get("weight", 0.0))
+                    continue
+                cell = row * SYSTEMS + s
+                if self.roles[cell] or self.weights[cell]:
+                    # Duplicated system: the cell keeps the last entry
+                    self.off_grid[g].append(self.weights[cell])
+                self.weights[cell] = entry.get("weight", 0.0)
+                self.roles[cell] = _code(entry.get("role"), ROLES)
+                self.polarity[cell] = _code(entry.get("polarity"), POLARITIES)
+
+    def __len__(self) -> int:
+        return len(self.gates)
+
+    def column(self, star_system: str) -> array:
+        """One system's weights over every line of the corpus (row order)."""
+        return self.weights[SYSTEM_INDEX[star_system]::SYSTEMS]
+
+    def line_key(self, row: int) -> str:
+        gate = self.gates[row // LINES]
+        return f"{gate}.{row % LINES + 1}"
+
+
+# ----------------------------------------------------------------------
+# Corpus-wide checks
+# ----------------------------------------------------------------------
+# Each check returns (violating rows with their messages, rows the rule
+# applied to). Messages follow fuzz_invariants: "Gate NN, NN.L: ...".
+
+def _line_message(tensor: WeightTensor, row: int, text: str) -> str:
+    return f"Gate {tensor.gates[row // LINES]}, {tensor.line_key(row)}: {text}"
+
+
+def check_exclusion(tensor: WeightTensor, sys_a: str, sys_b: str, threshold_a: Optional[float],
+                    max_b: Optional[float]) -> Tuple[List[Tuple[int, str]], int]:
+    """If sys_a meets threshold_a (> for 0, >= otherwise), sys_b must be 0 / <= max_b."""
+    column_a, column_b = tensor.column(sys_a), tensor.column(sys_b)
+    threshold_a = threshold_a or 0.0
+    limit = 0.0 if max_b is None else max_b
+
+    if threshold_a > 0:
+        applies = [row for row, weight_a in enumerate(column_a) if weight_a >= threshold_a]
+    else:
+        applies = [row for row, weight_a in enumerate(column_a) if weight_a > threshold_a]
+    hits = [row for row in applies if column_b[row] > limit]
+
+    op = "≥" if threshold_a > 0 else ">"
+    constraint = f"{sys_b} = 0" if max_b is None else f"{sys_b} ≤ {max_b}"
+    return [
+        (row, _line_message(
+            tensor, row, f"{sys_a} {op} {threshold_a} requires {constraint}, but {sys_b} = {column_b[row]}"
+        ))
+        for row in hits
+    ], len(applies)
+
+
+def check_faction(tensor: WeightTensor, sys_a: str, sys_b: str,
+                  threshold: float) -> Tuple[List[Tuple[int, str]], int]:
+    """Both factions present: at least one must be <= threshold."""
+    both = [
+        (row, weight_a, weight_b)
+        for row, (weight_a, weight_b) in enumerate(zip(tensor.column(sys_a), tensor.column(sys_b)))
+        if weight_a > 0 and weight_b > 0
+    ]
+    light, dark = sys_a.split()[-1], sys_b.split()[-1]
+    return [
+        (row, _line_message(
+            tensor, row,
+            f"Orion faction conflict - both {light} ({weight_a}) and {dark} ({weight_b}) > {threshold}; "
+            f"one should be down-ranked"
+        ))
+        for row, weight_a, weight_b in both
+        if weight_a > threshold and weight_b > threshold
+    ], len(both)
+
+
+def check_top2(tensor: WeightTensor) -> Tuple[List[Tuple[int, str]], int]:
+    """At most 2 systems, exactly 1 primary, <=1 secondary, primary outweighs secondary.
+
+    Roles are counted from the entries as written, so non-canonical names and
+    duplicated systems count like any other entry.
+    """
+    hits = []
+    rows = [row for row, present in enumerate(tensor.present) if present]
+    for row in rows:
+        listed = tensor.listed[row]
+        if listed > 2:
+            hits.append((row, _line_message(tensor, row, f"Top-2 violation - found {listed} systems (max 2)")))
+            continue
+        primaries = tensor.primaries[row]
+        secondaries = tensor.secondaries[row]
+        if primaries != 1:
+            hits.append((row, _line_message(tensor, row, f"Must have exactly 1 primary, found {primaries}")))
+        if secondaries > 1:
+            hits.append((row, _line_message(tensor, row, f"Must have ≤1 secondary, found {secondaries}")))
+        if listed == 2 and primaries and secondaries:
+            primary = tensor.primary_weight[row]
+            secondary = tensor.secondary_weight[row]
+            if primary <= secondary:
+                hits.append((row, _line_message(
+                    tensor, row, f"Primary weight ({primary}) must be > secondary weight ({secondary})"
+                )))
+    return hits, len(rows)
+
+
+def check_sum_unorm(tensor: WeightTensor) -> Tuple[List[Tuple[int, str]], int]:
+    """Declared sum_unorm equals the gate's weight total incl. off_grid (math.fsum, to 0.01); rows are gate slots."""
+    block = LINES * SYSTEMS
+    hits = []
+    for g, declared in enumerate(tensor.sum_unorm):
+        if math.isnan(declared):
+            hits.append((g, f"Gate {tensor.gates[g]}: Missing sum_unorm in _meta block"))
+            continue
+        actual = round(math.fsum([*tensor.weights[g * block:(g + 1) * block], *tensor.off_grid[g]]), 2)
+        declared = round(declared, 2)
+        if abs(actual - declared) > 0.01:
+            hits.append((g, f"Gate {tensor.gates[g]}: sum_unorm mismatch: declared {declared}, "
+                            f"but sum of all weights = {actual}"))
+    return hits, len(tensor)
+
+
+def check_tensor(tensor: WeightTensor, exclusions: Sequence[Tuple], orion_rule: Tuple[str, str, float],
+                 ) -> Tuple[List[Violation], Dict[str, Dict[str, int]]]:
+    """
+    Run every corpus-wide check.
+
+    Args:
+        tensor: Loaded weight tensor
+        exclusions: (sys_a, sys_b, threshold_a, max_b) pairwise exclusion rules
+        orion_rule: (light, dark, threshold) faction conflict rule
+
+    Returns:
+        (violations, stats): violations ordered by gate, line, then rule
+        order (gate-level rules after the gate's lines); stats per rule name
+        with tested (lines present), applicable, violations and passes
+    """
+    checks = [
+        (f"{sys_a}/{sys_b}", check_exclusion(tensor, sys_a, sys_b, threshold_a, max_b), LINES)
+        for sys_a, sys_b, threshold_a, max_b in exclusions
+    ]
+    checks.append((f"{orion_rule[0]}/{orion_rule[1]}", check_faction(tensor, *orion_rule), LINES))
+    checks.append((TOP2_RULE, check_top2(tensor), LINES))
+    checks.append((SUM_UNORM_RULE, check_sum_unorm(tensor), 1))
+
+    lines_present = sum(tensor.present)
+    ordered = []
+    stats = {}
+    for rule_index, (rule, (hits, applicable), per_gate) in enumerate(checks):
+        tested = lines_present if per_gate == LINES else len(tensor)
+        violating = len({row for row, _ in hits})
+        stats[rule] = {
+            "tested": tested,
+            "applicable": applicable,
+            "violations": violating,
+            "passes": tested - violating,
+        }
+        for row, message in hits:
+            if per_gate == LINES:
+                gate, line_key, sort_key = row // LINES, tensor.line_key(row), (row // LINES, row % LINES)
+            else:
+                gate, line_key, sort_key = row, None, (row, LINES)
+            ordered.append(((*sort_key, rule_index), Violation(tensor.gates[gate], line_key, rule, message)))
+
+    ordered.sort(key=lambda entry: entry[0])
+    return [violation for _, violation in ordered], stats
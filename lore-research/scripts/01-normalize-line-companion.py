@@ -3,13 +3,14 @@
 Stage 1: Text Normalization
 
 Selects the best available Line Companion source and normalizes OCR text.
+The source is streamed line by line through all normalization rules and
+written incrementally, so memory stays flat regardless of source size.
+Structured sources (djvu.xml, ABBYY, EPUB; see source_readers) also record
+where each leaf starts in normalized.txt (normalized.pages.json).
 
 Requirements: FR-LC-1, FR-LC-2
 """
 
-import gzip
-import json
-import logging
 import os
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -17,6 +18,8 @@ from typing import Optional, List, Dict, Any
 from config import (
     LINE_COMPANION_SOURCES,
     LINE_COMPANION_NORMALIZED,
+    LINE_COMPANION_PAGE_OFFSETS,
+    LINE_COMPANION_SCANDATA,
     MAX_LINE_LENGTH,
     OCR_FIX_DICT,
     MAX_BLANK_LINES,
@@ -24,12 +27,12 @@ from config import (
 )
 from utils import (
     setup_logging,
-    read_text_file,
-    write_text_file,
-    detect_ocr_errors,
     ensure_directory,
     write_json_file,
 )
+from ocr_fixes import OCRFixEngine
+from source_readers import iter_source_lines, read_scandata_page_numbers
+from stream_normalizer import StreamingNormalizer, NormalizedTextSink
 
 
 logger = setup_logging(__name__)
@@ -136,9 +139,12 @@ class SourceSelector:
         }
 
 
-class TextNormalizer:
+class TextNormalizer(StreamingNormalizer):
     """
     Normalizes OCR text from Line Companion sources.
+    
+    All rules (line endings, OCR fixes, blank-line collapsing, mid-sentence
+    joins) run in a single streaming pass; see stream_normalizer.
     """
     
     def __init__(self, ocr_fix_dict: dict = None):
@@ -148,170 +154,64 @@ class TextNormalizer:
         Args:
             ocr_fix_dict: Dictionary of OCR error patterns to fix
         """
-        self.ocr_fix_dict = ocr_fix_dict or OCR_FIX_DICT
-    
-    def normalize(self, text: str) -> str:
-        """
-        Apply all normalization steps to text.
-        
-        Args:
-            text: Raw text to normalize
-        
-        Returns:
-            Normalized text
-        """
-        logger.info("Applying normalization steps...")
-        
-        # Step 1: Normalize line endings (CRLF → LF)
-        text = self._normalize_line_endings(text)
-        logger.info("  ✓ Normalized line endings")
-        
-        # Step 2: Apply OCR fixes
-        text = self._apply_ocr_fixes(text)
-        logger.info(f"  ✓ Applied {len(self.ocr_fix_dict)} OCR fixes")
-        
-        # Step 3: Collapse excessive blank lines
-        text = self._collapse_blank_lines(text)
-        logger.info("  ✓ Collapsed excessive blank lines")
-        
-        # Step 4: Join mid-sentence newlines
-        text = self._join_mid_sentence_newlines(text)
-        logger.info("  ✓ Joined mid-sentence newlines")
-        
-        return text
-    
-    def _normalize_line_endings(self, text: str) -> str:
-        """Convert CRLF to LF."""
-        return text.replace("\r\n", "\n").replace("\r", "\n")
-    
-    def _apply_ocr_fixes(self, text: str) -> str:
-        """Apply OCR error corrections."""
-        for error, fix in self.ocr_fix_dict.items():
-            text = text.replace(error, fix)
-        return text
-    
-    def _collapse_blank_lines(self, text: str, max_blank: int = MAX_BLANK_LINES) -> str:
-        """Collapse 3+ blank lines to max_blank."""
-        import re
-        # Replace 3 or more consecutive newlines with max_blank+1 newlines
-        pattern = r"\n{3,}"
-        replacement = "\n" * (max_blank + 1)
-        return re.sub(pattern, replacement, text)
-    
-    def _join_mid_sentence_newlines(self, text: str) -> str:
-        """
-        Join lines that were split mid-sentence.
-        
-        Heuristic: If a line doesn't end with sentence-ending punctuation
-        and the next line doesn't start with a capital letter or number,
-        join them.
-        """
-        import re
-        lines = text.split("\n")
-        result = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Empty line - keep as is
-            if not line:
-                result.append("")
-                i += 1
-                continue
-            
-            # Check if this line should be joined with next
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                
-                # Join if:
-                # - Current line doesn't end with sentence-ending punctuation
-                # - Next line exists and doesn't start with capital/number/special marker
-                if (
-                    next_line
-                    and not re.search(r"[.!?:]\s*$", line)
-                    and not re.match(r"^[A-Z0-9]", next_line)
-                    and not re.match(r"^(Gate|Line|HEXAGRAM|Exaltation|Detriment)", next_line)
-                ):
-                    # Join with space
-                    line = line + " " + next_line
-                    i += 2
-                    result.append(line)
-                    continue
-            
-            result.append(line)
-            i += 1
-        
-        return "\n".join(result)
+        super().__init__(
+            ocr_fix_dict or OCR_FIX_DICT,
+            max_blank=MAX_BLANK_LINES,
+            join_blockers=r"^(Gate|Line|HEXAGRAM|Exaltation|Detriment)",
+        )
 
 
-def load_source_text(source_path: Path) -> str:
+def load_page_numbers() -> Dict[int, str]:
+    """Printed page numbers per leaf from scandata.xml (empty if unavailable)."""
+    if not LINE_COMPANION_SCANDATA.exists():
+        return {}
+    try:
+        return read_scandata_page_numbers(LINE_COMPANION_SCANDATA)
+    except Exception as e:
+        logger.warning(f"  ⚠ Could not read page numbers from {LINE_COMPANION_SCANDATA.name}: {e}")
+        return {}
+
+
+def write_page_offsets_file(sink: NormalizedTextSink, source_metadata: Dict[str, Any]) -> None:
     """
-    Load text from source file, handling different formats.
+    Write (or clear) the leaf offset sidecar for normalized.txt.
     
-    Args:
-        source_path: Path to source file
+    Structured sources (djvu.xml, ABBYY, EPUB) carry page boundaries; plain
+    text sources do not, so a sidecar left by an earlier run is removed.
     
-    Returns:
-        Text content
-    
-    Raises:
-        ValueError: If file format is not supported
+    Args:
+        sink: Sink that wrote the normalized text (page offsets)
+        source_metadata: Metadata about the source file
     """
-    suffix = source_path.suffix.lower()
-    
-    if suffix == ".txt":
-        return read_text_file(source_path)
+    if not sink.page_offsets:
+        if LINE_COMPANION_PAGE_OFFSETS.exists():
+            LINE_COMPANION_PAGE_OFFSETS.unlink()
+            logger.info(f"  ✓ Removed stale page offsets: {LINE_COMPANION_PAGE_OFFSETS.name}")
+        return
     
-    elif suffix == ".gz":
-        # Handle gzipped files (like abbyy.gz)
-        with gzip.open(source_path, "rt", encoding="utf-8") as f:
-            return f.read()
-    
-    elif suffix == ".epub":
-        # For MVP, we'll treat epub as unsupported and require manual extraction
-        # In Phase 2, could use ebooklib
-        raise ValueError(
-            f"EPUB format requires manual extraction. "
-            f"Please extract text from {source_path.name} and save as .txt"
-        )
-    
-    elif suffix == ".xml":
-        # For MVP, we'll read XML as text
-        # In Phase 2, could parse XML structure
-        return read_text_file(source_path)
-    
-    else:
-        raise ValueError(f"Unsupported file format: {suffix}")
+    write_json_file(LINE_COMPANION_PAGE_OFFSETS, {
+        "source_file": source_metadata["source_file"],
+        "total_characters": sink.total_characters,
+        "pages": sink.page_offsets,
+    })
+    logger.info(f"  ✓ Written page offsets: {LINE_COMPANION_PAGE_OFFSETS.name} ({len(sink.page_offsets)} pages)")
 
 
-def write_index_file(normalized_text: str, source_metadata: Dict[str, Any]) -> None:
+def write_index_file(sink: NormalizedTextSink, source_metadata: Dict[str, Any]) -> None:
     """
     Write companion index file with metadata for LLM-assisted review.
     
     Args:
-        normalized_text: The normalized text content
+        sink: Sink that wrote the normalized text (line counts and samples)
         source_metadata: Metadata about the source file
     """
-    lines = normalized_text.split("\n")
-    total_lines = len(lines)
-    
-    # Generate sample offsets (every 100 lines for review)
-    sample_offsets = []
-    for i in range(0, total_lines, 100):
-        if i < total_lines:
-            sample_offsets.append({
-                "line_number": i + 1,
-                "preview": lines[i][:80] + "..." if len(lines[i]) > 80 else lines[i]
-            })
-    
     index_data = {
         "source_file": source_metadata["source_file"],
         "source_path": source_metadata["source_path"],
         "selection_reason": source_metadata["selection_reason"],
-        "total_lines": total_lines,
-        "total_characters": len(normalized_text),
-        "sample_offsets": sample_offsets[:20],  # Limit to first 20 samples
+        "total_lines": sink.total_lines,
+        "total_characters": sink.total_characters,
+        "sample_offsets": sink.sample_offsets,  # Every 100th line, first 20 samples
         "note": "Sample offsets provided for LLM-assisted review"
     }
     
@@ -320,41 +220,19 @@ def write_index_file(normalized_text: str, source_metadata: Dict[str, Any]) -> N
     logger.info(f"  ✓ Written index file: {index_path.name}")
 
 
-def write_chunked_outputs(normalized_text: str, chunk_size: int = 500) -> None:
-    """
-    Write chunked outputs for interactive review.
-    
-    Args:
-        normalized_text: The normalized text content
-        chunk_size: Number of lines per chunk (default: 500)
-    """
-    lines = normalized_text.split("\n")
-    total_lines = len(lines)
-    chunk_count = (total_lines + chunk_size - 1) // chunk_size  # Ceiling division
-    
-    logger.info(f"  Creating {chunk_count} chunks ({chunk_size} lines each)...")
-    
-    for chunk_idx in range(chunk_count):
-        start_line = chunk_idx * chunk_size
-        end_line = min(start_line + chunk_size, total_lines)
-        chunk_lines = lines[start_line:end_line]
-        chunk_text = "\n".join(chunk_lines)
-        
-        # Format chunk number with leading zeros (e.g., normalized-part01.txt)
-        chunk_filename = f"normalized-part{chunk_idx + 1:02d}.txt"
-        chunk_path = LINE_COMPANION_NORMALIZED.parent / chunk_filename
-        
-        write_text_file(chunk_path, chunk_text)
-        logger.info(f"    ✓ {chunk_filename} (lines {start_line + 1}-{end_line})")
+def chunk_path(chunk_idx: int) -> Path:
+    """Chunk file for interactive review (e.g., normalized-part01.txt)."""
+    return LINE_COMPANION_NORMALIZED.parent / f"normalized-part{chunk_idx + 1:02d}.txt"
 
 
-def write_ocr_issues_log(issues: List[str], source_metadata: Dict[str, Any]) -> None:
+def write_ocr_issues_log(issues: List[str], source_metadata: Dict[str, Any], ocr_fixer: OCRFixEngine) -> None:
     """
     Write OCR issues to a markdown log file.
     
     Args:
         issues: List of detected OCR issues
         source_metadata: Metadata about the source file
+        ocr_fixer: OCR fix engine used for the run (per-rule hit counts)
     """
     ocr_issues_path = RESEARCH_OUTPUTS_DIR / "OCR_ISSUES.md"
     
@@ -371,6 +249,10 @@ def write_ocr_issues_log(issues: List[str], source_metadata: Dict[str, Any]) ->
                 f.write(f"- {issue}\n")
         else:
             f.write("No OCR issues detected.\n")
+        
+        f.write("\n## OCR Fix Rules\n\n")
+        f.write(f"{ocr_fixer.format_stats()}\n\n")
+        f.write(ocr_fixer.markdown_table())
     
     logger.info(f"  ✓ Written OCR issues log: {ocr_issues_path.name}")
 
@@ -401,54 +283,57 @@ def main():
         logger.info("=" * 60)
         return 0
     
-    # Step 3: Load source text
+    # Step 3: Stream source text through the normalizer into the output file.
+    # Write to a temp file first: the normalized file is itself the preferred
+    # source, so a partial write must never be left in its place.
+    chunk_normalized = os.environ.get("CHUNK_NORMALIZED", "0") == "1"
+    if chunk_normalized:
+        logger.info("CHUNK_NORMALIZED=1 detected, creating chunked outputs (500 lines each)...")
+    
     logger.info("")
-    logger.info("Loading source text...")
+    logger.info("Normalizing source text (single streaming pass)...")
+    ensure_directory(LINE_COMPANION_NORMALIZED.parent)
+    tmp_path = LINE_COMPANION_NORMALIZED.with_suffix(".txt.tmp")
+    normalizer = TextNormalizer()
     try:
-        raw_text = load_source_text(source_path)
-        logger.info(f"  Loaded {len(raw_text):,} characters")
-        logger.info(f"  Lines: {raw_text.count(chr(10)):,}")
+        source_lines = iter_source_lines(source_path, load_page_numbers())
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            sink = NormalizedTextSink(
+                out,
+                max_line_length=MAX_LINE_LENGTH,
+                chunk_size=500 if chunk_normalized else None,
+                chunk_path=chunk_path,
+            )
+            sink.consume(normalizer.normalize_lines(source_lines))
     except Exception as e:
-        logger.error(f"Failed to load source: {e}")
+        logger.error(f"Failed to normalize source: {e}")
+        tmp_path.unlink(missing_ok=True)
         return 1
+    os.replace(tmp_path, LINE_COMPANION_NORMALIZED)
     
-    # Step 4: Normalize text
-    logger.info("")
-    normalizer = TextNormalizer()
-    normalized_text = normalizer.normalize(raw_text)
-    
-    # Step 5: Detect OCR errors for logging
-    logger.info("")
-    logger.info("Detecting OCR errors...")
-    ocr_issues = detect_ocr_errors(normalized_text, MAX_LINE_LENGTH)
+    output_size = LINE_COMPANION_NORMALIZED.stat().st_size
+    logger.info(f"  ✓ Written to: {LINE_COMPANION_NORMALIZED}")
+    logger.info(f"    Size: {output_size:,} bytes ({output_size / 1024:.1f} KB)")
+    for path in sink.chunk_files:
+        logger.info(f"    ✓ {path.name}")
+    
+    # Step 4: OCR errors (detected while streaming)
+    ocr_issues = sink.ocr_issues
+    logger.info(f"  ✓ {normalizer.ocr_fixer.format_stats()}")
+    dead_rules = normalizer.ocr_fixer.dead_rules()
+    if dead_rules:
+        logger.info(f"    Rules that never fired: {', '.join(repr(r) for r in dead_rules)}")
     if ocr_issues:
         logger.warning(f"  ⚠ Detected {len(ocr_issues)} potential OCR errors")
     else:
         logger.info("  ✓ No OCR errors detected")
     
-    # Step 6: Write output files
+    # Step 5: Index file and OCR issues log
     logger.info("")
     logger.info("Writing output files...")
-    ensure_directory(LINE_COMPANION_NORMALIZED.parent)
-    
-    # Main normalized file
-    write_text_file(LINE_COMPANION_NORMALIZED, normalized_text)
-    output_size = LINE_COMPANION_NORMALIZED.stat().st_size
-    logger.info(f"  ✓ Written to: {LINE_COMPANION_NORMALIZED}")
-    logger.info(f"    Size: {output_size:,} bytes ({output_size / 1024:.1f} KB)")
-    
-    # Index file
-    write_index_file(normalized_text, source_metadata)
-    
-    # OCR issues log
-    write_ocr_issues_log(ocr_issues, source_metadata)
-    
-    # Chunked outputs (if requested via env var)
-    chunk_normalized = os.environ.get("CHUNK_NORMALIZED", "0")
-    if chunk_normalized == "1":
-        logger.info("")
-        logger.info("CHUNK_NORMALIZED=1 detected, creating chunked outputs...")
-        write_chunked_outputs(normalized_text, chunk_size=500)
+    write_index_file(sink, source_metadata)
+    write_page_offsets_file(sink, source_metadata)
+    write_ocr_issues_log(ocr_issues, source_metadata, normalizer.ocr_fixer)
     
     # Step 7: Log summary
     logger.info("")
@@ -458,8 +343,8 @@ def main():
     logger.info(f"Source: {source_metadata['source_file']}")
     logger.info(f"Reason: {source_metadata['selection_reason']}")
     logger.info(f"Output: {LINE_COMPANION_NORMALIZED.name}")
-    logger.info(f"Characters: {len(normalized_text):,}")
-    logger.info(f"Lines: {normalized_text.count(chr(10)):,}")
+    logger.info(f"Characters: {sink.total_characters:,}")
+    logger.info(f"Lines: {sink.newline_count:,}")
     if ocr_issues:
         logger.info(f"OCR Issues: {len(ocr_issues)} detected (see OCR_ISSUES.md)")
     logger.info("=" * 60)
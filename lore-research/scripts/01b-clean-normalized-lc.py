@@ -24,6 +24,7 @@ from utils import (
     write_text_file,
     ensure_directory,
 )
+from ocr_fixes import OCRFixEngine
 
 
 logger = setup_logging(__name__)
@@ -59,6 +60,7 @@ class SecondPassCleaner:
         self.ocr_fixes = {**OCR_FIX_DICT, **LC_SPECIFIC_OCR_FIXES}
         if ocr_fixes:
             self.ocr_fixes.update(ocr_fixes)
+        self.ocr_fixer = OCRFixEngine(self.ocr_fixes)
         
         # Page header patterns to remove
         self.page_patterns = [
@@ -86,7 +88,7 @@ class SecondPassCleaner:
         
         # Step 2: Apply extended OCR fixes
         text = self._apply_ocr_fixes(text)
-        logger.info(f"  ✓ Applied {len(self.ocr_fixes)} OCR fixes (including LC-specific)")
+        logger.info(f"  ✓ {self.ocr_fixer.format_stats()} (including LC-specific)")
         
         # Step 3: Apply stronger mid-sentence joining
         text = self._join_mid_sentence_stronger(text)
@@ -123,10 +125,14 @@ class SecondPassCleaner:
         return "\n".join(cleaned_lines)
     
     def _apply_ocr_fixes(self, text: str) -> str:
-        """Apply OCR error corrections."""
-        for error, fix in self.ocr_fixes.items():
-            text = text.replace(error, fix)
-        return text
+        """
+        Apply OCR error corrections in a single scan.
+        
+        Hit counters are reset first, so ``self.ocr_fixer.hits`` always
+        describes the most recently cleaned text.
+        """
+        self.ocr_fixer.reset()
+        return self.ocr_fixer.apply(text)
     
     def _join_mid_sentence_stronger(self, text: str) -> str:
         """
@@ -236,6 +242,15 @@ def main():
     output_main = LINE_COMPANION_DIR / "normalized.clean.txt"
     process_file(LINE_COMPANION_NORMALIZED, output_main, cleaner)
     
+    # Rule statistics for the full book (chunks repeat the same text)
+    logger.info("")
+    logger.info("OCR fix rule hits (main file):")
+    for error, fix, count in cleaner.ocr_fixer.rule_stats():
+        logger.info(f"  {count:6,}  {error!r} -> {fix!r}")
+    dead_rules = cleaner.ocr_fixer.dead_rules()
+    if dead_rules:
+        logger.info(f"  {len(dead_rules)} rules never fired (candidates for pruning)")
+    
     # Find all normalized-partNN.txt files
     logger.info("")
     logger.info("=" * 60)
@@ -2,13 +2,21 @@
 """
 Stage 2: Gate Block Detector (Task 3.1)
 
-Reads normalized Line Companion text and splits it into 64 gate blocks.
+Maps normalized Line Companion text (SourceText, no full decode) and splits
+it into 64 gate blocks.
 Validates gate count and logs missing gates to BAD_LINES.md.
-Optionally estimates page ranges from scandata if available.
+Gate text is not copied into gates.json: each gate records a byte span
+into normalized.txt, also written to the offset index (normalized.offsets.json)
+that later stages extend with line and segment spans.
+Attaches exact leaf ranges when 01 recorded page offsets for a structured
+source (binary search over the page breaks, also stored in the offset index
+for line-level hints), otherwise estimates page ranges from the scandata
+leaf table if available.
 
 Requirements: FR-LC-3
 """
 
+import argparse
 import re
 import sys
 from pathlib import Path
@@ -16,6 +24,8 @@ from datetime import datetime
 
 from config import (
     LINE_COMPANION_NORMALIZED,
+    LINE_COMPANION_PAGE_OFFSETS,
+    LINE_COMPANION_OFFSETS,
     LINE_COMPANION_GATES,
     LINE_COMPANION_DIR,
     BAD_LINES_FILE,
@@ -32,50 +42,94 @@ from utils import (
     log_bad_line,
     ensure_directory,
 )
+from leaf_table import LeafIntervals, load_leaf_table
+from offset_index import OffsetIndex, byte_span, file_digest, stripped_span
+from source_text import SourceText, compile_bytes
 
 
-def detect_gate_headings(text, logger):
+def compile_heading_pattern(patterns):
     """
-    Detect all gate headings in the text using patterns from config.
+    Compile line-anchored heading patterns into one alternation for a
+    single scan of the whole buffer.
+    
+    Returns (first_line_re, scan_re): ``first_line_re.match`` checks the
+    first line; ``scan_re`` matches "\\n" + heading for every later line.
+    A literal "\\n" prefix lets the regex engine skip straight to line
+    starts, which is much faster than ``^`` under MULTILINE.
+    
+    Patterns were written for single lines, so ``\\s`` is narrowed to
+    whitespace other than newline: a heading never spans two lines. Branch
+    order is kept, so the first pattern that matches a line still wins.
+    Each pattern must have exactly one capture group (the gate number).
+    Both regexes are bytes patterns that run on a SourceText buffer.
+    """
+    branches = [re.sub(r"(?<!\\)\\s", r"[^\\S\\n]", p.lstrip("^")) for p in patterns]
+    alternation = "|".join(f"(?:{b})" for b in branches)
+    return (
+        compile_bytes(alternation, re.IGNORECASE),
+        compile_bytes(f"\\n(?:{alternation})", re.IGNORECASE),
+    )
+
+
+GATE_HEADING_FIRST_LINE_RE, GATE_HEADING_SCAN_RE = compile_heading_pattern(GATE_HEADING_PATTERNS)
+
+
+def iter_heading_matches(source):
+    """Yield (line_start, match) for every line of a SourceText that starts with a gate heading."""
+    match = GATE_HEADING_FIRST_LINE_RE.match(source.buffer)
+    if match:
+        yield 0, match
+    for match in source.finditer(GATE_HEADING_SCAN_RE):
+        yield match.start() + 1, match
+
+
+def detect_gate_headings(source, logger):
+    """
+    Detect all gate headings in a SourceText using patterns from config.
     First match wins per line.
     
-    Returns list of tuples: (gate_num, byte_offset, line_number, heading_text)
+    One scan over the memory-mapped bytes; only heading lines are decoded.
+    Line numbers come from the newline index, char offsets are counted
+    forward from the previous heading.
+    
+    Returns list of tuples:
+        (gate_num, char_offset, line_number, heading_text, byte_offset)
     """
     headings = []
-    lines = text.split("\n")
-    current_byte_pos = 0
-    
-    for line_num, line in enumerate(lines, 1):
-        # Loop over all gate heading patterns - first match wins
-        for pattern in GATE_HEADING_PATTERNS:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                gate_num = int(match.group(1))
-                headings.append((gate_num, current_byte_pos, line_num, line.strip()))
-                logger.debug(f"Found gate {gate_num} at line {line_num}, byte {current_byte_pos}: {line.strip()}")
-                break  # First match wins
-        current_byte_pos += len(line) + 1  # +1 for newline
+    
+    for byte_pos, match in iter_heading_matches(source):
+        gate_num = int(next(g for g in match.groups() if g is not None))
+        line_num = source.line_number(byte_pos)
+        char_pos = source.char_offset(byte_pos)
+        heading_text = source.decode(byte_pos, source.line_end(byte_pos)).strip()
+        headings.append((gate_num, char_pos, line_num, heading_text, byte_pos))
+        logger.debug(f"Found gate {gate_num} at line {line_num}, char {char_pos}, byte {byte_pos}: {heading_text}")
     
     return headings
 
 
-def extract_gate_blocks(text, headings, logger):
-    """Extract text blocks between gate headings."""
+def extract_gate_blocks(source, headings, logger):
+    """Extract text blocks between gate headings, decoding one block at a time."""
     gates = {}
     
-    for i, (gate_num, start_pos, start_line, heading_text) in enumerate(headings):
+    for i, (gate_num, start_pos, start_line, heading_text, byte_offset) in enumerate(headings):
         if i + 1 < len(headings):
-            end_pos = headings[i + 1][1]
+            end_byte = headings[i + 1][4]
             end_line = headings[i + 1][2] - 1
         else:
-            end_pos = len(text)
-            end_line = len(text.split("\n"))
+            end_byte = len(source)
+            end_line = source.line_count
         
-        block_text = text[start_pos:end_pos].strip()
+        block = source.decode(byte_offset, end_byte)
+        block_start, block_end = stripped_span(block)
+        block_text = block[block_start:block_end]
+        span = byte_span(block, (block_start, block_end), byte_offset)
         gates[str(gate_num)] = {
             "title": heading_text,
             "text": block_text,
-            "byte_offset": start_pos,
+            "char_offset": start_pos,
+            "byte_offset": byte_offset,
+            "span": span,
             "line_range": [start_line, end_line],
         }
         logger.debug(f"Extracted gate {gate_num}: {len(block_text)} chars, lines {start_line}-{end_line}")
@@ -83,28 +137,30 @@ def extract_gate_blocks(text, headings, logger):
     return gates
 
 
-def estimate_page_hints(gates, scandata, total_text_bytes, logger):
+def estimate_page_hints(gates, leaf_table, total_text_bytes, logger):
     """
     Estimate page ranges for each gate based on byte offsets.
     
+    Only used when 01 recorded no page breaks (plain-text sources).
+    
     Args:
-        gates: Dictionary of gate data with byte_offset
-        scandata: Parsed scandata.json
-        total_text_bytes: Total bytes in normalized.txt
+        gates: Dictionary of gate data with byte_offset (UTF-8)
+        leaf_table: LeafTable from 02a (scandata leaves)
+        total_text_bytes: Total UTF-8 bytes in normalized.txt
         logger: Logger instance
     
     Returns:
         Dictionary mapping gate_num -> page_hint dict
     """
-    if not scandata:
+    if leaf_table is None:
         return {}
     
-    total_pages = scandata.get("bookData", {}).get("leafCount", 0)
+    total_pages = leaf_table.leaf_count
     if total_pages == 0:
         logger.warning("No leafCount in scandata, cannot estimate pages")
         return {}
     
-    dpi = scandata.get("bookData", {}).get("dpi", 300)
+    dpi = leaf_table.dpi or 300
     page_hints = {}
     
     for gate_num, gate_data in gates.items():
@@ -129,6 +185,38 @@ def estimate_page_hints(gates, scandata, total_text_bytes, logger):
     return page_hints
 
 
+def page_hints_from_offsets(gates, intervals, total_text_chars, dpi, logger):
+    """
+    Exact page ranges for each gate from the leaf offsets recorded by
+    01-normalize-line-companion.py for structured sources.
+    
+    Args:
+        gates: Dictionary of gate data with char_offset
+        intervals: LeafIntervals built from normalized.pages.json (char offsets)
+        total_text_chars: Total characters in normalized.txt
+        dpi: Scan DPI (from scandata, if loaded)
+        logger: Logger instance
+    
+    Returns:
+        Dictionary mapping gate_num -> page_hint dict
+    """
+    if not len(intervals):
+        return {}
+    
+    # A gate runs from its heading to the next gate's heading
+    ordered = sorted(gates.items(), key=lambda item: item[1].get("char_offset", 0))
+    page_hints = {}
+    for i, (gate_num, gate_data) in enumerate(ordered):
+        start = gate_data.get("char_offset", 0)
+        end = ordered[i + 1][1]["char_offset"] if i + 1 < len(ordered) else total_text_chars
+        page_hints[gate_num] = intervals.page_hint(start, end, dpi)
+        
+        hint = page_hints[gate_num]
+        logger.debug(f"Gate {gate_num}: leaves {hint['leaf_start']}-{hint['leaf_end']}")
+    
+    return page_hints
+
+
 def validate_gates(gates, logger):
     """
     Validate gate count and identify missing gates.
@@ -212,6 +300,11 @@ def log_page_hint_issues(issues, logger):
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Split normalized Line Companion text into gate blocks")
+    parser.add_argument("--embed-text", action="store_true",
+                        help="Also copy each gate's text into gates.json (default: byte spans only)")
+    args = parser.parse_args()
+    
     logger = setup_logging(__name__)
     logger.info("=" * 60)
     logger.info("Stage 2: Gate Block Detector (Task 3.1)")
@@ -226,12 +319,13 @@ def main():
     logger.info(f"Reading: {LINE_COMPANION_NORMALIZED}")
     
     try:
-        text = read_text_file(LINE_COMPANION_NORMALIZED)
-        total_bytes = len(text)
-        logger.info(f"Loaded {total_bytes:,} characters")
+        source = SourceText(LINE_COMPANION_NORMALIZED)
+        total_chars = source.char_count()
+        total_bytes = len(source)
+        logger.info(f"Mapped {total_chars:,} characters ({total_bytes:,} bytes)")
         
         logger.info("Detecting gate headings using patterns from config.GATE_HEADING_PATTERNS...")
-        headings = detect_gate_headings(text, logger)
+        headings = detect_gate_headings(source, logger)
         logger.info(f"Found {len(headings)} gate headings")
         
         if not headings:
@@ -239,7 +333,7 @@ def main():
             sys.exit(1)
         
         logger.info("Extracting text blocks between gate headings...")
-        gates = extract_gate_blocks(text, headings, logger)
+        gates = extract_gate_blocks(source, headings, logger)
         
         logger.info("Validating gate count...")
         is_valid, detected_count, missing_gates = validate_gates(gates, logger)
@@ -253,32 +347,54 @@ def main():
         if missing_gates:
             log_missing_gates(missing_gates, logger)
         
-        # Try to load scandata and estimate page hints
-        scandata_file = LINE_COMPANION_DIR / "scandata.json"
+        # Page hints: exact leaf ranges from recorded page breaks, else a
+        # linear estimate over the scandata leaves
         page_hints = {}
         page_hint_issues = []
+        byte_intervals = None
+        try:
+            leaf_table = load_leaf_table()
+        except (OSError, ValueError) as e:
+            issue = f"Error loading scandata: {e}"
+            logger.warning(issue)
+            page_hint_issues.append(issue)
+            leaf_table = None
         
-        if scandata_file.exists():
-            logger.info(f"Loading scandata from: {scandata_file}")
-            try:
-                scandata = read_json_file(scandata_file)
-                logger.info("Estimating page ranges for gates based on byte/line offset...")
-                page_hints = estimate_page_hints(gates, scandata, total_bytes, logger)
-                
-                if page_hints:
-                    logger.info(f"✅ Estimated page hints for {len(page_hints)} gates")
-                else:
-                    issue = "Failed to estimate page hints (scandata may be incomplete)"
-                    logger.warning(issue)
-                    page_hint_issues.append(issue)
-            except Exception as e:
-                issue = f"Error loading scandata: {e}"
+        page_offsets = read_json_file(LINE_COMPANION_PAGE_OFFSETS) if LINE_COMPANION_PAGE_OFFSETS.exists() else None
+        if page_offsets and page_offsets.get("total_characters") != total_chars:
+            issue = f"{LINE_COMPANION_PAGE_OFFSETS.name} does not match normalized.txt (stale), ignoring it"
+            logger.warning(issue)
+            page_hint_issues.append(issue)
+            page_offsets = None
+        
+        if page_offsets:
+            logger.info(f"Mapping gates to leaves using: {LINE_COMPANION_PAGE_OFFSETS}")
+            dpi = (leaf_table.dpi if leaf_table is not None else None) or 300
+            intervals = LeafIntervals.from_page_offsets(page_offsets)
+            page_hints = page_hints_from_offsets(gates, intervals, total_chars, dpi, logger)
+            if page_hints:
+                logger.info(f"✅ Exact page hints for {len(page_hints)} gates")
+                # Byte-keyed copy for the offset index (line hints in 03a)
+                byte_intervals = intervals.to_byte_offsets(source)
+            else:
+                issue = f"No leaf offsets in {LINE_COMPANION_PAGE_OFFSETS.name}"
+                logger.warning(issue)
+                page_hint_issues.append(issue)
+        elif leaf_table is not None:
+            logger.info(f"Estimating page ranges for gates over {leaf_table.leaf_count} scandata leaves...")
+            page_hints = estimate_page_hints(gates, leaf_table, total_bytes, logger)
+            
+            if page_hints:
+                logger.info(f"✅ Estimated page hints for {len(page_hints)} gates")
+            else:
+                issue = "Failed to estimate page hints (scandata may be incomplete)"
                 logger.warning(issue)
                 page_hint_issues.append(issue)
         else:
-            issue = f"Scandata not found at {scandata_file}, skipping page hint estimation"
+            issue = f"Scandata not found at {LINE_COMPANION_DIR / 'scandata.json'}, skipping page hint estimation"
             logger.info(issue)
             page_hint_issues.append(issue)
+        source.close()
         
         # Log page hint issues to OCR_ISSUES.md (do NOT error)
         if page_hint_issues:
@@ -301,12 +417,20 @@ def main():
         else:
             output["_meta"]["page_hints_available"] = False
         
+        # Gate text lives in normalized.txt; record byte spans in the offset
+        # index instead of copying it (unless --embed-text)
+        offset_index = OffsetIndex(LINE_COMPANION_OFFSETS, LINE_COMPANION_NORMALIZED.name, total_bytes,
+                                   sha256=file_digest(LINE_COMPANION_NORMALIZED))
+        if byte_intervals is not None:
+            offset_index.set_leaves(byte_intervals)
+        output["_meta"]["offset_index"] = LINE_COMPANION_OFFSETS.name
+        
         # Add gates with page hints if available
         for gate_num, gate_data in gates.items():
-            gate_output = {
-                "title": gate_data["title"],
-                "raw_text": gate_data["text"],
-            }
+            offset_index.set_gate(int(gate_num), gate_data["span"])
+            gate_output = {"title": gate_data["title"], "span": gate_data["span"]}
+            if args.embed_text:
+                gate_output["raw_text"] = gate_data["text"]
             
             # Add page hint if available (attach to gates.json under _meta.page_hint)
             if gate_num in page_hints:
@@ -319,6 +443,8 @@ def main():
         ensure_directory(LINE_COMPANION_GATES.parent)
         write_json_file(LINE_COMPANION_GATES, output)
         logger.info(f"✅ Wrote gates to: {LINE_COMPANION_GATES}")
+        offset_index.save()
+        logger.info(f"✅ Wrote offset index to: {LINE_COMPANION_OFFSETS}")
         
         # Per task requirements:
         # 60-63 → write JSON + warning + BAD_LINES
@@ -9,17 +9,20 @@ Reads:
 
 Writes:
   - lore-research/research-outputs/line-companion/scandata.json
+  - lore-research/research-outputs/line-companion/scandata.leaves.bin
+    (array-backed leaf table, see leaf_table.py)
 
-Provides helper to map leafNum → image dimensions and crop box.
+utils.get_page_by_leaf_num maps leafNum → image dimensions and crop box.
 """
 
 import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
+from leaf_table import LeafTable
 from utils import setup_logging, write_json_file
-from config import PROJECT_ROOT, S3_DATA_ROOT, LINE_COMPANION_DIR
+from config import LINE_COMPANION_DIR, LINE_COMPANION_LEAF_TABLE, LINE_COMPANION_SCANDATA
 
 
 logger = setup_logging(__name__)
@@ -116,24 +119,10 @@ def parse_scandata_xml(xml_path: Path) -> Dict[str, Any]:
     }
 
 
-def get_page_by_leaf_num(scandata: Dict[str, Any], leaf_num: int) -> Optional[Dict[str, Any]]:
-    """
-    Helper function to retrieve page metadata by leaf number.
-    
-    Args:
-        scandata: Parsed scandata dictionary
-        leaf_num: Leaf number to look up
-    
-    Returns:
-        Page metadata dictionary or None if not found
-    """
-    return scandata.get("pages", {}).get(str(leaf_num))
-
-
 def main():
     """Main execution function."""
     # Input path
-    scandata_xml_path = S3_DATA_ROOT / "Line Companion_scandata.xml"
+    scandata_xml_path = LINE_COMPANION_SCANDATA
     
     if not scandata_xml_path.exists():
         logger.error(f"Scandata XML not found: {scandata_xml_path}")
@@ -151,6 +140,10 @@ def main():
         write_json_file(output_path, scandata)
         logger.info(f"✓ Wrote scandata to: {output_path}")
         
+        # Write the array-backed leaf table
+        LeafTable.from_scandata(scandata).save(LINE_COMPANION_LEAF_TABLE)
+        logger.info(f"✓ Wrote leaf table to: {LINE_COMPANION_LEAF_TABLE}")
+        
         # Log summary
         book_data = scandata["bookData"]
         logger.info(f"Summary:")
@@ -6,19 +6,25 @@ Reads monolithic gates.json and writes each gate to its own file.
 
 Input:
     - lore-research/research-outputs/line-companion/gates.json
+    - normalized.txt + normalized.offsets.json (gate text is read lazily by span)
 
 Output:
-    - lore-research/research-outputs/line-companion/gates/gate-{NN}.json (64 files)
+    - lore-research/research-outputs/line-companion/gates/gate-{NN}.json (64 files);
+      while the offset index is current they carry _meta.span instead of a
+      raw_text copy (--embed-text keeps the copy)
     - Updates BAD_LINES.md for any gates with empty/missing text
 
 Requirements: FR-LC-3, FR-DI-5
 """
 
+import argparse
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 from config import (
+    LINE_COMPANION_NORMALIZED,
+    LINE_COMPANION_OFFSETS,
     LINE_COMPANION_GATES,
     LINE_COMPANION_GATES_DIR,
     EXPECTED_GATES,
@@ -30,10 +36,16 @@ from utils import (
     ensure_directory,
     log_bad_line,
 )
+from offset_index import OffsetIndex, SpanReader
 
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Fan gates.json out into per-gate files")
+    parser.add_argument("--embed-text", action="store_true",
+                        help="Also copy raw_text into gate files (default: byte spans only; 03a reads spans)")
+    args = parser.parse_args()
+    
     logger = setup_logging(__name__)
     
     logger.info("=" * 60)
@@ -54,6 +66,18 @@ def main():
     top_level_meta = gates_data.get("_meta", {})
     logger.info(f"Top-level metadata: {top_level_meta}")
     
+    # Gate text is sliced from normalized.txt on demand when gates.json only
+    # carries spans (see 02-split-gates.py)
+    reader = None
+    offset_index = OffsetIndex.load(LINE_COMPANION_OFFSETS)
+    if offset_index is not None and offset_index.matches(LINE_COMPANION_NORMALIZED):
+        reader = SpanReader(LINE_COMPANION_NORMALIZED, offset_index)
+        logger.info(f"Reading gate text by span from: {LINE_COMPANION_NORMALIZED}")
+    elif any(isinstance(g, dict) and "span" in g and "raw_text" not in g for g in gates_data.values()):
+        logger.error(f"Offset index missing or stale: {LINE_COMPANION_OFFSETS}")
+        logger.error("Please re-run 02-split-gates.py")
+        sys.exit(1)
+    
     # Create output directory
     ensure_directory(LINE_COMPANION_GATES_DIR)
     logger.info(f"Output directory: {LINE_COMPANION_GATES_DIR}")
@@ -88,7 +112,11 @@ def main():
         
         # Extract gate information
         title = gate_data.get("title")
-        raw_text = gate_data.get("raw_text", "")
+        span = gate_data.get("span")
+        if "raw_text" in gate_data:
+            raw_text = gate_data["raw_text"]
+        else:
+            raw_text = reader.text(span) if reader and span else ""
         gate_meta = gate_data.get("_meta", {})
         
         # Check if gate has empty/missing text
@@ -116,6 +144,11 @@ def main():
                 "created_at": created_at,
             }
         }
+        if span:
+            gate_file_data["_meta"]["span"] = span
+            # The text stays in normalized.txt while the index can locate it
+            if reader is not None and not args.embed_text:
+                del gate_file_data["raw_text"]
         
         # Copy page_hint from gate-level _meta if present
         if "page_hint" in gate_meta:
@@ -129,6 +162,9 @@ def main():
         if gate_num % 10 == 0:
             logger.info(f"Processed {gate_num}/{EXPECTED_GATES} gates...")
     
+    if reader:
+        reader.close()
+    
     # Log summary
     logger.info("=" * 60)
     logger.info("FANOUT COMPLETE")
@@ -3,18 +3,29 @@
 03a-detect-lines-per-gate.py
 
 For each gate-XX.json file, scan raw_text for line headings and populate the "lines" object.
+When the offset index is current, line byte spans are added to it (and gate
+files written by 03-fanout-gates.py without raw_text are read by span). If the
+index also holds page breaks (structured sources), each line gets a
+page_hint leaf range found by binary search over them.
 Logs gates with <6 lines to BAD_LINES.md.
 
+Gates are independent, so --jobs N processes them across N worker processes;
+issues are collected from the workers and written to BAD_LINES.md in gate order.
+
 Requirements: FR-LC-4, FR-VQ-2
 """
 
+import argparse
 import json
 import re
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from config import (
+    LINE_COMPANION_NORMALIZED,
+    LINE_COMPANION_OFFSETS,
     LINE_COMPANION_GATES_DIR,
     BAD_LINES_FILE,
     LINES_PER_GATE,
@@ -22,24 +33,20 @@ from config import (
     JSON_SORT_KEYS,
     JSON_ENSURE_ASCII,
 )
-from utils import setup_logging, ensure_directory
+from utils import setup_logging, ensure_directory, map_gates, parse_jobs
+from leaf_table import LeafIntervals
+from offset_index import OffsetIndex, SpanReader, byte_span, stripped_span
 
 logger = setup_logging(__name__)
 
 
-def detect_line_headings(raw_text: str, gate_number: int) -> Dict[str, Dict[str, str]]:
+def find_line_headings(raw_text: str, gate_number: int) -> List[Tuple[str, str, Tuple[int, int]]]:
     """
-    Detect line headings in raw_text and extract line content.
+    Find line headings in raw_text.
     
-    Returns dict like:
-    {
-        "1": {"heading": "Creation is independent of will", "raw": "..."},
-        "2": {"heading": "Love is light", "raw": "..."},
-        ...
-    }
+    Returns list of (line_num, heading, content_span) where content_span is
+    the char span of the stripped content between this heading and the next.
     """
-    lines_data = {}
-    
     # Pattern to match line headings like "1.1 Creation is independent of will"
     # or "1.2 Love is light" etc.
     # Format: <gate>.<line> <heading text>
@@ -51,25 +58,37 @@ def detect_line_headings(raw_text: str, gate_number: int) -> Dict[str, Dict[str,
     
     if not matches:
         logger.warning(f"Gate {gate_number}: No line headings found with pattern {line_pattern}")
-        return lines_data
+        return []
     
-    # Process each match and extract content until next match
+    headings = []
     for i, match in enumerate(matches):
-        line_num = match.group(1)
-        heading = match.group(2).strip()
-        
-        # Get start position (after the heading line)
+        # Content runs from after the heading line to the next heading (or end of text)
         start_pos = match.end()
-        
-        # Get end position (start of next heading or end of text)
-        if i + 1 < len(matches):
-            end_pos = matches[i + 1].start()
-        else:
-            end_pos = len(raw_text)
-        
-        # Extract raw content between this heading and next
-        raw_content = raw_text[start_pos:end_pos].strip()
-        
+        end_pos = matches[i + 1].start() if i + 1 < len(matches) else len(raw_text)
+        headings.append((match.group(1), match.group(2).strip(), stripped_span(raw_text, start_pos, end_pos)))
+    
+    return headings
+
+
+def detect_line_headings(raw_text: str, gate_number: int, headings: Optional[List] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Detect line headings in raw_text and extract line content.
+    Pass ``headings`` (from find_line_headings) to skip the scan.
+    
+    Returns dict like:
+    {
+        "1": {"heading": "Creation is independent of will", "raw": "..."},
+        "2": {"heading": "Love is light", "raw": "..."},
+        ...
+    }
+    """
+    lines_data = {}
+    
+    if headings is None:
+        headings = find_line_headings(raw_text, gate_number)
+    
+    for line_num, heading, (start, end) in headings:
+        raw_content = raw_text[start:end]
         lines_data[line_num] = {
             "heading": heading,
             "raw": raw_content
@@ -117,11 +136,23 @@ def write_json_if_changed(path: Path, data: dict) -> bool:
     return True
 
 
-def process_gate_file(gate_file: Path) -> Tuple[bool, int]:
+def process_gate_file(gate_file: Path, normalized_path: Optional[Path] = None,
+                      leaf_intervals: Optional[LeafIntervals] = None) -> Tuple[bool, int, List[str], Dict[str, List[int]]]:
     """
     Process a single gate file to detect and populate line data.
     
-    Returns (success, lines_found)
+    Safe to run in a worker process: issues and line spans are returned
+    rather than written to BAD_LINES.md / the offset index.
+    
+    Args:
+        gate_file: gate-NN.json
+        normalized_path: normalized.txt when the offset index is current;
+            gate text is then read by span if the file has no raw_text, and
+            line byte spans are returned for the index
+        leaf_intervals: Byte offset -> leaf index from the offset index;
+            each line with a span then gets its own page_hint
+    
+    Returns (success, lines_found, issues, line_spans)
     """
     gate_number = int(gate_file.stem.split('-')[1])
     
@@ -131,24 +162,38 @@ def process_gate_file(gate_file: Path) -> Tuple[bool, int]:
     with open(gate_file, 'r', encoding='utf-8') as f:
         gate_data = json.load(f)
     
-    raw_text = gate_data.get('raw_text', '')
+    span = gate_data.get('_meta', {}).get('span')
+    span_text = None
+    if span and normalized_path:
+        with SpanReader(normalized_path) as reader:
+            span_text = reader.text(span)
+    raw_text = gate_data['raw_text'] if 'raw_text' in gate_data else (span_text or '')
     
     if not raw_text:
         logger.warning(f"Gate {gate_number}: No raw_text found")
-        log_to_bad_lines(gate_number, "no raw_text in gate file")
-        return False, 0
+        return False, 0, ["no raw_text in gate file"], {}
     
     # Detect lines
-    lines_data = detect_line_headings(raw_text, gate_number)
+    headings = find_line_headings(raw_text, gate_number)
+    lines_data = detect_line_headings(raw_text, gate_number, headings)
     lines_found = len(lines_data)
+    issues = []
+    
+    # Line spans are only valid while the gate text still matches normalized.txt
+    line_spans = {}
+    if span_text is not None and span_text == raw_text:
+        line_spans = {line_num: byte_span(raw_text, content_span, span[0]) for line_num, _, content_span in headings}
     
     # Check if we have all 6 lines
     if lines_found < LINES_PER_GATE:
         logger.warning(f"Gate {gate_number}: Found only {lines_found}/6 lines")
-        log_to_bad_lines(
-            gate_number,
-            f"found only {lines_found}/6 lines - incomplete line detection"
-        )
+        issues.append(f"found only {lines_found}/6 lines - incomplete line detection")
+    
+    # Per-line leaf ranges by binary search over the recorded page breaks
+    if leaf_intervals is not None:
+        dpi = gate_data.get('_meta', {}).get('page_hint', {}).get('dpi')
+        for line_num, line_span in line_spans.items():
+            lines_data[line_num]['page_hint'] = leaf_intervals.page_hint(*line_span, dpi=dpi)
     
     # Update gate data with lines
     gate_data['lines'] = lines_data
@@ -167,11 +212,16 @@ def process_gate_file(gate_file: Path) -> Tuple[bool, int]:
     
     logger.info(f"Gate {gate_number}: Detected {lines_found} lines")
     
-    return lines_found == LINES_PER_GATE, lines_found
+    return lines_found == LINES_PER_GATE, lines_found, issues, line_spans
 
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Detect line headings in each fanned-out gate file")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes (default: 1, 0 = one per CPU)")
+    args = parser.parse_args()
+    
     logger.info("=" * 60)
     logger.info("Stage 3a: Detect lines per gate")
     logger.info("=" * 60)
@@ -190,19 +240,44 @@ def main():
         return 1
     
     logger.info(f"Found {len(gate_files)} gate files")
+    if args.jobs > 1:
+        logger.info(f"Processing with {args.jobs} worker processes")
     
     # Process each gate
     total_gates = 0
     complete_gates = 0
     total_lines = 0
     
-    for gate_file in gate_files:
-        success, lines_found = process_gate_file(gate_file)
+    offset_index = OffsetIndex.load(LINE_COMPANION_OFFSETS)
+    if offset_index is not None and not offset_index.matches(LINE_COMPANION_NORMALIZED):
+        logger.warning(f"Offset index is stale, not recording line spans: {LINE_COMPANION_OFFSETS}")
+        offset_index = None
+    normalized_path = LINE_COMPANION_NORMALIZED if offset_index is not None else None
+    leaf_intervals = offset_index.leaf_intervals() if offset_index is not None else None
+    if leaf_intervals is not None:
+        logger.info(f"Attaching line page hints from {len(leaf_intervals)} page breaks")
+    
+    results = map_gates(
+        partial(process_gate_file, normalized_path=normalized_path, leaf_intervals=leaf_intervals),
+        gate_files,
+        args.jobs,
+    )
+    
+    for gate_file, (success, lines_found, issues, line_spans) in zip(gate_files, results):
+        gate_number = int(gate_file.stem.split('-')[1])
+        for reason in issues:
+            log_to_bad_lines(gate_number, reason)
+        if offset_index is not None:
+            offset_index.set_lines(gate_number, line_spans)
         total_gates += 1
         total_lines += lines_found
         if success:
             complete_gates += 1
     
+    if offset_index is not None:
+        offset_index.save()
+        logger.info(f"Line spans written to: {LINE_COMPANION_OFFSETS}")
+    
     # Summary
     logger.info("=" * 60)
     logger.info("Summary:")
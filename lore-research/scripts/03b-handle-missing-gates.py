@@ -55,8 +55,10 @@ def check_missing_gates(gates_data):
             print(f"⚠️  Gate {gate_num}: invalid structure (not a dict)")
             continue
         
+        # 02-split-gates records a byte span instead of raw_text unless --embed-text
         raw_text = gate_obj.get('raw_text', '').strip()
-        if not raw_text:
+        span = gate_obj.get('span') or [0, 0]
+        if not raw_text and span[1] <= span[0]:
             missing_gates.append(gate_num)
             print(f"⚠️  Gate {gate_num}: empty or missing raw_text")
     
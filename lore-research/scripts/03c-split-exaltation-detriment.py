@@ -8,68 +8,94 @@ For each gate-XX.json, read lines object and parse each line's raw text into seg
 - detriment (text starting with planet name + "in detriment")
 
 Adds segments array to each line with type, planet, and text.
+When the offset index is current, segment byte spans are added to it.
 If no exaltation/detriment found, logs to BAD_LINES.md
+
+All line texts are joined into one buffer and segmented with a single scan
+of one combined marker pattern (segment_lines); a per-planet table of
+marker counts and missing-marker lines is printed (--stats writes it as
+JSON). --jobs N splits the gates into N slices segmented in parallel;
+per-gate issue lists are merged in gate order before BAD_LINES.md is written.
 """
 
+import argparse
 import json
 import re
+from array import array
+from bisect import bisect_right
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+from config import LINE_COMPANION_NORMALIZED, LINE_COMPANION_OFFSETS
+from offset_index import OffsetIndex, SpanReader, byte_span, stripped_span
+from utils import map_gates, parse_jobs
 
 # Paths
 GATES_DIR = Path("lore-research/research-outputs/line-companion/gates")
 BAD_LINES_FILE = Path("lore-research/research-outputs/BAD_LINES.md")
 
-# Regex patterns for detecting exaltation and detriment
-# Matches patterns like: "Mars exalted", "Jupiter in detriment", "The Moon exalted", etc.
-EXALTATION_PATTERN = re.compile(
-    r'\b(The\s+)?(Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto|Earth)\s+exalted\b',
-    re.IGNORECASE
-)
+PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto", "Earth")
+MARKER_TYPES = ("exaltation", "detriment")
 
-DETRIMENT_PATTERN = re.compile(
-    r'\b(The\s+)?(Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto|Earth)\s+in\s+detriment\b',
+# One pattern for both markers, e.g. "Mars exalted", "Jupiter in detriment",
+# "The Moon exalted"; the exaltation group tells the two apart
+SEGMENT_PATTERN = re.compile(
+    r'\b(?:The\s+)?(?P<planet>' + '|'.join(PLANETS) + r')\s+(?:(?P<exaltation>exalted)|in\s+detriment)\b',
     re.IGNORECASE
 )
 
+# Joins line texts in the batch buffer; no marker can match across it
+LINE_SEPARATOR = "\x00"
+
+LineKey = Tuple[int, int]
+
+
+def new_stats() -> Dict:
+    """Empty per-planet statistics table."""
+    return {
+        "lines": 0,
+        "planets": {planet: {kind: 0 for kind in MARKER_TYPES} for planet in PLANETS},
+        "missing": {kind: [] for kind in MARKER_TYPES},
+    }
+
 
-def parse_line_segments(raw_text: str, gate: int, line: int) -> Tuple[List[Dict], List[str]]:
+def merge_stats(total: Dict, part: Dict) -> Dict:
+    """Add the counts and missing-marker lines of ``part`` into ``total``."""
+    total["lines"] += part["lines"]
+    for planet, counts in part["planets"].items():
+        for kind, count in counts.items():
+            total["planets"][planet][kind] += count
+    for kind, lines in part["missing"].items():
+        total["missing"][kind].extend(lines)
+    return total
+
+
+def format_stats_table(stats: Dict) -> str:
+    """Per-planet marker counts and missing-marker line counts as a text table."""
+    rows = [f"{'Planet':<10}{'Exaltation':>12}{'Detriment':>12}"]
+    for planet, counts in stats["planets"].items():
+        rows.append(f"{planet:<10}{counts['exaltation']:>12}{counts['detriment']:>12}")
+    totals = {kind: sum(counts[kind] for counts in stats["planets"].values()) for kind in MARKER_TYPES}
+    rows.append(f"{'Total':<10}{totals['exaltation']:>12}{totals['detriment']:>12}")
+    rows.append(f"{'Missing':<10}{len(stats['missing']['exaltation']):>12}{len(stats['missing']['detriment']):>12}"
+                f"  (of {stats['lines']} lines)")
+    return "\n".join(rows)
+
+
+def build_segments(raw_text: str, gate: int, line: int,
+                   markers: List[Tuple[str, str, int]]) -> Tuple[List[Dict], List[str], List[Tuple[int, int]]]:
     """
-    Parse raw line text into segments: intro, exaltation, detriment.
+    Cut one line's raw text at its markers (type, planet, start), in order.
     
     Returns:
-        Tuple of (segments list, issues list)
+        Tuple of (segments list, issues list, char span of each segment's
+        text within raw_text)
     """
     segments = []
     issues = []
-    
-    # Find all exaltation and detriment positions
-    exaltation_matches = list(EXALTATION_PATTERN.finditer(raw_text))
-    detriment_matches = list(DETRIMENT_PATTERN.finditer(raw_text))
-    
-    # Create a list of all markers with their positions
-    markers = []
-    for match in exaltation_matches:
-        planet = match.group(2)  # Group 2 is the planet name
-        markers.append({
-            'type': 'exaltation',
-            'planet': planet,
-            'start': match.start(),
-            'end': match.end()
-        })
-    
-    for match in detriment_matches:
-        planet = match.group(2)  # Group 2 is the planet name
-        markers.append({
-            'type': 'detriment',
-            'planet': planet,
-            'start': match.start(),
-            'end': match.end()
-        })
-    
-    # Sort markers by position
-    markers.sort(key=lambda x: x['start'])
+    spans = []
     
     if not markers:
         # No exaltation or detriment found
@@ -79,93 +105,165 @@ def parse_line_segments(raw_text: str, gate: int, line: int) -> Tuple[List[Dict]
             'type': 'intro',
             'text': raw_text.strip()
         })
-        return segments, issues
+        spans.append(stripped_span(raw_text))
+        return segments, issues, spans
     
     # Extract intro (text before first marker)
-    intro_text = raw_text[:markers[0]['start']].strip()
+    intro_span = stripped_span(raw_text, 0, markers[0][2])
+    intro_text = raw_text[intro_span[0]:intro_span[1]]
     if intro_text:
         segments.append({
             'type': 'intro',
             'text': intro_text
         })
+        spans.append(intro_span)
     
-    # Extract each marked segment
-    for i, marker in enumerate(markers):
-        # Determine where this segment ends
-        if i + 1 < len(markers):
-            segment_end = markers[i + 1]['start']
-        else:
-            segment_end = len(raw_text)
-        
-        # Extract the segment text (from marker start to next marker or end)
-        segment_text = raw_text[marker['start']:segment_end].strip()
-        
+    # Each marked segment runs to the next marker or the end of the line
+    for i, (kind, planet, marker_start) in enumerate(markers):
+        segment_end = markers[i + 1][2] if i + 1 < len(markers) else len(raw_text)
+        segment_span = stripped_span(raw_text, marker_start, segment_end)
         segments.append({
-            'type': marker['type'],
-            'planet': marker['planet'],
-            'text': segment_text
+            'type': kind,
+            'planet': planet,
+            'text': raw_text[segment_span[0]:segment_span[1]]
         })
+        spans.append(segment_span)
     
-    # Validate: we should have at least one exaltation or detriment
-    has_exaltation = any(s['type'] == 'exaltation' for s in segments)
-    has_detriment = any(s['type'] == 'detriment' for s in segments)
+    return segments, issues, spans
+
+
+def segment_lines(lines: Sequence[Tuple[int, int, str]]) -> Tuple[List[Tuple[List[Dict], List[str], List[Tuple[int, int]]]], Dict]:
+    """
+    Segment many lines with one scan of SEGMENT_PATTERN.
     
-    if not has_exaltation and not has_detriment:
-        issues.append(f"gate.{gate}.{line}: parsed but no exaltation/detriment segments found")
+    The line texts are joined with LINE_SEPARATOR into one buffer; each
+    match is mapped back to its line by bisecting the table of line start
+    offsets.
     
-    return segments, issues
+    Args:
+        lines: (gate, line, raw text) triples
+    
+    Returns:
+        Tuple of (build_segments result per line, in input order; per-planet
+        statistics, see new_stats)
+    """
+    starts = array('q')
+    offset = 0
+    for _, _, raw_text in lines:
+        starts.append(offset)
+        offset += len(raw_text) + len(LINE_SEPARATOR)
+    buffer = LINE_SEPARATOR.join(raw_text for _, _, raw_text in lines)
+    
+    stats = new_stats()
+    markers: List[List[Tuple[str, str, int]]] = [[] for _ in lines]
+    for match in SEGMENT_PATTERN.finditer(buffer):
+        i = bisect_right(starts, match.start()) - 1
+        kind = 'exaltation' if match.group('exaltation') else 'detriment'
+        planet = match.group('planet')
+        markers[i].append((kind, planet, match.start() - starts[i]))
+        stats["planets"][planet.capitalize()][kind] += 1
+    
+    results = []
+    for (gate, line, raw_text), line_markers in zip(lines, markers):
+        results.append(build_segments(raw_text, gate, line, line_markers))
+        stats["lines"] += 1
+        for kind in MARKER_TYPES:
+            if not any(marker[0] == kind for marker in line_markers):
+                stats["missing"][kind].append(f"{gate}.{line}")
+    return results, stats
 
 
-def process_gate_file(gate_num: int) -> Tuple[bool, List[str]]:
+def parse_line_segments(raw_text: str, gate: int, line: int) -> Tuple[List[Dict], List[str], List[Tuple[int, int]]]:
     """
-    Process a single gate file and add segments to each line.
+    Parse raw line text into segments: intro, exaltation, detriment.
     
     Returns:
-        Tuple of (success boolean, issues list)
+        Tuple of (segments list, issues list, char span of each segment's
+        text within raw_text)
+    """
+    results, _ = segment_lines([(gate, line, raw_text)])
+    return results[0]
+
+
+def process_gates(gate_nums: List[int], use_index: bool = False) -> Tuple[List[Tuple[bool, List[str], Dict[str, List[Dict]]]], Dict]:
     """
-    gate_file = GATES_DIR / f"gate-{gate_num:02d}.json"
+    Segment the lines of several gate files in one pass and add segments
+    to each line.
     
-    if not gate_file.exists():
-        return False, [f"gate {gate_num}: file not found"]
+    Args:
+        gate_nums: Gate numbers
+        use_index: Offset index is current; return segment byte spans for
+            lines whose raw text still matches their indexed span
     
-    try:
-        with open(gate_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        return False, [f"gate {gate_num}: failed to read JSON: {e}"]
+    Returns:
+        Tuple of (per gate: success boolean, issues list, line -> segment
+        spans; per-planet statistics)
+    """
+    results: Dict[int, Tuple[bool, List[str], Dict[str, List[Dict]]]] = {}
+    gate_data: Dict[int, Dict] = {}
+    batch: List[Tuple[int, int, str]] = []
     
-    issues = []
-    modified = False
+    for gate_num in gate_nums:
+        gate_file = GATES_DIR / f"gate-{gate_num:02d}.json"
+        if not gate_file.exists():
+            results[gate_num] = (False, [f"gate {gate_num}: file not found"], {})
+            continue
+        try:
+            with open(gate_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            results[gate_num] = (False, [f"gate {gate_num}: failed to read JSON: {e}"], {})
+            continue
+        if not isinstance(data.get('lines'), dict):
+            results[gate_num] = (False, [f"gate {gate_num}: no 'lines' object found"], {})
+            continue
+        gate_data[gate_num] = data
+        for line_num, line_data in data['lines'].items():
+            if 'raw' in line_data:
+                batch.append((gate_num, int(line_num), line_data['raw']))
     
-    # Process each line
-    if 'lines' in data and isinstance(data['lines'], dict):
+    segmented, stats = segment_lines(batch)
+    line_results = {(gate, line): result for (gate, line, _), result in zip(batch, segmented)}
+    
+    reader = SpanReader(LINE_COMPANION_NORMALIZED, OffsetIndex.load(LINE_COMPANION_OFFSETS)) if use_index else None
+    for gate_num, data in gate_data.items():
+        issues = []
+        segment_spans = {}
+        modified = False
         for line_num, line_data in data['lines'].items():
             if 'raw' not in line_data:
                 issues.append(f"gate.{gate_num}.{line_num}: no 'raw' field")
                 continue
-            
             raw_text = line_data['raw']
-            
-            # Parse segments
-            segments, line_issues = parse_line_segments(raw_text, gate_num, int(line_num))
+            segments, line_issues, spans = line_results[(gate_num, int(line_num))]
             issues.extend(line_issues)
             
+            line_span = reader.index.line_span(gate_num, int(line_num)) if reader else None
+            if line_span and reader.text(line_span) == raw_text:
+                segment_spans[line_num] = [
+                    {**{k: v for k, v in segment.items() if k != 'text'}, 'span': byte_span(raw_text, span, line_span[0])}
+                    for segment, span in zip(segments, spans)
+                ]
+            
             # Add segments to line data
             line_data['segments'] = segments
             modified = True
-    else:
-        issues.append(f"gate {gate_num}: no 'lines' object found")
-        return False, issues
+        
+        # Write back to file if modified
+        if modified:
+            gate_file = GATES_DIR / f"gate-{gate_num:02d}.json"
+            try:
+                with open(gate_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                results[gate_num] = (False, [f"gate {gate_num}: failed to write JSON: {e}"], {})
+                continue
+        results[gate_num] = (True, issues, segment_spans)
     
-    # Write back to file if modified
-    if modified:
-        try:
-            with open(gate_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            return False, [f"gate {gate_num}: failed to write JSON: {e}"]
+    if reader:
+        reader.close()
     
-    return True, issues
+    return [results[gate_num] for gate_num in gate_nums], stats
 
 
 def log_to_bad_lines(issues: List[str]):
@@ -199,6 +297,14 @@ def main():
     """
     Main execution: process all 64 gate files
     """
+    parser = argparse.ArgumentParser(description="Split line text into exaltation/detriment segments")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes, each segmenting a slice of the gates in one pass "
+                             "(default: 1, 0 = one per CPU)")
+    parser.add_argument("--stats", type=Path,
+                        help="Also write the per-planet statistics table as JSON to this path")
+    args = parser.parse_args()
+    
     print("Task 3.5: Splitting exaltation/detriment segments")
     print("=" * 60)
     
@@ -206,9 +312,25 @@ def main():
     success_count = 0
     fail_count = 0
     
-    for gate_num in range(1, 65):
-        success, issues = process_gate_file(gate_num)
-        
+    offset_index = OffsetIndex.load(LINE_COMPANION_OFFSETS)
+    use_index = offset_index is not None and offset_index.matches(LINE_COMPANION_NORMALIZED)
+    
+    gate_nums = list(range(1, 65))
+    jobs = max(1, min(args.jobs, len(gate_nums)))
+    slices = [gate_nums[len(gate_nums) * i // jobs:len(gate_nums) * (i + 1) // jobs] for i in range(jobs)]
+    slice_results = map_gates(partial(process_gates, use_index=use_index), slices, jobs)
+    
+    results = {}
+    stats = new_stats()
+    for slice_gates, (gate_results, slice_stats) in zip(slices, slice_results):
+        results.update(zip(slice_gates, gate_results))
+        merge_stats(stats, slice_stats)
+    
+    for gate_num in gate_nums:
+        success, issues, segment_spans = results[gate_num]
+        for line_num, spans in segment_spans.items():
+            offset_index.set_segments(gate_num, int(line_num), spans)
+
         if success:
             success_count += 1
             status = "✓"
@@ -221,6 +343,18 @@ def main():
         
         all_issues.extend(issues)
     
+    if use_index:
+        offset_index.save()
+        print(f"Segment spans written to: {LINE_COMPANION_OFFSETS}")
+    
+    print("=" * 60)
+    print(format_stats_table(stats))
+    if args.stats:
+        args.stats.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.stats, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+        print(f"Statistics written to: {args.stats}")
+    
     print("=" * 60)
     print(f"Processed: {success_count} success, {fail_count} failed")
     print(f"Total issues: {len(all_issues)}")
@@ -160,9 +160,9 @@ def check_gate_file(gate_file: Path) -> Tuple[bool, Dict]:
             for issue in content_issues:
                 report['issues'].append(f"line {line_num}: {issue}")
     
-    # Check if raw_text is still present (for provenance)
-    if 'raw_text' not in gate_data:
-        report['issues'].append("missing 'raw_text' field (provenance)")
+    # Check the gate text is still reachable (raw_text, or a span into normalized.txt)
+    if 'raw_text' not in gate_data and 'span' not in gate_data.get('_meta', {}):
+        report['issues'].append("missing 'raw_text' field or '_meta.span' (provenance)")
     
     # Check _meta
     if '_meta' not in gate_data:
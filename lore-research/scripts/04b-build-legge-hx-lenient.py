@@ -4,26 +4,27 @@
 
 Lenient index builder that guarantees all 64 hexagrams are present in legge-hx.json,
 even if OCR quality is poor. Creates stub entries with provenance metadata and
-quality flags for downstream processing.
+quality flags for downstream processing. Parsing is the lenient mode of the
+tokenizer shared with 04 (legge_parser.py).
 
 Usage:
     python3 lore-research/scripts/04b-build-legge-hx-lenient.py
 """
 
 import json
-import re
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from source_text import SourceText
+from legge_parser import LENIENT, parse_legge
+
 # Paths
 SRC_TXT = Path("s3-data/hexagrams/legge-normalized.txt")
 PARA_DIR = Path("s3-data/hexagrams")
 OUT_JSON = Path("s3-data/hexagrams/legge-hx.json")
 
-# Lenient regex patterns
-HEX_HEADER_RE = re.compile(r"^\s*(?:[IVXLCDM]{1,6}|\d{1,2})\s*\.\s*(.+)$", re.IGNORECASE)
-LINE_RE = re.compile(r"^\s*([1-6])\.\s*(.+)$")
-
 
 def load_paraphrase_titles():
     """Load titles from paraphrase JSON files as fallback."""
@@ -41,80 +42,52 @@ def load_paraphrase_titles():
     return titles
 
 
-def parse_blocks_lenient(txt):
-    """
-    Very permissive parser that splits text into 64 hexagram blocks.
-    Allows for OCR artifacts and missing data.
+def parse_blocks_lenient(source):
     """
-    lines = txt.splitlines()
+    Very permissive parse into 64 hexagram entries.
+    Allows for OCR artifacts and missing data: hexagrams the lenient
+    tokenizer (legge_parser, lenient mode) does not find become stubs.
     
-    # Initialize accumulator for all 64 hexagrams
-    acc = {n: {"title": None, "raw_text": [], "lines": {}} for n in range(1, 65)}
-    current = None
-
-    def ensure_hex(n):
-        return acc.setdefault(n, {"title": None, "raw_text": [], "lines": {}})
-
-    # Parse line by line
-    for ln in lines:
-        # Check for line markers (1. 2. 3. etc.)
-        m_line = LINE_RE.match(ln)
-        if m_line and current:
-            idx = m_line.group(1)
-            text = m_line.group(2).strip()
-            acc[current]["lines"].setdefault(idx, [])
-            acc[current]["lines"][idx].append(text)
-            acc[current]["raw_text"].append(ln)
-            continue
-
-        # Check for hexagram header (e.g., "Hexagram 12", "XII.", "12.")
-        hex_match = re.search(r"Hexagram\s+(\d{1,2})", ln, re.IGNORECASE)
-        if hex_match:
-            n = int(hex_match.group(1))
-            if 1 <= n <= 64:
-                current = n
-                ensure_hex(current)
-                acc[current]["raw_text"].append(ln)
-            continue
-
-        # Check for roman numeral or number header
-        m_hdr = HEX_HEADER_RE.match(ln)
-        if m_hdr and current:
-            # Capture potential title
-            if not acc[current]["title"]:
-                acc[current]["title"] = m_hdr.group(1).strip()
-            acc[current]["raw_text"].append(ln)
-            continue
-
-        # Append to current hexagram if any
-        if current:
-            acc[current]["raw_text"].append(ln)
+    Args:
+        source: SourceText over legge-normalized.txt, or None for all stubs
+    """
+    blocks = {b.hexagram: b for b in parse_legge(source, LENIENT)} if source is not None else {}
 
     # Collapse to final structure
     out = {}
     for n in range(1, 65):
-        blk = acc[n]
-        lines_obj = {}
+        blk = blocks.get(n)
+        found = blk.lines if blk else {}
         
         # Build lines object (1-6)
-        for k in ("1", "2", "3", "4", "5", "6"):
-            arr = blk["lines"].get(k, [])
-            lines_obj[k] = {
-                "line": int(k),
-                "raw": (arr[0].strip() if arr else "")
+        lines_obj = {}
+        for k in range(1, 7):
+            lines_obj[str(k)] = {
+                "line": k,
+                "raw": source.decode(*found[k]) if k in found else ""
+            }
+
+        meta = {
+            "source": "legge-1899-ocr",
+            "normalized_from": str(SRC_TXT),
+            "extracted_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "quality": "ocr_janky",  # Important flag for downstream
+            "parse_mode": LENIENT,
+        }
+        if blk:
+            # UTF-8 byte spans into legge-normalized.txt
+            meta["spans"] = {
+                "text": list(blk.span),
+                "judgment": list(blk.judgment),
+                "lines": {str(k): list(span) for k, span in found.items()},
             }
 
         out[str(n)] = {
             "hexagram": n,
-            "title": (blk["title"] or "").strip(),
-            "raw_text": "\n".join(blk["raw_text"]).strip(),
+            "title": blk.title if blk else "",
+            "raw_text": source.decode(*blk.span) if blk else "",
             "lines": lines_obj,
-            "_meta": {
-                "source": "legge-1899-ocr",
-                "normalized_from": str(SRC_TXT),
-                "extracted_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-                "quality": "ocr_janky"  # Important flag for downstream
-            },
+            "_meta": meta,
             # Keep page fields for compatibility (may be None)
             "source_leaf_start": None,
             "source_leaf_end": None,
@@ -129,13 +102,13 @@ def main():
     """Main execution."""
     print(f"Reading source: {SRC_TXT}")
     
-    txt = SRC_TXT.read_text(encoding="utf-8") if SRC_TXT.exists() else ""
-    
-    if not txt:
+    if SRC_TXT.exists() and SRC_TXT.stat().st_size:
+        # Parse with lenient rules in one scan of the mapped file
+        with SourceText(SRC_TXT) as source:
+            idx = parse_blocks_lenient(source)
+    else:
         print(f"Warning: Source file {SRC_TXT} is empty or missing")
-    
-    # Parse with lenient rules
-    idx = parse_blocks_lenient(txt)
+        idx = parse_blocks_lenient(None)
     
     # Backfill titles from paraphrase JSONs so UI is readable
     p_titles = load_paraphrase_titles()
@@ -2,23 +2,33 @@
 """
 Attach Legge page/leaf metadata to hexagram index.
 
-Reads page map from s3-data/236066-The I Ching_page_numbers.json and
-estimates which leaf range each hexagram came from, attaching metadata
+Aligns the hexagram headers of legge-normalized.txt with the printed page
+numbers in the same text and the page map in
+s3-data/236066-The I Ching_page_numbers.json (see page_alignment.py), and
+attaches each hexagram's leaf range, page range and alignment confidence
 to s3-data/hexagrams/legge-hx.json.
 
 Task 2.5 from quote-extraction spec.
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
-from config import S3_DATA_ROOT, RESEARCH_OUTPUTS_DIR
+from config import LEGGE_HX_INDEX, LEGGE_NORMALIZED, LEGGE_PAGE_MAP, RESEARCH_OUTPUTS_DIR
+from legge_parser import LENIENT, parse_legge
+from page_alignment import PageAligner
+from source_text import SourceText, compile_bytes
 from utils import ensure_directory
 
+# The Text ends where the Appendixes (commentary) begin; the last
+# hexagram's block would otherwise run to the end of the book
+APPENDIX_RE = compile_bytes(r"^(?:THE )?APPENDIX(?:ES)?\b", re.MULTILINE)
+
 # Simple logging functions
 def log_info(msg: str):
     print(f"[INFO] {msg}")
@@ -32,101 +42,51 @@ def log_error(msg: str):
 
 def load_page_map(page_map_path: Path) -> dict:
     """
-    Load page map and build lookup: leafNum -> {confidence, ocr_value, pageNumber}
+    Load the parsed page map (leafNum -> OCR'd pageNumber entries).
     """
     log_info(f"Loading page map from: {page_map_path}")
     
     with open(page_map_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    # Build lookup dictionary
-    lookup = {}
-    for entry in data.get('pages', []):
-        leaf_num = entry.get('leafNum')
-        if leaf_num:
-            lookup[leaf_num] = {
-                'confidence': entry.get('confidence', 0),
-                'ocr_value': entry.get('ocr_value', []),
-                'pageNumber': entry.get('pageNumber', '')
-            }
-    
-    log_info(f"Loaded {len(lookup)} page map entries")
-    return lookup
+    log_info(f"Loaded {len(data.get('pages', []))} page map entries")
+    return data
 
 
-def estimate_leaf_range(hex_num: int, total_hexagrams: int = 64, 
-                       total_leaves: int = 500) -> tuple:
+def hexagram_blocks(source: SourceText, parsed: list) -> dict:
     """
-    Estimate leaf range for a hexagram based on its position.
-    
-    This is a rough estimate assuming hexagrams are distributed
-    somewhat evenly through the document.
-    
-    Returns: (leaf_start, leaf_end) or (None, None) if can't estimate
+    Hexagram number -> (header start, block end) byte offsets. The last
+    block is cut at the first Appendix heading after it.
     """
-    # Rough estimate: divide total leaves by number of hexagrams
-    # Account for front matter (first ~50 leaves are often intro/TOC)
-    front_matter_leaves = 50
-    content_leaves = total_leaves - front_matter_leaves
-    
-    leaves_per_hexagram = content_leaves / total_hexagrams
-    
-    # Estimate start and end
-    leaf_start = int(front_matter_leaves + (hex_num - 1) * leaves_per_hexagram)
-    leaf_end = int(front_matter_leaves + hex_num * leaves_per_hexagram)
-    
-    return (leaf_start, leaf_end)
+    blocks = {hx.hexagram: (hx.header[0], hx.span[1]) for hx in parsed}
+    if blocks:
+        last = max(blocks, key=lambda num: blocks[num][0])
+        start, end = blocks[last]
+        appendix = source.search(APPENDIX_RE, start, end)
+        if appendix:
+            blocks[last] = (start, appendix.start())
+    return blocks
 
 
-def get_page_candidates(page_map: dict, leaf_start: int, leaf_end: int) -> tuple:
-    """
-    Get page number candidates for a leaf range.
-    
-    Returns: (page_candidates, confidence)
-    """
-    candidates = []
-    confidences = []
-    
-    for leaf_num in range(leaf_start, leaf_end + 1):
-        if leaf_num in page_map:
-            entry = page_map[leaf_num]
-            ocr_values = entry.get('ocr_value', [])
-            confidence = entry.get('confidence', 0)
-            
-            # Add OCR values to candidates
-            for val in ocr_values:
-                if val and val not in candidates:
-                    candidates.append(val)
-            
-            confidences.append(confidence)
-    
-    # Calculate average confidence
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-    
-    return (candidates, avg_confidence)
-
-
-def attach_page_metadata(hexagrams: dict, page_map: dict) -> dict:
+def attach_page_metadata(hexagrams: dict, aligner: PageAligner, headers: dict) -> dict:
     """
     Attach page/leaf metadata to each hexagram.
+    
+    Args:
+        hexagrams: legge-hx.json contents (hexagram number -> data)
+        aligner: PageAligner over legge-normalized.txt
+        headers: Hexagram number -> (header start, block end) byte offsets
     """
     log_info("Attaching page/leaf metadata to hexagrams...")
     
-    # Determine total leaves from page map
-    max_leaf = max(page_map.keys()) if page_map else 500
-    log_info(f"Max leaf number in page map: {max_leaf}")
-    
     updated_count = 0
     failed_count = 0
     
     for hex_num_str, hex_data in hexagrams.items():
         hex_num = int(hex_num_str)
         
-        # Estimate leaf range
-        leaf_start, leaf_end = estimate_leaf_range(hex_num, total_leaves=max_leaf)
-        
-        if leaf_start is None or leaf_end is None:
-            log_warning(f"Could not estimate leaf range for hexagram {hex_num}")
+        if hex_num not in headers:
+            log_warning(f"No header anchor for hexagram {hex_num} in the normalized text")
             hex_data['source_leaf_start'] = None
             hex_data['source_leaf_end'] = None
             hex_data['source_page_candidates'] = []
@@ -134,17 +94,22 @@ def attach_page_metadata(hexagrams: dict, page_map: dict) -> dict:
             failed_count += 1
             continue
         
-        # Get page candidates
-        page_candidates, confidence = get_page_candidates(page_map, leaf_start, leaf_end)
+        header_start, block_end = headers[hex_num]
+        start = aligner.locate(header_start)
+        end = aligner.locate(max(block_end - 1, header_start))
+        page_candidates = aligner.page_candidates(start, end)
+        confidence = min(start.confidence, end.confidence)
         
         # Attach metadata
-        hex_data['source_leaf_start'] = leaf_start
-        hex_data['source_leaf_end'] = leaf_end
+        hex_data['source_leaf_start'] = start.leaf
+        hex_data['source_leaf_end'] = end.leaf
+        hex_data['source_page_start'] = start.page
+        hex_data['source_page_end'] = end.page
         hex_data['source_page_candidates'] = page_candidates
-        hex_data['source_page_confidence'] = round(confidence, 2)
+        hex_data['source_page_confidence'] = confidence
         
-        log_info(f"Hexagram {hex_num}: leaves {leaf_start}-{leaf_end}, "
-                f"pages {page_candidates}, confidence {confidence:.2f}")
+        log_info(f"Hexagram {hex_num}: leaves {start.leaf}-{end.leaf}, "
+                f"pages {start.page}-{end.page}, confidence {confidence:.2f}")
         
         updated_count += 1
     
@@ -177,7 +142,7 @@ def log_failures_to_bad_lines(hexagrams: dict):
         f.write(f"Generated: {datetime.utcnow().isoformat()}Z\n\n")
         for hex_num in failures:
             f.write(f"- hexagram: {hex_num} | source: legge-hx.json | "
-                   f"problem: could not estimate leaf range | "
+                   f"problem: no header anchor in legge-normalized.txt | "
                    f"suggestion: manual review needed\n")
 
 
@@ -188,8 +153,8 @@ def main():
     log_info("=" * 60)
     
     # Input files
-    page_map_path = S3_DATA_ROOT / '236066-The I Ching_page_numbers.json'
-    hexagrams_path = S3_DATA_ROOT / 'hexagrams' / 'legge-hx.json'
+    page_map_path = LEGGE_PAGE_MAP
+    hexagrams_path = LEGGE_HX_INDEX
     
     # Check inputs exist
     if not page_map_path.exists():
@@ -201,6 +166,11 @@ def main():
         log_error("Please run task 2.4 (04-build-legge-hexagram-index.py) first")
         sys.exit(1)
     
+    if not LEGGE_NORMALIZED.exists():
+        log_error(f"Normalized Legge text not found: {LEGGE_NORMALIZED}")
+        log_error("Please run 02-normalize-legge.py first")
+        sys.exit(1)
+    
     # Load data
     page_map = load_page_map(page_map_path)
     
@@ -210,8 +180,20 @@ def main():
     
     log_info(f"Loaded {len(hexagrams)} hexagrams")
     
+    # Align page anchors and locate each hexagram header
+    with SourceText(LEGGE_NORMALIZED) as source:
+        try:
+            aligner = PageAligner.build(source, page_map)
+        except ValueError as e:
+            log_error(f"Page alignment failed: {e}")
+            sys.exit(1)
+        log_info(f"Monotone anchor chains: {len(aligner.text_chain)} text pages, "
+                 f"{len(aligner.leaf_chain)} leaves")
+        headers = hexagram_blocks(source, parse_legge(source, LENIENT))
+    log_info(f"Found {len(headers)} hexagram headers")
+    
     # Attach metadata
-    hexagrams = attach_page_metadata(hexagrams, page_map)
+    hexagrams = attach_page_metadata(hexagrams, aligner, headers)
     
     # Log failures
     log_failures_to_bad_lines(hexagrams)
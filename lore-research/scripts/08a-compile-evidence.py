@@ -9,12 +9,14 @@ For each gate.line, pulls:
 - Keywords
 
 Outputs to evidence/{gate}-{line}.json for LLM consumption.
+
+Use --jobs N to compile gates across N worker processes.
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config import (
     S3_DATA_ROOT,
@@ -22,31 +24,28 @@ from config import (
     LEGGE_MODE,
     LEGGE_PARAPHRASE_DIR,
 )
-from utils import setup_logging
+from utils import setup_logging, parse_gate_spec, map_gates, parse_jobs
+from gate_corpus import get_corpus
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_DIR = RESEARCH_OUTPUTS_DIR / "evidence"
+
 
 def load_gate_file(gate: int) -> Optional[Dict]:
-    """Load gate file from s3-data/gates/."""
-    gate_file = S3_DATA_ROOT / "gates" / f"{gate:02d}.json"
-    if not gate_file.exists():
-        logger.warning(f"Gate file not found: {gate_file}")
-        return None
-    
-    with open(gate_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load gate file from s3-data/gates/ (memoized via GateCorpus)."""
+    gate_data = get_corpus().gate(gate)
+    if gate_data is None:
+        logger.warning(f"Gate file not found: {S3_DATA_ROOT / 'gates' / f'{gate:02d}.json'}")
+    return gate_data
 
 
 def load_hexagram_file(gate: int) -> Optional[Dict]:
-    """Load hexagram file from s3-data/hexagrams/."""
-    hex_file = S3_DATA_ROOT / "hexagrams" / f"{gate:02d}.json"
-    if not hex_file.exists():
-        logger.warning(f"Hexagram file not found: {hex_file}")
-        return None
-    
-    with open(hex_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load hexagram file from s3-data/hexagrams/ (memoized via GateCorpus)."""
+    hex_data = get_corpus().hexagram(gate)
+    if hex_data is None:
+        logger.warning(f"Hexagram file not found: {S3_DATA_ROOT / 'hexagrams' / f'{gate:02d}.json'}")
+    return hex_data
 
 
 def extract_quote(text: str, max_words: int = 25) -> str:
@@ -123,30 +122,52 @@ def compile_evidence_for_line(gate: int, line: int) -> Optional[Dict]:
     return evidence
 
 
-def compile_all_evidence():
-    """Compile evidence packs for all 384 gate.lines."""
-    output_dir = RESEARCH_OUTPUTS_DIR / "evidence"
+def compile_gate_evidence(gate: int) -> Tuple[int, int]:
+    """
+    Compile and write the six evidence packs for one gate.
+    
+    Returns:
+        Tuple of (compiled count, missing count)
+    """
+    compiled_count = 0
+    missing_count = 0
+    
+    for line in range(1, 7):
+        evidence = compile_evidence_for_line(gate, line)
+        
+        if evidence:
+            output_file = OUTPUT_DIR / f"{gate:02d}-{line}.json"
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(evidence, f, indent=2, ensure_ascii=False)
+            compiled_count += 1
+        else:
+            missing_count += 1
+            logger.warning(f"Could not compile evidence for {gate}.{line}")
+    
+    return compiled_count, missing_count
+
+
+def compile_all_evidence(gates: Optional[List[int]] = None, jobs: int = 1):
+    """Compile evidence packs for all 384 gate.lines (or only the given gates)."""
+    gates = gates or list(range(1, 65))
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"Compiling evidence packs to {output_dir}")
     
-    compiled_count = 0
-    missing_count = 0
+    corpus = get_corpus()
+    if jobs <= 1:
+        corpus.load_all(["gate", "hexagram"], gates)
+    else:
+        logger.info(f"Compiling with {jobs} worker processes")
     
-    for gate in range(1, 65):
-        for line in range(1, 7):
-            evidence = compile_evidence_for_line(gate, line)
-            
-            if evidence:
-                output_file = output_dir / f"{gate:02d}-{line}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(evidence, f, indent=2, ensure_ascii=False)
-                compiled_count += 1
-            else:
-                missing_count += 1
-                logger.warning(f"Could not compile evidence for {gate}.{line}")
+    results = map_gates(compile_gate_evidence, gates, jobs)
+    compiled_count = sum(compiled for compiled, _ in results)
+    missing_count = sum(missing for _, missing in results)
     
     logger.info(f"Compiled {compiled_count} evidence packs")
+    if jobs <= 1:
+        logger.info(corpus.format_stats())
     if missing_count > 0:
         logger.warning(f"Missing evidence for {missing_count} gate.lines")
     
@@ -166,9 +187,19 @@ def compile_all_evidence():
 
 
 def main():
-    setup_logging()
+    import argparse
+    
+    setup_logging(__name__)
+    
+    parser = argparse.ArgumentParser(description="Compile evidence packs for LLM star system scoring")
+    parser.add_argument("--gates", type=parse_gate_spec, default=None,
+                        help="Gates to compile, e.g. 1,5,10-12 (default: all 64)")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes (default: 1, 0 = one per CPU)")
+    args = parser.parse_args()
+    
     logger.info("Starting evidence compilation")
-    compile_all_evidence()
+    compile_all_evidence(args.gates, args.jobs)
     logger.info("Evidence compilation complete")
 
 
@@ -4,30 +4,50 @@ LLM-assisted star system scoring using OpenAI structured outputs.
 
 Reads evidence packs and uses LLM as a constrained "judge" to score
 all 8 star systems for each gate.line with alignment, weight, confidence, and reasoning.
+
+Gate.lines are scored concurrently by llm_async.AsyncScoringEngine, bounded by
+--concurrency and by requests/min (--rpm) and tokens/min (--tpm) token buckets,
+with exponential backoff on 429/5xx. --base-url points the scorer at any
+OpenAI-compatible endpoint (e.g. a local stub for testing).
+
+Validated outputs are cached on disk (response_cache.ResponseCache) keyed by
+model, temperature, system prompt and user prompt, so reruns only pay for
+prompts that changed. --refresh ignores cached answers (and overwrites them);
+--no-cache bypasses the cache entirely.
+
+Every finished gate.line is appended to star-maps-llm/_journal.ndjson
+(scoring_journal.ScoringJournal). Reruns skip lines whose journal entry is
+still valid (same prompt hash, output file present) and work through all
+selected lines in --batch-size chunks, so an interrupted run resumes where it
+stopped. Several 08b processes may share the journal; each claims a line
+before scoring it. --no-resume ignores the journal.
+
+--group-size 6 packs all six lines of a gate into one request (the rubric is
+sent once per gate instead of once per line); the answer is validated and
+split back into per-line files, with per-line requests as the fallback.
+Grouped answers are cached under the group request's fingerprint, and
+journal hashes carry the group size, so grouped and per-line runs never
+serve each other's answers.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Literal
 
 from pydantic import BaseModel, Field, conlist, confloat
 
 from config import RESEARCH_OUTPUTS_DIR
-from utils import setup_logging
+from utils import setup_logging, parse_gate_spec
+from llm_async import AsyncScoringEngine, ChatCompletionsClient, RateLimiter, DEFAULT_BASE_URL
+from response_cache import ResponseCache
+from scoring_journal import ScoringJournal
 
 logger = logging.getLogger(__name__)
 
-# Check for OpenAI
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    logger.warning("OpenAI library not installed. Install with: pip install openai")
-
 
 # ============================================================================
 # Pydantic Models for Structured Output
@@ -50,6 +70,11 @@ class StarMapOutput(BaseModel):
     source_meta: Dict
 
 
+class StarMapGroupOutput(BaseModel):
+    """Star system mappings for several gate.lines scored in one request."""
+    results: List[StarMapOutput]
+
+
 # ============================================================================
 # Rubric (condensed from v4.2 baselines)
 # ============================================================================
@@ -85,46 +110,86 @@ RUBRIC = """
 # Prompt Builder
 # ============================================================================
 
-def build_prompt(evidence: Dict) -> str:
-    """Build the LLM prompt from evidence pack."""
+SCORING_RULES = """Rules:
+- Use evidence quotes literally. Do NOT invent text.
+- If unsure, set alignment="none" and weight=0.0 with low confidence.
+- Prefer precision over coverage. Keep "why" concise (≤60 words).
+- At most 2 systems should have weight >0.4 per line.
+- If a behavior matches a system's core function, use alignment="core".
+- If a behavior matches a system's shadow/distorted expression, use alignment="shadow".
+- If no match, use alignment="none" and weight=0.0."""
+
+
+def build_context(evidence: Dict) -> str:
+    """Evidence block for one gate.line."""
     return f"""Context:
 - Gate.Line: {evidence['gate_line']}
 - LC: "{evidence['lc_quote']}" (title: {evidence['lc_title']}, locator: {evidence['lc_locator']})
 - Legge: "{evidence['legge_quote']}" (title: {evidence['legge_title']}, locator: {evidence['legge_locator']})
 - Normalized meaning: {evidence['normalized_meaning']}
-- Keywords: {', '.join(evidence['keywords'])}
+- Keywords: {', '.join(evidence['keywords'])}"""
+
+
+def build_prompt(evidence: Dict) -> str:
+    """Build the LLM prompt from evidence pack."""
+    return f"""{build_context(evidence)}
 
 Task:
 Score ALL 8 star systems with alignment (core|shadow|none), weight (0..1), confidence (0..1), and a short "why" that references phrases from the evidence.
 
-Rules:
-- Use evidence quotes literally. Do NOT invent text.
-- If unsure, set alignment="none" and weight=0.0 with low confidence.
-- Prefer precision over coverage. Keep "why" concise (≤60 words).
-- At most 2 systems should have weight >0.4 per line.
-- If a behavior matches a system's core function, use alignment="core".
-- If a behavior matches a system's shadow/distorted expression, use alignment="shadow".
-- If no match, use alignment="none" and weight=0.0.
+{SCORING_RULES}
 
 Respond with valid JSON matching the StarMapOutput schema."""
 
 
+def build_group_prompt(evidences: List[Dict]) -> str:
+    """Build one prompt scoring several gate.lines (typically the six lines of a gate)."""
+    contexts = "\n\n".join(build_context(evidence) for evidence in evidences)
+    gate_lines = ", ".join(evidence['gate_line'] for evidence in evidences)
+    return f"""{contexts}
+
+Task:
+For EACH gate.line above ({gate_lines}), score ALL 8 star systems with alignment (core|shadow|none), weight (0..1), confidence (0..1), and a short "why" that references phrases from that line's evidence. Score each line independently.
+
+{SCORING_RULES}
+
+Respond with a JSON object {{"results": [...]}} holding one StarMapOutput per gate.line, in the order listed above."""
+
+
 # ============================================================================
 # LLM Scorer
 # ============================================================================
 
 class LLMScorer:
-    """LLM-based star system scorer using OpenAI structured outputs."""
+    """LLM-based star system scorer using OpenAI JSON-mode chat completions."""
     
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.0):
-        if not OPENAI_AVAILABLE:
-            raise ImportError("OpenAI library required. Install with: pip install openai")
-        
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.0,
+        base_url: Optional[str] = None,
+        concurrency: int = 8,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 200_000,
+        max_retries: int = 5,
+        cache: Optional[ResponseCache] = None,
+        refresh: bool = False,
+        group_size: int = 1,
+    ):
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or DEFAULT_BASE_URL
         api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not api_key and base_url == DEFAULT_BASE_URL:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        self.client = OpenAI(api_key=api_key)
+        self.engine = AsyncScoringEngine(
+            ChatCompletionsClient(base_url, api_key),
+            RateLimiter(requests_per_minute, tokens_per_minute),
+            concurrency=concurrency,
+            max_retries=max_retries,
+        )
+        self.cache = cache
+        self.refresh = refresh
+        self.group_size = max(1, group_size)
         self.model = model
         self.temperature = temperature
         self.system_prompt = f"""You are a strict evaluator for star system mapping. Output ONLY valid JSON that conforms to the provided schema.
@@ -137,65 +202,267 @@ Rules:
 - Prefer precision over coverage.
 - At most 2 systems should have weight >0.4 per line."""
     
-    def score_gate_line(self, evidence: Dict, retry_on_fail: bool = True) -> Optional[StarMapOutput]:
-        """Score a single gate.line using LLM."""
-        user_prompt = build_prompt(evidence)
-        
+    def build_request(self, evidence: Dict) -> Dict:
+        """Build the chat-completions request body for one gate.line."""
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": build_prompt(evidence)}
+            ],
+            "response_format": {"type": "json_object"},
+        }
+    
+    def build_group_request(self, evidences: List[Dict]) -> Dict:
+        """Build one request body scoring several gate.lines."""
+        payload = self.build_request(evidences[0])
+        payload["messages"][1]["content"] = build_group_prompt(evidences)
+        payload["max_tokens"] = 900 * len(evidences)
+        return payload
+    
+    @staticmethod
+    def parse_response(response: Dict) -> StarMapOutput:
+        """Parse and validate a chat-completions response (raises if invalid)."""
+        content = response["choices"][0]["message"]["content"]
+        return StarMapOutput(**json.loads(content))
+    
+    @staticmethod
+    def parse_group_response(response: Dict) -> List[StarMapOutput]:
+        """Parse and validate a grouped response (raises if invalid)."""
+        content = response["choices"][0]["message"]["content"]
+        return StarMapGroupOutput(**json.loads(content)).results
+    
+    def group_indices(self, evidences: List[Dict], indices: List[int]) -> List[List[int]]:
+        """Split indices into runs of up to group_size lines from the same gate."""
+        groups: List[List[int]] = []
+        for index in indices:
+            gate = evidences[index]['gate_line'].split('.')[0]
+            current = groups[-1] if groups else None
+            if (current and len(current) < self.group_size
+                    and evidences[current[0]]['gate_line'].split('.')[0] == gate):
+                current.append(index)
+            else:
+                groups.append([index])
+        return groups
+    
+    def cache_key(self, payload: Dict) -> str:
+        """Response cache key for a request body."""
+        system_prompt, user_prompt = (m["content"] for m in payload["messages"])
+        return ResponseCache.key_for(self.model, self.temperature, system_prompt, user_prompt)
+    
+    def cached_result(self, key: str) -> Optional[StarMapOutput]:
+        """Return a validated cached result, or None on a miss / stale entry."""
+        if self.cache is None or self.refresh:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
         try:
-            # Use structured output (if available in your OpenAI version)
-            # Otherwise, parse JSON from response
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content
-            data = json.loads(content)
+            return StarMapOutput(**payload)
+        except Exception as e:
+            logger.warning(f"Ignoring invalid cache entry {key[:12]}: {e}")
+            return None
+    
+    def cached_group(self, key: str) -> Optional[List[StarMapOutput]]:
+        """Return validated cached results of a grouped request, or None."""
+        if self.cache is None or self.refresh:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        try:
+            return StarMapGroupOutput(**payload).results
+        except Exception as e:
+            logger.warning(f"Ignoring invalid cache entry {key[:12]}: {e}")
+            return None
+    
+    def score_many(self, evidences: List[Dict], on_result=None) -> List[Optional[StarMapOutput]]:
+        """
+        Score gate.lines concurrently, serving unchanged prompts from the cache.
+        
+        With group_size > 1, lines of the same gate are packed into one request;
+        groups whose answer is missing, invalid or mismatched fall back to
+        per-line requests. Invalid per-line responses are re-requested once.
+        Per-line answers are cached under the line's prompt key and grouped
+        answers under the group request's key, so a cache hit always comes
+        from the prompt that was actually sent.
+        
+        Returns:
+            Results in input order (None where scoring failed)
+        """
+        payloads = [self.build_request(evidence) for evidence in evidences]
+        keys = [self.cache_key(payload) for payload in payloads]
+        results: List[Optional[StarMapOutput]] = [self.cached_result(key) for key in keys]
+        
+        for index, result in enumerate(results):
+            if result is not None and on_result:
+                on_result(index, result, {"latency_ms": 0, "usage": {}, "cached": True})
+        
+        def store(index: int, result: Optional[StarMapOutput], info: Dict, cache_key: Optional[str] = None):
+            results[index] = result
+            if result is not None and cache_key is not None and self.cache is not None:
+                self.cache.put(cache_key, result.model_dump())
+            if on_result:
+                on_result(index, result, {"cached": False, **info})
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        if self.group_size > 1 and pending:
+            groups = self.group_indices(evidences, pending)
+            fallback: List[int] = []
             
-            # Validate with Pydantic
-            result = StarMapOutput(**data)
-            return result
+            group_payloads = [self.build_group_request([evidences[i] for i in g]) for g in groups]
+            group_keys = [self.cache_key(payload) for payload in group_payloads]
             
-        except Exception as e:
-            logger.error(f"Error scoring {evidence['gate_line']}: {e}")
+            def store_group(position: int, group_results: Optional[List[StarMapOutput]], info: Dict):
+                members = groups[position]
+                expected = [evidences[i]['gate_line'] for i in members]
+                if group_results is None or [r.gate_line for r in group_results] != expected:
+                    fallback.extend(members)
+                    return
+                if not info.get("cached") and self.cache is not None:
+                    self.cache.put(group_keys[position], {"results": [r.model_dump() for r in group_results]})
+                # Attribute the group's latency and tokens evenly to its lines
+                usage = info.get("usage", {})
+                share = {
+                    "latency_ms": info.get("latency_ms", 0) // len(members),
+                    "group_latency_ms": info.get("latency_ms", 0),
+                    "usage": {k: v // len(members) for k, v in usage.items() if isinstance(v, int)},
+                    "cached": info.get("cached", False),
+                }
+                for index, result in zip(members, group_results):
+                    store(index, result, share)
             
-            if retry_on_fail:
-                logger.info(f"Retrying {evidence['gate_line']}...")
-                time.sleep(1)
-                return self.score_gate_line(evidence, retry_on_fail=False)
+            to_send = []
+            for position, key in enumerate(group_keys):
+                cached = self.cached_group(key)
+                if cached is not None:
+                    store_group(position, cached, {"latency_ms": 0, "usage": {}, "cached": True})
+                else:
+                    to_send.append(position)
             
-            return None
+            asyncio.run(self.engine.run(
+                [group_payloads[position] for position in to_send],
+                parse=self.parse_group_response,
+                on_result=lambda i, group_results, info: store_group(to_send[i], group_results, info),
+                parse_retries=0,
+            ))
+            pending = sorted(fallback)
+            if pending:
+                logger.warning(f"Grouped scoring failed for {len(pending)} gate.lines; falling back to per-line requests")
+        
+        if not pending:
+            return results
+        
+        asyncio.run(self.engine.run(
+            [payloads[i] for i in pending],
+            parse=self.parse_response,
+            on_result=lambda position, result, info: store(pending[position], result, info, keys[pending[position]]),
+        ))
+        return results
+    
+    def score_gate_line(self, evidence: Dict) -> Optional[StarMapOutput]:
+        """Score a single gate.line using LLM."""
+        return self.score_many([evidence])[0]
+    
+    def prompt_hash(self, evidence: Dict) -> str:
+        """
+        Journal fingerprint of a gate.line: its per-line cache key, tagged
+        with the group size in grouped mode, so lines scored inside a group
+        prompt are not taken as done by a per-line run (or vice versa).
+        """
+        key = self.cache_key(self.build_request(evidence))
+        if self.group_size > 1:
+            key = hashlib.sha256(f"{key}:group={self.group_size}".encode("utf-8")).hexdigest()
+        return key
     
-    def score_batch(self, evidence_files: List[Path], output_dir: Path) -> Dict:
-        """Score a batch of gate.lines."""
+    def pending_files(self, evidence_files: List[Path], journal: Optional[ScoringJournal]) -> List[Path]:
+        """Drop evidence files whose journal entry is still valid."""
+        if journal is None:
+            return list(evidence_files)
+        
+        pending = []
+        for evidence_file in evidence_files:
+            with open(evidence_file, 'r', encoding='utf-8') as f:
+                evidence = json.load(f)
+            if not journal.is_done(evidence['gate_line'], self.prompt_hash(evidence)):
+                pending.append(evidence_file)
+        return pending
+    
+    def score_batch(
+        self,
+        evidence_files: List[Path],
+        output_dir: Path,
+        journal: Optional[ScoringJournal] = None,
+    ) -> Dict:
+        """Score a batch of gate.lines, journaling each one as it finishes."""
         output_dir.mkdir(parents=True, exist_ok=True)
         
         results = {
             "scored": 0,
             "failed": 0,
+            "skipped": 0,
             "needs_review": []
         }
         
+        evidences = []
         for evidence_file in evidence_files:
             with open(evidence_file, 'r', encoding='utf-8') as f:
-                evidence = json.load(f)
+                evidences.append(json.load(f))
+        hashes = [self.prompt_hash(evidence) for evidence in evidences]
+        
+        if journal is not None:
+            # Claim lines so parallel workers don't score the same ones, then
+            # re-read the journal in case another worker finished them meanwhile
+            claimed = [i for i, e in enumerate(evidences) if journal.claim(e['gate_line'])]
+            journal.reload()
+            keep = []
+            for i in claimed:
+                if journal.is_done(evidences[i]['gate_line'], hashes[i]):
+                    journal.release(evidences[i]['gate_line'])
+                else:
+                    keep.append(i)
+            results["skipped"] = len(evidences) - len(keep)
+            evidence_files = [evidence_files[i] for i in keep]
+            evidences = [evidences[i] for i in keep]
+            hashes = [hashes[i] for i in keep]
+        
+        def write_result(index: int, result: Optional[StarMapOutput], info: Dict):
+            # Write each output as soon as it arrives so an interrupted run keeps its progress
+            gate_line = evidences[index]['gate_line']
+            output_file = output_dir / f"{evidence_files[index].stem}.json"
+            if result:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(result.model_dump_json(indent=2))
+                logger.info(f"Scored {gate_line}{' (cached)' if info['cached'] else ''}")
             
+            if journal is not None:
+                usage = info.get("usage", {})
+                journal.append(
+                    gate_line,
+                    "done" if result else "failed",
+                    prompt_hash=hashes[index],
+                    output=str(output_file),
+                    latency_ms=info.get("latency_ms", 0),
+                    **({"group_latency_ms": info["group_latency_ms"]} if "group_latency_ms" in info else {}),
+                    prompt_tokens=usage.get("prompt_tokens", 0),
+                    completion_tokens=usage.get("completion_tokens", 0),
+                    cached=info["cached"],
+                    model=self.model,
+                )
+                journal.release(gate_line)
+        
+        try:
+            scored = self.score_many(evidences, on_result=write_result)
+        finally:
+            if journal is not None:
+                journal.release_all()
+        
+        for evidence, result in zip(evidences, scored):
             gate_line = evidence['gate_line']
-            logger.info(f"Scoring {gate_line}...")
-            
-            result = self.score_gate_line(evidence)
             
             if result:
-                # Write output
-                output_file = output_dir / f"{evidence_file.stem}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(result.model_dump_json(indent=2))
-                
                 results["scored"] += 1
                 
                 # Check if needs review (high weights on >2 systems)
@@ -211,10 +478,10 @@ Rules:
                     "gate_line": gate_line,
                     "reason": "Scoring failed after retry"
                 })
-            
-            # Rate limiting
-            time.sleep(0.5)
         
+        logger.info(f"LLM requests: {self.engine.format_stats()}")
+        if self.cache is not None:
+            logger.info(self.cache.format_stats())
         return results
 
 
@@ -225,14 +492,31 @@ Rules:
 def main():
     import argparse
     
-    setup_logging()
+    setup_logging(__name__)
     
     parser = argparse.ArgumentParser(description="LLM-assisted star system scoring")
     parser.add_argument("--model", default="gpt-4o-mini", help="OpenAI model to use")
     parser.add_argument("--temperature", type=float, default=0.0, help="Temperature (0.0-1.0)")
-    parser.add_argument("--batch-size", type=int, default=32, help="Number of lines to score per run")
+    parser.add_argument("--batch-size", type=int, default=32,
+                        help="Lines per checkpointed chunk (all selected lines are scored)")
     parser.add_argument("--start-gate", type=int, default=1, help="Starting gate number")
     parser.add_argument("--end-gate", type=int, default=64, help="Ending gate number")
+    parser.add_argument("--gates", type=parse_gate_spec, default=None,
+                        help="Explicit gates to score, e.g. 1,5,10-12 (overrides --start-gate/--end-gate)")
+    parser.add_argument("--base-url", default=None,
+                        help=f"OpenAI-compatible API base URL (default: $OPENAI_BASE_URL or {DEFAULT_BASE_URL})")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--rpm", type=float, default=500, help="Requests per minute limit (0 = unlimited)")
+    parser.add_argument("--tpm", type=float, default=200_000, help="Tokens per minute limit (0 = unlimited)")
+    parser.add_argument("--max-retries", type=int, default=5, help="Retries per request on 429/5xx")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--no-cache", action="store_true", help="Don't read or write the response cache")
+    cache_group.add_argument("--refresh", action="store_true",
+                             help="Ignore cached responses but store fresh ones")
+    parser.add_argument("--group-size", type=int, default=1,
+                        help="Gate.lines of one gate packed into each request (6 = one request per gate)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore the scoring journal and re-score every selected line")
     
     args = parser.parse_args()
     
@@ -245,8 +529,9 @@ def main():
         return 1
     
     # Collect evidence files
+    gates = args.gates or range(args.start_gate, args.end_gate + 1)
     evidence_files = []
-    for gate in range(args.start_gate, args.end_gate + 1):
+    for gate in gates:
         for line in range(1, 7):
             evidence_file = evidence_dir / f"{gate:02d}-{line}.json"
             if evidence_file.exists():
@@ -256,15 +541,39 @@ def main():
         logger.error("No evidence files found")
         return 1
     
-    # Limit to batch size
-    evidence_files = evidence_files[:args.batch_size]
+    scorer = LLMScorer(
+        model=args.model,
+        temperature=args.temperature,
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        max_retries=args.max_retries,
+        cache=None if args.no_cache else ResponseCache(),
+        refresh=args.refresh,
+        group_size=args.group_size,
+    )
+    
+    journal = None if args.no_resume else ScoringJournal(output_dir / "_journal.ndjson")
+    pending = scorer.pending_files(evidence_files, journal)
+    already_done = len(evidence_files) - len(pending)
+    if already_done:
+        logger.info(f"Resuming: {already_done} gate.lines already scored per journal")
     
-    logger.info(f"Scoring {len(evidence_files)} gate.lines with {args.model}")
+    logger.info(f"Scoring {len(pending)} gate.lines with {args.model}")
     
-    scorer = LLMScorer(model=args.model, temperature=args.temperature)
-    results = scorer.score_batch(evidence_files, output_dir)
+    results = {"scored": 0, "failed": 0, "skipped": 0, "needs_review": []}
+    batch_size = max(1, args.batch_size)
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        logger.info(f"Batch {start // batch_size + 1}: {len(chunk)} gate.lines")
+        chunk_results = scorer.score_batch(chunk, output_dir, journal)
+        for key in ("scored", "failed", "skipped"):
+            results[key] += chunk_results[key]
+        results["needs_review"].extend(chunk_results["needs_review"])
     
-    logger.info(f"Scored: {results['scored']}, Failed: {results['failed']}")
+    logger.info(f"Scored: {results['scored']}, Failed: {results['failed']}, "
+                f"Skipped (done/claimed elsewhere): {results['skipped'] + already_done}")
     
     if results['needs_review']:
         logger.warning(f"{len(results['needs_review'])} items need review")
@@ -2,7 +2,7 @@
 """
 Post-calibration consistency checker for LLM star system scores.
 
-Checks:
+Checks (thresholds from s3-data/pipeline_rules/scoring_invariants.v1.json):
 - Are weights sparse (≤2 systems >0.4)?
 - Do "core" and "shadow" both appear for the same system with high weights?
 - Does the "why" actually reference evidence phrases?
@@ -16,26 +16,30 @@ from pathlib import Path
 from typing import Dict, List
 
 from config import RESEARCH_OUTPUTS_DIR
+from scoring_rules import load_scoring_rules
 from utils import setup_logging
 
 logger = logging.getLogger(__name__)
 
 
 def check_sparsity(systems: List[Dict]) -> Dict:
-    """Check if weights are appropriately sparse."""
-    high_weight_systems = [s for s in systems if s['weight'] > 0.4]
+    """Check if weights are appropriately sparse (thresholds from the scoring rules file)."""
+    rules = load_scoring_rules()
+    high_weight_systems = [s for s in systems if s['weight'] > rules.high_weight]
+    too_many = len(high_weight_systems) > rules.max_high_weight
     
     return {
-        "pass": len(high_weight_systems) <= 2,
+        "pass": not too_many,
         "high_weight_count": len(high_weight_systems),
         "high_weight_systems": [s['id'] for s in high_weight_systems],
-        "issue": f"Too many high weights ({len(high_weight_systems)})" if len(high_weight_systems) > 2 else None
+        "issue": f"Too many high weights ({len(high_weight_systems)})" if too_many else None
     }
 
 
 def check_core_shadow_conflict(systems: List[Dict]) -> Dict:
     """Check if same system has both core and shadow with high weights."""
     conflicts = []
+    min_weight = load_scoring_rules().conflict_min_weight
     
     # Group by system ID
     by_system = {}
@@ -45,8 +49,8 @@ def check_core_shadow_conflict(systems: List[Dict]) -> Dict:
         by_system[s['id']].append(s)
     
     for system_id, scores in by_system.items():
-        core_scores = [s for s in scores if s['alignment'] == 'core' and s['weight'] > 0.3]
-        shadow_scores = [s for s in scores if s['alignment'] == 'shadow' and s['weight'] > 0.3]
+        core_scores = [s for s in scores if s['alignment'] == 'core' and s['weight'] > min_weight]
+        shadow_scores = [s for s in scores if s['alignment'] == 'shadow' and s['weight'] > min_weight]
         
         if core_scores and shadow_scores:
             conflicts.append({
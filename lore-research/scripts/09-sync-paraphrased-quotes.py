@@ -7,14 +7,18 @@ This replaces the long verbatim quotes with clean, legally-safe paraphrased vers
 for use in the connecting dots / star system mapping work.
 
 The paraphrased quotes are <25 words and safe to use.
+
+Use --jobs N to sync gates across N worker processes.
 """
 
+import argparse
 import json
 from pathlib import Path
 from typing import Dict
 
 from config import JSON_INDENT, JSON_ENSURE_ASCII
-from utils import setup_logging
+from utils import setup_logging, parse_gate_spec, map_gates, parse_jobs
+from gate_corpus import get_corpus
 
 logger = setup_logging(__name__)
 
@@ -24,15 +28,14 @@ GATE_LINE_API_DIR = Path("lore-research/research-outputs/gate-line-API-call")
 
 
 def load_s3_gate(gate_num: int) -> Dict:
-    """Load a gate file from s3-data/gates/"""
-    gate_file = S3_GATES_DIR / f"{gate_num:02d}.json"
+    """Load a gate file from s3-data/gates/ (memoized via GateCorpus)"""
+    gate_data = get_corpus().gate(gate_num)
     
-    if not gate_file.exists():
-        logger.warning(f"S3 gate file not found: {gate_file}")
+    if gate_data is None:
+        logger.warning(f"S3 gate file not found: {S3_GATES_DIR / f'{gate_num:02d}.json'}")
         return {}
     
-    with open(gate_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return gate_data
 
 
 def sync_gate_quotes(gate_num: int) -> bool:
@@ -99,6 +102,13 @@ def sync_gate_quotes(gate_num: int) -> bool:
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Sync paraphrased quotes into gate-line-API-call files")
+    parser.add_argument("--gates", type=parse_gate_spec, default=None,
+                        help="Gates to sync, e.g. 1,5,10-12 (default: all 64)")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes (default: 1, 0 = one per CPU)")
+    args = parser.parse_args()
+    
     logger.info("=" * 60)
     logger.info("Syncing paraphrased quotes from s3-data/gates to gate-line-API-call")
     logger.info("=" * 60)
@@ -112,12 +122,12 @@ def main():
         logger.error(f"Gate-line API directory not found: {GATE_LINE_API_DIR}")
         return 1
     
-    # Process all 64 gates
+    # Process all 64 gates (or the requested subset)
     success_count = 0
     fail_count = 0
     
-    for gate_num in range(1, 65):
-        if sync_gate_quotes(gate_num):
+    for synced in map_gates(sync_gate_quotes, args.gates or range(1, 65), args.jobs):
+        if synced:
             success_count += 1
         else:
             fail_count += 1
@@ -127,6 +137,8 @@ def main():
     logger.info("Summary:")
     logger.info(f"  Successfully synced: {success_count} gates")
     logger.info(f"  Failed: {fail_count} gates")
+    if args.jobs <= 1:
+        logger.info(f"  {get_corpus().format_stats()}")
     logger.info("=" * 60)
     
     return 0 if fail_count == 0 else 1
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """
 Generate all 64 gate-line-API-call files with paraphrased quotes from s3-data/gates/*.json
+
+Use --jobs N to generate gates across N worker processes.
 """
 
+import argparse
 import json
 from pathlib import Path
 
+from utils import parse_gate_spec, map_gates, parse_jobs
+from gate_corpus import get_corpus
+
 # Paths
 S3_GATES_DIR = Path("s3-data/gates")
 OUTPUT_DIR = Path("lore-research/research-outputs/gate-line-API-call")
@@ -13,15 +19,12 @@ OUTPUT_DIR = Path("lore-research/research-outputs/gate-line-API-call")
 def generate_gate_line_file(gate_num: int):
     """Generate a gate-line-X.json file with paraphrased quotes from s3-data"""
     
-    # Read source gate file
-    gate_file = S3_GATES_DIR / f"{gate_num:02d}.json"
-    if not gate_file.exists():
-        print(f"⚠️  Source file not found: {gate_file}")
+    # Read source gate file (memoized via GateCorpus)
+    gate_data = get_corpus().gate(gate_num)
+    if gate_data is None:
+        print(f"⚠️  Source file not found: {S3_GATES_DIR / f'{gate_num:02d}.json'}")
         return False
     
-    with open(gate_file, 'r', encoding='utf-8') as f:
-        gate_data = json.load(f)
-    
     # Build output structure
     output = {
         "gate": gate_num,
@@ -72,6 +75,13 @@ def generate_gate_line_file(gate_num: int):
     return True
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate gate-line-API-call files from s3-data/gates")
+    parser.add_argument("--gates", type=parse_gate_spec, default=None,
+                        help="Gates to generate, e.g. 1,5,10-12 (default: all 64)")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes (default: 1, 0 = one per CPU)")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("GENERATING GATE-LINE-API-CALL FILES")
     print("=" * 60)
@@ -81,8 +91,8 @@ def main():
     success_count = 0
     fail_count = 0
     
-    for gate_num in range(1, 65):
-        if generate_gate_line_file(gate_num):
+    for generated in map_gates(generate_gate_line_file, args.gates or range(1, 65), args.jobs):
+        if generated:
             success_count += 1
         else:
             fail_count += 1
@@ -91,6 +101,8 @@ def main():
     print(f"✅ Successfully generated: {success_count} files")
     if fail_count > 0:
         print(f"⚠️  Failed: {fail_count} files")
+    if args.jobs <= 1:
+        print(get_corpus().format_stats())
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -17,18 +17,16 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+from scoring_rules import load_scoring_rules
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 GATE_DIR = SCRIPT_DIR.parent / "research-outputs" / "star-mapping-by-gate"
 OUTPUT_FILE = SCRIPT_DIR.parent / "research-outputs" / "WEIGHT_CALIBRATION_AUDIT.md"
 
-# Weight standards from v4.2 baselines
-WEIGHT_STANDARDS = {
-    "core": {"min": 0.7, "max": 1.0, "label": "Core Match"},
-    "shadow": {"min": 0.4, "max": 0.6, "label": "Shadow Expression"},
-    "weak": {"min": 0.1, "max": 0.3, "label": "Weak Flavor"},
-    "none": {"min": 0.0, "max": 0.05, "label": "Non-Match"},
-}
+# Weight standards from v4.2 baselines (s3-data/pipeline_rules/scoring_invariants.v1.json)
+SCORING_RULES = load_scoring_rules()
+WEIGHT_STANDARDS = SCORING_RULES.weight_standards
 
 SYSTEMS = [
     "andromeda",
@@ -60,29 +58,7 @@ def analyze_weight(weight: float, alignment_type: str) -> Tuple[str, str]:
     - status: "ok", "under", "over", "wrong_range"
     - issue_description: human-readable problem
     """
-    if alignment_type == "core":
-        if weight >= 0.7:
-            return "ok", ""
-        elif weight >= 0.4:
-            return "under", f"Core behavior but weight={weight:.2f} (should be 0.7-1.0)"
-        else:
-            return "under", f"Core behavior but weight={weight:.2f} (severely under-weighted)"
-    
-    elif alignment_type == "shadow" or alignment_type == "secondary":
-        if 0.4 <= weight <= 0.6:
-            return "ok", ""
-        elif weight < 0.4:
-            return "under", f"Shadow behavior but weight={weight:.2f} (should be 0.4-0.6)"
-        else:
-            return "over", f"Shadow behavior but weight={weight:.2f} (should be 0.4-0.6)"
-    
-    elif alignment_type == "none":
-        if weight <= 0.05:
-            return "ok", ""
-        else:
-            return "over", f"Non-match but weight={weight:.2f} (should be ~0)"
-    
-    return "unknown", f"Unknown alignment_type: {alignment_type}"
+    return SCORING_RULES.weight_status(weight, alignment_type)
 
 
 def audit_all_gates() -> Dict[str, List[Dict]]:
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: gate heading detection in 02-split-gates.py.
+
+Compares the single-scan detector (one compiled bytes alternation run with
+finditer over a SourceText) against the previous per-line implementation
+(split + three re.match calls per line over a str) on the real normalized.txt and on a synthetic
+corpus N times its size, after checking both return the same headings.
+
+Usage:
+    python lore-research/scripts/bench_gate_headings.py [--scale 100] [--repeat 5]
+
+Run 01-normalize-line-companion.py first to benchmark on the real text;
+otherwise a synthetic stand-in of similar size is used.
+"""
+
+import argparse
+import importlib.util
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import GATE_HEADING_PATTERNS, LINE_COMPANION_NORMALIZED
+from source_text import SourceText
+
+_spec = importlib.util.spec_from_file_location(
+    "split_gates", Path(__file__).parent / "02-split-gates.py"
+)
+split_gates = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(split_gates)
+
+logger = logging.getLogger("bench_gate_headings")
+
+
+def legacy_detect_gate_headings(text):
+    """The previous implementation (per-line re.match over every pattern)."""
+    headings = []
+    lines = text.split("\n")
+    current_pos = 0
+    for line_num, line in enumerate(lines, 1):
+        for pattern in GATE_HEADING_PATTERNS:
+            match = re.match(pattern, line, re.IGNORECASE)
+            if match:
+                headings.append((int(match.group(1)), current_pos, line_num, line.strip()))
+                break
+        current_pos += len(line) + 1
+    return headings
+
+
+def synthetic_corpus(target_chars: int) -> str:
+    """Gate/line blocks with the heading density of the Line Companion."""
+    block = []
+    for gate in range(1, 65):
+        block.append(f"Gate {gate} - The Gate of Something")
+        for line in range(1, 7):
+            block.append(f"Line {line} Title of the line")
+            block.append("Body text of the line, which talks about the mechanics of the gate and")
+            block.append("continues over several lines before the next heading appears.")
+            block.append("")
+    text = "\n".join(block)
+    return text * max(1, target_chars // len(text))
+
+
+def best_time(func, text, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def detect(data: bytes):
+    """Single-scan detector on a fresh SourceText (newline index not yet built)."""
+    return split_gates.detect_gate_headings(SourceText(Path("<bench>"), data), logger)
+
+
+def bench(label: str, text: str, repeat: int) -> None:
+    data = text.encode("utf-8")
+    new = detect(data)
+    old = legacy_detect_gate_headings(text)
+    if [h[:4] for h in new] != old:
+        raise SystemExit(f"{label}: detectors disagree ({len(new)} vs {len(old)} headings)")
+
+    t_old = best_time(legacy_detect_gate_headings, text, repeat)
+    t_new = best_time(detect, data, repeat)
+    size_mb = len(data) / 1e6
+    print(
+        f"{label:<28} {size_mb:8.1f} MB {len(new):7,} headings  "
+        f"per-line {t_old * 1000:9.1f} ms  single-scan {t_new * 1000:9.1f} ms  "
+        f"x{t_old / t_new:5.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gate heading detection")
+    parser.add_argument("--scale", type=int, default=100, help="Synthetic corpus size (x real text)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (best is reported)")
+    args = parser.parse_args()
+
+    if LINE_COMPANION_NORMALIZED.exists():
+        real = LINE_COMPANION_NORMALIZED.read_text(encoding="utf-8")
+        bench("normalized.txt", real, args.repeat)
+    else:
+        print(f"{LINE_COMPANION_NORMALIZED} not found; using a synthetic stand-in")
+        real = synthetic_corpus(1_500_000)
+        bench("synthetic (1x)", real, args.repeat)
+
+    bench(f"{args.scale}x corpus", real * args.scale, max(1, args.repeat // 2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Legge hexagram/line parsing (legge_parser.py).
+
+Compares the one-pass tokenizer in strict and lenient mode against the
+previous parsers it replaced: 04's header finditer + per-hexagram line
+finditer over a decoded str, and 04b's line-by-line lenient loop. Strict
+output is first checked against the previous 04 parser.
+
+Usage:
+    python lore-research/scripts/bench_legge_parser.py [--scale 50] [--repeat 5]
+
+Run 02-normalize-legge.py first to benchmark on the real text; otherwise a
+synthetic stand-in is used.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import LEGGE_NORMALIZED
+from legge_parser import LENIENT, STRICT, parse_legge
+from source_text import SourceText
+
+LEGACY_HEX_RE = re.compile(r'^([IVXLCDM]+)[.,]\s+(The|Ti-ie)\s+(.+?)\s+Hexagram\.?', re.MULTILINE)
+LEGACY_LINE_RE = re.compile(
+    r'^(\d)\.\s+(In the |The )?(first|second|third|fourth|fifth|sixth|topmost)\s+line',
+    re.MULTILINE | re.IGNORECASE
+)
+LEGACY_ROMAN = {
+    "I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7, "VIII": 8, "IX": 9, "X": 10,
+}
+for _tens, _base in (("X", 10), ("XX", 20), ("XXX", 30), ("XL", 40), ("L", 50), ("LX", 60)):
+    for _unit, _value in [("", 0)] + list(LEGACY_ROMAN.items())[:9]:
+        LEGACY_ROMAN.setdefault(_tens + _unit, _base + _value)
+
+
+def legacy_strict(text):
+    """The previous 04 parser (two regex passes over a decoded str)."""
+    hexagrams = {}
+    matches = list(LEGACY_HEX_RE.finditer(text))
+    for i, match in enumerate(matches):
+        hex_num = LEGACY_ROMAN.get(match.group(1))
+        if not hex_num or hex_num > 64:
+            continue
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        raw = text[match.end():end].strip()
+        line_matches = list(LEGACY_LINE_RE.finditer(raw))
+        lines = {}
+        for j, line_match in enumerate(line_matches):
+            num = int(line_match.group(1))
+            if num > 6:
+                continue
+            line_end = line_matches[j + 1].start() if j + 1 < len(line_matches) else len(raw)
+            lines[num] = raw[line_match.start():line_end].strip()
+        hexagrams[hex_num] = (match.group(3).strip(), raw, lines)
+    return hexagrams
+
+
+def legacy_lenient(text):
+    """The previous 04b loop (three regexes per line)."""
+    header_re = re.compile(r"^\s*(?:[IVXLCDM]{1,6}|\d{1,2})\s*\.\s*(.+)$", re.IGNORECASE)
+    line_re = re.compile(r"^\s*([1-6])\.\s*(.+)$")
+    acc, current = {}, None
+    for ln in text.splitlines():
+        m_line = line_re.match(ln)
+        if m_line and current:
+            acc[current]["lines"].setdefault(m_line.group(1), []).append(m_line.group(2).strip())
+            continue
+        hex_match = re.search(r"Hexagram\s+(\d{1,2})", ln, re.IGNORECASE)
+        if hex_match:
+            current = int(hex_match.group(1))
+            acc.setdefault(current, {"title": None, "raw_text": [], "lines": {}})
+            continue
+        if header_re.match(ln) and current and not acc[current]["title"]:
+            acc[current]["title"] = ln
+        if current:
+            acc[current]["raw_text"].append(ln)
+    return acc
+
+
+def decoded(source, mode):
+    return {
+        h.hexagram: (h.title, source.decode(*h.span), {n: source.decode(*s) for n, s in h.lines.items()})
+        for h in parse_legge(source, mode)
+    }
+
+
+def synthetic_text() -> str:
+    """Legge-shaped text: 64 distinct headers, judgments, six line paragraphs and notes."""
+    numerals = {v: k for k, v in LEGACY_ROMAN.items()}
+    ordinals = ["first", "second", "third", "fourth", "fifth", "sixth"]
+    parts = []
+    for n in range(1, 65):
+        parts.append(f"{numerals[n]}. The Name {n} Hexagram.\n\nExplanation of the entire figure by king Wan.\n")
+        for i, ordinal in enumerate(ordinals, 1):
+            parts.append(f"{i}. In the {ordinal} line, divided, we see its subject going forward.\n")
+            parts.append("A commentary paragraph that runs on for a while before the next line.\n\n" * 20)
+    return "".join(parts)
+
+
+def best_times(funcs: dict, repeat: int) -> dict:
+    """Best time per function; rounds interleave the functions so load spikes hit all of them."""
+    best = {name: float("inf") for name in funcs}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            start = time.perf_counter()
+            func()
+            best[name] = min(best[name], time.perf_counter() - start)
+    return best
+
+
+def bench(label: str, data: bytes, repeat: int) -> None:
+    text = data.decode("utf-8")
+    source = SourceText(Path("<bench>"), data)
+    if decoded(source, STRICT) != legacy_strict(text):
+        raise SystemExit(f"{label}: strict tokenizer disagrees with the previous 04 parser")
+
+    timings = best_times({
+        "04 two-pass": lambda: legacy_strict(data.decode("utf-8")),
+        "04b per-line": lambda: legacy_lenient(data.decode("utf-8")),
+        "strict": lambda: decoded(SourceText(Path("<bench>"), data), STRICT),
+        "lenient": lambda: decoded(SourceText(Path("<bench>"), data), LENIENT),
+    }, repeat)
+    cells = "  ".join(f"{name} {seconds * 1000:8.1f} ms" for name, seconds in timings.items())
+    print(f"{label:<22} {len(data) / 1e6:7.1f} MB  {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Legge tokenizer/parser")
+    parser.add_argument("--scale", type=int, default=50, help="Large corpus size (x base text)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (best is reported)")
+    args = parser.parse_args()
+
+    if LEGGE_NORMALIZED.exists():
+        data = LEGGE_NORMALIZED.read_bytes()
+        label = "legge-normalized.txt"
+    else:
+        print(f"{LEGGE_NORMALIZED} not found; using a synthetic stand-in")
+        data = synthetic_text().encode("utf-8")
+        label = "synthetic (1x)"
+
+    bench(label, data, args.repeat)
+    bench(f"{args.scale}x corpus", data * args.scale, max(1, args.repeat // 2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
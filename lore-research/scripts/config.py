@@ -21,6 +21,7 @@ LINE_COMPANION_SOURCES = [
     S3_DATA_ROOT / "Line Companion_scandata.xml",
     S3_DATA_ROOT / "Line Companion_abbyy.gz",
 ]
+LINE_COMPANION_SCANDATA = S3_DATA_ROOT / "Line Companion_scandata.xml"
 
 # I Ching fallback sources
 I_CHING_SOURCES = [
@@ -46,11 +47,15 @@ GATES_CANDIDATE_DIR = GATES_DIR / "_candidate"
 STAR_SYSTEM_BASELINES_DIR = LORE_RESEARCH_ROOT / "research-outputs" / "star-systems" / "v4.2"
 ASSOCIATIONS_FILE = S3_DATA_ROOT / "associations" / "gate-line-to-star.v2.json"
 PIPELINE_RULES_FILE = S3_DATA_ROOT / "pipeline_rules" / "derivation.v1.json"
+SCORING_RULES_FILE = S3_DATA_ROOT / "pipeline_rules" / "scoring_invariants.v1.json"  # Exclusions, weight standards
 SOURCES_REGISTRY_FILE = S3_DATA_ROOT / "sources" / "registry.json"
 
 # Line Companion processing outputs
 LINE_COMPANION_DIR = RESEARCH_OUTPUTS_DIR / "line-companion"
 LINE_COMPANION_NORMALIZED = LINE_COMPANION_DIR / "normalized.txt"
+LINE_COMPANION_LEAF_TABLE = LINE_COMPANION_DIR / "scandata.leaves.bin"  # Array-backed scandata pages (02a)
+LINE_COMPANION_PAGE_OFFSETS = LINE_COMPANION_DIR / "normalized.pages.json"  # Leaf offsets (structured sources)
+LINE_COMPANION_OFFSETS = LINE_COMPANION_DIR / "normalized.offsets.json"  # Gate/line/segment byte spans
 LINE_COMPANION_GATES = LINE_COMPANION_DIR / "gates.json"
 LINE_COMPANION_GATES_DIR = LINE_COMPANION_DIR / "gates"  # Individual gate files
 LINE_COMPANION_GATE_LINES = LINE_COMPANION_DIR / "gate-lines.json"
@@ -68,6 +73,13 @@ STAR_MAPS_LLM_DIR = RESEARCH_OUTPUTS_DIR / "star-maps-llm"
 STAR_MAPS_CALIBRATED_DIR = RESEARCH_OUTPUTS_DIR / "star-maps-calibrated"
 STAR_MAPS_REPORTS_DIR = RESEARCH_OUTPUTS_DIR / "star-maps-reports"
 
+# Content-addressed LLM response cache (08b), bounded by total size on disk
+LLM_CACHE_DIR = RESEARCH_OUTPUTS_DIR / ".llm-cache"
+LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Incremental pipeline runner state (content fingerprints of stage inputs/code)
+PIPELINE_STATE_FILE = RESEARCH_OUTPUTS_DIR / ".pipeline-state.json"
+
 # Pipeline thresholds
 MIN_GATES_REQUIRED = 60  # Fail if fewer than 60 gates detected
 EXPECTED_GATES = 64
@@ -0,0 +1,185 @@
+"""
+Shared, memoized loaders for per-gate and per-hexagram JSON sources.
+
+Several stages read the same s3-data/gates/NN.json and s3-data/hexagrams/NN.json
+files (and the claude/ full-text passes) once per line, each with its own path
+fallbacks. GateCorpus resolves those paths in one place and parses each file at
+most once per process, counting cache hits and misses so callers can report how
+much re-parsing was avoided.
+
+Returned dicts are shared between callers and must be treated as read-only;
+copy before mutating.
+
+Usage:
+    from gate_corpus import get_corpus
+
+    corpus = get_corpus()
+    corpus.load_all(["gate", "hexagram"])
+    gate_data = corpus.gate(1)
+    logger.info(corpus.format_stats())
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import PROJECT_ROOT, S3_DATA_ROOT, LINE_COMPANION_GATES_DIR, EXPECTED_GATES
+
+
+# Candidate path templates per source kind, in priority order.
+# Templates are formatted with gate=<int>.
+SOURCE_PATHS: Dict[str, List[str]] = {
+    # Curated S³ gate files (paraphrased quotes + interpretation)
+    "gate": [
+        str(S3_DATA_ROOT / "gates" / "{gate:02d}.json"),
+    ],
+    # Curated S³ hexagram files (Legge translation + normalized meaning)
+    "hexagram": [
+        str(S3_DATA_ROOT / "hexagrams" / "{gate:02d}.json"),
+    ],
+    # Line Companion full text (manual full pass, then pipeline outputs)
+    "line_companion": [
+        str(PROJECT_ROOT / "claude" / "Full Pass" / "gate-{gate}-full.json"),
+        str(S3_DATA_ROOT / "gates" / "{gate:02d}.json"),
+        str(LINE_COMPANION_GATES_DIR / "gate-{gate:02d}.json"),
+    ],
+    # Legge I Ching full text (manual full pass, then S³ hexagram file)
+    "legge": [
+        str(PROJECT_ROOT / "claude" / "I-Ching-Full-Pass" / "hexagram-{gate:02d}.json"),
+        str(S3_DATA_ROOT / "hexagrams" / "{gate:02d}.json"),
+    ],
+}
+
+
+class GateCorpus:
+    """
+    Memoized, path-resolved JSON loader keyed by (kind, gate).
+
+    Parsed files are cached by resolved path, so two kinds that fall back to
+    the same file share one parse.
+    """
+
+    def __init__(self, source_paths: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize corpus.
+
+        Args:
+            source_paths: Override of SOURCE_PATHS (kind -> path templates)
+        """
+        self.source_paths = source_paths or SOURCE_PATHS
+        self._by_path: Dict[Path, Any] = {}
+        self._resolved: Dict[tuple, Optional[Path]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, kind: str, gate: int) -> Optional[Path]:
+        """
+        Return the first existing path for a source kind and gate.
+
+        Raises:
+            KeyError: If kind is not a known source kind
+        """
+        key = (kind, gate)
+        if key not in self._resolved:
+            candidates = (Path(t.format(gate=gate)) for t in self.source_paths[kind])
+            self._resolved[key] = next((p for p in candidates if p.exists()), None)
+        return self._resolved[key]
+
+    def load_json(self, path: Path) -> Any:
+        """
+        Parse a JSON file once and serve later calls from memory.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        path = Path(path)
+        if path in self._by_path:
+            self.hits += 1
+            return self._by_path[path]
+
+        self.misses += 1
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._by_path[path] = data
+        return data
+
+    def load(self, kind: str, gate: int) -> Optional[Dict]:
+        """Load a source for a gate, or None if no candidate path exists."""
+        path = self.resolve(kind, gate)
+        if path is None:
+            return None
+        return self.load_json(path)
+
+    def require(self, kind: str, gate: int) -> Dict:
+        """Load a source for a gate, raising if it is missing."""
+        data = self.load(kind, gate)
+        if data is None:
+            raise FileNotFoundError(f"No {kind} source found for gate {gate}")
+        return data
+
+    def gate(self, gate: int) -> Optional[Dict]:
+        return self.load("gate", gate)
+
+    def hexagram(self, gate: int) -> Optional[Dict]:
+        return self.load("hexagram", gate)
+
+    def line_companion(self, gate: int) -> Optional[Dict]:
+        return self.load("line_companion", gate)
+
+    def legge(self, gate: int) -> Optional[Dict]:
+        return self.load("legge", gate)
+
+    def load_all(
+        self,
+        kinds: Iterable[str] = ("gate", "hexagram"),
+        gates: Optional[Iterable[int]] = None,
+    ) -> Dict[str, Dict[int, Optional[Dict]]]:
+        """
+        Bulk-load sources for many gates up front.
+
+        Args:
+            kinds: Source kinds to load
+            gates: Gate numbers (default: 1-64)
+
+        Returns:
+            Dict of kind -> {gate: data or None}
+        """
+        gates = list(gates) if gates is not None else list(range(1, EXPECTED_GATES + 1))
+        return {kind: {gate: self.load(kind, gate) for gate in gates} for kind in kinds}
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters: hits, misses (= files parsed) and hit rate."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files_parsed": len(self._by_path),
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def format_stats(self) -> str:
+        stats = self.stats()
+        return (
+            f"GateCorpus: {stats['files_parsed']} files parsed, "
+            f"{stats['hits']} cache hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.0%})"
+        )
+
+    def clear(self) -> None:
+        """Drop all cached data and counters."""
+        self._by_path.clear()
+        self._resolved.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_corpus: Optional[GateCorpus] = None
+
+
+def get_corpus() -> GateCorpus:
+    """Return the process-wide shared GateCorpus."""
+    global _corpus
+    if _corpus is None:
+        _corpus = GateCorpus()
+    return _corpus
@@ -0,0 +1,317 @@
+"""
+Array-backed scandata leaf table and offset -> leaf interval index.
+
+scandata.json keys every page by its leaf number as a string. LeafTable
+holds the same pages as parallel ``array('i')`` columns (leafNum, original
+size, crop box, page type, flags) indexed by leaf position, and saves them
+to a binary sidecar next to scandata.json:
+
+    LEAFTABLE 1\\n
+    {"count": 407, "byteorder": "little", "columns": [...], "bookData": {...},
+     "page_types": ["Normal", "Title"], ...}\\n
+    <count int32 values of each column, in "columns" order>
+
+LeafIntervals maps text offsets to leaves. It is built from the page breaks
+01-normalize-line-companion.py records in normalized.pages.json (leaf and
+printed page at a character offset) and answers "which leaves does
+[start, end) span" with a bisect instead of a byte-proportional guess.
+
+Usage:
+    table = load_leaf_table()
+    page = table.page(42)           # same dict as scandata["pages"]["42"]
+
+    intervals = LeafIntervals.from_page_offsets(read_json_file(LINE_COMPANION_PAGE_OFFSETS))
+    hint = intervals.page_hint(gate_start, gate_end, dpi=table.dpi)
+"""
+
+import json
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+MAGIC = b"LEAFTABLE 1\n"
+
+COLUMNS = (
+    "leaf_num",
+    "orig_width",
+    "orig_height",
+    "crop_x",
+    "crop_y",
+    "crop_w",
+    "crop_h",
+    "page_type",
+    "flags",
+)
+
+# Stored for values that are None in scandata.json
+MISSING = -(2 ** 31)
+
+# flags column bits
+HAS_CROP_BOX = 1
+HAS_BOOK_START = 2
+BOOK_START = 4
+
+
+def _encode(value: Optional[int]) -> int:
+    return MISSING if value is None else value
+
+
+def _decode(value: int) -> Optional[int]:
+    return None if value == MISSING else value
+
+
+class LeafTable:
+    """Scandata pages as parallel int columns, looked up by leaf number."""
+
+    def __init__(self, book_data: Optional[Dict[str, Any]] = None, meta: Optional[Dict[str, Any]] = None):
+        """
+        Initialize an empty table.
+
+        Args:
+            book_data: scandata bookData (dpi, leafCount, bookId)
+            meta: scandata _meta (source, total_pages)
+        """
+        self.book_data: Dict[str, Any] = dict(book_data or {})
+        self.meta: Dict[str, Any] = dict(meta or {})
+        self.page_types: List[Optional[str]] = []
+        self.columns: Dict[str, array] = {name: array("i") for name in COLUMNS}
+
+    @classmethod
+    def from_scandata(cls, scandata: Dict[str, Any]) -> "LeafTable":
+        """Build from a parsed scandata.json (or parse_scandata_xml result)."""
+        table = cls(scandata.get("bookData"), scandata.get("_meta"))
+        pages = sorted(scandata.get("pages", {}).values(), key=lambda page: page["leafNum"])
+        for page in pages:
+            table.append(page)
+        return table
+
+    def append(self, page: Dict[str, Any]) -> None:
+        """Add one page dict; leaves must be appended in increasing order."""
+        leaf_nums = self.columns["leaf_num"]
+        if leaf_nums and page["leafNum"] <= leaf_nums[-1]:
+            raise ValueError(f"leaf {page['leafNum']} appended after leaf {leaf_nums[-1]}")
+
+        page_type = page.get("pageType")
+        if page_type not in self.page_types:
+            self.page_types.append(page_type)
+        crop = page.get("cropBox")
+        flags = 0
+        if crop is not None:
+            flags |= HAS_CROP_BOX
+        if "bookStart" in page:
+            flags |= HAS_BOOK_START | (BOOK_START if page["bookStart"] else 0)
+        crop = crop or {}
+
+        row = (
+            page["leafNum"],
+            _encode(page.get("origWidth")),
+            _encode(page.get("origHeight")),
+            _encode(crop.get("x")),
+            _encode(crop.get("y")),
+            _encode(crop.get("w")),
+            _encode(crop.get("h")),
+            self.page_types.index(page_type),
+            flags,
+        )
+        for name, value in zip(COLUMNS, row):
+            self.columns[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.columns["leaf_num"])
+
+    @property
+    def dpi(self) -> Optional[int]:
+        return self.book_data.get("dpi")
+
+    @property
+    def leaf_count(self) -> int:
+        """bookData leafCount, or the number of pages if it is missing."""
+        return self.book_data.get("leafCount") or len(self)
+
+    def index(self, leaf_num: int) -> Optional[int]:
+        """Row of ``leaf_num``, or None. Direct when leaves are numbered 0..n-1."""
+        leaf_nums = self.columns["leaf_num"]
+        if 0 <= leaf_num < len(leaf_nums) and leaf_nums[leaf_num] == leaf_num:
+            return leaf_num
+        i = bisect_left(leaf_nums, leaf_num)
+        return i if i < len(leaf_nums) and leaf_nums[i] == leaf_num else None
+
+    def page(self, leaf_num: int) -> Optional[Dict[str, Any]]:
+        """Page metadata in the scandata.json layout, or None if the leaf is unknown."""
+        i = self.index(leaf_num)
+        if i is None:
+            return None
+        col = self.columns
+        page = {
+            "leafNum": col["leaf_num"][i],
+            "pageType": self.page_types[col["page_type"][i]],
+            "origWidth": _decode(col["orig_width"][i]),
+            "origHeight": _decode(col["orig_height"][i]),
+        }
+        flags = col["flags"][i]
+        if flags & HAS_CROP_BOX:
+            page["cropBox"] = {
+                "x": _decode(col["crop_x"][i]),
+                "y": _decode(col["crop_y"][i]),
+                "w": _decode(col["crop_w"][i]),
+                "h": _decode(col["crop_h"][i]),
+            }
+        if flags & HAS_BOOK_START:
+            page["bookStart"] = bool(flags & BOOK_START)
+        return page
+
+    # ------------------------------------------------------------------
+    # Binary sidecar
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the binary sidecar atomically."""
+        header = {
+            "count": len(self),
+            "byteorder": sys.byteorder,
+            "columns": list(COLUMNS),
+            "bookData": self.book_data,
+            "_meta": self.meta,
+            "page_types": self.page_types,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+            for name in COLUMNS:
+                f.write(self.columns[name].tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LeafTable"]:
+        """
+        Read a sidecar written by save().
+
+        Returns:
+            The table, or None if the file does not exist or is from another version
+
+        Raises:
+            ValueError: If the file is truncated
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            header = json.loads(f.readline().decode("utf-8"))
+            if header.get("columns") != list(COLUMNS):
+                return None
+            table = cls(header.get("bookData"), header.get("_meta"))
+            table.page_types = header.get("page_types", [])
+            count = header["count"]
+            for name in COLUMNS:
+                column = table.columns[name]
+                data = f.read(count * column.itemsize)
+                if len(data) != count * column.itemsize:
+                    raise ValueError(f"Truncated leaf table {path.name}: column {name}")
+                column.frombytes(data)
+                if header.get("byteorder") != sys.byteorder:
+                    column.byteswap()
+        return table
+
+
+def load_leaf_table(sidecar_path: Optional[Path] = None, json_path: Optional[Path] = None) -> Optional[LeafTable]:
+    """
+    Line Companion leaf table: the binary sidecar if present and not older
+    than scandata.json, else built from scandata.json. None if neither
+    exists (02a not run).
+    """
+    from config import LINE_COMPANION_DIR, LINE_COMPANION_LEAF_TABLE
+
+    sidecar_path = Path(sidecar_path or LINE_COMPANION_LEAF_TABLE)
+    json_path = Path(json_path or LINE_COMPANION_DIR / "scandata.json")
+    json_mtime = json_path.stat().st_mtime_ns if json_path.exists() else None
+
+    if sidecar_path.exists() and (json_mtime is None or sidecar_path.stat().st_mtime_ns >= json_mtime):
+        table = LeafTable.load(sidecar_path)
+        if table is not None:
+            return table
+    if json_mtime is None:
+        return None
+    with open(json_path, "r", encoding="utf-8") as f:
+        return LeafTable.from_scandata(json.load(f))
+
+
+class LeafIntervals:
+    """Sorted page-break offsets -> leaf, answering span lookups by bisect."""
+
+    def __init__(self, starts: Iterable[int] = (), leaves: Iterable[int] = (),
+                 pages: Optional[Sequence[Optional[str]]] = None):
+        """
+        Initialize index.
+
+        Args:
+            starts: Offset where each leaf's text begins (increasing)
+            leaves: Leaf number starting at each offset
+            pages: Printed page label of each leaf, if known
+        """
+        self.starts = array("q", starts)
+        self.leaves = array("i", leaves)
+        self.pages: List[Optional[str]] = list(pages) if pages is not None else [None] * len(self.starts)
+        if not len(self.starts) == len(self.leaves) == len(self.pages):
+            raise ValueError("starts, leaves and pages must have the same length")
+
+    @classmethod
+    def from_page_offsets(cls, page_offsets: Dict[str, Any], key: str = "char_offset") -> "LeafIntervals":
+        """Build from normalized.pages.json (entries without a leaf are skipped)."""
+        breaks = sorted(
+            ((p[key], p["leaf"], p.get("page")) for p in page_offsets.get("pages", []) if p.get("leaf") is not None),
+            key=lambda entry: entry[0],
+        )
+        return cls(
+            (start for start, _, _ in breaks),
+            (leaf for _, leaf, _ in breaks),
+            [page for _, _, page in breaks],
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def index_at(self, offset: int) -> int:
+        """Interval containing ``offset`` (text before the first break counts as the first leaf)."""
+        return max(bisect_right(self.starts, offset) - 1, 0)
+
+    def leaf_at(self, offset: int) -> int:
+        return self.leaves[self.index_at(offset)]
+
+    def leaf_range(self, start: int, end: int) -> Tuple[int, int]:
+        """(first, last) interval indexes covering [start, end); an empty span covers its start."""
+        first = self.index_at(start)
+        last = max(bisect_left(self.starts, max(end, start + 1)) - 1, 0)
+        return first, max(first, last)
+
+    def page_hint(self, start: int, end: int, dpi: Optional[int] = None) -> Dict[str, Any]:
+        """Page hint dict (the layout gates.json _meta.page_hint uses) for [start, end)."""
+        first, last = self.leaf_range(start, end)
+        hint = {
+            "leaf_start": self.leaves[first],
+            "leaf_end": self.leaves[last],
+            "dpi": dpi,
+            "estimation_method": "leaf_offsets",
+        }
+        if self.pages[first] or self.pages[last]:
+            hint["page_start"] = self.pages[first]
+            hint["page_end"] = self.pages[last]
+        return hint
+
+    def to_byte_offsets(self, source) -> "LeafIntervals":
+        """Same breaks with character offsets converted to byte offsets of ``source`` (a SourceText)."""
+        return LeafIntervals((source.byte_offset(start) for start in self.starts), self.leaves, self.pages)
+
+    def to_json(self) -> List[List[Any]]:
+        return [[start, leaf, page] for start, leaf, page in zip(self.starts, self.leaves, self.pages)]
+
+    @classmethod
+    def from_json(cls, rows: Sequence[Sequence[Any]]) -> "LeafIntervals":
+        return cls((row[0] for row in rows), (row[1] for row in rows), [row[2] for row in rows])
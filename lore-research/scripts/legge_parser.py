@@ -0,0 +1,249 @@
+"""
+One-pass tokenizer and parser for the normalized Legge I Ching text.
+
+04-build-legge-hexagram-index.py (strict) and 04b-build-legge-hx-lenient.py
+(lenient) share this parser. A single bytes regex, run once over the
+memory-mapped legge-normalized.txt (SourceText), emits two kinds of token:
+
+    HEX   hexagram header     "XXIII. The Po Hexagram."
+    LINE  line paragraph      "3. In the third line, divided, ..."
+
+A small state machine folds the token stream into hexagram blocks. Every
+block records UTF-8 byte spans into the file for the whole text after the
+header, the judgment (the text before the first line paragraph) and each
+of lines 1-6. All spans are stripped, so decoding one gives the text the
+scripts store.
+
+Modes:
+    strict   Headers must read "<roman>. The|Ti-ie <title> Hexagram"; lines
+             "<digit>. [In the |The ]<ordinal> line". Same matches as the
+             original two-regex 04 parser.
+    lenient  Headers may have OCR-damaged numerals ("XXI1", "LX I"), any
+             word in place of "The", and must end their line; line
+             paragraphs may have a parenthetical before "line" and take
+             their number from the ordinal ("first" .. "sixth", "topmost").
+
+Usage:
+    with SourceText(LEGGE_NORMALIZED) as source:
+        for hexagram in parse_legge(source, "lenient"):
+            text = source.decode(*hexagram.judgment)
+"""
+
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from offset_index import byte_span, stripped_span
+from source_text import SourceText, compile_bytes
+
+Span = Tuple[int, int]
+
+STRICT = "strict"
+LENIENT = "lenient"
+MODES = (STRICT, LENIENT)
+
+ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6, "topmost": 6}
+
+_ORDINAL_ALT = "|".join(ORDINALS)
+
+# Strict grammar: the patterns the original 04 parser used, as named
+# branches. Both grammars are anchored at line starts by _token_res.
+_STRICT_PATTERN = (
+    r"(?P<hex_num>[IVXLCDM]+)[.,]\s+(?:The|Ti-ie)\s+(?P<hex_title>.+?)\s+Hexagram\.?"
+    r"|(?i:(?P<line_num>\d)\.\s+(?:In the |The )?(?P<line_ord>" + _ORDINAL_ALT + r")\s+line)"
+)
+
+# Lenient grammar: single-line headers with OCR-tolerant numerals, and
+# line paragraphs numbered by their ordinal
+_LENIENT_PATTERN = (
+    r"(?P<hex_num>[IVXLCDMl1|]+(?:[^\S\n][IVXLCDMl1|]+)?|\d{1,2})[.,][^\S\n]*\S+[^\S\n]+"
+    r"(?P<hex_title>[^\n]+?)[^\S\n]+Hexagram\.?[^\S\n]*$"
+    r"|(?i:(?P<line_num>[1-7Il])[.,]?[^\S\n]+(?:In[^\S\n]+the[^\S\n]+|The[^\S\n]+)?"
+    r"(?P<line_ord>" + _ORDINAL_ALT + r")[^\S\n]*(?:\([^)\n]*\)[^\S\n]*)?line)"
+)
+
+
+def _token_res(pattern: str):
+    """
+    (first_line_re, scan_re) for a grammar, as in 02-split-gates: match the
+    first line directly, then scan for "\n" + token so the regex engine
+    skips straight to line starts instead of trying ``^`` at every byte.
+    """
+    return (
+        compile_bytes(f"(?:{pattern})", re.MULTILINE),
+        compile_bytes(f"\\n(?:{pattern})", re.MULTILINE),
+    )
+
+
+TOKEN_RES = {STRICT: _token_res(_STRICT_PATTERN), LENIENT: _token_res(_LENIENT_PATTERN)}
+
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+_CANONICAL_ROMAN_RE = re.compile(r"M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})")
+# OCR confusions for "I" in scanned numerals
+_ROMAN_OCR = str.maketrans({"1": "I", "l": "I", "|": "I", " ": None, "\t": None})
+
+
+def parse_numeral(token: str, lenient: bool = False) -> Optional[int]:
+    """
+    Parse an arabic or canonical roman numeral ("XLIV" -> 44).
+
+    Lenient mode first repairs OCR confusions ("XXI1" -> XXII, "LX I" -> LXI).
+    Returns None for anything that is not a well-formed numeral.
+    """
+    token = token.strip()
+    if token.isdigit():
+        return int(token)
+    if lenient:
+        token = token.translate(_ROMAN_OCR).upper()
+    if not token or not _CANONICAL_ROMAN_RE.fullmatch(token):
+        return None
+    total = 0
+    for i, char in enumerate(token):
+        value = _ROMAN_VALUES[char]
+        if i + 1 < len(token) and _ROMAN_VALUES[token[i + 1]] > value:
+            total -= value
+        else:
+            total += value
+    return total
+
+
+class Token(NamedTuple):
+    kind: str              # "HEX" or "LINE"
+    number: Optional[int]  # hexagram or line number (None if unparseable)
+    text: str              # numeral as written (HEX) or ordinal (LINE)
+    title: str             # hexagram title (HEX only)
+    start: int             # byte offsets of the match
+    end: int
+
+
+class LeggeHexagram(NamedTuple):
+    hexagram: int
+    title: str
+    header: Span            # byte span of the header match
+    span: Span              # stripped text after the header up to the next header
+    judgment: Span          # stripped text before the first line paragraph
+    lines: Dict[int, Span]  # line number (1-6) -> stripped line paragraph
+
+
+# Lower-cased ordinal as matched -> (ordinal, line number)
+_ORDINAL_BYTES = {ordinal.encode("ascii"): (ordinal, number) for ordinal, number in ORDINALS.items()}
+
+
+def _matches(source: SourceText, mode: str) -> Iterator[Tuple[int, "re.Match"]]:
+    """(line start, match) for every token match, first line included."""
+    first_line_re, scan_re = TOKEN_RES[mode]
+    first = first_line_re.match(source.buffer)
+    if first:
+        yield 0, first
+    for match in source.finditer(scan_re):
+        yield match.start() + 1, match
+
+
+def _hex_token(source: SourceText, match: "re.Match", start: int, lenient: bool) -> Token:
+    numeral = match.group("hex_num").decode("ascii")
+    title = source.decode(*match.span("hex_title")).strip()
+    return Token("HEX", parse_numeral(numeral, lenient), numeral, title, start, match.end())
+
+
+def tokenize(source: SourceText, mode: str = STRICT) -> Iterator[Token]:
+    """Yield HEX and LINE tokens from one scan of the mapped text."""
+    lenient = mode == LENIENT
+    for start, match in _matches(source, mode):
+        line_num, line_ord = match.group("line_num", "line_ord")
+        if line_ord is None:
+            yield _hex_token(source, match, start, lenient)
+        else:
+            ordinal, number = _ORDINAL_BYTES[line_ord.lower()]
+            yield Token("LINE", number if lenient else line_num[0] - 48, ordinal, "", start, match.end())
+
+
+_ASCII_SPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+def _stripped(source: SourceText, start: int, end: int) -> Span:
+    """
+    Byte span of the stripped text in [start, end).
+
+    ASCII whitespace (what str.strip removes below 0x80) is skipped on the
+    bytes; only a block whose edge is a non-ASCII character is decoded, in
+    case that character is Unicode whitespace.
+    """
+    buffer = source.buffer
+    while start < end and buffer[start] in _ASCII_SPACE:
+        start += 1
+    while end > start and buffer[end - 1] in _ASCII_SPACE:
+        end -= 1
+    if start < end and (buffer[start] >= 0x80 or buffer[end - 1] >= 0x80):
+        text = source.decode(start, end)
+        return tuple(byte_span(text, stripped_span(text), start))
+    return start, end
+
+
+def parse_legge(source: SourceText, mode: str = STRICT, issues: Optional[List[str]] = None) -> List[LeggeHexagram]:
+    """
+    Fold the token stream into hexagram blocks (in order of first header).
+
+    A header opens a block that runs to the next header (or end of file).
+    Line paragraphs before the first header are ignored; a line paragraph
+    ends at the next token. Line numbers outside 1-6 (e.g. the seventh
+    paragraph of hexagrams 1 and 2) still end the previous line but are
+    not kept. Later headers or lines with the same number replace earlier
+    ones, as in the original parser.
+
+    Args:
+        source: Mapped legge-normalized.txt
+        mode: "strict" or "lenient"
+        issues: Optional list that receives one message per skipped header
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown parse mode {mode!r} (expected one of {', '.join(MODES)})")
+
+    # The scan loop below is tokenize() folded inline: line paragraphs are
+    # kept as (start, number) pairs and only headers become Tokens. Blocks
+    # map hexagram -> (header, block end, line paragraphs); spans are only
+    # computed for the blocks that survive, after the scan.
+    lenient = mode == LENIENT
+    blocks: Dict[int, Tuple[Token, int, List[Tuple[int, int]]]] = {}
+    current: Optional[Token] = None
+    line_starts: List[Tuple[int, int]] = []
+
+    def close(end: int) -> None:
+        if current is None:
+            return
+        if not 1 <= (current.number or 0) <= 64:
+            if issues is not None:
+                issues.append(f"Could not convert hexagram numeral: {current.text}")
+            return
+        if current.number in blocks and issues is not None:
+            issues.append(f"Hexagram {current.number} header repeated; keeping the later one")
+        blocks[current.number] = (current, end, line_starts)
+
+    for start, match in _matches(source, mode):
+        line_num, line_ord = match.group("line_num", "line_ord")
+        if line_ord is None:
+            close(start)
+            current = _hex_token(source, match, start, lenient)
+            line_starts = []
+        elif current is not None:
+            number = _ORDINAL_BYTES[line_ord.lower()][1] if lenient else line_num[0] - 48
+            line_starts.append((start, number))
+    close(len(source))
+
+    hexagrams = []
+    for header, end, starts in blocks.values():
+        lines = {}
+        for i, (start, number) in enumerate(starts):
+            if 1 <= number <= 6:
+                lines[number] = _stripped(source, start, starts[i + 1][0] if i + 1 < len(starts) else end)
+        hexagrams.append(LeggeHexagram(
+            hexagram=header.number,
+            title=header.title,
+            header=(header.start, header.end),
+            span=_stripped(source, header.end, end),
+            judgment=_stripped(source, header.end, starts[0][0] if starts else end),
+            lines=lines,
+        ))
+
+    return hexagrams
@@ -0,0 +1,368 @@
+"""
+Async chat-completions engine with bounded concurrency and rate limiting.
+
+Used by 08b-llm-score-star-systems.py to score many gate.lines concurrently
+without exceeding the provider's requests/min and tokens/min limits:
+
+- TokenBucket / RateLimiter: token buckets for requests/min and tokens/min,
+  plus a shared cooldown when the server answers 429 (so every in-flight
+  worker backs off, not just the one that was throttled).
+- ChatCompletionsClient: minimal stdlib HTTP client for an OpenAI-compatible
+  ``POST {base_url}/chat/completions`` endpoint. Pointing base_url at a local
+  stub server makes the whole engine testable offline.
+- AsyncScoringEngine: runs requests under an asyncio.Semaphore, retries
+  429/5xx and network errors with exponential backoff and full jitter, and
+  returns results in input order.
+
+Usage:
+    client = ChatCompletionsClient("https://api.openai.com/v1", api_key)
+    limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+    engine = AsyncScoringEngine(client, limiter, concurrency=8)
+    results = asyncio.run(engine.run(payloads, parse=parse_fn))
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+# Completion tokens assumed per request when the payload sets no max_tokens
+DEFAULT_COMPLETION_TOKENS = 800
+
+
+class HTTPStatusError(Exception):
+    """Non-2xx response from the chat-completions endpoint."""
+
+    def __init__(self, status: int, body: str = "", retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}: {body[:200]}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+def is_retryable(error: Exception) -> bool:
+    """429/5xx responses and network errors are retried; other errors are not."""
+    if isinstance(error, HTTPStatusError):
+        return error.status in RETRYABLE_STATUSES
+    return isinstance(error, (OSError, asyncio.TimeoutError))
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 60.0,
+    retry_after: Optional[float] = None,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Exponential backoff with full jitter: uniform(0, min(cap, base * 2**attempt)).
+
+    A server-provided Retry-After is treated as a lower bound.
+    """
+    rng = rng or random
+    delay = rng.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def estimate_tokens(payload: Dict) -> int:
+    """Rough token estimate for rate limiting (~4 characters per token)."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in payload.get("messages", []))
+    return prompt_chars // 4 + payload.get("max_tokens", DEFAULT_COMPLETION_TOKENS)
+
+
+# ============================================================================
+# Rate limiting
+# ============================================================================
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate_per_minute``.
+
+    A rate <= 0 disables the bucket. The balance may go negative after
+    debit(), which delays later acquisitions until usage is paid back.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            rate_per_minute: Refill rate; <= 0 means unlimited
+            capacity: Maximum burst (default: one minute's worth)
+            clock: Monotonic clock, overridable for tests
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(rate_per_minute, 0)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Take ``amount`` tokens if available.
+
+        Returns:
+            0.0 if acquired, otherwise seconds to wait before trying again
+        """
+        if self.unlimited:
+            return 0.0
+        amount = min(amount, self.capacity)  # a single oversized request must still fit
+        self._refill()
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    async def acquire(self, amount: float = 1) -> None:
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def debit(self, amount: float) -> None:
+        """Charge extra usage discovered after the fact (e.g. actual tokens > estimate)."""
+        if not self.unlimited:
+            self._refill()
+            self.tokens -= amount
+
+
+class RateLimiter:
+    """Requests/min and tokens/min buckets plus a shared 429 cooldown."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests = TokenBucket(requests_per_minute, clock=clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock=clock)
+        self.clock = clock
+        self.paused_until = 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of ``tokens`` estimated tokens may be sent."""
+        while self.paused_until > self.clock():
+            await asyncio.sleep(self.paused_until - self.clock())
+        await self.requests.acquire(1)
+        await self.tokens.acquire(tokens)
+
+    def record_usage(self, estimated: int, actual: Optional[int]) -> None:
+        """Reconcile the tokens/min bucket with usage reported by the server."""
+        if actual is not None and actual > estimated:
+            self.tokens.debit(actual - estimated)
+
+    def cooldown(self, seconds: float) -> None:
+        """Pause all new requests for ``seconds`` (called on 429)."""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+# ============================================================================
+# HTTP client
+# ============================================================================
+
+class ChatCompletionsClient:
+    """Minimal OpenAI-compatible chat-completions client (stdlib only)."""
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, api_key: Optional[str] = None, timeout: float = 120.0):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def post(self, payload: Dict) -> Dict:
+        """
+        Send one request synchronously.
+
+        Raises:
+            HTTPStatusError: On a non-2xx response
+            OSError: On connection errors and timeouts
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers=headers,
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            body = e.read().decode("utf-8", errors="replace")
+            retry_after = e.headers.get("Retry-After") if e.headers else None
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None
+            raise HTTPStatusError(e.code, body, retry_after) from None
+
+    async def create(self, payload: Dict) -> Dict:
+        """Send one request without blocking the event loop."""
+        return await asyncio.to_thread(self.post, payload)
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+class AsyncScoringEngine:
+    """Bounded-concurrency request runner with retries and rate limiting."""
+
+    def __init__(
+        self,
+        client: ChatCompletionsClient,
+        limiter: Optional[RateLimiter] = None,
+        concurrency: int = 8,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            client: Object with an async ``create(payload) -> response`` method
+            limiter: Rate limiter (default: unlimited)
+            concurrency: Maximum requests in flight
+            max_retries: Retries per request for 429/5xx/network errors
+            backoff_base: Base delay (seconds) for exponential backoff
+            backoff_cap: Maximum backoff delay (seconds)
+            rng: Random source for jitter, overridable for tests
+        """
+        self.client = client
+        self.limiter = limiter or RateLimiter()
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rng = rng or random.Random()
+        self.stats = {
+            "requests": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "server_errors": 0,
+            "invalid_responses": 0,
+            "failed": 0,
+        }
+
+    async def complete(self, payload: Dict) -> Dict:
+        """
+        Send one request, retrying transient failures.
+
+        Raises:
+            HTTPStatusError: On a non-retryable status or when retries run out
+        """
+        estimated = estimate_tokens(payload)
+        attempt = 0
+        while True:
+            await self.limiter.acquire(estimated)
+            self.stats["requests"] += 1
+            try:
+                response = await self.client.create(payload)
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                retry_after = getattr(e, "retry_after", None)
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap, retry_after, self.rng)
+                if getattr(e, "status", None) == 429:
+                    self.stats["rate_limited"] += 1
+                    self.limiter.cooldown(delay)
+                else:
+                    self.stats["server_errors"] += 1
+                self.stats["retries"] += 1
+                attempt += 1
+                logger.warning(f"{e} - retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            usage = response.get("usage") or {}
+            self.limiter.record_usage(estimated, usage.get("total_tokens"))
+            return response
+
+    async def run(
+        self,
+        payloads: Sequence[Dict],
+        parse: Optional[Callable[[Dict], Any]] = None,
+        on_result: Optional[Callable[[int, Optional[Any], Dict], None]] = None,
+        parse_retries: int = 1,
+    ) -> List[Optional[Any]]:
+        """
+        Run all requests concurrently.
+
+        Args:
+            payloads: Chat-completions request bodies
+            parse: Converts a response to a result; raising marks the
+                response invalid and re-requests it (up to parse_retries)
+            on_result: Called as ``on_result(index, result, info)`` as each
+                request finishes (result is None on failure); info holds
+                ``latency_ms`` and the server-reported ``usage``
+            parse_retries: Extra attempts for responses that fail to parse
+
+        Returns:
+            Results in input order (None for failed requests)
+        """
+        parse = parse or (lambda response: response)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def worker(index: int, payload: Dict) -> Optional[Any]:
+            async with semaphore:
+                result = None
+                info = {"latency_ms": 0, "usage": {}}
+                started = time.monotonic()
+                for _ in range(parse_retries + 1):
+                    try:
+                        response = await self.complete(payload)
+                        info["usage"] = response.get("usage") or {}
+                        result = parse(response)
+                        break
+                    except (HTTPStatusError, OSError, asyncio.TimeoutError) as e:
+                        logger.error(f"Request {index} failed: {e}")
+                        break
+                    except Exception as e:
+                        self.stats["invalid_responses"] += 1
+                        logger.error(f"Request {index} returned an unusable response: {e}")
+                info["latency_ms"] = round((time.monotonic() - started) * 1000)
+                if result is None:
+                    self.stats["failed"] += 1
+                if on_result:
+                    on_result(index, result, info)
+                return result
+
+        return await asyncio.gather(*(worker(i, p) for i, p in enumerate(payloads)))
+
+    def format_stats(self) -> str:
+        s = self.stats
+        return (
+            f"{s['requests']} requests, {s['retries']} retries "
+            f"({s['rate_limited']} rate-limited, {s['server_errors']} server/network errors), "
+            f"{s['invalid_responses']} invalid responses, {s['failed']} failed"
+        )
@@ -0,0 +1,90 @@
+"""
+Compiled multi-pattern OCR fix engine.
+
+All OCR fix rules are compiled into one alternation regex (longest pattern
+first), so a text is scanned once no matter how many rules there are, and
+each rule counts how often it fired. Rules with zero hits over a full source
+are candidates for pruning; the counts are written to OCR_ISSUES.md.
+
+Matching is leftmost-longest over the original text: a replacement is never
+rescanned, so unlike chained ``str.replace`` calls one rule cannot fire on the
+output of another. Equal-length patterns keep their dictionary order.
+
+Usage:
+    fixer = OCRFixEngine(OCR_FIX_DICT)
+    text = fixer.apply(text)
+    for rule in fixer.dead_rules():
+        print("never fired:", rule)
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+class OCRFixEngine:
+    """Single-scan replacer for an OCR error -> fix dictionary."""
+
+    def __init__(self, fixes: Dict[str, str]):
+        """
+        Initialize engine.
+
+        Args:
+            fixes: OCR error -> fix replacements
+
+        Raises:
+            ValueError: If a rule has an empty pattern
+        """
+        if "" in fixes:
+            raise ValueError("OCR fix pattern must not be empty")
+        self.fixes = dict(fixes)
+        self.hits: Dict[str, int] = {error: 0 for error in self.fixes}
+        self._pattern: Optional[re.Pattern] = None
+        if self.fixes:
+            # sorted() is stable, so equal-length patterns keep dict order
+            ordered = sorted(self.fixes, key=len, reverse=True)
+            self._pattern = re.compile("|".join(re.escape(error) for error in ordered))
+
+    def __len__(self) -> int:
+        return len(self.fixes)
+
+    def _replace(self, match: re.Match) -> str:
+        error = match.group(0)
+        self.hits[error] += 1
+        return self.fixes[error]
+
+    def apply(self, text: str) -> str:
+        """Apply every rule in one scan of ``text`` and count the hits."""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+    def reset(self) -> None:
+        """Zero all hit counters."""
+        for error in self.hits:
+            self.hits[error] = 0
+
+    @property
+    def total_hits(self) -> int:
+        return sum(self.hits.values())
+
+    def dead_rules(self) -> List[str]:
+        """Patterns that never fired (in rule order)."""
+        return [error for error, count in self.hits.items() if count == 0]
+
+    def rule_stats(self) -> List[Tuple[str, str, int]]:
+        """(pattern, fix, hits) per rule, most frequent first."""
+        stats = [(error, self.fixes[error], count) for error, count in self.hits.items()]
+        return sorted(stats, key=lambda s: -s[2])
+
+    def format_stats(self) -> str:
+        """One-line summary for logs."""
+        fired = len(self.fixes) - len(self.dead_rules())
+        return f"{self.total_hits:,} OCR fixes applied ({fired}/{len(self.fixes)} rules fired)"
+
+    def markdown_table(self) -> str:
+        """Per-rule hit counts as a markdown table (for OCR_ISSUES.md)."""
+        rows = ["| Pattern | Fix | Hits |", "|---|---|---|"]
+        for error, fix, count in self.rule_stats():
+            error, fix = error.replace("|", "\\|"), fix.replace("|", "\\|")
+            rows.append(f"| `{error}` | `{fix}` | {count} |")
+        return "\n".join(rows) + "\n"
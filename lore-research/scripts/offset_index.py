@@ -0,0 +1,245 @@
+"""
+Offset index for normalized.txt and a lazy, memory-mapped span reader.
+
+Instead of copying the book into gates.json, the per-gate files and their
+per-line fields, stages record where each piece lives in normalized.txt:
+
+    {
+      "version": 2,
+      "source": "normalized.txt",
+      "size_bytes": 1505509,
+      "sha256": "9f2c...",
+      "leaves": [[0, 12, "1"], [3104, 13, "2"], ...],
+      "gates": {
+        "1": {
+          "span": [0, 27031],
+          "lines": {
+            "1": {"span": [412, 3310],
+                  "segments": [{"type": "intro", "span": [412, 1020]}, ...]}
+          }
+        }
+      }
+    }
+
+Spans are [start, end) UTF-8 byte offsets into normalized.txt and cover the
+stripped text, so ``SpanReader.text(span)`` returns exactly what a stage
+would otherwise have stored. 02-split-gates writes the gate spans, 03a the
+line spans and 03c the segment spans. When 01 recorded real page breaks
+(normalized.pages.json), 02-split-gates also stores them as
+[byte offset, leaf, printed page] rows under "leaves" so later stages can
+turn any span into a page hint (see leaf_table.LeafIntervals).
+
+The index records the size and SHA-256 of normalized.txt; matches()
+compares both, so a same-length OCR fix also marks the spans stale.
+
+Usage:
+    index = OffsetIndex.load(LINE_COMPANION_OFFSETS)
+    with SpanReader(LINE_COMPANION_NORMALIZED, index) as reader:
+        text = reader.gate_text(12)
+        line = reader.line_text(12, 3)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from leaf_table import LeafIntervals
+from source_text import SourceText
+
+Span = Tuple[int, int]
+
+INDEX_VERSION = 2
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stripped_span(text: str, start: int = 0, end: Optional[int] = None) -> Span:
+    """Char span of ``text[start:end].strip()`` within ``text``."""
+    end = len(text) if end is None else end
+    piece = text[start:end]
+    stripped = piece.lstrip()
+    if not stripped:
+        return start, start
+    lead = len(piece) - len(stripped)
+    trail = len(stripped) - len(stripped.rstrip())
+    return start + lead, end - trail
+
+
+def byte_span(text: str, span: Span, base: int = 0) -> List[int]:
+    """Convert a char span within ``text`` to absolute UTF-8 byte offsets."""
+    start, end = span
+    if text.isascii():
+        return [base + start, base + end]
+    head = len(text[:start].encode("utf-8"))
+    return [base + head, base + head + len(text[start:end].encode("utf-8"))]
+
+
+class OffsetIndex:
+    """Gate -> line -> segment byte spans for one normalized source file."""
+
+    def __init__(self, path: Path, source: str = "", size_bytes: int = 0, gates: Optional[Dict] = None,
+                 leaves: Optional[List] = None, sha256: str = ""):
+        """
+        Initialize index.
+
+        Args:
+            path: Sidecar JSON file
+            source: Name of the indexed text file
+            size_bytes: Size of the indexed text file (staleness check)
+            gates: Existing gate entries
+            leaves: Page-break rows [byte offset, leaf, page]
+            sha256: Content digest of the indexed text file (staleness check)
+        """
+        self.path = Path(path)
+        self.source = source
+        self.size_bytes = size_bytes
+        self.sha256 = sha256
+        self._verified: Optional[Tuple[str, int, int]] = None  # (path, size, mtime_ns) last matched
+        self.gates: Dict[str, Dict] = gates or {}
+        self.leaves: List = leaves or []
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["OffsetIndex"]:
+        """Load the sidecar, or None if it does not exist or is from another version."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls(path, data.get("source", ""), data.get("size_bytes", 0), data.get("gates", {}),
+                   data.get("leaves", []), data.get("sha256", ""))
+
+    def matches(self, source_path: Path) -> bool:
+        """
+        True if ``source_path`` still has the size and content digest the
+        index was built for. The file is hashed at most once per
+        (size, mtime) for a given index.
+        """
+        source_path = Path(source_path)
+        if not source_path.exists():
+            return False
+        stat = source_path.stat()
+        if stat.st_size != self.size_bytes:
+            return False
+        signature = (str(source_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if signature == self._verified:
+            return True
+        if file_digest(source_path) != self.sha256:
+            return False
+        self._verified = signature
+        return True
+
+    def save(self) -> None:
+        """Write the sidecar atomically."""
+        data = {
+            "version": INDEX_VERSION,
+            "source": self.source,
+            "size_bytes": self.size_bytes,
+            "sha256": self.sha256,
+            "leaves": self.leaves,
+            "gates": self.gates,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    # ------------------------------------------------------------------
+    # Writers
+    # ------------------------------------------------------------------
+
+    def set_gate(self, gate: int, span: Sequence[int]) -> None:
+        """Record a gate span (drops any line spans recorded for the old text)."""
+        self.gates[str(gate)] = {"span": list(span), "lines": {}}
+
+    def set_lines(self, gate: int, lines: Dict[str, Sequence[int]]) -> None:
+        """Replace the line spans of a gate (line number -> span)."""
+        entry = self.gates.setdefault(str(gate), {"span": None, "lines": {}})
+        entry["lines"] = {str(line): {"span": list(span)} for line, span in lines.items()}
+
+    def set_leaves(self, intervals: LeafIntervals) -> None:
+        """Record the page breaks (intervals keyed by byte offset)."""
+        self.leaves = intervals.to_json()
+
+    def set_segments(self, gate: int, line: int, segments: List[Dict]) -> None:
+        """Replace the segment spans of a line (dicts with type/planet/span)."""
+        entry = self.gates.get(str(gate), {}).get("lines", {}).get(str(line))
+        if entry is None:
+            raise KeyError(f"gate {gate} line {line} has no span")
+        entry["segments"] = segments
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def gate_span(self, gate: int) -> Optional[Span]:
+        entry = self.gates.get(str(gate))
+        return tuple(entry["span"]) if entry and entry.get("span") else None
+
+    def line_span(self, gate: int, line: int) -> Optional[Span]:
+        entry = self.gates.get(str(gate), {}).get("lines", {}).get(str(line))
+        return tuple(entry["span"]) if entry else None
+
+    def segment_spans(self, gate: int, line: int) -> List[Dict]:
+        entry = self.gates.get(str(gate), {}).get("lines", {}).get(str(line))
+        return entry.get("segments", []) if entry else []
+
+    def leaf_intervals(self) -> Optional[LeafIntervals]:
+        """Byte offset -> leaf index, or None if no page breaks were recorded."""
+        return LeafIntervals.from_json(self.leaves) if self.leaves else None
+
+
+class SpanReader:
+    """Slices indexed spans out of a memory-mapped SourceText on demand."""
+
+    def __init__(self, path: Path, index: Optional[OffsetIndex] = None):
+        """
+        Open reader.
+
+        Args:
+            path: Indexed text file (normalized.txt)
+            index: Offset index for gate/line lookups
+
+        Raises:
+            ValueError: If the index was built for a different version of the file
+        """
+        self.path = Path(path)
+        self.index = index
+        if index is not None and not index.matches(self.path):
+            raise ValueError(f"Offset index {index.path.name} is stale for {self.path.name}; re-run 02-split-gates.py")
+        self.source = SourceText(self.path)
+
+    def __enter__(self) -> "SpanReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.source.close()
+
+    def text(self, span: Sequence[int]) -> str:
+        return self.source.decode(*span)
+
+    def gate_text(self, gate: int) -> Optional[str]:
+        span = self.index.gate_span(gate)
+        return self.text(span) if span else None
+
+    def line_text(self, gate: int, line: int) -> Optional[str]:
+        span = self.index.line_span(gate, line)
+        return self.text(span) if span else None
+
+    def segment_texts(self, gate: int, line: int) -> List[str]:
+        return [self.text(s["span"]) for s in self.index.segment_spans(gate, line)]
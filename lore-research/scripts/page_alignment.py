@@ -0,0 +1,193 @@
+"""
+Anchor-based page alignment for the Legge I Ching.
+
+The djvu text keeps the printed page numbers of the scan: bare number lines
+and running headers such as "30 THE Yf KING. CH. III." (OCR-damaged, with
+stray footnote numbers mixed in). The page map
+(236066-The I Ching_page_numbers.json) gives the page number the scan's OCR
+read on each leaf; the book was scanned as two-page spreads, so most leaves
+carry two pages, and a few entries are misreads.
+
+Both sources are cleaned the same way: a monotone dynamic program keeps the
+heaviest chain of anchors whose page numbers increase strictly with their
+position (a weighted longest increasing subsequence, O(n log n) with a
+Fenwick tree of prefix maxima). Outliers cannot join a long increasing
+chain and drop out.
+
+    text chain   byte offset in legge-normalized.txt -> printed page
+    leaf chain   leaf number -> first printed page on the leaf
+
+PageAligner answers offset -> page (interpolated between text anchors) ->
+leaf (bisect over the leaf chain), so every hexagram header gets an exact
+leaf range with one bisect per lookup. The confidence of a lookup drops
+with the number of pages between the anchors bracketing it.
+
+Usage:
+    with SourceText(LEGGE_NORMALIZED) as source:
+        aligner = PageAligner.build(source, read_json_file(LEGGE_PAGE_MAP))
+        start = aligner.locate(hexagram.header[0])
+        print(start.page, start.leaf, start.confidence)
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from source_text import SourceText, compile_bytes
+
+# A page number line: bare digits ("122", OCR-split "2 2"), or digits
+# before/after a running header ending in "KING" ("30 THE Yf KING. CH. III.")
+PAGE_NUMBER_RE = compile_bytes(
+    r"^[^\S\n]*(?:"
+    r"(?P<num>\d(?:[^\S\n]?\d){0,2})(?:[^\S\n]+(?P<head>[^\n]*KING\b[^\n]*))?"
+    r"|(?P<head2>[^\n]*KING\b[^\n]*?)[^\S\n]+(?P<num2>\d{1,3})"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Running headers are rarely footnote numbers, so they outweigh bare numbers
+HEADER_WEIGHT = 2
+NUMBER_WEIGHT = 1
+
+# Anchors at most this many pages apart pin a lookup between them (a spread)
+EXACT_PAGE_GAP = 2
+
+
+class PageAnchor(NamedTuple):
+    position: int   # byte offset (text chain) or leaf number (leaf chain)
+    page: int       # printed page number
+    weight: int = 1
+
+
+class PageLocation(NamedTuple):
+    page: int
+    leaf: int
+    confidence: float
+
+
+def monotone_chain(anchors: Sequence[PageAnchor]) -> List[PageAnchor]:
+    """
+    Heaviest subsequence of anchors (in position order) whose pages
+    strictly increase. Ties keep the chain ending earliest.
+    """
+    pages = sorted({anchor.page for anchor in anchors})
+    rank = {page: i + 1 for i, page in enumerate(pages)}
+    # tree[r]: best (score, index) of a chain ending at a page of rank <= r
+    tree: List[Tuple[int, int]] = [(0, -1)] * (len(pages) + 1)
+    scores: List[int] = []
+    previous: List[int] = []
+
+    for i, anchor in enumerate(anchors):
+        best = (0, -1)
+        r = rank[anchor.page] - 1
+        while r > 0:
+            best = max(best, tree[r], key=lambda entry: entry[0])
+            r -= r & -r
+        score = best[0] + anchor.weight
+        scores.append(score)
+        previous.append(best[1])
+        r = rank[anchor.page]
+        while r <= len(pages):
+            if score > tree[r][0]:
+                tree[r] = (score, i)
+            r += r & -r
+
+    if not anchors:
+        return []
+    i = max(range(len(anchors)), key=scores.__getitem__)
+    chain = []
+    while i != -1:
+        chain.append(anchors[i])
+        i = previous[i]
+    return chain[::-1]
+
+
+def find_page_anchors(source: SourceText) -> List[PageAnchor]:
+    """Page number lines of the mapped text, in offset order."""
+    anchors = []
+    for match in source.finditer(PAGE_NUMBER_RE):
+        number = match.group("num") or match.group("num2")
+        page = int(re.sub(rb"\s", b"", number))
+        weight = HEADER_WEIGHT if match.group("head") or match.group("head2") else NUMBER_WEIGHT
+        anchors.append(PageAnchor(match.start(), page, weight))
+    return anchors
+
+
+def page_map_anchors(page_map: Dict) -> List[PageAnchor]:
+    """(leaf, page) anchors from the page map's numeric pageNumber entries, in leaf order."""
+    entries = sorted(
+        (entry["leafNum"], int(entry["pageNumber"]))
+        for entry in page_map.get("pages", [])
+        if entry.get("leafNum") is not None and str(entry.get("pageNumber", "")).isdigit()
+    )
+    return [PageAnchor(leaf, page) for leaf, page in entries]
+
+
+class PageAligner:
+    """Byte offset -> printed page -> leaf over two monotone anchor chains."""
+
+    def __init__(self, text_chain: Sequence[PageAnchor], leaf_chain: Sequence[PageAnchor]):
+        """
+        Initialize aligner.
+
+        Args:
+            text_chain: Text anchors (offset, page) with strictly increasing pages
+            leaf_chain: Leaf anchors (leaf, first page) with strictly increasing pages
+
+        Raises:
+            ValueError: If either chain is empty
+        """
+        if not text_chain or not leaf_chain:
+            raise ValueError("page alignment needs at least one text anchor and one leaf anchor")
+        self.text_chain = list(text_chain)
+        self.leaf_chain = list(leaf_chain)
+        self._offsets = [anchor.position for anchor in self.text_chain]
+        self._leaf_pages = [anchor.page for anchor in self.leaf_chain]
+
+    @classmethod
+    def build(cls, source: SourceText, page_map: Dict) -> "PageAligner":
+        """Align the mapped normalized text against a parsed page map."""
+        return cls(monotone_chain(find_page_anchors(source)), monotone_chain(page_map_anchors(page_map)))
+
+    def page_at(self, offset: int) -> Tuple[int, float]:
+        """
+        Printed page at a byte offset and its confidence.
+
+        Between two anchors the page is interpolated by offset; confidence
+        is 1.0 when they are at most EXACT_PAGE_GAP pages apart and falls as
+        EXACT_PAGE_GAP / gap beyond. Outside the chain the nearest anchor's
+        page is used with confidence 0.
+        """
+        k = bisect_right(self._offsets, offset) - 1
+        if k < 0:
+            return self.text_chain[0].page, 0.0
+        if k == len(self.text_chain) - 1:
+            return self.text_chain[k].page, 0.0
+        left, right = self.text_chain[k], self.text_chain[k + 1]
+        gap = right.page - left.page
+        page = left.page + (offset - left.position) * gap // (right.position - left.position)
+        return page, min(1.0, EXACT_PAGE_GAP / gap)
+
+    def leaf_for_page(self, page: int) -> Tuple[int, float]:
+        """Leaf holding a printed page, with the same gap-based confidence over the leaf chain."""
+        k = bisect_right(self._leaf_pages, page) - 1
+        if k < 0:
+            return self.leaf_chain[0].position, 0.0
+        anchor = self.leaf_chain[k]
+        if k == len(self.leaf_chain) - 1:
+            return anchor.position, 1.0 if page - anchor.page < EXACT_PAGE_GAP else 0.0
+        following = self.leaf_chain[k + 1]
+        leaves = following.position - anchor.position
+        pages = following.page - anchor.page
+        # Spread the skipped pages evenly over the skipped leaves
+        leaf = anchor.position + (page - anchor.page) * leaves // pages
+        return leaf, min(1.0, EXACT_PAGE_GAP * leaves / pages)
+
+    def locate(self, offset: int) -> PageLocation:
+        page, page_confidence = self.page_at(offset)
+        leaf, leaf_confidence = self.leaf_for_page(page)
+        return PageLocation(page, leaf, round(page_confidence * leaf_confidence, 2))
+
+    def page_candidates(self, start: PageLocation, end: PageLocation) -> List[str]:
+        """Every printed page from start.page to end.page, as strings (agrees with the page range)."""
+        return [str(page) for page in range(start.page, max(start.page, end.page) + 1)]
@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+"""
+Incremental pipeline runner for the numbered lore-research stages.
+
+Each stage declares the files it reads and writes. Stage inputs and code are
+fingerprinted by content hash (SHA-256) and recorded in PIPELINE_STATE_FILE
+after a successful run. On the next run a stage is skipped when its code,
+inputs and upstream stages are unchanged and its outputs still exist.
+
+Per-gate stages fingerprint each gate separately and are invoked with
+``--gates`` for only the gates whose inputs changed, so editing one
+s3-data/gates/NN.json file rebuilds just that gate's evidence, scores and
+API file downstream.
+
+Usage:
+    python3 lore-research/scripts/pipeline.py               # run stale stages
+    python3 lore-research/scripts/pipeline.py --dry-run     # show the plan only
+    python3 lore-research/scripts/pipeline.py --stages 08a 08b --force
+    python3 lore-research/scripts/pipeline.py --jobs 8      # fan gates out over 8 processes
+    python3 lore-research/scripts/pipeline.py --list
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from config import (
+    PROJECT_ROOT,
+    S3_DATA_ROOT,
+    LINE_COMPANION_SOURCES,
+    LINE_COMPANION_DIR,
+    LINE_COMPANION_SCANDATA,
+    LINE_COMPANION_NORMALIZED,
+    LINE_COMPANION_PAGE_OFFSETS,
+    LINE_COMPANION_LEAF_TABLE,
+    LINE_COMPANION_GATES,
+    LINE_COMPANION_GATES_DIR,
+    LINE_COMPANION_OFFSETS,
+    RESEARCH_OUTPUTS_DIR,
+    EVIDENCE_DIR,
+    STAR_MAPS_LLM_DIR,
+    STAR_MAPS_CALIBRATED_DIR,
+    STAR_MAPS_REPORTS_DIR,
+    STAR_SYSTEM_BASELINES_DIR,
+    LEGGE_NORMALIZED,
+    LEGGE_HX_INDEX,
+    LEGGE_PAGE_MAP,
+    I_CHING_SOURCES,
+    EXPECTED_GATES,
+    LINES_PER_GATE,
+    PIPELINE_STATE_FILE,
+    SCORING_RULES_FILE,
+)
+from utils import setup_logging, read_json_file, write_json_file, parse_gate_spec, parse_jobs
+
+logger = setup_logging(__name__)
+
+SCRIPTS_DIR = Path(__file__).parent
+STATE_VERSION = 1
+ALL_GATES = list(range(1, EXPECTED_GATES + 1))
+NORMALIZER_MODULES = ("config.py", "utils.py", "ocr_fixes.py", "stream_normalizer.py")
+CORPUS_MODULES = ("config.py", "utils.py", "gate_corpus.py")
+OFFSET_INDEX_MODULES = ("config.py", "utils.py", "source_text.py", "offset_index.py", "leaf_table.py")
+LEGGE_PARSER_MODULES = ("config.py", "utils.py", "source_text.py", "offset_index.py", "legge_parser.py")
+SCORING_MODULES = ("config.py", "utils.py", "scoring_rules.py")
+
+# Paths that are not (yet) named in config.py
+LC_SCANDATA_JSON = LINE_COMPANION_DIR / "scandata.json"
+GATE_LINE_API_DIR = RESEARCH_OUTPUTS_DIR / "gate-line-API-call"
+STAR_MAPPING_DRAFTS_DIR = RESEARCH_OUTPUTS_DIR / "star-mapping-drafts"
+STAR_MAPPING_COLLAPSED_DIR = RESEARCH_OUTPUTS_DIR / "star-mapping-collapsed"
+STAR_MAPPING_BY_GATE_DIR = RESEARCH_OUTPUTS_DIR / "star-mapping-by-gate"
+APP_DATA_DIR = PROJECT_ROOT / "star-system-sorter" / "public" / "data"
+SOURCE_LIBRARY_FILE = PROJECT_ROOT / "lore-research" / "source-mining" / "!ESOTERIC_SOURCE_LIBRARY.md"
+
+
+class Stage:
+    """
+    A pipeline stage backed by one numbered script.
+
+    Whole-corpus stages are described by ``inputs``/``outputs``. Per-gate
+    stages additionally provide ``gate_inputs``/``gate_outputs`` callables
+    mapping a gate number to the files that gate reads and writes; the
+    script must accept ``--gates`` (see utils.parse_gate_spec).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inputs: Sequence[Path] = (),
+        outputs: Sequence[Path] = (),
+        after: Sequence[str] = (),
+        gate_inputs: Optional[Callable[[int], List[Path]]] = None,
+        gate_outputs: Optional[Callable[[int], List[Path]]] = None,
+        modules: Sequence[str] = ("config.py", "utils.py"),
+        args: Sequence[str] = (),
+        parallel: bool = False,
+    ):
+        """
+        Initialize stage.
+
+        Args:
+            name: Script stem, e.g. "08a-compile-evidence"
+            inputs: Files/directories read for every gate
+            outputs: Files/directories written (must exist after a run)
+            after: Names of upstream stages whose re-run invalidates this one
+            gate_inputs: gate -> files read for that gate (per-gate stages)
+            gate_outputs: gate -> files written for that gate (per-gate stages)
+            modules: Shared modules in SCRIPTS_DIR that count as stage code
+            args: Extra command-line arguments passed to the script
+            parallel: Script accepts ``--jobs N`` (see utils.map_gates)
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.after = tuple(after)
+        self.gate_inputs = gate_inputs
+        self.gate_outputs = gate_outputs
+        self.modules = tuple(modules)
+        self.args = tuple(args)
+        self.parallel = parallel
+
+    @property
+    def script(self) -> Path:
+        return SCRIPTS_DIR / f"{self.name}.py"
+
+    @property
+    def per_gate(self) -> bool:
+        return self.gate_inputs is not None
+
+    @property
+    def code_paths(self) -> List[Path]:
+        return [self.script] + [SCRIPTS_DIR / m for m in self.modules]
+
+
+def _gate_line_files(directory: Path) -> Callable[[int], List[Path]]:
+    """Per-gate file list for NN-L.json evidence/score layouts."""
+    return lambda gate: [directory / f"{gate:02d}-{line}.json" for line in range(1, LINES_PER_GATE + 1)]
+
+
+# Stages in run order. ``after`` may only name stages listed earlier.
+STAGES: List[Stage] = [
+    # Line Companion extraction
+    Stage(
+        "01-normalize-line-companion",
+        inputs=LINE_COMPANION_SOURCES[1:],
+        outputs=[LINE_COMPANION_NORMALIZED],
+        modules=NORMALIZER_MODULES + ("source_readers.py",),
+    ),
+    Stage(
+        "02a-ingest-lc-scandata",
+        inputs=[LINE_COMPANION_SCANDATA],
+        outputs=[LC_SCANDATA_JSON, LINE_COMPANION_LEAF_TABLE],
+        modules=("config.py", "utils.py", "leaf_table.py"),
+    ),
+    Stage(
+        "02-split-gates",
+        inputs=[LINE_COMPANION_NORMALIZED, LINE_COMPANION_PAGE_OFFSETS, LINE_COMPANION_LEAF_TABLE],
+        outputs=[LINE_COMPANION_GATES, LINE_COMPANION_OFFSETS],
+        after=["01-normalize-line-companion", "02a-ingest-lc-scandata"],
+        modules=OFFSET_INDEX_MODULES,
+    ),
+    Stage(
+        "03-fanout-gates",
+        inputs=[LINE_COMPANION_GATES],
+        outputs=[LINE_COMPANION_GATES_DIR],
+        after=["02-split-gates"],
+        modules=OFFSET_INDEX_MODULES,
+    ),
+    # 03a and 03c rewrite the fanned-out gate files in place, so they are
+    # keyed on the fanout stage rather than on the files they modify.
+    Stage(
+        "03a-detect-lines-per-gate",
+        outputs=[LINE_COMPANION_GATES_DIR],
+        after=["03-fanout-gates"],
+        modules=OFFSET_INDEX_MODULES,
+        parallel=True,
+    ),
+    Stage(
+        "03c-split-exaltation-detriment",
+        outputs=[LINE_COMPANION_GATES_DIR],
+        after=["03a-detect-lines-per-gate"],
+        modules=OFFSET_INDEX_MODULES,
+        parallel=True,
+    ),
+    Stage(
+        "04a-verify-line-extraction",
+        after=["03c-split-exaltation-detriment"],
+    ),
+    # Legge I Ching (verified/repaired modes)
+    Stage(
+        "02-normalize-legge",
+        inputs=[I_CHING_SOURCES[0]],
+        outputs=[LEGGE_NORMALIZED],
+        modules=NORMALIZER_MODULES,
+    ),
+    Stage(
+        "04-build-legge-hexagram-index",
+        inputs=[LEGGE_NORMALIZED],
+        outputs=[LEGGE_HX_INDEX],
+        after=["02-normalize-legge"],
+        modules=LEGGE_PARSER_MODULES,
+    ),
+    Stage(
+        "05-attach-legge-page-metadata",
+        inputs=[LEGGE_PAGE_MAP, LEGGE_NORMALIZED],
+        outputs=[LEGGE_HX_INDEX],
+        after=["04-build-legge-hexagram-index"],
+        modules=LEGGE_PARSER_MODULES + ("page_alignment.py",),
+    ),
+    Stage(
+        "05a-sanitize-legge-lines",
+        outputs=[LEGGE_HX_INDEX],
+        after=["05-attach-legge-page-metadata"],
+    ),
+    # LLM-assisted star mapping
+    Stage(
+        "08a-compile-evidence",
+        gate_inputs=lambda gate: [
+            S3_DATA_ROOT / "gates" / f"{gate:02d}.json",
+            S3_DATA_ROOT / "hexagrams" / f"{gate:02d}.json",
+        ],
+        gate_outputs=_gate_line_files(EVIDENCE_DIR),
+        modules=CORPUS_MODULES,
+        parallel=True,
+    ),
+    Stage(
+        "08b-llm-score-star-systems",
+        gate_inputs=_gate_line_files(EVIDENCE_DIR),
+        gate_outputs=_gate_line_files(STAR_MAPS_LLM_DIR),
+        after=["08a-compile-evidence"],
+        modules=("config.py", "utils.py", "llm_async.py", "response_cache.py", "scoring_journal.py"),
+    ),
+    Stage(
+        "08c-post-calibrate",
+        inputs=[STAR_MAPS_LLM_DIR, EVIDENCE_DIR, SCORING_RULES_FILE],
+        outputs=[STAR_MAPS_CALIBRATED_DIR],
+        after=["08b-llm-score-star-systems"],
+        modules=SCORING_MODULES,
+    ),
+    Stage(
+        "08d-generate-disagreement-report",
+        inputs=[STAR_MAPS_CALIBRATED_DIR, STAR_MAPS_LLM_DIR, STAR_MAPPING_DRAFTS_DIR],
+        outputs=[STAR_MAPS_REPORTS_DIR],
+        after=["08c-post-calibrate"],
+    ),
+    # Gate-line API files
+    Stage(
+        "10-generate-gate-line-files",
+        gate_inputs=lambda gate: [S3_DATA_ROOT / "gates" / f"{gate:02d}.json"],
+        gate_outputs=lambda gate: [GATE_LINE_API_DIR / f"gate-line-{gate}.json"],
+        modules=CORPUS_MODULES,
+        parallel=True,
+    ),
+    Stage(
+        "09-sync-paraphrased-quotes",
+        gate_inputs=lambda gate: [S3_DATA_ROOT / "gates" / f"{gate:02d}.json"],
+        gate_outputs=lambda gate: [GATE_LINE_API_DIR / f"gate-line-{gate}.json"],
+        after=["10-generate-gate-line-files"],
+        modules=CORPUS_MODULES,
+        parallel=True,
+    ),
+    # Manual star mapping drafts -> app data
+    Stage(
+        "11-merge-star-mappings",
+        inputs=[STAR_MAPPING_DRAFTS_DIR],
+        outputs=[RESEARCH_OUTPUTS_DIR / "gateLine_star_map.json"],
+    ),
+    Stage(
+        "12-restructure-star-mappings",
+        inputs=[STAR_MAPPING_DRAFTS_DIR],
+        outputs=[STAR_MAPPING_COLLAPSED_DIR],
+    ),
+    Stage(
+        "13-restructure-by-gate",
+        inputs=[STAR_MAPPING_DRAFTS_DIR],
+        outputs=[STAR_MAPPING_BY_GATE_DIR],
+    ),
+    Stage(
+        "14-merge-gate-mappings",
+        inputs=[STAR_MAPPING_BY_GATE_DIR],
+        outputs=[APP_DATA_DIR / "gateLine_star_map.json"],
+        after=["13-restructure-by-gate"],
+    ),
+    Stage(
+        "15-verify-gate-mappings",
+        inputs=[APP_DATA_DIR / "gateLine_star_map.json"],
+        after=["14-merge-gate-mappings"],
+    ),
+    Stage(
+        "16-consolidate-sources",
+        inputs=[STAR_SYSTEM_BASELINES_DIR, SOURCE_LIBRARY_FILE],
+        outputs=[APP_DATA_DIR / "star_system_sources.json"],
+    ),
+    Stage(
+        "17-verify-sources-integration",
+        inputs=[APP_DATA_DIR / "star_system_sources.json"],
+        after=["16-consolidate-sources"],
+    ),
+    Stage(
+        "18-audit-weight-calibration",
+        inputs=[STAR_MAPPING_BY_GATE_DIR, SCORING_RULES_FILE],
+        outputs=[RESEARCH_OUTPUTS_DIR / "WEIGHT_CALIBRATION_AUDIT.md"],
+        after=["13-restructure-by-gate"],
+        modules=SCORING_MODULES,
+    ),
+]
+
+
+# ============================================================================
+# Fingerprinting
+# ============================================================================
+
+class Fingerprinter:
+    """
+    Content-hash fingerprints for files and directories.
+
+    File hashes are cached by (size, mtime_ns) so unchanged files are not
+    re-read on every run; the cache is persisted with the pipeline state.
+    """
+
+    MISSING = "missing"
+
+    def __init__(self, stat_cache: Optional[Dict[str, List]] = None):
+        self.stat_cache: Dict[str, List] = stat_cache if stat_cache is not None else {}
+        self._memo: Dict[Path, str] = {}
+
+    def file_hash(self, path: Path) -> str:
+        """Return the SHA-256 of a file's contents, or MISSING."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return self.MISSING
+
+        key = _rel(path)
+        cached = self.stat_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha = digest.hexdigest()
+        self.stat_cache[key] = [stat.st_size, stat.st_mtime_ns, sha]
+        return sha
+
+    def path_hash(self, path: Path) -> str:
+        """Hash a file, or a directory as the sorted list of its files' hashes."""
+        if path in self._memo:
+            return self._memo[path]
+
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for child in sorted(p for p in path.rglob("*") if p.is_file()):
+                digest.update(f"{child.relative_to(path).as_posix()}:{self.file_hash(child)}\n".encode("utf-8"))
+            sha = digest.hexdigest()
+        else:
+            sha = self.file_hash(path)
+
+        self._memo[path] = sha
+        return sha
+
+    def combined(self, paths: Iterable[Path]) -> str:
+        """Single fingerprint over several paths (order-insensitive)."""
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            digest.update(f"{_rel(path)}:{self.path_hash(path)}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def forget(self, paths: Iterable[Path]) -> None:
+        """Drop memoized hashes for paths a stage may just have rewritten."""
+        paths = list(paths)
+        for memo_path in list(self._memo):
+            if any(memo_path == p or p in memo_path.parents or memo_path in p.parents for p in paths):
+                del self._memo[memo_path]
+
+
+def _rel(path: Path) -> str:
+    """Path relative to the project root (stable across checkouts)."""
+    try:
+        return path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+# ============================================================================
+# State
+# ============================================================================
+
+def load_state(state_file: Path = PIPELINE_STATE_FILE) -> Dict:
+    """Load runner state, discarding it if the format version changed."""
+    if state_file.exists():
+        try:
+            state = read_json_file(state_file)
+            if state.get("version") == STATE_VERSION:
+                return state
+            logger.info("Pipeline state has an old format version, starting fresh")
+        except json.JSONDecodeError:
+            logger.warning(f"Pipeline state is corrupt, starting fresh: {state_file}")
+    return {"version": STATE_VERSION, "stat_cache": {}, "stages": {}}
+
+
+def save_state(state: Dict, state_file: Path = PIPELINE_STATE_FILE) -> None:
+    write_json_file(state_file, state)
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+class StagePlan:
+    """Decision for one stage: whether to run it and for which gates."""
+
+    def __init__(self, stage: Stage, reason: Optional[str], gates: Optional[List[int]] = None):
+        """
+        Args:
+            stage: The stage
+            reason: Why it must run, or None to skip it
+            gates: For per-gate stages, the gates to rebuild (None = all)
+        """
+        self.stage = stage
+        self.reason = reason
+        self.gates = gates
+
+    @property
+    def will_run(self) -> bool:
+        return self.reason is not None
+
+    @property
+    def gate_args(self) -> List[str]:
+        if not self.stage.per_gate or self.gates is None or self.gates == ALL_GATES:
+            return []
+        return ["--gates", ",".join(str(g) for g in self.gates)]
+
+
+def plan_stage(
+    stage: Stage,
+    record: Optional[Dict],
+    fp: Fingerprinter,
+    upstream_runs: Dict[str, Optional[List[int]]],
+    gates: List[int],
+    force: bool = False,
+    predict: bool = False,
+    upstream: Optional[Dict[str, Optional[str]]] = None,
+) -> StagePlan:
+    """
+    Decide whether a stage is stale.
+
+    Whole-corpus stages re-run when their code or inputs changed, an output
+    is missing, or an upstream stage re-ran since they last ran: in this
+    invocation, or in an earlier one (its completed_at differs from the one
+    recorded with this stage). Several of them rewrite their upstream's
+    files in place, so upstream runs cannot be seen through input hashes
+    alone.
+
+    Per-gate stages are fingerprinted gate by gate over code + shared inputs
+    + that gate's inputs, so a partial ``--gates`` run never marks other
+    gates as current. Upstream per-gate runs are only assumed to dirty the
+    same gates when ``predict`` is set (dry runs, where files have not been
+    rewritten yet); real runs rely on the content hashes.
+
+    Args:
+        stage: Stage to plan
+        record: Stored state for the stage from the last successful run
+        fp: Fingerprinter for the current tree
+        upstream_runs: Stages already run in this invocation, mapped to the
+            gates they rebuilt (None = whole corpus)
+        gates: Gates in scope for this invocation
+        force: Re-run regardless of fingerprints
+        predict: Treat upstream per-gate runs as changing those gates
+        upstream: completed_at of each ``after`` stage, as from
+            upstream_completions() (None = not checked)
+
+    Returns:
+        StagePlan with a reason (or None when the stage can be skipped)
+    """
+    ran_upstream = [name for name in stage.after if name in upstream_runs]
+    whole_upstream = [name for name in ran_upstream if upstream_runs[name] is None]
+
+    if not stage.per_gate:
+        reason = None
+        if force:
+            reason = "forced"
+        elif record is None:
+            reason = "never run"
+        elif record.get("code") != fp.combined(stage.code_paths):
+            reason = "code changed"
+        elif record.get("inputs") != fp.combined(stage.inputs):
+            reason = "inputs changed"
+        elif ran_upstream:
+            reason = f"upstream {ran_upstream[0]} re-ran"
+        elif upstream is not None and record.get("upstream", {}) != upstream:
+            recorded = record.get("upstream", {})
+            changed = [name for name in stage.after if recorded.get(name) != upstream.get(name)]
+            reason = f"upstream {changed[0]} re-ran since last run" if changed else "upstream stages changed"
+        else:
+            missing = [p for p in stage.outputs if not p.exists()]
+            if missing:
+                reason = f"output missing: {_rel(missing[0])}"
+        return StagePlan(stage, reason)
+
+    if force:
+        return StagePlan(stage, "forced", list(gates))
+    if whole_upstream and predict:
+        return StagePlan(stage, f"upstream {whole_upstream[0]} will re-run", list(gates))
+
+    upstream_gates = set()
+    if predict:
+        for name in ran_upstream:
+            upstream_gates.update(upstream_runs[name] or [])
+
+    stored_gates = (record or {}).get("gates", {})
+    dirty = [
+        gate for gate in gates
+        if gate in upstream_gates
+        or stored_gates.get(str(gate)) != gate_fingerprint(stage, gate, fp)
+        or any(not p.exists() for p in stage.gate_outputs(gate))
+    ]
+
+    if not dirty:
+        return StagePlan(stage, None, [])
+    reason = "never run" if record is None else f"{len(dirty)} gate(s) stale"
+    return StagePlan(stage, reason, dirty)
+
+
+def gate_fingerprint(stage: Stage, gate: int, fp: Fingerprinter) -> str:
+    """Fingerprint of everything a per-gate stage reads for one gate."""
+    return fp.combined(stage.code_paths + list(stage.inputs) + stage.gate_inputs(gate))
+
+
+def upstream_completions(stage: Stage, stage_records: Dict[str, Dict]) -> Dict[str, Optional[str]]:
+    """completed_at of each of the stage's ``after`` stages (None if never run)."""
+    return {name: (stage_records.get(name) or {}).get("completed_at") for name in stage.after}
+
+
+def record_stage(
+    stage: Stage,
+    plan: StagePlan,
+    record: Optional[Dict],
+    fp: Fingerprinter,
+    upstream: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict:
+    """
+    Build the state record for a stage after it ran successfully.
+
+    ``upstream`` (from upstream_completions()) is stored for whole-corpus
+    stages so a later upstream re-run marks them stale.
+    """
+    written = list(stage.outputs)
+    if stage.per_gate:
+        written += [p for gate in plan.gates for p in stage.gate_outputs(gate)]
+    fp.forget(written)
+
+    new_record = {"completed_at": datetime.now(timezone.utc).isoformat()}
+    if stage.per_gate:
+        gate_hashes = dict((record or {}).get("gates", {}))
+        for gate in plan.gates:
+            gate_hashes[str(gate)] = gate_fingerprint(stage, gate, fp)
+        new_record["gates"] = gate_hashes
+    else:
+        new_record["code"] = fp.combined(stage.code_paths)
+        new_record["inputs"] = fp.combined(stage.inputs)
+        if upstream is not None:
+            new_record["upstream"] = upstream
+    return new_record
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def select_stages(names: Optional[List[str]]) -> List[Stage]:
+    """Resolve stage names or numeric prefixes (e.g. "08a") to stages."""
+    if not names:
+        return list(STAGES)
+
+    selected = []
+    for name in names:
+        matches = [s for s in STAGES if s.name == name or s.name.split("-", 1)[0] == name]
+        if not matches:
+            raise ValueError(f"Unknown stage: {name}")
+        selected.extend(m for m in matches if m not in selected)
+    return [s for s in STAGES if s in selected]
+
+
+def run_stage(plan: StagePlan, jobs: int = 1) -> int:
+    """Run one stage script from the project root (scripts use repo-relative paths)."""
+    cmd = [sys.executable, str(plan.stage.script), *plan.stage.args, *plan.gate_args]
+    if plan.stage.parallel and jobs > 1:
+        cmd += ["--jobs", str(jobs)]
+    logger.info(f"▶ {plan.stage.name} ({plan.reason})")
+    logger.debug(f"  $ {' '.join(cmd)}")
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    return result.returncode
+
+
+def run_pipeline(
+    stages: List[Stage],
+    gates: List[int],
+    force: bool = False,
+    dry_run: bool = False,
+    state_file: Path = PIPELINE_STATE_FILE,
+    jobs: int = 1,
+) -> int:
+    """
+    Plan and run stages in order, persisting state after each success.
+
+    Returns:
+        0 on success, otherwise the exit code of the first failing stage
+    """
+    state = load_state(state_file)
+    fp = Fingerprinter(state["stat_cache"])
+    upstream_runs: Dict[str, Optional[List[int]]] = {}
+    ran, skipped = 0, 0
+
+    for stage in stages:
+        if not stage.script.exists():
+            logger.error(f"Stage script not found: {stage.script}")
+            return 1
+
+        record = state["stages"].get(stage.name)
+        upstream = upstream_completions(stage, state["stages"])
+        plan = plan_stage(stage, record, fp, upstream_runs, gates, force, predict=dry_run, upstream=upstream)
+
+        if not plan.will_run:
+            logger.info(f"✓ {stage.name}: up to date")
+            skipped += 1
+            continue
+
+        partial = stage.per_gate and plan.gates != ALL_GATES
+        upstream_runs[stage.name] = plan.gates if partial else None
+
+        if dry_run:
+            scope = f" gates {plan.gates}" if partial else ""
+            logger.info(f"• {stage.name}: would run ({plan.reason}){scope}")
+            ran += 1
+            continue
+
+        returncode = run_stage(plan, jobs)
+        if returncode != 0:
+            logger.error(f"✗ {stage.name} failed with exit code {returncode}")
+            save_state(state, state_file)
+            return returncode
+
+        state["stages"][stage.name] = record_stage(stage, plan, record, fp, upstream)
+        save_state(state, state_file)
+        ran += 1
+
+    if not dry_run:
+        save_state(state, state_file)
+
+    logger.info("=" * 60)
+    logger.info(f"Stages {'to run' if dry_run else 'run'}: {ran}, up to date: {skipped}")
+    logger.info("=" * 60)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental lore-research pipeline runner")
+    parser.add_argument("--stages", nargs="+", help="Stage names or prefixes to consider (default: all)")
+    parser.add_argument("--gates", type=parse_gate_spec, default=ALL_GATES,
+                        help="Restrict per-gate stages to these gates, e.g. 1,5,10-12")
+    parser.add_argument("--force", action="store_true", help="Re-run selected stages even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Show which stages would run")
+    parser.add_argument("--list", action="store_true", help="List registered stages and exit")
+    parser.add_argument("--jobs", type=parse_jobs, default=1,
+                        help="Worker processes for stages that support --jobs (0 = one per CPU)")
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            kind = "per-gate" if stage.per_gate else "corpus"
+            after = f" (after {', '.join(stage.after)})" if stage.after else ""
+            print(f"{stage.name:40s} {kind}{after}")
+        return 0
+
+    try:
+        stages = select_stages(args.stages)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    return run_pipeline(stages, args.gates, force=args.force, dry_run=args.dry_run, jobs=args.jobs)
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,147 @@
+"""
+Content-addressed, size-bounded disk cache for LLM responses.
+
+Entries are keyed on a SHA-256 of (model, temperature, system prompt, user
+prompt), so a rerun of 08b only pays for prompts whose rubric, evidence,
+model or temperature actually changed. Values are the validated JSON
+payloads (e.g. StarMapOutput.model_dump()), one file per entry under
+``<cache_dir>/<key[:2]>/<key>.json``.
+
+The cache is bounded by total bytes on disk. Reads refresh an entry's mtime
+and eviction removes the least recently used entries first.
+
+Usage:
+    cache = ResponseCache(LLM_CACHE_DIR)
+    key = cache.key_for(model, temperature, system_prompt, user_prompt)
+    payload = cache.get(key)
+    if payload is None:
+        payload = call_llm(...)
+        cache.put(key, payload)
+    logger.info(cache.format_stats())
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from config import LLM_CACHE_DIR, LLM_CACHE_MAX_BYTES
+
+CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """Disk-backed LRU cache of JSON payloads keyed by prompt fingerprint."""
+
+    def __init__(self, directory: Path = LLM_CACHE_DIR, max_bytes: int = LLM_CACHE_MAX_BYTES):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            max_bytes: Evict least recently used entries above this total size
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._index: Optional[Dict[str, Tuple[float, int]]] = None  # key -> (last use, size)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+        """Fingerprint of everything that determines the model's answer."""
+        material = json.dumps(
+            [CACHE_VERSION, model, float(temperature), system_prompt, user_prompt],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> Dict[str, Tuple[float, int]]:
+        if self._index is None:
+            self._index = {}
+            if self.directory.exists():
+                for path in self.directory.glob("*/*.json"):
+                    stat = path.stat()
+                    self._index[path.stem] = (stat.st_mtime, stat.st_size)
+        return self._index
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload, or None on a miss (or unreadable entry)."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        # Mark as recently used (a concurrent evict may have removed it since the read)
+        try:
+            os.utime(path)
+            stat = path.stat()
+            self._load_index()[key] = (stat.st_mtime, stat.st_size)
+        except OSError:
+            self._load_index().pop(key, None)
+        self.hits += 1
+        return payload
+
+    def put(self, key: str, payload: Any) -> None:
+        """Store a payload and evict least recently used entries if over budget."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        stat = path.stat()
+        self._load_index()[key] = (stat.st_mtime, stat.st_size)
+        self.writes += 1
+        self._evict(keep=key)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        index = self._load_index()
+        total = sum(size for _, size in index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, (_, size) in sorted(index.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._path(key).unlink(missing_ok=True)
+            del index[key]
+            total -= size
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this process plus current on-disk size."""
+        lookups = self.hits + self.misses
+        index = self._load_index()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": len(index),
+            "bytes": sum(size for _, size in index.values()),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def format_stats(self) -> str:
+        stats = self.stats()
+        return (
+            f"Response cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.0%}), {stats['writes']} writes, "
+            f"{stats['evictions']} evictions, {stats['entries']} entries / {stats['bytes'] / 1024:.0f} KiB"
+        )
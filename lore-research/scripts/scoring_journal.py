@@ -0,0 +1,205 @@
+"""
+Append-only NDJSON journal of completed LLM scoring work (08b).
+
+One JSON object per line, appended as each gate.line finishes:
+
+    {"gate_line": "12.3", "status": "done", "prompt_hash": "<sha256>",
+     "output": ".../12-3.json", "latency_ms": 812, "prompt_tokens": 1490,
+     "completion_tokens": 402, "cached": false, "model": "gpt-4o-mini",
+     "pid": 4242, "ts": "2026-01-01T00:00:00+00:00"}
+
+The latest entry per gate.line wins. An entry counts as done only while its
+prompt hash still matches the current prompt and its output file exists, so
+editing evidence or the rubric re-queues exactly the affected lines.
+
+Parallel workers on one machine share the journal safely: appends are single
+O_APPEND writes under an advisory lock, and each worker claims a gate.line
+with an exclusive lock file before scoring it. Claims left behind by a dead
+process are reclaimed under a flock on the claims dir.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND alone
+    fcntl = None
+
+
+class ScoringJournal:
+    """Append-only record of scored gate.lines with per-line claims."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize journal.
+
+        Args:
+            path: NDJSON journal file (claims live in a sibling ``.claims`` dir)
+        """
+        self.path = Path(path)
+        self.claims_dir = self.path.with_name(self.path.name + ".claims")
+        self._claimed: List[str] = []
+        self.entries: Dict[str, Dict] = {}
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read(self) -> Iterator[Dict]:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash; later appends start on a new line
+                    continue
+
+    def reload(self) -> None:
+        """Re-read the journal (latest entry per gate.line wins)."""
+        self.entries = {}
+        for entry in self._read():
+            if "gate_line" in entry:
+                self.entries[entry["gate_line"]] = entry
+
+    def is_done(self, gate_line: str, prompt_hash: str) -> bool:
+        """True if gate.line was scored for this exact prompt and its output still exists."""
+        entry = self.entries.get(gate_line)
+        return (
+            entry is not None
+            and entry.get("status") == "done"
+            and entry.get("prompt_hash") == prompt_hash
+            and Path(entry.get("output", "")).exists()
+        )
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, gate_line: str, status: str, **fields) -> Dict:
+        """Append one entry and return it."""
+        entry = {"gate_line": gate_line, "status": status, **fields}
+        entry.setdefault("pid", os.getpid())
+        entry.setdefault("ts", datetime.now(timezone.utc).isoformat())
+        data = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            # Terminate a torn line left by a crashed writer before appending
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b"\n":
+                data = b"\n" + data
+            os.write(fd, data)
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        self.entries[gate_line] = entry
+        return entry
+
+    # ------------------------------------------------------------------
+    # Claims (parallel workers)
+    # ------------------------------------------------------------------
+
+    def _claim_path(self, gate_line: str) -> Path:
+        return self.claims_dir / f"{gate_line}.lock"
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        if pid <= 0:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _claim_owner(self, path: Path) -> int:
+        try:
+            return int(path.read_text().strip())
+        except (OSError, ValueError):
+            return 0
+
+    def _take_over(self, path: Path, tmp_path: Path) -> bool:
+        """
+        Replace a stale claim with ours, under an exclusive flock on the
+        claims dir so two workers cannot both see the same dead owner and
+        one delete the other's fresh claim. The owner is re-read under the
+        lock. Without fcntl (Windows) the takeover is best effort.
+        """
+        lock_fd = os.open(self.claims_dir / ".takeover.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            owner = self._claim_owner(path)
+            if owner != os.getpid() and self._pid_alive(owner):
+                return False
+            path.unlink(missing_ok=True)
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                # A live worker claimed it between unlink and link (fast path)
+                return False
+            return True
+        finally:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def claim(self, gate_line: str) -> bool:
+        """
+        Claim a gate.line for this process.
+
+        Returns:
+            False if another live process holds the claim
+        """
+        self.claims_dir.mkdir(parents=True, exist_ok=True)
+        path = self._claim_path(gate_line)
+        tmp_path = self.claims_dir / f".{gate_line}.{os.getpid()}.tmp"
+        tmp_path.write_text(str(os.getpid()))
+        try:
+            try:
+                # link() is atomic and fails if the claim exists, so the
+                # claim file never appears without its owner's pid
+                os.link(tmp_path, path)
+            except FileExistsError:
+                owner = self._claim_owner(path)
+                if owner != os.getpid() and self._pid_alive(owner):
+                    return False
+                # Stale claim from a dead worker (or our own): take it over
+                if not self._take_over(path, tmp_path):
+                    return False
+            self._claimed.append(gate_line)
+            return True
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def release(self, gate_line: str) -> None:
+        self._claim_path(gate_line).unlink(missing_ok=True)
+        if gate_line in self._claimed:
+            self._claimed.remove(gate_line)
+
+    def release_all(self) -> None:
+        for gate_line in list(self._claimed):
+            self.release(gate_line)
+
+    def summary(self) -> Dict[str, int]:
+        statuses: Dict[str, int] = {}
+        for entry in self.entries.values():
+            statuses[entry.get("status", "?")] = statuses.get(entry.get("status", "?"), 0) + 1
+        return statuses
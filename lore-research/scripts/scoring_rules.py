@@ -0,0 +1,124 @@
+"""
+Shared star-system scoring invariants (s3-data/pipeline_rules/scoring_invariants.v1.json).
+
+One declarative file holds the canonical system names, the pairwise
+exclusions, the Orion faction cap, the v4.2 weight standards and the
+sparsity / core-shadow thresholds. load_scoring_rules() parses and checks
+it once per process and compiles the rules into plain tuples (the layout
+the validators unpack) and predicate closures:
+
+    rules = load_scoring_rules()
+    for (sys_a, sys_b, threshold_a, max_b), violated in zip(rules.pairwise_exclusions,
+                                                          rules.exclusion_predicates):
+        if violated(weights.get(sys_a, 0.0), weights.get(sys_b, 0.0)): ...
+    rules.weight_status(0.55, "core")   # ("under", "Core behavior but weight=0.55 ...")
+
+Used by GPT-5/scripts/validate_gate_outputs.py, fuzz_invariants.py (and
+through it weight_tensor.py), 08c-post-calibrate.py and
+18-audit-weight-calibration.py.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import SCORING_RULES_FILE
+
+ExclusionRule = Tuple[str, str, float, Optional[float]]
+
+
+def _compile_exclusion(threshold_a: float, max_b: Optional[float]) -> Callable[[float, float], bool]:
+    """(weight_a, weight_b) -> violated, with the comparison chosen once."""
+    limit = 0.0 if max_b is None else max_b
+    if threshold_a > 0:
+        return lambda weight_a, weight_b: weight_a >= threshold_a and weight_b > limit
+    return lambda weight_a, weight_b: weight_a > threshold_a and weight_b > limit
+
+
+class ScoringRules:
+    """Parsed and compiled scoring_invariants file."""
+
+    def __init__(self, data: Dict[str, Any], source: Optional[Path] = None):
+        """
+        Compile a parsed rules file.
+
+        Raises:
+            ValueError: If a rule names a system outside canonical_systems
+                or a required section is missing
+        """
+        self.source = source
+        self.version = data.get("version")
+        try:
+            self.canonical_systems: List[str] = list(data["canonical_systems"])
+            self.pairwise_exclusions: List[ExclusionRule] = [
+                (rule["system"], rule["excludes"], rule["threshold"], rule["max"])
+                for rule in data["pairwise_exclusions"]["rules"]
+            ]
+            light, dark = data["orion_faction"]["systems"]
+            self.orion_faction_rule: Tuple[str, str, float] = (light, dark, data["orion_faction"]["max"])
+            self.weight_standards: Dict[str, Dict[str, Any]] = data["weight_standards"]
+            self.high_weight: float = data["sparsity"]["high_weight"]
+            self.max_high_weight: int = data["sparsity"]["max_high_weight"]
+            self.conflict_min_weight: float = data["core_shadow_conflict"]["min_weight"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Malformed scoring rules {source or ''}: {e!r}") from e
+
+        named = {name for rule in self.pairwise_exclusions for name in rule[:2]} | {light, dark}
+        unknown = sorted(named - set(self.canonical_systems))
+        if unknown:
+            raise ValueError(f"Scoring rules name non-canonical systems: {', '.join(unknown)}")
+
+        self.exclusion_predicates = [
+            _compile_exclusion(threshold_a, max_b) for _, _, threshold_a, max_b in self.pairwise_exclusions
+        ]
+        self.weight_status = self._compile_weight_status()
+
+    def _compile_weight_status(self) -> Callable[[float, str], Tuple[str, str]]:
+        """weight, alignment_type -> (status, issue) against the weight standards."""
+        core = self.weight_standards["core"]
+        shadow = self.weight_standards["shadow"]
+        none = self.weight_standards["none"]
+        core_range = f"{core['min']}-{core['max']}"
+        shadow_range = f"{shadow['min']}-{shadow['max']}"
+
+        def weight_status(weight: float, alignment_type: str) -> Tuple[str, str]:
+            if alignment_type == "core":
+                if weight >= core["min"]:
+                    return "ok", ""
+                elif weight >= shadow["min"]:
+                    return "under", f"Core behavior but weight={weight:.2f} (should be {core_range})"
+                else:
+                    return "under", f"Core behavior but weight={weight:.2f} (severely under-weighted)"
+
+            elif alignment_type == "shadow" or alignment_type == "secondary":
+                if shadow["min"] <= weight <= shadow["max"]:
+                    return "ok", ""
+                elif weight < shadow["min"]:
+                    return "under", f"Shadow behavior but weight={weight:.2f} (should be {shadow_range})"
+                else:
+                    return "over", f"Shadow behavior but weight={weight:.2f} (should be {shadow_range})"
+
+            elif alignment_type == "none":
+                if weight <= none["max"]:
+                    return "ok", ""
+                else:
+                    return "over", f"Non-match but weight={weight:.2f} (should be ~0)"
+
+            return "unknown", f"Unknown alignment_type: {alignment_type}"
+
+        return weight_status
+
+
+@lru_cache(maxsize=None)
+def load_scoring_rules(path: Optional[Path] = None) -> ScoringRules:
+    """
+    Load and compile the scoring rules file (once per path per process).
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If it is not valid JSON or fails ScoringRules checks
+    """
+    path = Path(path or SCORING_RULES_FILE)
+    with open(path, "r", encoding="utf-8") as f:
+        return ScoringRules(json.load(f), path)
@@ -0,0 +1,294 @@
+"""
+Streaming readers for the Line Companion source formats.
+
+Every reader yields the source text as LF-free lines, interleaved with
+PageMark objects at each page/leaf boundary, and keeps memory bounded:
+XML sources are read with ``iterparse`` and each page is cleared once
+emitted, EPUB sources are read one spine document at a time from the zip.
+The output feeds StreamingNormalizer directly; NormalizedTextSink turns the
+marks into exact page offsets in the normalized text.
+
+Formats:
+    *.txt              plain OCR text (no page marks)
+    *.gz               gzipped plain text (no page marks)
+    *_djvu.xml         DjVuXML: OBJECT per leaf, PARAGRAPH/LINE/WORD text
+    *_abbyy.gz / .xml  ABBYY FineReader XML: page/par/line/charParams
+    *.epub             XHTML spine documents; epub:type="pagebreak" marks
+
+scandata.xml holds scan metadata only; ``read_scandata_page_numbers`` uses
+it to label leaves with printed page numbers.
+
+Usage:
+    page_numbers = read_scandata_page_numbers(scandata_path)
+    for item in iter_source_lines(path, page_numbers):
+        ...  # str line or PageMark
+"""
+
+import gzip
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from stream_normalizer import iter_text_lines
+
+
+class PageMark(NamedTuple):
+    """Start of a source page; ``column`` is the offset into the line it starts in."""
+
+    leaf: Optional[int]
+    page: Optional[str] = None
+    column: int = 0
+
+
+SourceItem = Union[str, PageMark]
+
+_LEAF_IN_NAME = re.compile(r"_(\d+)\.djvu$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _labelled(mark: PageMark, page_numbers: Optional[Dict[int, str]]) -> PageMark:
+    if page_numbers and mark.page is None and mark.leaf in page_numbers:
+        return mark._replace(page=page_numbers[mark.leaf])
+    return mark
+
+
+# ----------------------------------------------------------------------------
+# Scandata (leaf -> printed page number)
+# ----------------------------------------------------------------------------
+
+def read_scandata_page_numbers(path: Path) -> Dict[int, str]:
+    """
+    Map leaf number -> printed page number from an Internet Archive scandata.xml.
+
+    Returns:
+        Dictionary (empty if the scan has no pageNumber entries)
+    """
+    page_numbers = {}
+    for _, elem in ET.iterparse(str(path), events=("end",)):
+        if _local(elem.tag) != "page":
+            continue
+        leaf = elem.get("leafNum")
+        number = next((c.text for c in elem if _local(c.tag) == "pageNumber"), None)
+        if leaf is not None and number and number.strip():
+            page_numbers[int(leaf)] = number.strip()
+        elem.clear()
+    return page_numbers
+
+
+# ----------------------------------------------------------------------------
+# DjVuXML
+# ----------------------------------------------------------------------------
+
+def iter_djvu_xml(path: Path, page_numbers: Optional[Dict[int, str]] = None) -> Iterator[SourceItem]:
+    """
+    Stream a DjVuXML file (``*_djvu.xml``).
+
+    Each OBJECT is one leaf; its number comes from the ``usemap`` file name
+    (``..._0042.djvu``) or, failing that, its position in the file. Each
+    LINE becomes one output line and paragraphs are separated by a blank line.
+    """
+    leaf_index = 0
+    words: List[str] = []
+    for event, elem in ET.iterparse(str(path), events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag == "OBJECT":
+                match = _LEAF_IN_NAME.search(elem.get("usemap", ""))
+                leaf = int(match.group(1)) if match else leaf_index
+                leaf_index += 1
+                yield _labelled(PageMark(leaf), page_numbers)
+            continue
+
+        if tag == "WORD":
+            if elem.text and elem.text.strip():
+                words.append(elem.text.strip())
+        elif tag == "LINE":
+            if words:
+                yield " ".join(words)
+            words = []
+        elif tag == "PARAGRAPH":
+            yield ""
+        elif tag == "OBJECT":
+            elem.clear()
+
+
+# ----------------------------------------------------------------------------
+# ABBYY FineReader XML
+# ----------------------------------------------------------------------------
+
+def iter_abbyy(path: Path, page_numbers: Optional[Dict[int, str]] = None) -> Iterator[SourceItem]:
+    """
+    Stream ABBYY FineReader XML (``*_abbyy.gz`` or uncompressed ``.xml``).
+
+    ABBYY lists every scanned leaf in order, so the n-th page is leaf n.
+    Line text is the concatenation of its charParams (or of its formatting
+    runs for files exported without per-character data).
+    """
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rb") as f:
+        leaf = 0
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            tag = _local(elem.tag)
+            if event == "start":
+                if tag == "page":
+                    yield _labelled(PageMark(leaf), page_numbers)
+                    leaf += 1
+                continue
+
+            if tag == "line":
+                chars = [c.text or "" for c in elem.iter() if _local(c.tag) == "charParams"]
+                if not chars:
+                    chars = [f.text or "" for f in elem.iter() if _local(f.tag) == "formatting"]
+                text = "".join(chars).strip()
+                if text:
+                    yield text
+                elem.clear()
+            elif tag == "par":
+                yield ""
+                elem.clear()
+            elif tag == "page":
+                elem.clear()
+
+
+# ----------------------------------------------------------------------------
+# EPUB
+# ----------------------------------------------------------------------------
+
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "blockquote", "li", "tr", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6", "dt", "dd", "figcaption", "table",
+}
+_SKIP_TAGS = {"head", "script", "style", "title"}
+
+
+class _XHTMLTextExtractor(HTMLParser):
+    """Collects paragraphs (separated by blank lines) and page-break marks."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items: List[SourceItem] = []
+        self._text: List[str] = []
+        self._skip_depth = 0
+
+    def _flush(self, paragraph_end: bool) -> None:
+        text = _WHITESPACE.sub(" ", "".join(self._text)).strip()
+        self._text = []
+        if text:
+            self.items.append(text)
+            if paragraph_end:
+                self.items.append("")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        attributes = dict(attrs)
+        if attributes.get("epub:type") == "pagebreak" or attributes.get("role") == "doc-pagebreak":
+            self._flush(paragraph_end=False)
+            label = attributes.get("title") or attributes.get("aria-label") or attributes.get("id")
+            self.items.append(PageMark(None, label))
+        elif tag in _BLOCK_TAGS:
+            self._flush(paragraph_end=True)
+        elif tag == "br":
+            self._flush(paragraph_end=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in _SKIP_TAGS:
+            self._skip_depth -= 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in _BLOCK_TAGS:
+            self._flush(paragraph_end=True)
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush(paragraph_end=True)
+
+
+def _epub_spine(archive: zipfile.ZipFile) -> List[str]:
+    """Archive paths of the EPUB spine documents, in reading order."""
+    container = ET.fromstring(archive.read("META-INF/container.xml"))
+    rootfile = next(e for e in container.iter() if _local(e.tag) == "rootfile")
+    opf_path = rootfile.get("full-path")
+    opf = ET.fromstring(archive.read(opf_path))
+    base = posixpath.dirname(opf_path)
+
+    manifest = {
+        item.get("id"): posixpath.normpath(posixpath.join(base, item.get("href")))
+        for item in opf.iter()
+        if _local(item.tag) == "item"
+    }
+    return [
+        manifest[ref.get("idref")]
+        for ref in opf.iter()
+        if _local(ref.tag) == "itemref" and ref.get("idref") in manifest and ref.get("linear", "yes") != "no"
+    ]
+
+
+def iter_epub(path: Path, page_numbers: Optional[Dict[int, str]] = None) -> Iterator[SourceItem]:
+    """
+    Stream an EPUB's spine documents as paragraphs.
+
+    EPUBs have no scan leaves; page marks come from the publisher's page-list
+    (``epub:type="pagebreak"`` / ``role="doc-pagebreak"``) with ``leaf=None``.
+    """
+    with zipfile.ZipFile(path) as archive:
+        for doc_path in _epub_spine(archive):
+            parser = _XHTMLTextExtractor()
+            parser.feed(archive.read(doc_path).decode("utf-8", errors="replace"))
+            parser.close()
+            yield from parser.items
+
+
+# ----------------------------------------------------------------------------
+# Dispatch
+# ----------------------------------------------------------------------------
+
+def _iter_plain_text(path: Path) -> Iterator[str]:
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        yield from iter_text_lines(f)
+
+
+def iter_source_lines(path: Path, page_numbers: Optional[Dict[int, str]] = None) -> Iterator[SourceItem]:
+    """
+    Stream any Line Companion source as lines and page marks.
+
+    Args:
+        path: Source file
+        page_numbers: Optional leaf -> printed page number (from scandata)
+
+    Returns:
+        Iterator over str lines and PageMark objects
+
+    Raises:
+        ValueError: If the file format is not supported or holds no text
+    """
+    name = path.name.lower()
+    if name.endswith("scandata.xml"):
+        raise ValueError(f"{path.name} holds scan metadata only (no text); use it for page numbers")
+    if "abbyy" in name and name.endswith((".gz", ".xml")):
+        return iter_abbyy(path, page_numbers)
+    if name.endswith(".xml"):
+        return iter_djvu_xml(path, page_numbers)
+    if name.endswith(".epub"):
+        return iter_epub(path, page_numbers)
+    if name.endswith((".txt", ".gz")):
+        return _iter_plain_text(path)
+    raise ValueError(f"Unsupported file format: {path.suffix}")
@@ -0,0 +1,229 @@
+"""
+Zero-copy access to large UTF-8 text files.
+
+``utils.read_text_file`` decodes a whole book into one ``str``. SourceText
+memory-maps the file instead. Regexes run directly on the mapped bytes,
+only matched spans are decoded, and a newline index built once answers
+line-number and line-span lookups with a bisect:
+
+    with SourceText(LEGGE_NORMALIZED) as source:
+        for match in source.finditer(HEADER_RE):       # bytes regex
+            title = source.decode(*match.span(1))
+            line = source.line_number(match.start())
+
+All offsets are UTF-8 byte offsets into the file. ``char_offset`` converts
+one to a character offset (what ``str`` indexing of the decoded file would
+use) without decoding the prefix; ``byte_offset`` goes the other way.
+"""
+
+import mmap
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, islice
+from pathlib import Path
+from typing import Iterator, Optional, Pattern, Tuple, Union
+
+Span = Tuple[int, int]
+
+# Bytes that are not UTF-8 continuation bytes (0x80-0xBF); deleting them
+# leaves one byte per extra byte of a multi-byte character
+_NON_CONTINUATION = bytes(range(0x80)) + bytes(range(0xC0, 0x100))
+
+# Newline index is built in chunks of this size to bound the copies made
+_INDEX_CHUNK = 1 << 23
+
+_CHAR_CLASS_RE = re.compile(r"\[(\^?)((?:\\.|[^\]\\])+)\]")
+
+
+def compile_bytes(pattern: Union[str, bytes, Pattern], flags: int = 0) -> Pattern:
+    """
+    Compile a regex for use on a SourceText buffer.
+
+    Str patterns are encoded as UTF-8. A character class that lists
+    non-ASCII characters (e.g. ``[-–—]``) would otherwise match their
+    individual bytes, so it is rewritten as an alternation of the encoded
+    characters. Note that in bytes mode ``\\s``, ``\\d``, ``\\w`` and
+    IGNORECASE only cover ASCII.
+
+    Raises:
+        ValueError: For negated classes or ranges with non-ASCII members
+    """
+    if isinstance(pattern, re.Pattern):
+        if isinstance(pattern.pattern, bytes):
+            return pattern
+        flags |= pattern.flags & ~re.UNICODE
+        pattern = pattern.pattern
+    if isinstance(pattern, bytes):
+        return re.compile(pattern, flags)
+
+    def rewrite(match):
+        negated, body = match.groups()
+        if body.isascii():
+            return match.group(0)
+        if negated or re.search(r"(?<=[^\x00-\x7f])-(?=.)|(?<=.)-(?=[^\x00-\x7f])", body):
+            raise ValueError(f"Cannot match character class {match.group(0)!r} on UTF-8 bytes")
+        ascii_part = "".join(c for c in body if c.isascii())
+        branches = [re.escape(c) for c in dict.fromkeys(c for c in body if not c.isascii())]
+        if ascii_part:
+            branches.insert(0, f"[{ascii_part}]")
+        return f"(?:{'|'.join(branches)})"
+
+    return re.compile(_CHAR_CLASS_RE.sub(rewrite, pattern).encode("utf-8"), flags)
+
+
+class SourceText:
+    """A UTF-8 text file mapped read-only, searched as bytes and decoded by span."""
+
+    def __init__(self, path: Path, data: Optional[bytes] = None):
+        """
+        Open file.
+
+        Args:
+            path: Text file to map
+            data: Use these bytes instead of mapping ``path`` (see from_text)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        self.path = Path(path)
+        self._file = None
+        if data is not None:
+            self._buffer = data
+        else:
+            if not self.path.exists():
+                raise FileNotFoundError(f"File not found: {self.path}")
+            self._file = open(self.path, "rb")
+            size = self.path.stat().st_size
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._newlines: Optional[array] = None
+        self._char_cursor = (0, 0)
+        self._byte_cursor = (0, 0)
+
+    @classmethod
+    def from_text(cls, text: str, name: str = "<memory>") -> "SourceText":
+        """In-memory SourceText over ``text`` (tests, small inputs)."""
+        return cls(Path(name), text.encode("utf-8"))
+
+    def __enter__(self) -> "SourceText":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def buffer(self):
+        """The raw bytes-like buffer (mmap or bytes)."""
+        return self._buffer
+
+    # ------------------------------------------------------------------
+    # Search and decode
+    # ------------------------------------------------------------------
+
+    def finditer(self, pattern, start: int = 0, end: Optional[int] = None) -> Iterator[re.Match]:
+        """Iterate matches of a bytes regex (see compile_bytes) over the buffer."""
+        end = len(self._buffer) if end is None else end
+        return compile_bytes(pattern).finditer(self._buffer, start, end)
+
+    def search(self, pattern, start: int = 0, end: Optional[int] = None) -> Optional[re.Match]:
+        end = len(self._buffer) if end is None else end
+        return compile_bytes(pattern).search(self._buffer, start, end)
+
+    def decode(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Decode the bytes in [start, end) only."""
+        end = len(self._buffer) if end is None else end
+        return self._buffer[start:end].decode("utf-8")
+
+    def read_text(self) -> str:
+        """Decode the whole file (what read_text_file would return for LF files)."""
+        return self.decode()
+
+    def char_offset(self, byte_offset: int) -> int:
+        """
+        Character offset of ``byte_offset`` (which must fall on a character
+        boundary). Counts continuation bytes from the last lookup when
+        offsets are requested in increasing order.
+        """
+        base_byte, base_char = self._char_cursor
+        if byte_offset < base_byte:
+            base_byte, base_char = 0, 0
+        extra = len(self._buffer[base_byte:byte_offset].translate(None, _NON_CONTINUATION))
+        self._char_cursor = (byte_offset, base_char + byte_offset - base_byte - extra)
+        return self._char_cursor[1]
+
+    def char_count(self) -> int:
+        return self.char_offset(len(self._buffer))
+
+    def byte_offset(self, char_offset: int) -> int:
+        """
+        Byte offset of the character at ``char_offset`` (the inverse of
+        ``char_offset``). Decodes only the bytes since the last lookup when
+        offsets are requested in increasing order.
+        """
+        base_byte, base_char = self._byte_cursor
+        if char_offset < base_char:
+            base_byte, base_char = 0, 0
+        count = char_offset - base_char
+        # count characters take at most 4 * count bytes; a character cut at
+        # the end of the slice is dropped and lies past the ones we need
+        chunk = self._buffer[base_byte:base_byte + 4 * count].decode("utf-8", errors="ignore")
+        self._byte_cursor = (base_byte + len(chunk[:count].encode("utf-8")), char_offset)
+        return self._byte_cursor[0]
+
+    # ------------------------------------------------------------------
+    # Lines
+    # ------------------------------------------------------------------
+
+    @property
+    def newlines(self) -> array:
+        """Byte offsets of every "\\n" in the file (built on first use)."""
+        if self._newlines is None:
+            self._newlines = array("q")
+            for base in range(0, len(self._buffer), _INDEX_CHUNK):
+                parts = self._buffer[base:base + _INDEX_CHUNK].split(b"\n")
+                ends = accumulate((len(p) + 1 for p in parts[:-1]), initial=base - 1)
+                self._newlines.extend(islice(ends, 1, None))
+        return self._newlines
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counted like ``text.count("\\n") + 1``."""
+        return len(self.newlines) + 1
+
+    def line_number(self, byte_offset: int) -> int:
+        """1-based number of the line containing ``byte_offset``."""
+        return bisect_left(self.newlines, byte_offset) + 1
+
+    def line_span(self, line_number: int) -> Span:
+        """Byte span of a 1-based line, without its newline."""
+        newlines = self.newlines
+        if not 1 <= line_number <= len(newlines) + 1:
+            raise IndexError(f"line {line_number} out of range (1-{len(newlines) + 1})")
+        start = newlines[line_number - 2] + 1 if line_number > 1 else 0
+        end = newlines[line_number - 1] if line_number <= len(newlines) else len(self._buffer)
+        return start, end
+
+    def line_end(self, byte_offset: int) -> int:
+        """Byte offset of the end of the line containing ``byte_offset``."""
+        end = self._buffer.find(b"\n", byte_offset)
+        return len(self._buffer) if end == -1 else end
+
+    def line(self, line_number: int) -> str:
+        return self.decode(*self.line_span(line_number))
+
+    def iter_lines(self) -> Iterator[str]:
+        """Decode one line at a time (split on "\\n" only, like ``str.split("\\n")``)."""
+        start = 0
+        for newline in self.newlines:
+            yield self.decode(start, newline)
+            start = newline + 1
+        yield self.decode(start)
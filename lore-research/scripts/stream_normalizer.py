@@ -0,0 +1,283 @@
+"""
+Streaming, single-pass OCR text normalizer.
+
+Applies the Stage 1 normalization rules (line endings, OCR fixes, blank-line
+collapsing, mid-sentence joins) as a chain of line generators, so a source of
+any size is normalized with constant memory and written out incrementally.
+Output is byte-identical to applying the four rules to the whole text in
+sequence:
+
+    text.replace("\r\n", "\n").replace("\r", "\n")
+    <OCR fixes, one leftmost-longest scan (ocr_fixes.OCRFixEngine)>
+    re.sub(r"\n{3,}", "\n" * (max_blank + 1), text)
+    <join line i with line i+1 when i is unfinished and i+1 continues it>
+
+Besides text lines, the line iterator may carry page marks (any non-str
+object with a ``column`` field, see source_readers.PageMark). Marks pass
+through every rule without affecting the text and are re-anchored to the
+output line where their page begins, so NormalizedTextSink can record exact
+page offsets in the normalized text.
+
+Used by 01-normalize-line-companion.py and 02-normalize-legge.py.
+
+Usage:
+    normalizer = StreamingNormalizer(OCR_FIX_DICT, join_blockers=r"^(Gate|Line)")
+    with open(src, encoding="utf-8") as f_in, open(dst, "w", encoding="utf-8") as f_out:
+        sink = NormalizedTextSink(f_out)
+        sink.consume(normalizer.normalize_lines(iter_text_lines(f_in)))
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from config import MAX_BLANK_LINES, MAX_LINE_LENGTH
+from ocr_fixes import OCRFixEngine
+
+_END = object()
+
+
+def iter_text_lines(stream: TextIO) -> Iterator[str]:
+    """
+    Yield the lines of a text stream without their newlines.
+
+    Matches ``text.split("\\n")``: a trailing newline yields a final empty
+    line and an empty stream yields one empty line. Open files with the
+    default universal-newline mode so CRLF/CR endings arrive as LF.
+    """
+    ended_with_newline = True
+    for raw in stream:
+        if raw.endswith("\n"):
+            yield raw[:-1]
+            ended_with_newline = True
+        else:
+            yield raw
+            ended_with_newline = False
+    if ended_with_newline:
+        yield ""
+
+
+class StreamingNormalizer:
+    """All normalization rules applied in one pass over a line iterator."""
+
+    def __init__(
+        self,
+        ocr_fix_dict: Dict[str, str],
+        max_blank: int = MAX_BLANK_LINES,
+        join_blockers: str = r"^(Gate|Line|HEXAGRAM|Exaltation|Detriment)",
+    ):
+        """
+        Initialize normalizer.
+
+        Args:
+            ocr_fix_dict: OCR error -> fix replacements (see ocr_fixes)
+            max_blank: Blank lines kept where 2+ consecutive blank lines occur
+            join_blockers: Regex; a next line matching it is never joined
+
+        Raises:
+            ValueError: If an OCR fix pattern spans a line break
+        """
+        for error in ocr_fix_dict:
+            if "\n" in error or "\r" in error:
+                raise ValueError(f"OCR fix pattern spans lines: {error!r}")
+        self.ocr_fix_dict = ocr_fix_dict
+        self.ocr_fixer = OCRFixEngine(ocr_fix_dict)
+        self.max_blank = max_blank
+        self._sentence_end = re.compile(r"[.!?:]\s*$")
+        self._continuation_start = re.compile(r"^[A-Z0-9]")
+        self._join_blocker = re.compile(join_blockers)
+
+    def normalize(self, text: str) -> str:
+        """Normalize a whole string (convenience wrapper around normalize_lines)."""
+        lines = iter_text_lines(io.StringIO(text, newline=None))
+        return "\n".join(self.normalize_lines(lines))
+
+    def normalize_lines(self, lines: Iterable[Any]) -> Iterator[Any]:
+        """Normalize a stream of LF-split lines (and page marks), yielding output lines and marks."""
+        return self._join_mid_sentence_newlines(self._collapse_blank_lines(self._apply_ocr_fixes(lines)))
+
+    def _apply_ocr_fixes(self, lines: Iterable[str]) -> Iterator[str]:
+        apply = self.ocr_fixer.apply
+        for line in lines:
+            if not isinstance(line, str):
+                yield line
+                continue
+            line = apply(line)
+            if "\n" in line:
+                # A fix introduced a line break; later rules see the split lines
+                yield from line.split("\n")
+            else:
+                yield line
+
+    def _collapsed_blank_count(self, blanks: int, at_start: bool, at_end: bool) -> int:
+        # A run of blank lines corresponds to a run of newline characters in
+        # the joined text; collapse that run exactly as re.sub(r"\n{3,}") would.
+        edges = int(at_start) + int(at_end)
+        newlines = blanks + 1 - edges
+        if newlines >= 3:
+            newlines = self.max_blank + 1
+        return newlines - 1 + edges
+
+    def _collapse_blank_lines(self, lines: Iterable[Any]) -> Iterator[Any]:
+        blanks = 0
+        seen_content = False
+        marks = []  # held back so they never split a blank run
+        for line in lines:
+            if not isinstance(line, str):
+                marks.append(line)
+                continue
+            if line == "":
+                blanks += 1
+                continue
+            if blanks:
+                yield from [""] * self._collapsed_blank_count(blanks, not seen_content, False)
+                blanks = 0
+            yield from marks
+            marks = []
+            seen_content = True
+            yield line
+        if blanks:
+            yield from [""] * self._collapsed_blank_count(blanks, not seen_content, True)
+        yield from marks
+
+    def _should_join(self, line: str, next_line: str) -> bool:
+        return bool(
+            next_line
+            and not self._sentence_end.search(line)
+            and not self._continuation_start.match(next_line)
+            and not self._join_blocker.match(next_line)
+        )
+
+    def _join_mid_sentence_newlines(self, lines: Iterable[Any]) -> Iterator[Any]:
+        """
+        Join lines that were split mid-sentence (one line of lookahead).
+
+        Heuristic: If a line doesn't end with sentence-ending punctuation
+        and the next line doesn't start with a capital letter or number,
+        join them.
+        """
+        it = iter(lines)
+        current = next(it, _END)
+        while current is not _END:
+            if not isinstance(current, str):
+                yield current
+                current = next(it, _END)
+                continue
+
+            line = current.strip()
+            following = next(it, _END)
+            marks = []
+            while following is not _END and not isinstance(following, str):
+                marks.append(following)
+                following = next(it, _END)
+
+            if line and following is not _END:
+                next_line = following.strip()
+                if self._should_join(line, next_line):
+                    # Pages starting at the joined-in line now start mid-line
+                    for mark in marks:
+                        yield mark._replace(column=mark.column + len(line) + 1)
+                    yield line + " " + next_line
+                    current = next(it, _END)
+                    continue
+
+            yield line
+            yield from marks
+            current = following
+
+
+class NormalizedTextSink:
+    """
+    Writes normalized lines incrementally and collects the statistics the
+    stage scripts report (line/character counts, over-long lines, review
+    samples, page offsets), optionally splitting the output into fixed-size
+    chunk files.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        max_line_length: int = MAX_LINE_LENGTH,
+        sample_every: int = 100,
+        max_samples: int = 20,
+        chunk_size: Optional[int] = None,
+        chunk_path: Optional[Callable[[int], Path]] = None,
+    ):
+        """
+        Initialize sink.
+
+        Args:
+            out: Text stream receiving "\\n".join(lines)
+            max_line_length: Lines longer than this are reported as OCR issues
+            sample_every: Keep a preview of every Nth line
+            max_samples: Maximum previews kept
+            chunk_size: Lines per chunk file (None = no chunks)
+            chunk_path: chunk index (0-based) -> chunk file path
+        """
+        self.out = out
+        self.max_line_length = max_line_length
+        self.sample_every = sample_every
+        self.max_samples = max_samples
+        self.chunk_size = chunk_size
+        self.chunk_path = chunk_path
+        self.total_lines = 0
+        self.total_characters = 0
+        self.ocr_issues: List[str] = []
+        self.sample_offsets: List[Dict] = []
+        self.chunk_files: List[Path] = []
+        self.page_offsets: List[Dict] = []
+
+    @property
+    def newline_count(self) -> int:
+        return max(self.total_lines - 1, 0)
+
+    def _record_mark(self, mark: Any) -> None:
+        # The next line starts after the newline separating it from the last one
+        line_start = self.total_characters + (1 if self.total_lines else 0)
+        self.page_offsets.append({
+            "leaf": mark.leaf,
+            "page": mark.page,
+            "char_offset": line_start + mark.column,
+            "line_number": self.total_lines + 1,
+        })
+
+    def consume(self, lines: Iterable[Any]) -> None:
+        """Write output lines; page marks among them are recorded in ``page_offsets``."""
+        chunk_file = None
+        try:
+            for line in lines:
+                if not isinstance(line, str):
+                    self._record_mark(line)
+                    continue
+                index = self.total_lines
+                if index:
+                    self.out.write("\n")
+                self.out.write(line)
+                self.total_lines += 1
+                self.total_characters += len(line) + (1 if index else 0)
+
+                if len(line) > self.max_line_length:
+                    self.ocr_issues.append(f"Line {index + 1}: Excessive length ({len(line)} chars)")
+
+                if index % self.sample_every == 0 and len(self.sample_offsets) < self.max_samples:
+                    self.sample_offsets.append({
+                        "line_number": index + 1,
+                        "preview": line[:80] + "..." if len(line) > 80 else line,
+                    })
+
+                if self.chunk_size:
+                    position = index % self.chunk_size
+                    if position == 0:
+                        if chunk_file:
+                            chunk_file.close()
+                        path = self.chunk_path(index // self.chunk_size)
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        chunk_file = open(path, "w", encoding="utf-8")
+                        self.chunk_files.append(path)
+                    else:
+                        chunk_file.write("\n")
+                    chunk_file.write(line)
+        finally:
+            if chunk_file:
+                chunk_file.close()
@@ -26,7 +26,7 @@ def test_fanout_gates():
     print(f"✓ All {EXPECTED_GATES} gate files exist")
     
     # Check structure of each gate file
-    required_keys = {"gate", "title", "raw_text", "lines", "_meta"}
+    required_keys = {"gate", "title", "lines", "_meta"}
     required_meta_keys = {"source", "extracted_from", "created_at"}
     
     for gate_num in range(1, EXPECTED_GATES + 1):
@@ -52,11 +52,16 @@ def test_fanout_gates():
         assert gate_data["lines"] == {}, \
             f"Gate {gate_num} lines should be empty dict, got: {gate_data['lines']}"
         
-        # Check that raw_text exists and is non-empty
-        assert isinstance(gate_data["raw_text"], str), \
-            f"Gate {gate_num} raw_text should be string"
-        assert len(gate_data["raw_text"]) > 0, \
-            f"Gate {gate_num} has empty raw_text"
+        # Gate text is either copied (raw_text) or located by span in normalized.txt
+        if "raw_text" in gate_data:
+            assert isinstance(gate_data["raw_text"], str), \
+                f"Gate {gate_num} raw_text should be string"
+            assert len(gate_data["raw_text"]) > 0, \
+                f"Gate {gate_num} has empty raw_text"
+        else:
+            span = gate_data["_meta"].get("span")
+            assert span and span[1] > span[0], \
+                f"Gate {gate_num} has neither raw_text nor a non-empty _meta.span"
     
     print(f"✓ All {EXPECTED_GATES} gate files have correct structure")
     
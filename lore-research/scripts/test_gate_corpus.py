@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared GateCorpus loader.
+Run with: python test_gate_corpus.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gate_corpus import GateCorpus
+
+
+def test_memoized_loads_and_counters():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "01.json").write_text(json.dumps({"gate": 1}))
+        corpus = GateCorpus({"gate": [str(root / "{gate:02d}.json")]})
+
+        first = corpus.gate(1)
+        second = corpus.gate(1)
+        assert first == {"gate": 1}
+        assert first is second, "Second load should be served from memory"
+        assert corpus.stats()["misses"] == 1
+        assert corpus.stats()["hits"] == 1
+        assert corpus.gate(2) is None
+    print("✓ memoized loads and counters")
+
+
+def test_fallback_paths_share_one_parse():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "s3-05.json").write_text(json.dumps({"lines": []}))
+        corpus = GateCorpus({
+            "gate": [str(root / "s3-{gate:02d}.json")],
+            "line_companion": [str(root / "full-{gate}.json"), str(root / "s3-{gate:02d}.json")],
+        })
+
+        assert corpus.resolve("line_companion", 5) == root / "s3-05.json"
+        loaded = corpus.load_all(["gate", "line_companion"], [5])
+        assert loaded["gate"][5] is loaded["line_companion"][5]
+        assert corpus.stats()["files_parsed"] == 1
+
+        try:
+            corpus.require("line_companion", 6)
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError("require() should raise for a missing source")
+    print("✓ fallback paths share one parse")
+
+
+if __name__ == "__main__":
+    test_memoized_loads_and_counters()
+    test_fallback_paths_share_one_parse()
+    print("\n✅ All gate corpus tests passed!")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the array-backed scandata leaf table and offset -> leaf intervals (leaf_table.py).
+Run with: python test_leaf_table.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from leaf_table import LeafIntervals, LeafTable, load_leaf_table
+from offset_index import OffsetIndex
+from source_text import SourceText
+from utils import get_page_by_leaf_num
+
+SCANDATA = {
+    "bookData": {"dpi": 300, "leafCount": 4, "bookId": "linecompanion"},
+    "pages": {
+        "0": {"leafNum": 0, "pageType": "Title", "origWidth": 2400, "origHeight": 3300,
+              "cropBox": {"x": 10, "y": 20, "w": 2300, "h": 3200}, "bookStart": False},
+        "1": {"leafNum": 1, "pageType": "Normal", "origWidth": 2410, "origHeight": None,
+              "cropBox": {"x": 0, "y": 0, "w": 2410, "h": None}},
+        "2": {"leafNum": 2, "pageType": "Normal", "origWidth": 2400, "origHeight": 3300, "bookStart": True},
+        "10": {"leafNum": 10, "pageType": None, "origWidth": None, "origHeight": None},
+    },
+    "_meta": {"source": "s3-data/Line Companion_scandata.xml", "total_pages": 4},
+}
+
+
+def test_pages_match_scandata_json():
+    table = LeafTable.from_scandata(SCANDATA)
+    assert len(table) == 4 and table.dpi == 300 and table.leaf_count == 4
+    for key, page in SCANDATA["pages"].items():
+        assert table.page(int(key)) == page
+        assert get_page_by_leaf_num(table, int(key)) == get_page_by_leaf_num(SCANDATA, int(key))
+    assert table.page(3) is None and table.page(999) is None and table.page(-1) is None
+    print("✓ pages match scandata.json")
+
+
+def test_binary_sidecar_round_trip():
+    table = LeafTable.from_scandata(SCANDATA)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scandata.leaves.bin"
+        table.save(path)
+        loaded = LeafTable.load(path)
+        assert loaded.book_data == SCANDATA["bookData"] and loaded.meta == SCANDATA["_meta"]
+        assert [loaded.page(int(k)) for k in SCANDATA["pages"]] == list(SCANDATA["pages"].values())
+
+        path.write_bytes(path.read_bytes()[:-3])
+        try:
+            LeafTable.load(path)
+            assert False, "truncated sidecar must be rejected"
+        except ValueError:
+            pass
+        assert LeafTable.load(Path(tmp) / "missing.bin") is None
+    print("✓ binary sidecar round trip")
+
+
+def test_stale_sidecar_rebuilt_from_json():
+    with tempfile.TemporaryDirectory() as tmp:
+        sidecar, json_path = Path(tmp) / "scandata.leaves.bin", Path(tmp) / "scandata.json"
+        assert load_leaf_table(sidecar, json_path) is None
+
+        json_path.write_text(json.dumps(SCANDATA), encoding="utf-8")
+        LeafTable.from_scandata(SCANDATA).save(sidecar)
+        os.utime(json_path, ns=(1_000_000_000, 1_000_000_000))
+        assert load_leaf_table(sidecar, json_path).page(10) == SCANDATA["pages"]["10"]
+
+        # scandata.json re-ingested after the sidecar was written
+        edited = json.loads(json.dumps(SCANDATA))
+        edited["pages"]["10"]["pageType"] = "Normal"
+        json_path.write_text(json.dumps(edited), encoding="utf-8")
+        os.utime(sidecar, ns=(1_000_000_000, 1_000_000_000))
+        assert load_leaf_table(sidecar, json_path).page(10)["pageType"] == "Normal"
+
+        json_path.unlink()
+        assert load_leaf_table(sidecar, json_path).page(10)["pageType"] is None
+    print("✓ stale sidecar rebuilt from scandata.json")
+
+
+def test_line_companion_table_matches_scandata():
+    from config import LINE_COMPANION_DIR
+    from utils import read_json_file
+
+    scandata_path = LINE_COMPANION_DIR / "scandata.json"
+    if not scandata_path.exists():
+        print("⚠ Line Companion scandata.json not found; run 02a-ingest-lc-scandata.py (skipped)")
+        return
+    scandata = read_json_file(scandata_path)
+    table = load_leaf_table()
+    assert table.book_data == scandata.get("bookData", {})
+    for key in scandata.get("pages", {}):
+        assert get_page_by_leaf_num(table, int(key)) == get_page_by_leaf_num(scandata, int(key))
+    assert get_page_by_leaf_num(table, 99999) is None
+    print("✓ Line Companion leaf table matches scandata.json")
+
+
+def test_intervals_bisect_page_breaks():
+    page_offsets = {"pages": [
+        {"leaf": 13, "page": "2", "char_offset": 40},
+        {"leaf": 12, "page": "1", "char_offset": 0},
+        {"leaf": None, "page": None, "char_offset": 20},
+        {"leaf": 14, "page": None, "char_offset": 90},
+    ]}
+    intervals = LeafIntervals.from_page_offsets(page_offsets)
+    assert list(intervals.starts) == [0, 40, 90] and list(intervals.leaves) == [12, 13, 14]
+    assert [intervals.leaf_at(o) for o in (0, 39, 40, 89, 90, 500)] == [12, 12, 13, 13, 14, 14]
+
+    assert intervals.page_hint(5, 40, dpi=300) == {
+        "leaf_start": 12, "leaf_end": 12, "dpi": 300, "estimation_method": "leaf_offsets",
+        "page_start": "1", "page_end": "1",
+    }
+    assert intervals.leaf_range(30, 41) == (0, 1)
+    assert intervals.leaf_range(40, 40) == (1, 1)
+    assert "page_start" not in LeafIntervals([0], [5]).page_hint(0, 10)
+    print("✓ intervals bisect page breaks")
+
+
+def test_byte_intervals_in_offset_index():
+    text = "☰☰☰☰ page one\nété page two\nend"
+    source = SourceText.from_text(text)
+    breaks = [text.index("page one"), text.index("été"), text.index("end")]
+    intervals = LeafIntervals(breaks, [1, 2, 3], ["i", "ii", "iii"]).to_byte_offsets(source)
+    data = text.encode("utf-8")
+    assert list(intervals.starts) == [data.index(b"page one"), data.index("été".encode("utf-8")), data.index(b"end")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = OffsetIndex(Path(tmp) / "normalized.offsets.json", "normalized.txt", len(data))
+        assert index.leaf_intervals() is None
+        index.set_leaves(intervals)
+        index.save()
+        loaded = OffsetIndex.load(index.path).leaf_intervals()
+        assert loaded.to_json() == intervals.to_json()
+        assert loaded.leaf_at(data.index(b"two")) == 2
+    print("✓ byte intervals stored in the offset index")
+
+
+if __name__ == "__main__":
+    test_pages_match_scandata_json()
+    test_binary_sidecar_round_trip()
+    test_stale_sidecar_rebuilt_from_json()
+    test_line_companion_table_matches_scandata()
+    test_intervals_bisect_page_breaks()
+    test_byte_intervals_in_offset_index()
+
+    print()
+    print("✅ All leaf table tests passed!")
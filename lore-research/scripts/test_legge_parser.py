@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the one-pass Legge tokenizer/parser (legge_parser.py).
+Run with: python test_legge_parser.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from legge_parser import LENIENT, STRICT, parse_legge, parse_numeral, tokenize
+from source_text import SourceText
+
+SAMPLE = """Introduction mentioning the I. The Preface Hexagram in passing.
+1. In the first line, this is not inside any hexagram.
+
+I. The Khien Hexagram.
+
+Explanation of the entire figure by king Wan.
+
+Khien represents what is great.
+
+1. In the first (or lowest) line, undivided, the dragon lies hid.
+
+2. In the second line, undivided, the dragon appears in the field.
+It will be advantageous.
+
+7. (The lines are all strong.) Good fortune.
+
+XXI1. Tim Ho Hexagram.
+
+Judgment of the biting through ☲.
+
+I. The first line, undivided, shows one with his feet in the stocks.
+
+3. In the third line, divided, he bites through dried flesh.
+"""
+
+
+def _texts(source, hexagram):
+    return source.decode(*hexagram.judgment), {n: source.decode(*s) for n, s in hexagram.lines.items()}
+
+
+def test_parse_numeral():
+    assert [parse_numeral(n) for n in ("I", "IV", "XLIV", "LXIV", "MCMXCIX", "12")] == [1, 4, 44, 64, 1999, 12]
+    assert parse_numeral("IIII") is None and parse_numeral("XXI1") is None and parse_numeral("") is None
+    assert parse_numeral("XXI1", lenient=True) == 22
+    assert parse_numeral("LX I", lenient=True) == 61
+    assert parse_numeral("lV", lenient=True) == 4
+    print("✓ parse_numeral")
+
+
+def test_strict_mode():
+    source = SourceText.from_text(SAMPLE)
+    issues = []
+    hexagrams = parse_legge(source, STRICT, issues)
+
+    # "XXI1" is not a roman numeral in strict mode and "Tim" is not "The"
+    assert [h.hexagram for h in hexagrams] == [1]
+    khien = hexagrams[0]
+    assert khien.title == "Khien"
+    judgment, lines = _texts(source, khien)
+    # "(or lowest)" breaks the strict line grammar, so line 1 stays in the
+    # judgment, and the missed header leaves hexagram 22's line 3 in hexagram 1
+    assert judgment.startswith("Explanation of the entire figure") and judgment.endswith("the dragon lies hid.")
+    assert set(lines) == {2, 3}
+    assert lines[2].startswith("2. In the second line") and lines[2].endswith("feet in the stocks.")
+    assert source.decode(*khien.span).startswith("Explanation") and source.decode(*khien.span).endswith("dried flesh.")
+    assert issues == []
+    print("✓ strict mode")
+
+
+def test_lenient_mode():
+    source = SourceText.from_text(SAMPLE)
+    hexagrams = {h.hexagram: h for h in parse_legge(source, LENIENT)}
+
+    assert sorted(hexagrams) == [1, 22]
+    assert hexagrams[22].title == "Ho"
+    judgment, lines = _texts(source, hexagrams[22])
+    assert judgment == "Judgment of the biting through ☲."
+    assert lines[1].startswith("I. The first line") and lines[3].endswith("dried flesh.")
+    _, khien_lines = _texts(source, hexagrams[1])
+    assert sorted(khien_lines) == [1, 2] and "lies hid" in khien_lines[1]
+    # The seventh paragraph is not a line token, so it stays with line 2
+    assert khien_lines[2].endswith("Good fortune.")
+    # Spans are byte offsets: the multi-byte trigram shifts everything after it
+    data = SAMPLE.encode("utf-8")
+    assert data[slice(*hexagrams[22].lines[3])].decode("utf-8") == lines[3]
+    print("✓ lenient mode")
+
+
+def test_tokens_issues_and_modes():
+    text = "I. The Khien Hexagram.\nbody\nLXX. The Bogus Hexagram.\nbody\nI. The Khien Hexagram.\nagain\n"
+    source = SourceText.from_text(text)
+    assert [t.start for t in tokenize(source)] == [0, 28, 58]
+    issues = []
+    hexagrams = parse_legge(source, STRICT, issues)
+    assert len(hexagrams) == 1 and source.decode(*hexagrams[0].span) == "again"
+    assert issues == ["Could not convert hexagram numeral: LXX", "Hexagram 1 header repeated; keeping the later one"]
+    try:
+        parse_legge(source, "fuzzy")
+        assert False, "unknown mode must be rejected"
+    except ValueError:
+        pass
+    print("✓ tokens, issues and modes")
+
+
+if __name__ == "__main__":
+    test_parse_numeral()
+    test_strict_mode()
+    test_lenient_mode()
+    test_tokens_issues_and_modes()
+    print("\n✅ All Legge parser tests passed!")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the async chat-completions engine (llm_async.py), run against a
+local stub server that imitates the chat-completions endpoint.
+Run with: python test_llm_async.py
+"""
+
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm_async import (
+    AsyncScoringEngine,
+    ChatCompletionsClient,
+    HTTPStatusError,
+    RateLimiter,
+    TokenBucket,
+    backoff_delay,
+)
+
+
+class StubServer:
+    """
+    Chat-completions stub. ``failures`` is a list of status codes returned
+    (in order) before the server starts answering 200.
+    """
+
+    def __init__(self, failures=(), delay: float = 0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    stub.calls += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    status = stub.failures.pop(0) if stub.failures else 200
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+
+                if status != 200:
+                    self.send_response(status)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    self.wfile.write(b'{"error": "stub"}')
+                    return
+
+                content = body["messages"][-1]["content"]
+                payload = {
+                    "choices": [{"message": {"role": "assistant", "content": json.dumps({"echo": content})}}],
+                    "usage": {"total_tokens": 10},
+                }
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _payloads(n: int):
+    return [{"model": "stub", "messages": [{"role": "user", "content": f"line {i}"}]} for i in range(n)]
+
+
+def _parse(response):
+    return json.loads(response["choices"][0]["message"]["content"])["echo"]
+
+
+def test_results_in_order_under_concurrency_limit():
+    with StubServer(delay=0.05) as stub:
+        engine = AsyncScoringEngine(ChatCompletionsClient(stub.base_url), concurrency=3)
+        results = asyncio.run(engine.run(_payloads(10), parse=_parse))
+    assert results == [f"line {i}" for i in range(10)]
+    assert stub.max_in_flight <= 3, f"Concurrency limit exceeded: {stub.max_in_flight}"
+    assert stub.max_in_flight > 1, "Requests should overlap"
+    print("✓ results in order under concurrency limit")
+
+
+def test_retries_429_and_5xx_with_backoff():
+    with StubServer(failures=[429, 503, 429]) as stub:
+        engine = AsyncScoringEngine(
+            ChatCompletionsClient(stub.base_url), concurrency=1, backoff_base=0.01, rng=random.Random(0)
+        )
+        results = asyncio.run(engine.run(_payloads(2), parse=_parse))
+    assert results == ["line 0", "line 1"]
+    assert engine.stats["retries"] == 3
+    assert engine.stats["rate_limited"] == 2
+    assert engine.stats["server_errors"] == 1
+    assert stub.calls == 5
+    print("✓ retries 429/5xx with backoff")
+
+
+def test_gives_up_after_max_retries_and_on_client_errors():
+    with StubServer(failures=[500] * 3 + [400]) as stub:
+        engine = AsyncScoringEngine(
+            ChatCompletionsClient(stub.base_url), concurrency=1, max_retries=2, backoff_base=0.01
+        )
+        finished = []
+        results = asyncio.run(engine.run(_payloads(2), parse=_parse, on_result=lambda i, r, info: finished.append(i)))
+    assert results == [None, None]
+    assert sorted(finished) == [0, 1]
+    assert engine.stats["failed"] == 2
+    assert stub.calls == 4, "400 must not be retried"
+    print("✓ gives up after max retries and on client errors")
+
+
+def test_token_bucket_and_backoff_math():
+    now = [0.0]
+    bucket = TokenBucket(rate_per_minute=60, capacity=2, clock=lambda: now[0])
+    assert bucket.try_acquire(1) == 0.0
+    assert bucket.try_acquire(1) == 0.0
+    assert abs(bucket.try_acquire(1) - 1.0) < 1e-9, "Refill is one token per second"
+    now[0] = 1.0
+    assert bucket.try_acquire(1) == 0.0
+    bucket.debit(3)
+    assert abs(bucket.try_acquire(1) - 4.0) < 1e-9, "Debited usage must be paid back"
+    assert TokenBucket(0).try_acquire(10 ** 6) == 0.0
+
+    limiter = RateLimiter(clock=lambda: now[0])
+    limiter.cooldown(5)
+    assert limiter.paused_until == 6.0
+
+    rng = random.Random(1)
+    for attempt in range(8):
+        assert 0 <= backoff_delay(attempt, base=1, cap=10, rng=rng) <= 10
+    assert backoff_delay(0, base=0.001, retry_after=2.5) == 2.5
+    assert HTTPStatusError(429).status == 429
+    print("✓ token bucket and backoff math")
+
+
+if __name__ == "__main__":
+    test_results_in_order_under_concurrency_limit()
+    test_retries_429_and_5xx_with_backoff()
+    test_gives_up_after_max_retries_and_on_client_errors()
+    test_token_bucket_and_backoff_math()
+    print("\n✅ All async engine tests passed!")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled OCR fix engine (ocr_fixes.py).
+Run with: python test_ocr_fixes.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import OCR_FIX_DICT
+from ocr_fixes import OCRFixEngine
+
+
+def _sequential(text: str, fixes: dict) -> str:
+    for error, fix in fixes.items():
+        text = text.replace(error, fix)
+    return text
+
+
+def test_matches_sequential_replace_on_independent_rules():
+    fixes = {**OCR_FIX_DICT, "lMe": "We", "V*stern": "Western", "i. e.": "i.e."}
+    engine = OCRFixEngine(fixes)
+    rng = random.Random(7)
+    pieces = list(fixes) + ["line", "Gate ", "i.e.", " ", "\n", "x", "V*", "l"]
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+        assert engine.apply(text) == _sequential(text, fixes), repr(text)
+    print("✓ matches sequential replace on independent rules")
+
+
+def test_longest_match_and_single_scan():
+    engine = OCRFixEngine({"ab": "1", "abc": "2", "2": "3"})
+    # Longest pattern wins at a position; replacements are never rescanned
+    assert engine.apply("abcab") == "21"
+    assert engine.hits == {"ab": 1, "abc": 1, "2": 0}
+    assert OCRFixEngine({}).apply("unchanged") == "unchanged"
+    try:
+        OCRFixEngine({"": "x"})
+        assert False, "Empty pattern must be rejected"
+    except ValueError:
+        pass
+    print("✓ longest match and single scan")
+
+
+def test_hit_counters_and_report():
+    engine = OCRFixEngine({"l ine": "line", "G ate": "Gate", "a|b": "ab"})
+    engine.apply("l ine one, l ine two")
+    engine.apply("G ate 1, a|b")
+    assert engine.hits == {"l ine": 2, "G ate": 1, "a|b": 1}
+    assert engine.total_hits == 4
+    assert engine.dead_rules() == []
+    assert engine.rule_stats()[0] == ("l ine", "line", 2)
+    assert engine.format_stats() == "4 OCR fixes applied (3/3 rules fired)"
+    assert "| `a\\|b` | `ab` | 1 |" in engine.markdown_table()
+
+    engine.reset()
+    assert engine.total_hits == 0
+    assert engine.dead_rules() == ["l ine", "G ate", "a|b"]
+    print("✓ hit counters and report")
+
+
+if __name__ == "__main__":
+    test_matches_sequential_replace_on_independent_rules()
+    test_longest_match_and_single_scan()
+    test_hit_counters_and_report()
+    print("\n✅ All OCR fix engine tests passed!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the normalized.txt offset index and span reader (offset_index.py).
+Run with: python test_offset_index.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from offset_index import OffsetIndex, SpanReader, byte_span, file_digest, stripped_span
+
+
+def test_stripped_span():
+    text = "  Gate 1\n body \n\n"
+    start, end = stripped_span(text)
+    assert text[start:end] == text.strip()
+    start, end = stripped_span(text, 9, 16)
+    assert text[start:end] == "body"
+    assert stripped_span(text, 14, 18) == (14, 14)
+    print("✓ stripped span")
+
+
+def test_byte_span_non_ascii():
+    text = "héxagram ☷ café"
+    span = (text.index("☷"), len(text))
+    start, end = byte_span(text, span, base=10)
+    assert text.encode("utf-8")[start - 10:end - 10].decode("utf-8") == "☷ café"
+    assert byte_span("plain", (1, 3), base=5) == [6, 8]
+    print("✓ byte span with non-ASCII text")
+
+
+def test_save_load_and_read_spans():
+    text = "intro\nGate 1 ☰\nLine 1 é\nexalted\nGate 2\nrest\n"
+    data = text.encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "normalized.txt"
+        source.write_bytes(data)
+        index = OffsetIndex(Path(tmp) / "normalized.offsets.json", source.name, len(data),
+                            sha256=file_digest(source))
+
+        gate_start = data.index(b"Gate 1")
+        gate_end = data.index(b"\nGate 2")
+        line_start = data.index(b"Line 1")
+        index.set_gate(1, [gate_start, gate_end])
+        index.set_lines(1, {"1": [line_start, gate_end]})
+        index.set_segments(1, 1, [{"type": "exaltation", "planet": "Sun", "span": [data.index(b"exalted"), gate_end]}])
+        try:
+            index.set_segments(1, 2, [])
+            assert False, "unknown line must be rejected"
+        except KeyError:
+            pass
+        index.save()
+
+        loaded = OffsetIndex.load(index.path)
+        assert loaded.matches(source)
+        with SpanReader(source, loaded) as reader:
+            assert reader.gate_text(1) == "Gate 1 ☰\nLine 1 é\nexalted"
+            assert reader.line_text(1, 1) == "Line 1 é\nexalted"
+            assert reader.segment_texts(1, 1) == ["exalted"]
+            assert reader.gate_text(2) is None
+
+        # Same-length OCR fix: size unchanged, content digest differs
+        source.write_bytes(data.replace(b"exalted", b"exa1ted"))
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+        assert not loaded.matches(source)
+        source.write_bytes(data + b"more")
+        assert not loaded.matches(source)
+        try:
+            SpanReader(source, loaded)
+            assert False, "stale index must be rejected"
+        except ValueError:
+            pass
+        assert OffsetIndex.load(Path(tmp) / "missing.json") is None
+    print("✓ save, load and read spans")
+
+
+def test_empty_source():
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "empty.txt"
+        source.write_bytes(b"")
+        with SpanReader(source) as reader:
+            assert reader.text((0, 0)) == ""
+    print("✓ empty source")
+
+
+if __name__ == "__main__":
+    test_stripped_span()
+    test_byte_span_non_ascii()
+    test_save_load_and_read_spans()
+    test_empty_source()
+    print("\n✅ All offset index tests passed!")
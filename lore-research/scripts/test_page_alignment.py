@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the anchor-based Legge page alignment (page_alignment.py).
+Run with: python test_page_alignment.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from page_alignment import PageAligner, PageAnchor, find_page_anchors, monotone_chain, page_map_anchors
+from source_text import SourceText
+
+
+def brute_force_chain_weight(anchors):
+    best = [0] * len(anchors)
+    for i, anchor in enumerate(anchors):
+        best[i] = anchor.weight + max(
+            (best[j] for j in range(i) if anchors[j].page < anchor.page), default=0
+        )
+    return max(best, default=0)
+
+
+def test_monotone_chain_is_heaviest_increasing():
+    rng = random.Random(7)
+    for _ in range(300):
+        anchors = [PageAnchor(i, rng.randint(0, 30), rng.randint(1, 3)) for i in range(rng.randint(0, 25))]
+        chain = monotone_chain(anchors)
+        assert all(a.page < b.page and a.position < b.position for a, b in zip(chain, chain[1:]))
+        assert sum(a.weight for a in chain) == brute_force_chain_weight(anchors)
+    print("✓ monotone chain is the heaviest increasing subsequence")
+
+
+def test_page_number_anchors():
+    text = (
+        "Preface\n57\n59\n"                      # table of contents
+        "body text\n\n30 THE Yf KING. CH. III.\n"
+        "more text\n3 1\n"                        # OCR-split page number
+        "a footnote\n1 The Shu IV, xi, 1,2.\n"    # footnote, not a page line
+        "CH. III. THE YI KING. 32\n"
+    )
+    with SourceText.from_text(text) as source:
+        anchors = find_page_anchors(source)
+    assert [(a.page, a.weight) for a in anchors] == [(57, 1), (59, 1), (30, 2), (31, 1), (32, 2)]
+    assert [a.page for a in monotone_chain(anchors)] == [30, 31, 32]
+    print("✓ page number anchors")
+
+
+def test_aligner_locates_offsets():
+    text_chain = [PageAnchor(0, 10), PageAnchor(1000, 12), PageAnchor(2000, 20)]
+    page_map = {"pages": [
+        {"leafNum": 5, "pageNumber": "10"},
+        {"leafNum": 6, "pageNumber": "12"},
+        {"leafNum": 7, "pageNumber": "3"},   # misread, dropped by the chain
+        {"leafNum": 7, "pageNumber": ""},
+        {"leafNum": 8, "pageNumber": "16"},
+        {"leafNum": 10, "pageNumber": "20"},
+    ]}
+    aligner = PageAligner(text_chain, monotone_chain(page_map_anchors(page_map)))
+    assert [a.position for a in aligner.leaf_chain] == [5, 6, 8, 10]
+
+    assert aligner.locate(500) == (11, 5, 1.0)
+    assert aligner.locate(1500) == (16, 8, 0.25)
+    assert aligner.locate(1750) == (18, 9, 0.25)
+    assert aligner.locate(2500).confidence == 0.0
+    start, end = aligner.locate(500), aligner.locate(1750)
+    assert aligner.page_candidates(start, end) == [str(page) for page in range(11, 19)]
+    assert aligner.page_candidates(end, end) == ["18"]
+
+    try:
+        PageAligner([], aligner.leaf_chain)
+        assert False, "empty chain must be rejected"
+    except ValueError:
+        pass
+    print("✓ aligner locates offsets")
+
+
+if __name__ == "__main__":
+    test_monotone_chain_is_heaviest_increasing()
+    test_page_number_anchors()
+    test_aligner_locates_offsets()
+
+    print()
+    print("✅ All page alignment tests passed!")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental pipeline runner (pipeline.py).
+Run with: python test_pipeline.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline import Stage, Fingerprinter, plan_stage, record_stage, upstream_completions
+from utils import parse_gate_spec, map_gates
+
+
+def _per_gate_stage(root: Path) -> Stage:
+    return Stage(
+        "10-generate-gate-line-files",
+        gate_inputs=lambda gate: [root / "in" / f"{gate:02d}.json"],
+        gate_outputs=lambda gate: [root / "out" / f"{gate:02d}.json"],
+    )
+
+
+def _square_with_issue(gate: int):
+    return gate * gate, [f"gate {gate}"] if gate % 2 else []
+
+
+def test_parse_gate_spec():
+    assert parse_gate_spec("1,5,10-12") == [1, 5, 10, 11, 12]
+    assert parse_gate_spec("01-64") == list(range(1, 65))
+    assert parse_gate_spec("3, 3,2") == [2, 3]
+    for bad in ("0", "65", "5-2", ""):
+        try:
+            parse_gate_spec(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for {bad!r}")
+    print("✓ parse_gate_spec")
+
+
+def test_fingerprint_tracks_content_not_mtime():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "a.txt"
+        path.write_text("hello")
+        first = Fingerprinter().file_hash(path)
+        path.write_text("hello")
+        assert Fingerprinter().file_hash(path) == first
+        path.write_text("world")
+        assert Fingerprinter().file_hash(path) != first
+        assert Fingerprinter().file_hash(Path(tmp) / "missing") == Fingerprinter.MISSING
+    print("✓ fingerprint tracks content")
+
+
+def test_per_gate_plan_only_rebuilds_changed_gates():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "in").mkdir()
+        (root / "out").mkdir()
+        gates = [1, 2, 3]
+        for gate in gates:
+            (root / "in" / f"{gate:02d}.json").write_text(f'{{"gate": {gate}}}')
+            (root / "out" / f"{gate:02d}.json").write_text("{}")
+
+        stage = _per_gate_stage(root)
+        plan = plan_stage(stage, None, Fingerprinter(), {}, gates)
+        assert plan.will_run and plan.gates == gates
+
+        record = record_stage(stage, plan, None, Fingerprinter())
+        plan = plan_stage(stage, record, Fingerprinter(), {}, gates)
+        assert not plan.will_run, "Unchanged inputs should be skipped"
+
+        (root / "in" / "02.json").write_text('{"gate": 2, "edited": true}')
+        plan = plan_stage(stage, record, Fingerprinter(), {}, gates)
+        assert plan.gates == [2], f"Only gate 2 should be stale, got {plan.gates}"
+        assert plan.gate_args == ["--gates", "2"]
+
+        (root / "out" / "03.json").unlink()
+        plan = plan_stage(stage, record, Fingerprinter(), {}, gates)
+        assert plan.gates == [2, 3], "Missing outputs should mark their gate stale"
+    print("✓ per-gate plan rebuilds only changed gates")
+
+
+def test_whole_stage_reruns_after_upstream():
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.txt"
+        source.write_text("text")
+        stage = Stage("03-fanout-gates", inputs=[source], after=["02-split-gates"])
+
+        plan = plan_stage(stage, None, Fingerprinter(), {}, [1])
+        record = record_stage(stage, plan, None, Fingerprinter())
+        assert not plan_stage(stage, record, Fingerprinter(), {}, [1]).will_run
+
+        plan = plan_stage(stage, record, Fingerprinter(), {"02-split-gates": None}, [1])
+        assert plan.will_run and "upstream" in plan.reason
+    print("✓ whole stage re-runs after upstream")
+
+
+def test_whole_stage_reruns_after_upstream_in_earlier_invocation():
+    stage = Stage("03c-split-exaltation-detriment", after=["03a-detect-lines-per-gate"])
+    records = {"03a-detect-lines-per-gate": {"completed_at": "2025-01-01T00:00:00+00:00"}}
+
+    upstream = upstream_completions(stage, records)
+    plan = plan_stage(stage, None, Fingerprinter(), {}, [1], upstream=upstream)
+    record = record_stage(stage, plan, None, Fingerprinter(), upstream)
+    assert record["upstream"] == {"03a-detect-lines-per-gate": "2025-01-01T00:00:00+00:00"}
+    assert not plan_stage(stage, record, Fingerprinter(), {}, [1], upstream=upstream).will_run
+
+    # 03a re-ran on its own (e.g. --stages 03a); nothing in this invocation ran upstream
+    records["03a-detect-lines-per-gate"] = {"completed_at": "2025-01-02T00:00:00+00:00"}
+    plan = plan_stage(stage, record, Fingerprinter(), {}, [1], upstream=upstream_completions(stage, records))
+    assert plan.will_run and plan.reason == "upstream 03a-detect-lines-per-gate re-ran since last run"
+
+    # Records written before upstream completions were stored are stale once
+    del record["upstream"]
+    assert plan_stage(stage, record, Fingerprinter(), {}, [1], upstream=upstream).will_run
+    print("✓ whole stage re-runs after upstream re-ran in an earlier invocation")
+
+
+def test_map_gates_keeps_gate_order_across_workers():
+    gates = list(range(1, 17))
+    serial = map_gates(_square_with_issue, gates, jobs=1)
+    pooled = map_gates(_square_with_issue, gates, jobs=4)
+    assert pooled == serial
+    assert [square for square, _ in pooled] == [g * g for g in gates]
+    merged = [issue for _, issues in pooled for issue in issues]
+    assert merged == [f"gate {g}" for g in gates if g % 2]
+    print("✓ map_gates keeps gate order across workers")
+
+
+if __name__ == "__main__":
+    test_parse_gate_spec()
+    test_fingerprint_tracks_content_not_mtime()
+    test_per_gate_plan_only_rebuilds_changed_gates()
+    test_whole_stage_reruns_after_upstream()
+    test_whole_stage_reruns_after_upstream_in_earlier_invocation()
+    test_map_gates_keeps_gate_order_across_workers()
+    print("\n✅ All pipeline tests passed!")
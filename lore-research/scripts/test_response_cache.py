@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the disk-backed LLM response cache (response_cache.py).
+Run with: python test_response_cache.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import response_cache
+from response_cache import ResponseCache
+
+
+def test_key_covers_model_temperature_and_prompts():
+    base = ResponseCache.key_for("gpt-4o-mini", 0.0, "system", "user")
+    assert base == ResponseCache.key_for("gpt-4o-mini", 0, "system", "user")
+    variants = [
+        ResponseCache.key_for("gpt-4o", 0.0, "system", "user"),
+        ResponseCache.key_for("gpt-4o-mini", 0.2, "system", "user"),
+        ResponseCache.key_for("gpt-4o-mini", 0.0, "system v2", "user"),
+        ResponseCache.key_for("gpt-4o-mini", 0.0, "system", "user edited"),
+    ]
+    assert base not in variants and len(set(variants)) == 4
+    print("✓ key covers model, temperature and prompts")
+
+
+def test_hits_misses_and_persistence():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp))
+        key = ResponseCache.key_for("m", 0.0, "s", "u")
+        assert cache.get(key) is None
+        cache.put(key, {"gate_line": "1.1"})
+        assert cache.get(key) == {"gate_line": "1.1"}
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+        reopened = ResponseCache(Path(tmp))
+        assert len(reopened) == 1
+        assert reopened.get(key) == {"gate_line": "1.1"}
+    print("✓ hits, misses and persistence")
+
+
+def test_lru_eviction_keeps_recently_used():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp), max_bytes=10 ** 6)
+        keys = [ResponseCache.key_for("m", 0.0, "s", str(i)) for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, {"text": "x" * 100})
+            # Give entries distinct, increasing last-use times
+            os.utime(cache._path(key), (1000 + age, 1000 + age))
+        cache._index = None
+
+        cache.get(keys[0])  # keys[0] becomes most recently used
+        cache.max_bytes = 2 * cache._path(keys[0]).stat().st_size
+        cache.put(ResponseCache.key_for("m", 0.0, "s", "new"), {"text": "x" * 100})
+
+        assert cache.get(keys[0]) is not None, "Recently used entry must survive"
+        assert cache.get(keys[1]) is None and cache.get(keys[2]) is None
+        assert cache.stats()["evictions"] == 2
+    print("✓ LRU eviction keeps recently used entries")
+
+
+def test_hit_survives_concurrent_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp))
+        key = ResponseCache.key_for("m", 0.0, "s", "u")
+        cache.put(key, {"gate_line": "1.1"})
+
+        real_utime = os.utime
+
+        def evict_then_utime(path, *args):
+            os.remove(path)  # another process evicts the entry after our read
+            real_utime(path, *args)
+
+        response_cache.os.utime = evict_then_utime
+        try:
+            assert cache.get(key) == {"gate_line": "1.1"}
+        finally:
+            response_cache.os.utime = real_utime
+        assert len(cache) == 0 and cache.stats()["hits"] == 1
+    print("✓ hit survives concurrent eviction")
+
+
+if __name__ == "__main__":
+    test_key_covers_model_temperature_and_prompts()
+    test_hits_misses_and_persistence()
+    test_lru_eviction_keeps_recently_used()
+    test_hit_survives_concurrent_eviction()
+    print("\n✅ All response cache tests passed!")
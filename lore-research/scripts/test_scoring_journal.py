@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the resumable 08b scoring journal (scoring_journal.py).
+Run with: python test_scoring_journal.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scoring_journal import ScoringJournal
+
+
+def test_done_requires_matching_hash_and_output():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        output = root / "01-1.json"
+        output.write_text("{}")
+        journal = ScoringJournal(root / "_journal.ndjson")
+        journal.append("1.1", "done", prompt_hash="abc", output=str(output))
+        journal.append("1.2", "failed", prompt_hash="def", output=str(root / "01-2.json"))
+
+        reopened = ScoringJournal(root / "_journal.ndjson")
+        assert reopened.is_done("1.1", "abc")
+        assert not reopened.is_done("1.1", "changed"), "Edited prompt must be re-scored"
+        assert not reopened.is_done("1.2", "def"), "Failed lines must be retried"
+        output.unlink()
+        assert not reopened.is_done("1.1", "abc"), "Missing output must be re-scored"
+    print("✓ done requires matching hash and output")
+
+
+def test_torn_last_line_is_ignored_and_repaired():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "_journal.ndjson"
+        journal = ScoringJournal(path)
+        journal.append("1.1", "done", prompt_hash="a", output="x")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"gate_line": "1.2", "sta')  # crash mid-write
+        journal = ScoringJournal(path)
+        assert set(journal.entries) == {"1.1"}
+
+        journal.append("1.3", "done", prompt_hash="c", output="z")
+        assert set(ScoringJournal(path).entries) == {"1.1", "1.3"}
+    print("✓ torn last line is ignored and repaired")
+
+
+def test_claims_exclude_live_workers_and_reclaim_stale():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "_journal.ndjson"
+        worker = ScoringJournal(path)
+        assert worker.claim("5.1")
+
+        other = ScoringJournal(path)
+        claim_file = other._claim_path("5.1")
+        claim_file.write_text(str(os.getppid()))  # held by a live process
+        assert not other.claim("5.1")
+
+        claim_file.write_text("999999999")  # owner no longer running
+        assert other.claim("5.1")
+        other.release_all()
+        assert not claim_file.exists()
+    print("✓ claims exclude live workers and reclaim stale ones")
+
+
+def _claim_and_hold(path: Path) -> bool:
+    # Stay alive (holding any claim) until every worker has tried
+    won = ScoringJournal(path).claim("7.2")
+    (path.parent / f"tried.{os.getpid()}").touch()
+    deadline = time.monotonic() + 10
+    while len(list(path.parent.glob("tried.*"))) < 8 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return won
+
+
+def test_stale_claim_is_taken_over_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "_journal.ndjson"
+        journal = ScoringJournal(path)
+        journal.claims_dir.mkdir()
+        journal._claim_path("7.2").write_text("999999999")  # dead owner
+        with ProcessPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(_claim_and_hold, [path] * 8))
+        assert results.count(True) == 1
+    print("✓ stale claim is taken over by exactly one worker")
+
+
+if __name__ == "__main__":
+    test_done_requires_matching_hash_and_output()
+    test_torn_last_line_is_ignored_and_repaired()
+    test_claims_exclude_live_workers_and_reclaim_stale()
+    test_stale_claim_is_taken_over_once()
+    print("\n✅ All scoring journal tests passed!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared scoring invariants loader (scoring_rules.py).
+Run with: python test_scoring_rules.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import SCORING_RULES_FILE
+from scoring_rules import ScoringRules, load_scoring_rules
+
+
+def test_rules_file_compiles():
+    rules = load_scoring_rules()
+    assert rules is load_scoring_rules()
+    assert len(rules.canonical_systems) == 8
+    assert ("Sirius", "Orion Light", 0.60, 0.35) in rules.pairwise_exclusions
+    assert rules.orion_faction_rule == ("Orion Light", "Orion Dark", 0.35)
+    assert (rules.high_weight, rules.max_high_weight, rules.conflict_min_weight) == (0.4, 2, 0.3)
+    print("✓ rules file compiles")
+
+
+def test_exclusion_thresholds():
+    rules = load_scoring_rules()
+    predicates = dict(zip([rule[:2] for rule in rules.pairwise_exclusions], rules.exclusion_predicates))
+
+    # Zero threshold: any weight applies (>), excluded system must be 0
+    assert predicates[("Pleiades", "Draco")](0.01, 0.01)
+    assert not predicates[("Pleiades", "Draco")](0.0, 0.9)
+    # Non-zero threshold: >=, excluded system capped at max
+    assert predicates[("Sirius", "Orion Light")](0.60, 0.36)
+    assert not predicates[("Sirius", "Orion Light")](0.60, 0.35)
+    assert not predicates[("Sirius", "Orion Light")](0.59, 0.9)
+    print("✓ exclusion thresholds")
+
+
+def test_weight_status():
+    status = load_scoring_rules().weight_status
+    assert status(0.8, "core") == ("ok", "")
+    assert status(0.55, "core") == ("under", "Core behavior but weight=0.55 (should be 0.7-1.0)")
+    assert status(0.2, "core")[1].endswith("(severely under-weighted)")
+    assert status(0.7, "secondary") == ("over", "Shadow behavior but weight=0.70 (should be 0.4-0.6)")
+    assert status(0.05, "none") == ("ok", "")
+    assert status(0.5, "other") == ("unknown", "Unknown alignment_type: other")
+    print("✓ weight status")
+
+
+def test_malformed_rules_rejected():
+    data = json.loads(SCORING_RULES_FILE.read_text(encoding="utf-8"))
+    data["pairwise_exclusions"]["rules"][0]["excludes"] = "Vega"
+    try:
+        ScoringRules(data)
+        assert False, "non-canonical system must be rejected"
+    except ValueError as e:
+        assert "Vega" in str(e)
+
+    del data["sparsity"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rules.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        try:
+            load_scoring_rules(path)
+            assert False, "missing section must be rejected"
+        except ValueError as e:
+            assert "sparsity" in str(e)
+    print("✓ malformed rules rejected")
+
+
+if __name__ == "__main__":
+    test_rules_file_compiles()
+    test_exclusion_thresholds()
+    test_weight_status()
+    test_malformed_rules_rejected()
+
+    print()
+    print("✅ All scoring rules tests passed!")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the structured source readers (source_readers.py) and the page
+offsets they produce through the streaming normalizer.
+Run with: python test_source_readers.py
+"""
+
+import gzip
+import io
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from source_readers import PageMark, iter_source_lines, read_scandata_page_numbers
+from stream_normalizer import NormalizedTextSink, StreamingNormalizer
+
+DJVU_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<DjVuXML><BODY>
+<OBJECT usemap="LC_0007.djvu"><HIDDENTEXT><PAGECOLUMN><REGION>
+  <PARAGRAPH><LINE><WORD>Gate</WORD><WORD>1</WORD></LINE></PARAGRAPH>
+  <PARAGRAPH><LINE><WORD>The</WORD><WORD>creative</WORD></LINE><LINE><WORD>force</WORD></LINE></PARAGRAPH>
+</REGION></PAGECOLUMN></HIDDENTEXT></OBJECT>
+<OBJECT usemap="LC_0008.djvu"><HIDDENTEXT><PAGECOLUMN><REGION>
+  <PARAGRAPH><LINE><WORD>continues</WORD><WORD>here.</WORD></LINE></PARAGRAPH>
+  <PARAGRAPH><LINE><WORD>Line</WORD><WORD>1</WORD></LINE></PARAGRAPH>
+</REGION></PAGECOLUMN></HIDDENTEXT></OBJECT>
+</BODY></DjVuXML>
+"""
+
+ABBYY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<document xmlns="http://www.abbyy.com/FineReader_xml/FineReader10-schema-v1.xml">
+<page><block><text><par><line><formatting>{first}</formatting></line></par></text></block></page>
+<page><block><text><par><line><formatting>{second}</formatting></line></par></text></block></page>
+</document>
+"""
+
+
+def _normalize(items):
+    out = io.StringIO()
+    sink = NormalizedTextSink(out)
+    sink.consume(StreamingNormalizer({}).normalize_lines(items))
+    return out.getvalue(), sink.page_offsets
+
+
+def _page_text(text, offsets, index):
+    start = offsets[index]["char_offset"]
+    end = offsets[index + 1]["char_offset"] if index + 1 < len(offsets) else len(text)
+    return text[start:end]
+
+
+def test_djvu_xml_page_offsets():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "LC_djvu.xml"
+        path.write_text(DJVU_XML, encoding="utf-8")
+        text, offsets = _normalize(iter_source_lines(path, {8: "2"}))
+
+    assert text == "Gate 1\n\nThe creative force\n\ncontinues here.\n\nLine 1\n", repr(text)
+    assert [(o["leaf"], o["page"]) for o in offsets] == [(7, None), (8, "2")]
+    assert _page_text(text, offsets, 0) == "Gate 1\n\nThe creative force\n\n"
+    assert _page_text(text, offsets, 1) == "continues here.\n\nLine 1\n"
+    assert offsets[1]["line_number"] == 5
+    print("✓ djvu.xml page offsets")
+
+
+def test_page_mark_inside_joined_line():
+    items = [
+        "Gate 4", "", PageMark(1), "a sentence that", "",
+        PageMark(2), PageMark(3), "", "", "", "runs on", PageMark(4), "and on.",
+    ]
+    text, offsets = _normalize(items)
+    assert text == "Gate 4\n\na sentence that\n\nruns on and on."
+    assert [text[o["char_offset"]:][:5] for o in offsets] == ["a sen", "runs ", "runs ", "and o"]
+    assert [o["line_number"] for o in offsets] == [3, 5, 5, 5]
+    print("✓ page mark inside joined line")
+
+
+def test_abbyy_gz_and_blank_runs():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "LC_abbyy.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(ABBYY_XML.format(first="Gate 2 opening.", second="Second page text."))
+        items = list(iter_source_lines(path))
+        text, offsets = _normalize(items)
+
+    assert items[0] == PageMark(0)
+    assert text == "Gate 2 opening.\n\nSecond page text.\n"
+    assert [o["leaf"] for o in offsets] == [0, 1]
+    assert _page_text(text, offsets, 1) == "Second page text.\n"
+    print("✓ abbyy.gz pages and blank runs")
+
+
+def test_epub_spine_and_pagebreaks():
+    container = """<?xml version="1.0"?><container xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles><rootfile full-path="OEBPS/content.opf"/></rootfiles></container>"""
+    opf = """<?xml version="1.0"?><package xmlns="http://www.idpf.org/2007/opf">
+<manifest><item id="c2" href="text/c2.xhtml"/><item id="c1" href="text/c1.xhtml"/></manifest>
+<spine><itemref idref="c1"/><itemref idref="c2"/></spine></package>"""
+    c1 = """<html><head><title>skip me</title><style>p{}</style></head><body>
+<h1>Gate 3</h1><p>Difficulty at the <i>beginning</i>
+is</p><span epub:type="pagebreak" title="12"/><p>ordering.</p></body></html>"""
+    c2 = "<html><body><p>Line 1&amp;2</p></body></html>"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "LC.epub"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("META-INF/container.xml", container)
+            archive.writestr("OEBPS/content.opf", opf)
+            archive.writestr("OEBPS/text/c1.xhtml", c1)
+            archive.writestr("OEBPS/text/c2.xhtml", c2)
+        items = list(iter_source_lines(path))
+        text, offsets = _normalize(items)
+
+    assert "skip me" not in text
+    assert text.startswith("Gate 3\n\nDifficulty at the beginning is\n\nordering.")
+    assert text.endswith("Line 1&2\n")
+    assert offsets == [{"leaf": None, "page": "12", "char_offset": text.index("ordering."), "line_number": 5}]
+    print("✓ epub spine and page breaks")
+
+
+def test_scandata_page_numbers_and_unsupported_sources():
+    scandata = """<book><pageData>
+<page leafNum="4"><pageNumber>1</pageNumber></page>
+<page leafNum="5"><pageType>Normal</pageType></page>
+</pageData></book>"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "LC_scandata.xml"
+        path.write_text(scandata, encoding="utf-8")
+        assert read_scandata_page_numbers(path) == {4: "1"}
+        for name in ("LC_scandata.xml", "LC.pdf"):
+            try:
+                iter_source_lines(Path(tmp) / name)
+                assert False, f"{name} must be rejected"
+            except ValueError:
+                pass
+    print("✓ scandata page numbers and unsupported sources")
+
+
+if __name__ == "__main__":
+    test_djvu_xml_page_offsets()
+    test_page_mark_inside_joined_line()
+    test_abbyy_gz_and_blank_runs()
+    test_epub_spine_and_pagebreaks()
+    test_scandata_page_numbers_and_unsupported_sources()
+    print("\n✅ All source reader tests passed!")
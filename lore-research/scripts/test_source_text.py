@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped text access layer (source_text.py).
+Run with: python test_source_text.py
+"""
+
+import random
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import source_text
+from source_text import SourceText, compile_bytes
+
+
+def test_lines_and_char_offsets_match_str():
+    rng = random.Random(13)
+    original_chunk = source_text._INDEX_CHUNK
+    source_text._INDEX_CHUNK = 7  # force lines to straddle index chunks
+    try:
+        for _ in range(300):
+            text = "".join(rng.choice("ab \n\né☷") for _ in range(rng.randint(0, 80)))
+            source = SourceText.from_text(text)
+            lines = text.split("\n")
+
+            assert source.line_count == text.count("\n") + 1
+            assert list(source.iter_lines()) == lines
+            assert [source.line(n) for n in range(1, len(lines) + 1)] == lines
+            for i in range(len(text) + 1):
+                byte_offset = len(text[:i].encode("utf-8"))
+                assert source.line_number(byte_offset) == text.count("\n", 0, i) + 1
+            # Forward and backward lookups both use the cursor correctly
+            offsets = sorted(rng.sample(range(len(text) + 1), min(6, len(text) + 1)))
+            for i in offsets + offsets[::-1]:
+                assert source.char_offset(len(text[:i].encode("utf-8"))) == i
+                assert source.byte_offset(i) == len(text[:i].encode("utf-8"))
+            assert source.char_count() == len(text)
+    finally:
+        source_text._INDEX_CHUNK = original_chunk
+    print("✓ lines and char offsets match str")
+
+
+def test_compile_bytes_character_classes():
+    dash_re = compile_bytes(r"^Gate\s+(\d{1,2})\s*[-–—]", re.IGNORECASE)
+    assert dash_re.match("gate 7 — Title".encode("utf-8")).group(1) == b"7"
+    assert dash_re.match("Gate 7 -".encode("utf-8"))
+    # A stray lead byte of "—" must not match on its own
+    assert not dash_re.match(b"Gate 7 \xe2")
+    assert compile_bytes(re.compile(r"a.b", re.DOTALL)).flags & re.DOTALL
+    for pattern in (r"[^–]", r"[а-я]"):
+        try:
+            compile_bytes(pattern)
+            assert False, f"{pattern} must be rejected"
+        except ValueError:
+            pass
+    print("✓ compile_bytes character classes")
+
+
+def test_mapped_file_search_and_decode():
+    text = "I. The Khien Hexagram.\nbody ☰\n\nII. The Khwăn Hexagram\nmore\n"
+    header_re = compile_bytes(r"^([IVX]+)\.\s+The\s+(.+?)\s+Hexagram", re.MULTILINE)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "legge.txt"
+        path.write_text(text, encoding="utf-8")
+        with SourceText(path) as source:
+            matches = list(source.finditer(header_re))
+            assert [source.decode(*m.span(2)) for m in matches] == ["Khien", "Khwăn"]
+            assert [source.line_number(m.start()) for m in matches] == [1, 4]
+            assert source.decode(matches[0].end(), matches[1].start()).strip() == ".\nbody ☰"
+            assert source.search(b"more").start() == source.line_span(5)[0]
+            assert source.read_text() == text
+
+        empty = Path(tmp) / "empty.txt"
+        empty.write_bytes(b"")
+        with SourceText(empty) as source:
+            assert source.read_text() == "" and source.line_count == 1
+        try:
+            SourceText(Path(tmp) / "missing.txt")
+            assert False, "missing file must raise"
+        except FileNotFoundError:
+            pass
+    print("✓ mapped file search and decode")
+
+
+if __name__ == "__main__":
+    test_lines_and_char_offsets_match_str()
+    test_compile_bytes_character_classes()
+    test_mapped_file_search_and_decode()
+    print("\n✅ All source text tests passed!")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch exaltation/detriment segmenter in 03c-split-exaltation-detriment.py.
+Run with: python test_split_exaltation_detriment.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+spec = importlib.util.spec_from_file_location(
+    "split_segments", Path(__file__).parent / "03c-split-exaltation-detriment.py"
+)
+split_segments = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(split_segments)
+
+LINES = [
+    (1, 1, "Creation is independent of will.\nThe Moon exalted. Sensitivity.\nMars in detriment. Vanity."),
+    (1, 2, "Love is light. Venus exalted. Harmony."),
+    (2, 1, "  No markers here at all.  "),
+    (2, 2, "Earth in  detriment. The end of the line: Sun"),
+    (2, 3, "exalted at the start of the next line, not a marker. JUPITER EXALTED."),
+]
+
+
+def test_batch_matches_per_line():
+    results, _ = split_segments.segment_lines(LINES)
+    for (gate, line, raw), result in zip(LINES, results):
+        assert split_segments.parse_line_segments(raw, gate, line) == result
+
+    segments, issues, spans = results[0]
+    assert [(s["type"], s.get("planet")) for s in segments] == [
+        ("intro", None), ("exaltation", "Moon"), ("detriment", "Mars")
+    ]
+    assert segments[1]["text"] == "The Moon exalted. Sensitivity."
+    assert [LINES[0][2][start:end] for start, end in spans] == [s["text"] for s in segments]
+    assert issues == []
+
+    segments, issues, _ = results[2]
+    assert segments == [{"type": "intro", "text": "No markers here at all."}]
+    assert issues == ["gate.2.1: no exaltation or detriment markers found"]
+    print("✓ batch segmentation matches per-line parsing")
+
+
+def test_markers_do_not_cross_lines():
+    results, _ = split_segments.segment_lines(LINES)
+    assert [(s["type"], s.get("planet")) for s in results[3][0]] == [("detriment", "Earth")]
+    assert [(s["type"], s.get("planet")) for s in results[4][0]] == [("intro", None), ("exaltation", "JUPITER")]
+    print("✓ markers do not cross line boundaries")
+
+
+def test_per_planet_stats():
+    _, stats = split_segments.segment_lines(LINES)
+    assert stats["lines"] == 5
+    assert stats["planets"]["Moon"] == {"exaltation": 1, "detriment": 0}
+    assert stats["planets"]["Jupiter"] == {"exaltation": 1, "detriment": 0}
+    assert stats["planets"]["Earth"] == {"exaltation": 0, "detriment": 1}
+    assert stats["missing"] == {"exaltation": ["2.1", "2.2"], "detriment": ["1.2", "2.1", "2.3"]}
+
+    merged = split_segments.merge_stats(split_segments.new_stats(), stats)
+    split_segments.merge_stats(merged, stats)
+    assert merged["lines"] == 10 and merged["planets"]["Mars"]["detriment"] == 2
+
+    table = split_segments.format_stats_table(stats)
+    assert "Jupiter" in table and "(of 5 lines)" in table
+    print("✓ per-planet statistics")
+
+
+if __name__ == "__main__":
+    test_batch_matches_per_line()
+    test_markers_do_not_cross_lines()
+    test_per_planet_stats()
+
+    print()
+    print("✅ All segmenter tests passed!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-scan gate heading detector in 02-split-gates.py.
+Run with: python test_split_gates.py
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+spec = importlib.util.spec_from_file_location(
+    "split_gates", Path(__file__).parent / "02-split-gates.py"
+)
+split_gates = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(split_gates)
+
+from source_text import SourceText
+
+logger = logging.getLogger(__name__)
+
+
+def test_headings_offsets_and_line_numbers():
+    text = "Gate 1 - The Creative\nbody\n\nnot a Gate 2\nHEXAGRAM 2 ☷ café\nmore\ngate 3: lower case\n"
+    headings = split_gates.detect_gate_headings(SourceText.from_text(text), logger)
+
+    assert [h[0] for h in headings] == [1, 2, 3]
+    assert [h[2] for h in headings] == [1, 5, 7]
+    assert headings[1][3] == "HEXAGRAM 2 ☷ café"
+    for gate, char_offset, line_num, heading, byte_offset in headings:
+        assert text[char_offset:].startswith(heading)
+        assert text.encode("utf-8")[byte_offset:].startswith(heading.encode("utf-8"))
+    # Multi-byte characters before gate 3 push its byte offset past its char offset
+    assert headings[2][4] - headings[2][1] == len("☷é".encode("utf-8")) - 2
+    print("✓ headings, offsets and line numbers")
+
+
+def test_headings_never_span_lines():
+    text = "Gate\n12 is not a heading\n  Gate 4 indented is not either\nGate\t5\n"
+    headings = split_gates.detect_gate_headings(SourceText.from_text(text), logger)
+    assert [(h[0], h[2]) for h in headings] == [(5, 4)]
+    print("✓ headings never span lines")
+
+
+def test_gate_blocks_use_char_offsets():
+    text = "intro\nGate 1\nfirst ☰ block\nGate 2\nsecond block"
+    headings = split_gates.detect_gate_headings(SourceText.from_text(text), logger)
+    gates = split_gates.extract_gate_blocks(SourceText.from_text(text), headings, logger)
+    assert gates["1"]["text"] == "Gate 1\nfirst ☰ block"
+    assert gates["2"]["text"] == "Gate 2\nsecond block"
+    assert gates["2"]["line_range"] == [4, 5]
+    assert gates["2"]["byte_offset"] == gates["2"]["char_offset"] + 2
+    assert text.encode("utf-8")[slice(*gates["1"]["span"])].decode("utf-8") == gates["1"]["text"]
+    print("✓ gate blocks use char offsets")
+
+
+if __name__ == "__main__":
+    test_headings_offsets_and_line_numbers()
+    test_headings_never_span_lines()
+    test_gate_blocks_use_char_offsets()
+    print("\n✅ All gate heading tests passed!")
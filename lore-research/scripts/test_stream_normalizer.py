@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming normalizer (stream_normalizer.py): output must be
+byte-identical to the original whole-text, four-step normalizer.
+Run with: python test_stream_normalizer.py
+"""
+
+import io
+import random
+import re
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stream_normalizer import StreamingNormalizer, NormalizedTextSink, iter_text_lines
+
+FIXES = {"l ine": "line", "G ate": "Gate", "detri ment": "detriment", "xx": "x\n"}
+BLOCKERS = r"^(Gate|Line|HEXAGRAM|Exaltation|Detriment)"
+
+
+def reference_normalize(text: str, fixes=FIXES, max_blank: int = 1) -> str:
+    """The original TextNormalizer.normalize, step by step over the whole text."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    for error, fix in fixes.items():
+        text = text.replace(error, fix)
+    text = re.sub(r"\n{3,}", "\n" * (max_blank + 1), text)
+
+    lines = text.split("\n")
+    result = []
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        if not line:
+            result.append("")
+            i += 1
+            continue
+        if i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if (
+                next_line
+                and not re.search(r"[.!?:]\s*$", line)
+                and not re.match(r"^[A-Z0-9]", next_line)
+                and not re.match(BLOCKERS, next_line)
+            ):
+                result.append(line + " " + next_line)
+                i += 2
+                continue
+        result.append(line)
+        i += 1
+    return "\n".join(result)
+
+
+def test_edge_cases_match_reference():
+    normalizer = StreamingNormalizer(FIXES, join_blockers=BLOCKERS)
+    cases = [
+        "",
+        "\n",
+        "\n\n\n",
+        "\n\n\nstart",
+        "end\n\n\n\n",
+        "a\n\nb\n\n\nc\n\n\n\n\nd",
+        "G ate 1\r\nthe l ine\rcontinues here.\r\n",
+        "  indented\n   \n\n\nno stop\nlower next\nUpper next",
+        "one xx two\nthree",
+    ]
+    for text in cases:
+        assert normalizer.normalize(text) == reference_normalize(text), repr(text)
+    print("✓ edge cases match reference")
+
+
+def test_random_texts_match_reference():
+    rng = random.Random(42)
+    tokens = ["word", "Gate 5", "l ine", "end.", "x", "xx", " ", "", "Upper", "lower", "7th", "q:"]
+    separators = ["\n", "\n\n", "\n\n\n", "\r\n", "\r", " ", "\n \n"]
+    for max_blank in (0, 1, 2):
+        normalizer = StreamingNormalizer(FIXES, max_blank=max_blank, join_blockers=BLOCKERS)
+        for _ in range(300):
+            parts = [rng.choice(tokens) + rng.choice(separators) for _ in range(rng.randint(0, 25))]
+            text = "".join(parts)
+            expected = reference_normalize(text, max_blank=max_blank)
+            assert normalizer.normalize(text) == expected, repr(text)
+    print("✓ random texts match reference")
+
+
+def test_sink_streams_output_and_stats():
+    normalizer = StreamingNormalizer(FIXES, join_blockers=BLOCKERS)
+    text = "Title.\n" + "\n".join("y" * n + "." for n in range(1, 250)) + "\n"
+    expected = reference_normalize(text)
+
+    out = io.StringIO()
+    sink = NormalizedTextSink(out, max_line_length=200)
+    sink.consume(normalizer.normalize_lines(iter_text_lines(io.StringIO(text))))
+
+    lines = expected.split("\n")
+    assert out.getvalue() == expected
+    assert sink.total_lines == len(lines)
+    assert sink.total_characters == len(expected)
+    assert sink.newline_count == expected.count("\n")
+    assert [s["line_number"] for s in sink.sample_offsets] == [1, 101, 201]
+    assert len(sink.ocr_issues) == sum(1 for line in lines if len(line) > 200)
+    print("✓ sink streams output and stats")
+
+
+if __name__ == "__main__":
+    test_edge_cases_match_reference()
+    test_random_texts_match_reference()
+    test_sink_streams_output_and_stats()
+    print("\n✅ All streaming normalizer tests passed!")
@@ -6,9 +6,11 @@ Provides file I/O, logging, validation helpers, and common operations.
 
 import json
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from config import (
     LOG_FORMAT,
@@ -19,6 +21,7 @@ from config import (
     JSON_SORT_KEYS,
     JSON_ENSURE_ASCII,
 )
+from leaf_table import LeafTable
 
 
 def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
@@ -311,12 +314,13 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def get_page_by_leaf_num(scandata: Dict[str, Any], leaf_num: int) -> Optional[Dict[str, Any]]:
+def get_page_by_leaf_num(scandata: Union[LeafTable, Dict[str, Any]], leaf_num: int) -> Optional[Dict[str, Any]]:
     """
     Helper function to retrieve page metadata by leaf number from scandata.
     
     Args:
-        scandata: Parsed scandata dictionary (from scandata.json)
+        scandata: LeafTable (from leaf_table.load_leaf_table), or a parsed
+            scandata dictionary (from scandata.json)
         leaf_num: Leaf number to look up
     
     Returns:
@@ -325,9 +329,98 @@ def get_page_by_leaf_num(scandata: Dict[str, Any], leaf_num: int) -> Optional[Di
         Returns None if leaf number not found.
     
     Example:
-        >>> scandata = read_json_file(Path("scandata.json"))
-        >>> page = get_page_by_leaf_num(scandata, 42)
+        >>> table = load_leaf_table()
+        >>> page = get_page_by_leaf_num(table, 42)
         >>> if page:
         ...     print(f"Page {page['leafNum']}: {page['origWidth']}x{page['origHeight']}")
     """
+    if isinstance(scandata, LeafTable):
+        return scandata.page(leaf_num)
+    # scandata.json keys pages by the leaf number as a string
     return scandata.get("pages", {}).get(str(leaf_num))
+
+
+def parse_gate_spec(spec: str) -> List[int]:
+    """
+    Parse a gate selection string into a sorted list of gate numbers.
+    
+    Accepts comma-separated gates and inclusive ranges, with or without
+    zero padding (e.g. "1,5,10-12" or "01-64").
+    
+    Args:
+        spec: Gate selection string
+    
+    Returns:
+        Sorted list of unique gate numbers
+    
+    Raises:
+        ValueError: If the spec is malformed or names a gate outside 1-64
+    """
+    gates = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+            if start > end:
+                raise ValueError(f"Invalid gate range: {part}")
+            gates.update(range(start, end + 1))
+        else:
+            gates.add(int(part))
+    
+    invalid = sorted(g for g in gates if not validate_gate_number(g))
+    if invalid:
+        raise ValueError(f"Gate numbers out of range (1-64): {invalid}")
+    if not gates:
+        raise ValueError(f"Empty gate selection: {spec!r}")
+    
+    return sorted(gates)
+
+
+def parse_jobs(value: str) -> int:
+    """
+    Parse a --jobs value into a worker count.
+    
+    Args:
+        value: Positive integer, or 0 for one worker per CPU
+    
+    Returns:
+        Number of worker processes (>= 1)
+    
+    Raises:
+        ValueError: If the value is negative or not an integer
+    """
+    jobs = int(value)
+    if jobs < 0:
+        raise ValueError(f"--jobs must be >= 0, got {jobs}")
+    return jobs or os.cpu_count() or 1
+
+
+def map_gates(func: Callable[[Any], Any], items: Iterable[Any], jobs: int = 1,
+              mp_context: Optional[Any] = None) -> List[Any]:
+    """
+    Apply func to each gate (or gate file), optionally across worker processes.
+    
+    Results are returned in input order regardless of completion order, so
+    callers can merge per-gate issues deterministically. func must be a
+    module-level function (picklable); workers must not append to shared
+    files such as BAD_LINES.md -- return issues and let the caller write them.
+    
+    Args:
+        func: Per-gate worker function
+        items: Gate numbers or gate files
+        jobs: Worker processes (1 = run serially in this process)
+        mp_context: Optional multiprocessing context for the pool (e.g.
+            "fork", so workers inherit caches built by the caller)
+    
+    Returns:
+        List of func results, one per item, in input order
+    """
+    items = list(items)
+    if jobs <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items)), mp_context=mp_context) as pool:
+        return list(pool.map(func, items))